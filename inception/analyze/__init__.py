@@ -1,5 +1,16 @@
 """Analysis layer for semantic extraction."""
 
+from inception.analyze.nlp import (
+    get_nlp,
+    parse,
+    parse_many,
+)
+from inception.analyze.matcher import (
+    PhraseMatch,
+    PhraseSet,
+    compile_phrases,
+    normalize_phrase,
+)
 from inception.analyze.entities import (
     Entity,
     EntityCluster,
@@ -33,8 +44,23 @@ from inception.analyze.gaps import (
     detect_gaps,
     create_gap_node,
 )
+from inception.analyze.pipeline import (
+    DocumentAnalysis,
+    analyze_doc,
+    analyze_text,
+    analyze_texts,
+)
 
 __all__ = [
+    # Shared spaCy pipeline
+    "get_nlp",
+    "parse",
+    "parse_many",
+    # Phrase matching
+    "PhraseMatch",
+    "PhraseSet",
+    "compile_phrases",
+    "normalize_phrase",
     # Entities
     "Entity",
     "EntityCluster",
@@ -64,4 +90,9 @@ __all__ = [
     "GapDetector",
     "detect_gaps",
     "create_gap_node",
+    # Single-pass analysis
+    "DocumentAnalysis",
+    "analyze_doc",
+    "analyze_text",
+    "analyze_texts",
 ]
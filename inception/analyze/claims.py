@@ -10,9 +10,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Any
 
-import spacy
 from spacy.tokens import Doc, Span as SpacySpan
 
+from inception.analyze.matcher import PhraseSet
+from inception.analyze.nlp import get_nlp
 from inception.db.keys import NodeKind
 from inception.db.records import Confidence
 
@@ -99,6 +100,8 @@ EVIDENTIALS = {
     "research shows", "studies suggest", "evidence indicates",
 }
 
+_HEDGE_PHRASES = PhraseSet(sorted(HEDGE_WORDS))
+
 # Negation markers
 NEGATION_MARKERS = {"not", "n't", "never", "no", "none", "neither", "nor"}
 
@@ -125,26 +128,24 @@ class ClaimExtractor:
         """
         self.model_name = model_name
         self.min_claim_length = min_claim_length
-        self._nlp = None
     
     def _get_nlp(self):
-        """Lazy-load spaCy model."""
-        if self._nlp is None:
-            self._nlp = spacy.load(self.model_name)
-        return self._nlp
+        """Get the shared spaCy pipeline (loaded once per process)."""
+        return get_nlp(self.model_name)
     
-    def extract(self, text: str) -> ClaimExtractionResult:
+    def extract(self, text: str, doc: Doc | None = None) -> ClaimExtractionResult:
         """
         Extract claims from text.
         
         Args:
             text: Input text
+            doc: Already parsed Doc of the text (parsed here if not given)
         
         Returns:
             ClaimExtractionResult with extracted claims
         """
-        nlp = self._get_nlp()
-        doc = nlp(text)
+        if doc is None:
+            doc = self._get_nlp()(text)
         
         claims = []
         hedged_count = 0
@@ -278,16 +279,12 @@ class ClaimExtractor:
         root,
     ) -> tuple[str, list[str]]:
         """Analyze the modality and hedging of a sentence."""
-        sent_lower = sent.text.lower()
-        
-        hedges = []
         modality = "assertion"
         
         # Check for hedge words
-        for hedge in HEDGE_WORDS:
-            if hedge in sent_lower:
-                hedges.append(hedge)
-                modality = "possibility"
+        hedges = _HEDGE_PHRASES.phrases_in(sent.text)
+        if hedges:
+            modality = "possibility"
         
         # Check modal verbs
         for child in root.children:
@@ -9,9 +9,9 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Iterator
 
-import spacy
 from spacy.tokens import Doc, Span as SpacySpan
 
+from inception.analyze.nlp import get_nlp, parse_many
 from inception.config import get_config
 from inception.db.keys import NodeKind
 from inception.db.records import Confidence
@@ -110,26 +110,24 @@ class EntityExtractor:
         """
         self.model_name = model_name
         self.use_coreference = use_coreference
-        self._nlp = None
     
     def _get_nlp(self):
-        """Lazy-load spaCy model."""
-        if self._nlp is None:
-            self._nlp = spacy.load(self.model_name)
-        return self._nlp
+        """Get the shared spaCy pipeline (loaded once per process)."""
+        return get_nlp(self.model_name)
     
-    def extract(self, text: str) -> EntityExtractionResult:
+    def extract(self, text: str, doc: Doc | None = None) -> EntityExtractionResult:
         """
         Extract entities from text.
         
         Args:
             text: Input text
+            doc: Already parsed Doc of the text (parsed here if not given)
         
         Returns:
             EntityExtractionResult with entities and clusters
         """
-        nlp = self._get_nlp()
-        doc = nlp(text)
+        if doc is None:
+            doc = self._get_nlp()(text)
         
         entities = []
         entity_counts: dict[str, int] = {}
@@ -159,19 +157,19 @@ class EntityExtractor:
     def extract_batch(
         self,
         texts: list[str],
+        n_process: int = 1,
     ) -> Iterator[EntityExtractionResult]:
         """
         Extract entities from multiple texts efficiently.
         
         Args:
             texts: List of input texts
+            n_process: Parser processes for `nlp.pipe`
         
         Yields:
             EntityExtractionResult for each text
         """
-        nlp = self._get_nlp()
-        
-        for doc in nlp.pipe(texts, batch_size=50):
+        for doc in parse_many(texts, self.model_name, n_process=n_process):
             entities = []
             entity_counts: dict[str, int] = {}
             
@@ -8,10 +8,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import TYPE_CHECKING
 
+from inception.analyze.matcher import compile_phrases
 from inception.db.keys import NodeKind
 from inception.db.records import Confidence
 
+if TYPE_CHECKING:
+    from spacy.tokens import Doc
+
 
 class GapType(str, Enum):
     """Types of knowledge gaps."""
@@ -148,6 +153,7 @@ class GapDetector:
         text: str,
         transcript_confidence: float = 1.0,
         ocr_confidence: float = 1.0,
+        doc: Doc | None = None,
     ) -> GapDetectionResult:
         """
         Detect gaps in text content.
@@ -156,6 +162,7 @@ class GapDetector:
             text: Input text
             transcript_confidence: Confidence of transcription
             ocr_confidence: Confidence of OCR
+            doc: Parsed Doc of the text, used for sentence boundaries
         
         Returns:
             GapDetectionResult with detected gaps
@@ -181,7 +188,7 @@ class GapDetector:
             ))
         
         # Detect ambiguous references
-        ambiguous_gaps = self._detect_ambiguous_references(text)
+        ambiguous_gaps = self._detect_ambiguous_references(text, doc)
         gaps.extend(ambiguous_gaps)
         
         # Detect vague quantities
@@ -211,14 +218,17 @@ class GapDetector:
             epistemic_count=epistemic_count,
         )
     
-    def _detect_ambiguous_references(self, text: str) -> list[Gap]:
+    def _detect_ambiguous_references(self, text: str, doc: Doc | None = None) -> list[Gap]:
         """Detect ambiguous pronoun references."""
         import re
         
         gaps = []
         
         # Pattern for sentences starting with pronouns
-        sentences = text.split(".")
+        if doc is not None and doc.has_annotation("SENT_START"):
+            sentences = [sent.text for sent in doc.sents]
+        else:
+            sentences = text.split(".")
         for i, sent in enumerate(sentences):
             sent = sent.strip()
             if not sent:
@@ -239,30 +249,29 @@ class GapDetector:
         return gaps
     
     def _detect_vague_quantities(self, text: str) -> list[Gap]:
-        """Detect vague quantity expressions."""
-        import re
-        
+        """Detect vague quantity expressions (all patterns in one pass)."""
         gaps = []
         
-        for pattern in self.vague_quantity_patterns:
-            matches = list(re.finditer(rf"\b{pattern}\b", text.lower()))
-            for match in matches:
-                # Only flag if in potentially important context
-                context_start = max(0, match.start() - 30)
-                context_end = min(len(text), match.end() + 30)
-                context = text[context_start:context_end]
-                
-                gaps.append(Gap(
-                    gap_type=GapType.UNCLEAR_QUANTITY,
-                    description=f"Vague quantity '{pattern}'",
-                    context_text=context,
-                    start_char=match.start(),
-                    end_char=match.end(),
-                    severity="minor",
-                ))
+        for match in compile_phrases(self.vague_quantity_patterns).finditer(text):
+            # Limit to first 5 to avoid noise
+            if len(gaps) == 5:
+                break
+            
+            # Only flag if in potentially important context
+            context_start = max(0, match.start - 30)
+            context_end = min(len(text), match.end + 30)
+            context = text[context_start:context_end]
+            
+            gaps.append(Gap(
+                gap_type=GapType.UNCLEAR_QUANTITY,
+                description=f"Vague quantity '{match.phrase}'",
+                context_text=context,
+                start_char=match.start,
+                end_char=match.end,
+                severity="minor",
+            ))
         
-        # Limit to top 5 to avoid noise
-        return gaps[:5]
+        return gaps
     
     def _detect_undefined_terms(self, text: str) -> list[Gap]:
         """Detect potentially undefined technical terms."""
@@ -0,0 +1,163 @@
+"""
+Compiled multi-phrase matching.
+
+Gap, hedge and procedure-indicator detection and entity mention linking
+all look for a fixed list of phrases in text. Rather than one scan per
+phrase, `PhraseSet` compiles the whole list into a single alternation
+regex (longest phrase first) and reports every hit with its offsets in
+one pass.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Iterator, Mapping
+
+
+@dataclass(frozen=True)
+class PhraseMatch:
+    """One phrase occurrence in a text."""
+    
+    phrase: str  # The pattern as given (lowercased)
+    label: str | None
+    start: int
+    end: int
+
+
+class PhraseSet:
+    """
+    A fixed set of phrases matched case-insensitively in one pass.
+    
+    Matches don't overlap: the leftmost hit wins, and at one position
+    the longest phrase (so "a bit more" rather than "a bit").
+    
+    Example:
+        phrases = PhraseSet({"quantity": ["some", "a lot"], "hedge": ["might"]})
+        for m in phrases.finditer(text):
+            ...  # m.label, m.phrase, m.start, m.end
+    """
+    
+    def __init__(
+        self,
+        phrases: Mapping[str, Iterable[str]] | Iterable[str],
+        word_boundaries: bool = True,
+    ):
+        """
+        Compile the phrases.
+        
+        Args:
+            phrases: Phrases, or a mapping of label to phrases
+            word_boundaries: Only match whole words (otherwise any substring)
+        """
+        if isinstance(phrases, Mapping):
+            labelled = [(label, p) for label, group in phrases.items() for p in group]
+        else:
+            labelled = [(None, p) for p in phrases]
+        
+        self.labels: dict[str, str | None] = {}
+        for label, phrase in labelled:
+            phrase = normalize_phrase(phrase)
+            if phrase:
+                self.labels.setdefault(phrase, label)
+        self.word_boundaries = word_boundaries
+        
+        # Longest first, so the regex prefers "a bit more" over "a bit"
+        ordered = sorted(self.labels, key=len, reverse=True)
+        alternation = "|".join(_phrase_regex(p).pattern for p in ordered)
+        if not alternation:
+            alternation = r"(?!)"
+        
+        if word_boundaries:
+            self._regex = re.compile(rf"(?<!\w)(?:{alternation})(?!\w)", re.IGNORECASE)
+            self._overlapping_regex = re.compile(
+                rf"(?<!\w)(?=((?:{alternation})(?!\w)))", re.IGNORECASE
+            )
+        else:
+            self._regex = re.compile(alternation, re.IGNORECASE)
+            self._overlapping_regex = re.compile(rf"(?=({alternation}))", re.IGNORECASE)
+        
+        # Shorter phrases that a hit on a longer phrase also contains at
+        # its start ("new" in "new york"), for overlapping matching
+        self._prefixes: dict[str, list[tuple[str, re.Pattern]]] = {}
+        for phrase in ordered:
+            self._prefixes[phrase] = [
+                (other, _phrase_regex(other))
+                for other in ordered
+                if len(other) < len(phrase) and phrase.startswith(other)
+                and not (word_boundaries and _is_word_char(phrase[len(other)]))
+            ]
+    
+    def __len__(self) -> int:
+        return len(self.labels)
+    
+    def finditer(self, text: str, overlapping: bool = False) -> Iterator[PhraseMatch]:
+        """
+        Yield phrase occurrences in text order.
+        
+        Args:
+            text: Text to scan
+            overlapping: Also report phrases inside or overlapping another
+                hit ("york" and "new" within "new york")
+        """
+        labels = self.labels
+        
+        if not overlapping:
+            for m in self._regex.finditer(text):
+                phrase = normalize_phrase(m.group())
+                yield PhraseMatch(phrase, labels.get(phrase), m.start(), m.end())
+            return
+        
+        for m in self._overlapping_regex.finditer(text):
+            start, end = m.span(1)
+            phrase = normalize_phrase(m.group(1))
+            yield PhraseMatch(phrase, labels.get(phrase), start, end)
+            
+            for prefix, prefix_regex in self._prefixes.get(phrase, ()):
+                prefix_end = prefix_regex.match(text, start).end()
+                yield PhraseMatch(prefix, labels[prefix], start, prefix_end)
+    
+    def findall(self, text: str, overlapping: bool = False) -> list[PhraseMatch]:
+        """All phrase occurrences in text order."""
+        return list(self.finditer(text, overlapping))
+    
+    def search(self, text: str) -> PhraseMatch | None:
+        """The first phrase occurrence, or None."""
+        return next(self.finditer(text), None)
+    
+    def phrases_in(self, text: str) -> list[str]:
+        """Distinct phrases found, in order of first occurrence."""
+        return list(dict.fromkeys(m.phrase for m in self.finditer(text)))
+
+
+def normalize_phrase(text: str) -> str:
+    """Lowercase and collapse whitespace, the form phrases are keyed by."""
+    return " ".join(text.lower().split())
+
+
+def _phrase_regex(phrase: str) -> re.Pattern:
+    return re.compile(re.escape(phrase).replace(r"\ ", r"\s+"), re.IGNORECASE)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+@lru_cache(maxsize=64)
+def _compiled(phrases: tuple[str, ...], word_boundaries: bool) -> PhraseSet:
+    return PhraseSet(phrases, word_boundaries=word_boundaries)
+
+
+def compile_phrases(phrases: Iterable[str], word_boundaries: bool = True) -> PhraseSet:
+    """
+    Get a compiled PhraseSet, reusing one already built for the same list.
+    
+    Args:
+        phrases: Phrases to match
+        word_boundaries: Only match whole words
+    
+    Returns:
+        Shared PhraseSet
+    """
+    return _compiled(tuple(phrases), word_boundaries)
@@ -0,0 +1,71 @@
+"""
+Shared spaCy model loading and parsing.
+
+Every extractor in the analysis layer works from the same model, loaded
+once per process with only the components they use, so a document is
+parsed once and its `Doc` shared.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Iterable, Iterator
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+DEFAULT_MODEL = "en_core_web_sm"
+
+# Pipeline components none of the extractors read (entities need ner;
+# claims and procedures need the tagger, attribute ruler and parser)
+EXCLUDED_COMPONENTS = ("lemmatizer",)
+
+_models: dict[str, Language] = {}
+_lock = threading.Lock()
+
+
+def get_nlp(model_name: str = DEFAULT_MODEL) -> Language:
+    """
+    Get the process-wide spaCy pipeline for a model, loading it on first use.
+    
+    Args:
+        model_name: spaCy model name
+    
+    Returns:
+        The loaded Language, shared by all callers in this process
+    """
+    nlp = _models.get(model_name)
+    if nlp is None:
+        with _lock:
+            nlp = _models.get(model_name)
+            if nlp is None:
+                nlp = spacy.load(model_name, exclude=list(EXCLUDED_COMPONENTS))
+                _models[model_name] = nlp
+    return nlp
+
+
+def parse(text: str, model_name: str = DEFAULT_MODEL) -> Doc:
+    """Parse a single text with the shared pipeline."""
+    return get_nlp(model_name)(text)
+
+
+def parse_many(
+    texts: Iterable[str],
+    model_name: str = DEFAULT_MODEL,
+    n_process: int = 1,
+    batch_size: int = 50,
+) -> Iterator[Doc]:
+    """
+    Parse many texts with `nlp.pipe`.
+    
+    Args:
+        texts: Input texts
+        model_name: spaCy model name
+        n_process: Worker processes (each loads its own model copy)
+        batch_size: Texts per batch
+    
+    Yields:
+        A Doc per text, in input order
+    """
+    yield from get_nlp(model_name).pipe(texts, n_process=n_process, batch_size=batch_size)
@@ -0,0 +1,100 @@
+"""
+Single-pass document analysis.
+
+Parses each text once with the shared spaCy pipeline and runs entity,
+claim and procedure extraction and gap detection over the same `Doc`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from spacy.tokens import Doc
+
+from inception.analyze.claims import ClaimExtractionResult, ClaimExtractor
+from inception.analyze.entities import EntityExtractionResult, EntityExtractor
+from inception.analyze.gaps import GapDetectionResult, GapDetector
+from inception.analyze.nlp import DEFAULT_MODEL, parse, parse_many
+from inception.analyze.procedures import ProcedureExtractionResult, ProcedureExtractor
+
+
+@dataclass
+class DocumentAnalysis:
+    """All analysis results for one text."""
+    
+    doc: Doc
+    entities: EntityExtractionResult
+    claims: ClaimExtractionResult
+    procedures: ProcedureExtractionResult
+    gaps: GapDetectionResult
+
+
+def analyze_doc(
+    doc: Doc,
+    transcript_confidence: float = 1.0,
+    ocr_confidence: float = 1.0,
+) -> DocumentAnalysis:
+    """
+    Run every extractor over an already parsed Doc.
+    
+    Args:
+        doc: Parsed document
+        transcript_confidence: Confidence of transcription
+        ocr_confidence: Confidence of OCR
+    
+    Returns:
+        DocumentAnalysis
+    """
+    text = doc.text
+    
+    return DocumentAnalysis(
+        doc=doc,
+        entities=EntityExtractor().extract(text, doc=doc),
+        claims=ClaimExtractor().extract(text, doc=doc),
+        procedures=ProcedureExtractor().extract(text, doc=doc),
+        gaps=GapDetector().detect(text, transcript_confidence, ocr_confidence, doc=doc),
+    )
+
+
+def analyze_text(
+    text: str,
+    model_name: str = DEFAULT_MODEL,
+    transcript_confidence: float = 1.0,
+    ocr_confidence: float = 1.0,
+) -> DocumentAnalysis:
+    """
+    Parse a text once and run every extractor over it.
+    
+    Args:
+        text: Input text
+        model_name: spaCy model name
+        transcript_confidence: Confidence of transcription
+        ocr_confidence: Confidence of OCR
+    
+    Returns:
+        DocumentAnalysis
+    """
+    return analyze_doc(parse(text, model_name), transcript_confidence, ocr_confidence)
+
+
+def analyze_texts(
+    texts: Iterable[str],
+    model_name: str = DEFAULT_MODEL,
+    n_process: int = 1,
+    batch_size: int = 50,
+) -> Iterator[DocumentAnalysis]:
+    """
+    Analyze many texts, parsing them in batches with `nlp.pipe`.
+    
+    Args:
+        texts: Input texts
+        model_name: spaCy model name
+        n_process: Parser processes
+        batch_size: Texts per batch
+    
+    Yields:
+        DocumentAnalysis per text, in input order
+    """
+    for doc in parse_many(texts, model_name, n_process=n_process, batch_size=batch_size):
+        yield analyze_doc(doc)
@@ -11,8 +11,10 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
-import spacy
+from spacy.tokens import Doc
 
+from inception.analyze.matcher import PhraseSet
+from inception.analyze.nlp import get_nlp
 from inception.db.keys import NodeKind
 from inception.db.records import Confidence
 
@@ -132,6 +134,8 @@ PROCEDURE_INDICATORS = [
     "follow these steps", "here's how",
 ]
 
+_INDICATOR_PHRASES = PhraseSet(PROCEDURE_INDICATORS, word_boundaries=False)
+
 ACTION_VERBS = {
     "click", "tap", "select", "choose", "open", "close",
     "create", "delete", "add", "remove", "insert",
@@ -163,38 +167,39 @@ class ProcedureExtractor:
             model_name: spaCy model name
         """
         self.model_name = model_name
-        self._nlp = None
     
     def _get_nlp(self):
-        """Lazy-load spaCy model."""
-        if self._nlp is None:
-            self._nlp = spacy.load(self.model_name)
-        return self._nlp
+        """Get the shared spaCy pipeline (loaded once per process)."""
+        return get_nlp(self.model_name)
     
-    def extract(self, text: str) -> ProcedureExtractionResult:
+    def extract(self, text: str, doc: Doc | None = None) -> ProcedureExtractionResult:
         """
         Extract procedures from text.
         
+        The text is parsed at most once (and not at all if a Doc is
+        given); step action verbs are read from the same parse.
+        
         Args:
             text: Input text
+            doc: Already parsed Doc of the text (parsed here if needed)
         
         Returns:
             ProcedureExtractionResult with extracted procedures
         """
-        nlp = self._get_nlp()
-        
         procedures = []
         
         # Check if text contains procedure indicators
-        text_lower = text.lower()
-        has_procedure_indicator = any(
-            ind in text_lower for ind in PROCEDURE_INDICATORS
-        )
+        has_procedure_indicator = _INDICATOR_PHRASES.search(text) is not None
         
         # Try to extract numbered steps
         steps = self._extract_numbered_steps(text)
         
         if steps:
+            if doc is None:
+                doc = self._get_nlp()(text)
+            for step in steps:
+                step.action_verb = self._step_action_verb(doc, step)
+            
             # Create a procedure from the steps
             procedure = Procedure(
                 steps=steps,
@@ -203,7 +208,8 @@ class ProcedureExtractor:
             )
             
             # Try to extract title (first line before steps)
-            title = self._extract_title(text, steps[0].start_char if steps else 0)
+            first_line = text.rfind("\n", 0, steps[0].start_char) + 1
+            title = self._extract_title(text, first_line)
             if title:
                 procedure.title = title
             
@@ -214,7 +220,8 @@ class ProcedureExtractor:
         
         elif has_procedure_indicator:
             # Try to extract imperative sentences as steps
-            doc = nlp(text)
+            if doc is None:
+                doc = self._get_nlp()(text)
             steps = self._extract_imperative_steps(doc)
             
             if steps:
@@ -233,14 +240,18 @@ class ProcedureExtractor:
         )
     
     def _extract_numbered_steps(self, text: str) -> list[ProcedureStep]:
-        """Extract numbered or bulleted steps."""
+        """Extract numbered or bulleted steps (action verbs are filled in by the caller)."""
         steps = []
-        lines = text.split("\n")
+        line_start = 0
         
-        for i, line in enumerate(lines):
-            line = line.strip()
+        for raw_line in text.split("\n"):
+            offset = line_start
+            line_start += len(raw_line) + 1
+            
+            line = raw_line.strip()
             if not line:
                 continue
+            line_offset = offset + raw_line.index(line)
             
             # Check for numbered steps
             match = re.match(r"^\s*(?:step\s+)?(\d+)[.):]\s*(.+)", line, re.IGNORECASE)
@@ -251,7 +262,8 @@ class ProcedureExtractor:
                 step = ProcedureStep(
                     index=len(steps),
                     text=step_text,
-                    action_verb=self._extract_action_verb(step_text),
+                    start_char=line_offset + match.start(2),
+                    end_char=line_offset + match.end(2),
                 )
                 steps.append(step)
                 continue
@@ -264,7 +276,8 @@ class ProcedureExtractor:
                     step = ProcedureStep(
                         index=len(steps),
                         text=step_text,
-                        action_verb=self._extract_action_verb(step_text),
+                        start_char=line_offset + bullet_match.start(1),
+                        end_char=line_offset + bullet_match.end(1),
                     )
                     steps.append(step)
         
@@ -294,12 +307,20 @@ class ProcedureExtractor:
         
         return steps
     
+    def _step_action_verb(self, doc: Doc, step: ProcedureStep) -> str | None:
+        """Action verb of a step, read from the tokens of the parsed text it spans."""
+        span = doc.char_span(step.start_char, step.end_char, alignment_mode="expand")
+        if span is None:
+            return None
+        return self._action_verb(span)
+    
     def _extract_action_verb(self, text: str) -> str | None:
-        """Extract the primary action verb from step text."""
-        nlp = self._get_nlp()
-        doc = nlp(text)
-        
-        for token in doc:
+        """Extract the primary action verb from standalone step text."""
+        return self._action_verb(self._get_nlp()(text))
+    
+    def _action_verb(self, tokens) -> str | None:
+        """First action verb (or failing that, any verb) among tokens."""
+        for token in tokens:
             if token.pos_ == "VERB" and token.text.lower() in ACTION_VERBS:
                 return token.text.lower()
             if token.pos_ == "VERB":
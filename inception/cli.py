@@ -454,43 +454,78 @@ def ingest(
     if is_youtube:
         console.print("[cyan]Detected YouTube video[/cyan]")
         
-        # Step 1: Download audio with yt-dlp
-        console.print("  [dim]→ Downloading audio with yt-dlp...[/dim]")
+        # Step 1: Download audio with yt-dlp (or reuse the artifact store)
+        from inception.ingest.artifact_store import get_artifact_store
+        
+        store = get_artifact_store() if cfg.pipeline.cache_enabled else None
+        audio_key = f"{uri}#audio"
+        metadata_key = f"{uri}#metadata"
         
         with tempfile.TemporaryDirectory() as tmpdir:
             audio_path = Path(tmpdir) / "audio.mp3"
             
-            try:
-                result = subprocess.run([
-                    "yt-dlp",
-                    "-x", "--audio-format", "mp3",
-                    "-o", str(audio_path),
-                    "--no-playlist",
-                    uri
-                ], capture_output=True, text=True, timeout=120)
+            cached_audio = store.lookup_url(audio_key) if store else None
+            if cached_audio is not None:
+                # Work on a clone so eviction can't remove the blob mid-use
+                try:
+                    store.materialize(cached_audio.content_hash, audio_path)
+                except (KeyError, OSError):
+                    audio_path.unlink(missing_ok=True)
+                    cached_audio = None
+            
+            if cached_audio is not None:
+                console.print("  [green]✓ Using cached audio[/green]")
+            else:
+                console.print("  [dim]→ Downloading audio with yt-dlp...[/dim]")
                 
-                if result.returncode != 0:
-                    console.print(f"[red]yt-dlp error: {result.stderr[:200]}[/red]")
-                    return
+                try:
+                    result = subprocess.run([
+                        "yt-dlp",
+                        "-x", "--audio-format", "mp3",
+                        "-o", str(audio_path),
+                        "--no-playlist",
+                        uri
+                    ], capture_output=True, text=True, timeout=120)
+                    
+                    if result.returncode != 0:
+                        console.print(f"[red]yt-dlp error: {result.stderr[:200]}[/red]")
+                        return
+                        
+                    console.print(f"  [green]✓ Downloaded audio[/green]")
                     
-                console.print(f"  [green]✓ Downloaded audio[/green]")
+                except FileNotFoundError:
+                    console.print("[red]yt-dlp not installed. Run: pip install yt-dlp[/red]")
+                    return
+                except subprocess.TimeoutExpired:
+                    console.print("[red]Download timed out[/red]")
+                    return
                 
-            except FileNotFoundError:
-                console.print("[red]yt-dlp not installed. Run: pip install yt-dlp[/red]")
-                return
-            except subprocess.TimeoutExpired:
-                console.print("[red]Download timed out[/red]")
-                return
+                if store and audio_path.exists():
+                    audio_hash = store.put_file(audio_path)
+                    store.record_url(audio_key, audio_hash, content_type="audio/mpeg")
             
             # Step 2: Get video metadata
             console.print("  [dim]→ Fetching metadata...[/dim]")
             try:
-                meta_result = subprocess.run([
-                    "yt-dlp", "-j", "--no-playlist", uri
-                ], capture_output=True, text=True, timeout=30)
+                cached_meta = store.lookup_url(metadata_key) if store else None
+                meta_path = store.get_path(cached_meta.content_hash) if cached_meta else None
+                
+                if meta_path is not None:
+                    meta_json = meta_path.read_text()
+                else:
+                    meta_json = None
+                    meta_result = subprocess.run([
+                        "yt-dlp", "-j", "--no-playlist", uri
+                    ], capture_output=True, text=True, timeout=30)
+                    
+                    if meta_result.returncode == 0:
+                        meta_json = meta_result.stdout
+                        if store:
+                            meta_hash = store.put_bytes(meta_json.encode())
+                            store.record_url(metadata_key, meta_hash, content_type="application/json")
                 
-                if meta_result.returncode == 0:
-                    metadata = json.loads(meta_result.stdout)
+                if meta_json:
+                    metadata = json.loads(meta_json)
                     title = metadata.get("title", "Unknown")
                     channel = metadata.get("channel", "Unknown")
                     duration = metadata.get("duration", 0)
@@ -537,24 +572,46 @@ def ingest(
                 claims = []
             else:
                 try:
-                    import openai
-                    client = openai.OpenAI()
+                    from inception.enhance.llm import CloudProvider, LLMExtractor, get_llm_cache
                     
-                    response = client.chat.completions.create(
-                        model="gpt-4o-mini",
-                        messages=[{
-                            "role": "system",
-                            "content": "Extract entities and claims from this transcript. Return JSON with 'entities' (list of {id, name, type, description}) and 'claims' (list of {id, statement, entity_ids, confidence})."
-                        }, {
-                            "role": "user",
-                            "content": f"Title: {title}\nChannel: {channel}\n\nTranscript:\n{transcript[:8000]}"
-                        }],
-                        response_format={"type": "json_object"}
+                    # Long transcripts are chunked and extracted concurrently;
+                    # re-ingests of unchanged transcripts hit the response cache
+                    extractor = LLMExtractor(
+                        provider=CloudProvider(provider="openai", model="gpt-4o-mini"),
+                        cache=get_llm_cache() if cfg.pipeline.cache_enabled else None,
+                    )
+                    extracted = extractor.extract_all(
+                        f"Title: {title}\nChannel: {channel}\n\nTranscript:\n{transcript}"
                     )
+                    if extracted.errors:
+                        console.print(
+                            f"[yellow]{len(extracted.errors)} transcript chunk(s) "
+                            f"failed to extract[/yellow]"
+                        )
                     
-                    extracted = json.loads(response.choices[0].message.content)
-                    entities = extracted.get("entities", [])
-                    claims = extracted.get("claims", [])
+                    entities = [
+                        {
+                            "id": f"ent_{i}",
+                            "name": e.name,
+                            "type": e.entity_type,
+                            "description": e.description or "",
+                        }
+                        for i, e in enumerate(extracted.entities)
+                    ]
+                    entity_ids = {e["name"].lower(): e["id"] for e in entities}
+                    claims = [
+                        {
+                            "id": f"claim_{i}",
+                            "statement": c.text,
+                            "entity_ids": [
+                                entity_ids[name.lower()]
+                                for name in (c.subject, c.object)
+                                if name and name.lower() in entity_ids
+                            ],
+                            "confidence": c.confidence,
+                        }
+                        for i, c in enumerate(extracted.claims)
+                    ]
                     
                     console.print(f"  [green]✓ Extracted {len(entities)} entities, {len(claims)} claims[/green]")
                     
@@ -568,6 +625,7 @@ def ingest(
             
             try:
                 import lmdb
+                from inception.db.intervals import VALIDITY_DB, put_validity
                 db_path = os.path.expanduser("~/.inception/knowledge.lmdb")
                 env = lmdb.open(db_path, map_size=10*1024*1024*1024, max_dbs=10, subdir=True)
                 
@@ -575,6 +633,7 @@ def ingest(
                     entities_db = env.open_db(b'entities', txn=txn, create=True)
                     claims_db = env.open_db(b'claims', txn=txn, create=True)
                     sources_db = env.open_db(b'sources', txn=txn, create=True)
+                    validity_db = env.open_db(VALIDITY_DB, txn=txn, create=True)
                     
                     # Add source
                     source_id = f"yt-{uri.split('=')[-1][:11]}"
@@ -592,6 +651,10 @@ def ingest(
                     for entity in entities:
                         entity["source_ids"] = [source_id]
                         txn.put(entity["id"].encode(), json.dumps(entity).encode(), db=entities_db)
+                        put_validity(
+                            txn, validity_db, entity["id"].encode(),
+                            entity.get("valid_from"), entity.get("valid_until"),
+                        )
                     
                     # Add claims
                     for claim in claims:
@@ -616,7 +679,7 @@ def ingest(
         
     elif is_url:
         console.print("[cyan]Detected web page[/cyan]")
-        console.print("[dim]Web ingestion coming soon[/dim]")
+        console.print("[dim]Use `inception ingest-site` to crawl and ingest web pages[/dim]")
         
     else:
         console.print("[cyan]Detected local file[/cyan]")
@@ -641,6 +704,18 @@ def ingest_channel(
     
     Downloads and processes all videos within the specified date range.
     """
+    import asyncio
+    import re
+    from datetime import datetime
+    
+    import yaml
+    
+    from inception.db.keys import SourceType
+    from inception.ingest.channel import ChannelIngestor
+    from inception.ingest.source_manager import SourceFeed, SourceManager
+    
+    cfg: Config = ctx.obj["config"]
+    
     console.print(f"[bold]Ingesting channel:[/bold] {channel_url}")
     console.print(f"  Since: {since}")
     if until:
@@ -648,8 +723,130 @@ def ingest_channel(
     if topic_rules:
         console.print(f"  Topic rules: {topic_rules}")
     
-    # TODO: Implement channel ingestion
-    console.print("[dim]Channel ingestion not yet implemented[/dim]")
+    if cfg.pipeline.offline_mode:
+        console.print("[yellow]Running in offline mode - skipping download[/yellow]")
+        return
+    
+    manager = SourceManager()
+    try:
+        source_type = manager.detect_source_type(channel_url)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+    
+    if source_type not in (SourceType.YOUTUBE_CHANNEL, SourceType.YOUTUBE_PLAYLIST):
+        console.print("[red]Expected a YouTube channel or playlist URL[/red]")
+        return
+    
+    rules: list[str] = []
+    if topic_rules:
+        loaded = yaml.safe_load(topic_rules.read_text()) or []
+        rules = [str(rule) for rule in (loaded.get("rules", []) if isinstance(loaded, dict) else loaded)]
+        for rule in rules:
+            try:
+                re.compile(rule)
+            except re.error as e:
+                console.print(f"[red]Invalid topic rule {rule!r}: {e}[/red]")
+                return
+    
+    feed = SourceFeed(
+        feed_type="youtube_channel" if source_type == SourceType.YOUTUBE_CHANNEL else "youtube_playlist",
+        uri=channel_url,
+        since=datetime.strptime(since, "%Y-%m-%d"),
+        until=datetime.strptime(until, "%Y-%m-%d") if until else None,
+        topic_rules=rules,
+    )
+    
+    watermark = manager.get_watermark(channel_url)
+    if watermark:
+        console.print(f"  [dim]Resuming after {watermark['watermark']} ({watermark['timestamp']:%Y-%m-%d %H:%M})[/dim]")
+    
+    def on_item(item) -> None:
+        if item.status == "completed":
+            console.print(f"  [green]✓ {item.title or item.video_id}[/green]")
+        elif item.status == "skipped":
+            console.print(f"  [dim]- {item.title or item.video_id} (already ingested)[/dim]")
+        elif item.status == "filtered":
+            console.print(f"  [dim]- {item.title or item.video_id} (no topic rule matched)[/dim]")
+        else:
+            console.print(f"  [red]✗ {item.title or item.video_id} ({item.stage}): {item.error}[/red]")
+    
+    ingestor = ChannelIngestor(manager=manager)
+    try:
+        result = asyncio.run(ingestor.run(feed, on_item=on_item))
+    except RuntimeError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+    
+    console.print()
+    console.print(f"[bold green]✓ Channel ingestion complete![/bold green]")
+    console.print(f"  Completed: {len(result.completed)}")
+    console.print(f"  Skipped: {len(result.skipped)}")
+    if feed.topic_rules:
+        console.print(f"  Filtered: {len(result.filtered)}")
+    console.print(f"  Failed: {len(result.failed)}")
+    if result.watermark:
+        console.print(f"  Watermark: {result.watermark}")
+
+
+@main.command("ingest-site")
+@click.argument("root_url")
+@click.option("--max-pages", type=int, default=10, show_default=True, help="Pages to extract")
+@click.option("--max-depth", type=int, default=2, show_default=True, help="Link depth from root")
+@click.option("--include", multiple=True, help="Only follow URLs matching this regex (repeatable)")
+@click.option("--exclude", multiple=True, help="Skip URLs matching this regex (repeatable)")
+@click.pass_context
+def ingest_site(
+    ctx: click.Context,
+    root_url: str,
+    max_pages: int,
+    max_depth: int,
+    include: tuple[str, ...],
+    exclude: tuple[str, ...],
+) -> None:
+    """
+    Crawl a website and ingest its pages.
+    
+    Pages are analyzed and stored as they are crawled. Re-running only
+    fetches pages that changed and only ingests pages not seen before.
+    """
+    import asyncio
+    
+    from inception.ingest.site import SiteIngestor
+    
+    cfg: Config = ctx.obj["config"]
+    
+    console.print(f"[bold]Ingesting site:[/bold] {root_url}")
+    
+    if cfg.pipeline.offline_mode:
+        console.print("[yellow]Running in offline mode - skipping crawl[/yellow]")
+        return
+    
+    def on_page(page) -> None:
+        if page.status == "completed":
+            console.print(f"  [green]✓ {page.title or page.url}[/green]")
+        elif page.status == "skipped":
+            console.print(f"  [dim]- {page.url} (already ingested)[/dim]")
+        else:
+            console.print(f"  [red]✗ {page.url}: {page.error}[/red]")
+    
+    ingestor = SiteIngestor(
+        max_pages=max_pages,
+        max_depth=max_depth,
+        include_patterns=list(include),
+        exclude_patterns=list(exclude),
+    )
+    result = asyncio.run(ingestor.run(root_url, on_page=on_page))
+    
+    for error in result.crawl_errors:
+        console.print(f"  [red]✗ {error['url']}: {error['error']}[/red]")
+    
+    console.print()
+    console.print("[bold green]✓ Site ingestion complete![/bold green]")
+    console.print(f"  Completed: {len(result.completed)}")
+    console.print(f"  Skipped: {len(result.skipped)}")
+    console.print(f"  Unchanged: {len(result.not_modified)}")
+    console.print(f"  Failed: {len(result.failed) + len(result.crawl_errors)}")
 
 
 @main.command("ingest-batch")
@@ -660,12 +857,65 @@ def ingest_batch(ctx: click.Context, sources_file: Path) -> None:
     Ingest multiple sources from a JSONL file.
     
     Each line should contain a JSON object with 'uri' and optional
-    'since', 'until', and 'topics' fields.
+    'since', 'until', and 'topics' fields. Sources already ingested
+    are skipped. Pending YouTube videos are downloaded, transcribed and
+    extracted like channel uploads, and recorded as sources once done;
+    other source types are listed but not run yet.
     """
+    import asyncio
+    
+    from inception.db.keys import SourceType
+    from inception.ingest.channel import ChannelIngestor
+    from inception.ingest.source_manager import SourceManager, parse_batch_file
+    
     console.print(f"[bold]Batch ingestion from:[/bold] {sources_file}")
     
-    # TODO: Implement batch ingestion
-    console.print("[dim]Batch ingestion not yet implemented[/dim]")
+    try:
+        jobs = parse_batch_file(sources_file)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        return
+    
+    manager = SourceManager()
+    new_uris = set(manager.filter_new_uris([job.uri for job in jobs]))
+    pending = [job for job in jobs if job.uri in new_uris]
+    runnable = [job for job in pending if job.source_type == SourceType.YOUTUBE_VIDEO]
+    
+    console.print(f"  Sources: {len(jobs)}")
+    console.print(f"  Already ingested: {len(jobs) - len(pending)}")
+    console.print(f"  Pending: {len(pending)}")
+    if len(runnable) < len(pending):
+        console.print(
+            f"  [yellow]Unsupported: {len(pending) - len(runnable)} "
+            f"(only YouTube videos; use ingest-channel for channels and playlists)[/yellow]"
+        )
+    
+    cfg: Config = ctx.obj["config"]
+    if runnable and cfg.pipeline.offline_mode:
+        console.print("[yellow]Running in offline mode - skipping download[/yellow]")
+        return
+    
+    if not runnable:
+        return
+    
+    def on_item(item) -> None:
+        if item.status == "completed":
+            console.print(f"  [green]✓ {item.url}[/green]")
+        elif item.status == "failed":
+            console.print(f"  [red]✗ {item.url} ({item.stage}): {item.error}[/red]")
+    
+    ingestor = ChannelIngestor(manager=manager)
+    items = asyncio.run(ingestor.ingest_videos([job.uri for job in runnable], on_item=on_item))
+    
+    for job, item in zip(runnable, items):
+        job.status = item.status
+        job.error = item.error
+        job.source_nid = item.source_nid
+    
+    completed = sum(job.status == "completed" for job in runnable)
+    failed = sum(job.status == "failed" for job in runnable)
+    console.print()
+    console.print(f"[bold]Batch complete:[/bold] {completed} ingested, {failed} failed")
 
 
 @main.command("build-graph")
@@ -683,6 +933,28 @@ def build_graph(ctx: click.Context, source_id: str) -> None:
     console.print("[dim]Graph building not yet implemented[/dim]")
 
 
+@main.command("fuse")
+@click.option("--workers", type=int, default=None, help="Fusion processes (default: CPU count)")
+@click.pass_context
+def fuse(ctx: click.Context, workers: Optional[int]) -> None:
+    """
+    Fuse claims ingested since the last run.
+    
+    Matches new claims against the graph and re-fuses only the claim
+    clusters they touch.
+    """
+    from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+    
+    console.print("[bold]Fusing new claims...[/bold]")
+    
+    result = IncrementalFusionJob(max_workers=workers).run()
+    
+    console.print(f"  New claims: {result.new_claims}")
+    console.print(f"  Groups re-fused: {result.groups}")
+    console.print(f"  Fused claims written: {result.fused_nodes} (replacing {result.replaced_nodes})")
+    console.print(f"  Conflicts resolved: {result.conflicts_resolved}, unresolved: {result.unresolved_conflicts}")
+
+
 @main.command()
 @click.argument("query_text")
 @click.option("--time", type=str, help="Time range filter (e.g., 'last 7 days')")
@@ -58,6 +58,12 @@ class PipelineConfig:
     
     offline_mode: bool = False
     cache_enabled: bool = True
+    cache_max_bytes: int = 20 * 1024 * 1024 * 1024  # 20GB artifact store budget
+    cache_web_pages: bool = False  # Keep fetched pages in the artifact store
+    llm_cache_max_bytes: int = 1024 * 1024 * 1024  # 1GB LLM response cache budget
+    llm_cache_ttl_seconds: int = 30 * 24 * 3600  # 30 days
+    link_cache_ttl_seconds: int = 30 * 24 * 3600  # Ontology links, 30 days
+    link_cache_nil_ttl_seconds: int = 7 * 24 * 3600  # NIL results, 7 days
     max_workers: int = 4
     seed: int | None = None  # For reproducibility
 
@@ -147,6 +153,14 @@ class Config:
             config.pipeline = PipelineConfig(
                 offline_mode=p_data.get("offline_mode", config.pipeline.offline_mode),
                 cache_enabled=p_data.get("cache_enabled", config.pipeline.cache_enabled),
+                cache_max_bytes=p_data.get("cache_max_bytes", config.pipeline.cache_max_bytes),
+                cache_web_pages=p_data.get("cache_web_pages", config.pipeline.cache_web_pages),
+                llm_cache_max_bytes=p_data.get("llm_cache_max_bytes", config.pipeline.llm_cache_max_bytes),
+                llm_cache_ttl_seconds=p_data.get("llm_cache_ttl_seconds", config.pipeline.llm_cache_ttl_seconds),
+                link_cache_ttl_seconds=p_data.get("link_cache_ttl_seconds", config.pipeline.link_cache_ttl_seconds),
+                link_cache_nil_ttl_seconds=p_data.get(
+                    "link_cache_nil_ttl_seconds", config.pipeline.link_cache_nil_ttl_seconds
+                ),
                 max_workers=p_data.get("max_workers", config.pipeline.max_workers),
                 seed=p_data.get("seed"),
             )
@@ -180,6 +194,12 @@ class Config:
             "pipeline": {
                 "offline_mode": self.pipeline.offline_mode,
                 "cache_enabled": self.pipeline.cache_enabled,
+                "cache_max_bytes": self.pipeline.cache_max_bytes,
+                "cache_web_pages": self.pipeline.cache_web_pages,
+                "llm_cache_max_bytes": self.pipeline.llm_cache_max_bytes,
+                "llm_cache_ttl_seconds": self.pipeline.llm_cache_ttl_seconds,
+                "link_cache_ttl_seconds": self.pipeline.link_cache_ttl_seconds,
+                "link_cache_nil_ttl_seconds": self.pipeline.link_cache_nil_ttl_seconds,
                 "max_workers": self.pipeline.max_workers,
                 "seed": self.pipeline.seed,
             },
@@ -15,6 +15,8 @@ from inception.db.keys import (
     decode_temporal_key,
 )
 from inception.db.graphtag import compute_graphtag, graphtag_to_bytes, bytes_to_graphtag
+from inception.db.intervals import IntervalIndex
+from inception.db.lru import LRUIndex
 from inception.db.records import (
     SourceRecord,
     ArtifactRecord,
@@ -39,6 +41,10 @@ __all__ = [
     "compute_graphtag",
     "graphtag_to_bytes",
     "bytes_to_graphtag",
+    # Intervals
+    "IntervalIndex",
+    # LRU
+    "LRUIndex",
     # Records
     "SourceRecord",
     "ArtifactRecord",
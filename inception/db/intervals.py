@@ -0,0 +1,568 @@
+"""
+Interval index for validity ranges.
+
+`IntervalIndex` is built from centered interval trees: each node keeps
+the intervals containing its center point sorted by start and by end,
+so a point query walks one root-to-leaf path and reads off matches
+without testing non-matches. Unbounded ends are -inf/+inf.
+
+For LMDB, validity ranges are stored in their own database, keyed by
+start so they load in order:
+
+    b"S" + start (8) + item id       ->  end (8)
+    b"I" + item id                   ->  start (8) + end (8)
+    b"M" + level (1) + bucket (8)    ->  max end (8)
+    b"#gen"                          ->  write generation (8)
+    b"#count"                        ->  number of ranges (8)
+
+The "I" entries let an update remove the old range, and the generation
+tells readers when a loaded index is out of date. The "M" entries make
+the database queryable in place: level l groups starts into buckets of
+2^(22 + 6l) ms and keeps the latest end in each, so `query_validity`
+only descends into buckets holding a range that reaches the query.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+import struct
+from bisect import bisect_right
+from datetime import datetime, timezone
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+VALIDITY_DB = b"validity"
+
+_START_PREFIX = b"S"
+_ITEM_PREFIX = b"I"
+_MAX_PREFIX = b"M"
+_GENERATION_KEY = b"#gen"
+_COUNT_KEY = b"#count"
+
+# Start buckets of the max-end summaries: leaves span 2^22 ms (about
+# 70 minutes), each level up 64 times more, so 7 levels cover all
+# 64-bit starts with at most 64 buckets at the top
+_LEAF_SHIFT = 22
+_FANOUT_BITS = 6
+_LEVELS = 7
+
+# Offset so negative milliseconds sort before positive ones (as in
+# encode_temporal_key); 0 and 2^64 - 1 stand for unbounded
+_OFFSET = 1 << 63
+_UNBOUNDED_START = 0
+_UNBOUNDED_END = (1 << 64) - 1
+
+
+class IntervalIndex(Generic[T]):
+    """
+    Closed intervals answering point and range queries in O(log^2 n + k).
+    
+    Additions are absorbed incrementally with the logarithmic method:
+    the intervals are split into trees of distinct power-of-two-ish
+    sizes, and a new tree merges only the smaller ones, like carrying
+    in a binary counter. Each interval is rebuilt O(log n) times in
+    total, so interleaving additions and queries never rebuilds the
+    whole index per query.
+    
+    Example:
+        index = IntervalIndex()
+        index.add(0, 10, "a")
+        index.add(5, None, "b")
+        index.at(7)  # ["a", "b"] in some order
+    """
+    
+    def __init__(self, intervals: Iterable[tuple[float | None, float | None, T]] = ()):
+        """
+        Create an index.
+        
+        Args:
+            intervals: (start, end, item) triples; None is unbounded
+        """
+        self._trees: list[_CenteredTree[T]] = []  # Decreasing sizes
+        self._pending: list[tuple[float, float, T]] = []
+        
+        for start, end, item in intervals:
+            self.add(start, end, item)
+    
+    def __len__(self) -> int:
+        return sum(len(tree) for tree in self._trees) + len(self._pending)
+    
+    def add(self, start: float | None, end: float | None, item: T) -> None:
+        """Add an interval (None is unbounded)."""
+        self._pending.append((
+            -math.inf if start is None else start,
+            math.inf if end is None else end,
+            item,
+        ))
+    
+    def at(self, point: float) -> list[T]:
+        """Items whose interval contains a point."""
+        self._flush()
+        
+        found: list[T] = []
+        for tree in self._trees:
+            tree.at(point, found)
+        return found
+    
+    def overlapping(self, lo: float, hi: float) -> list[T]:
+        """Items whose interval overlaps [lo, hi]."""
+        if hi < lo:
+            return []
+        
+        self._flush()
+        
+        found: list[T] = []
+        for tree in self._trees:
+            tree.overlapping(lo, hi, found)
+        return found
+    
+    def _flush(self) -> None:
+        """Build the pending intervals into a tree, merging smaller trees."""
+        if not self._pending:
+            return
+        
+        intervals = self._pending
+        self._pending = []
+        while self._trees and len(self._trees[-1]) <= len(intervals):
+            intervals = self._trees.pop().intervals + intervals
+        self._trees.append(_CenteredTree(intervals))
+
+
+class _CenteredTree(Generic[T]):
+    """Static centered interval tree over (start, end, item) triples."""
+    
+    def __init__(self, intervals: list[tuple[float, float, T]]):
+        self.intervals = intervals
+        
+        ordered = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        self._starts = [intervals[i][0] for i in ordered]
+        self._start_items = [intervals[i][2] for i in ordered]
+        
+        self._centers: list[float] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._by_start: list[tuple[list[float], list[T]]] = []
+        self._by_end: list[tuple[list[float], list[T]]] = []
+        
+        if ordered:
+            # (members, parent node, is right child); members stay sorted by start
+            stack: list[tuple[list[int], int, bool]] = [(ordered, -1, False)]
+            while stack:
+                members, parent, is_right = stack.pop()
+                node = self._add_node(members, stack)
+                if parent >= 0:
+                    (self._right if is_right else self._left)[parent] = node
+    
+    def __len__(self) -> int:
+        return len(self.intervals)
+    
+    def at(self, point: float, found: list[T]) -> None:
+        """Append items whose interval contains a point."""
+        node = 0 if self._centers else -1
+        while node >= 0:
+            center = self._centers[node]
+            if point < center:
+                starts, items = self._by_start[node]
+                found.extend(items[:bisect_right(starts, point)])
+                node = self._left[node]
+            elif point > center:
+                neg_ends, items = self._by_end[node]
+                found.extend(items[:bisect_right(neg_ends, -point)])
+                node = self._right[node]
+            else:
+                found.extend(self._by_start[node][1])
+                break
+    
+    def overlapping(self, lo: float, hi: float, found: list[T]) -> None:
+        """Append items whose interval overlaps [lo, hi]."""
+        # Those containing lo, plus those starting in (lo, hi]
+        self.at(lo, found)
+        first = bisect_right(self._starts, lo)
+        last = bisect_right(self._starts, hi)
+        found.extend(self._start_items[first:last])
+    
+    def _add_node(self, members: list[int], stack: list) -> int:
+        """Create a node for members, pushing its children to build."""
+        intervals = self.intervals
+        
+        # The median endpoint is an endpoint of some member, so at
+        # least one member contains it and every node makes progress
+        endpoints = sorted(
+            p for i in members for p in intervals[i][:2] if not math.isinf(p)
+        )
+        center = endpoints[len(endpoints) // 2] if endpoints else 0.0
+        
+        left, right, here = [], [], []
+        for i in members:
+            start, end, _ = intervals[i]
+            if end < center:
+                left.append(i)
+            elif start > center:
+                right.append(i)
+            else:
+                here.append(i)
+        
+        node = len(self._centers)
+        self._centers.append(center)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._by_start.append((
+            [intervals[i][0] for i in here],
+            [intervals[i][2] for i in here],
+        ))
+        by_end = sorted(here, key=lambda i: -intervals[i][1])
+        self._by_end.append((
+            [-intervals[i][1] for i in by_end],
+            [intervals[i][2] for i in by_end],
+        ))
+        
+        if left:
+            stack.append((left, node, False))
+        if right:
+            stack.append((right, node, True))
+        return node
+
+
+# === LMDB persistence ===
+
+_REDUCED_DATE = re.compile(r"[+-]?\d{4}(-\d{2})?")
+
+def to_epoch_ms(value: datetime | str | int | float | None) -> int | None:
+    """
+    Convert a timestamp to milliseconds since the epoch.
+    
+    Accepts datetimes, ISO 8601 strings (a trailing "Z" and a bare
+    year or year-month are allowed) and numbers of milliseconds. Naive
+    datetimes are taken as UTC.
+    
+    Returns:
+        Milliseconds, or None for None or an empty string
+    
+    Raises:
+        ValueError: If a string is not an ISO 8601 date
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if _REDUCED_DATE.fullmatch(value):
+            # ISO 8601 reduced precision ("2020", "2020-05"): the first instant
+            value = (value + "-01-01")[:10]
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def validity_bound(value: datetime | str | int | float | None, item: Any = None) -> int | None:
+    """
+    Like `to_epoch_ms`, but an unparseable value is logged and taken as
+    unbounded, so one bad date can't fail every query or write.
+    """
+    try:
+        return to_epoch_ms(value)
+    except (TypeError, ValueError, OverflowError):
+        logger.warning(f"Ignoring unparseable validity bound {value!r} of {item!r}")
+        return None
+
+
+def _pack_start(start_ms: int | None) -> bytes:
+    return struct.pack(">Q", _UNBOUNDED_START if start_ms is None else start_ms + _OFFSET)
+
+
+def _pack_end(end_ms: int | None) -> bytes:
+    return struct.pack(">Q", _UNBOUNDED_END if end_ms is None else end_ms + _OFFSET)
+
+
+def _unpack(packed: bytes, unbounded: int, infinity: float) -> float:
+    (value,) = struct.unpack(">Q", packed)
+    return infinity if value == unbounded else value - _OFFSET
+
+
+def put_validity(
+    txn: Any,
+    db: Any,
+    item_id: bytes,
+    valid_from: datetime | str | int | None,
+    valid_until: datetime | str | int | None,
+) -> None:
+    """
+    Record (or replace) an item's validity range.
+    
+    Unparseable bounds are logged and stored as unbounded.
+    
+    Args:
+        txn: LMDB write transaction
+        db: The validity database handle
+        item_id: Item key, e.g. the entity id
+        valid_from: Start of validity (None is unbounded)
+        valid_until: End of validity (None is unbounded)
+    """
+    replaced = _remove(txn, db, item_id)
+    
+    start = _pack_start(validity_bound(valid_from, item_id))
+    end = _pack_end(validity_bound(valid_until, item_id))
+    txn.put(_START_PREFIX + start + item_id, end, db=db)
+    txn.put(_ITEM_PREFIX + item_id, start + end, db=db)
+    _raise_max(txn, db, struct.unpack(">Q", start)[0], end)
+    if not replaced:
+        _add_count(txn, db, 1)
+    _bump_generation(txn, db)
+
+
+def delete_validity(txn: Any, db: Any, item_id: bytes) -> bool:
+    """Remove an item's validity range, returning whether it had one."""
+    if not _remove(txn, db, item_id):
+        return False
+    
+    _add_count(txn, db, -1)
+    _bump_generation(txn, db)
+    return True
+
+
+def _remove(txn: Any, db: Any, item_id: bytes) -> bool:
+    existing = txn.get(_ITEM_PREFIX + item_id, db=db)
+    if existing is None:
+        return False
+    
+    txn.delete(_START_PREFIX + existing[:8] + item_id, db=db)
+    txn.delete(_ITEM_PREFIX + item_id, db=db)
+    _lower_max(txn, db, struct.unpack(">Q", existing[:8])[0], existing[8:])
+    return True
+
+
+def has_validity(txn: Any, db: Any, item_id: bytes) -> bool:
+    """Whether an item has a stored range."""
+    return txn.get(_ITEM_PREFIX + item_id, db=db) is not None
+
+
+def validity_ids(txn: Any, db: Any) -> Iterator[bytes]:
+    """Ids of every item with a stored range."""
+    cursor = txn.cursor(db=db)
+    if cursor.set_range(_ITEM_PREFIX):
+        for key in cursor.iternext(values=False):
+            if not key.startswith(_ITEM_PREFIX):
+                break
+            yield key[1:]
+
+
+def validity_generation(txn: Any, db: Any) -> int:
+    """Write generation of the validity database (0 if never written)."""
+    value = txn.get(_GENERATION_KEY, db=db)
+    return struct.unpack(">Q", value)[0] if value else 0
+
+
+def validity_count(txn: Any, db: Any) -> int | None:
+    """
+    Number of stored ranges, or None if the database predates the
+    count and max-end summaries (see `rebuild_validity_summaries`).
+    """
+    value = txn.get(_COUNT_KEY, db=db)
+    return struct.unpack(">Q", value)[0] if value else None
+
+
+def _bump_generation(txn: Any, db: Any) -> None:
+    txn.put(_GENERATION_KEY, struct.pack(">Q", validity_generation(txn, db) + 1), db=db)
+
+
+def _add_count(txn: Any, db: Any, delta: int) -> None:
+    count = validity_count(txn, db) or 0
+    txn.put(_COUNT_KEY, struct.pack(">Q", max(count + delta, 0)), db=db)
+
+
+def _shift(level: int) -> int:
+    return _LEAF_SHIFT + level * _FANOUT_BITS
+
+
+def _max_key(level: int, bucket: int) -> bytes:
+    return _MAX_PREFIX + bytes([level]) + struct.pack(">Q", bucket)
+
+
+def _raise_max(txn: Any, db: Any, start: int, end: bytes) -> None:
+    """Account for a new range in the summaries of its start buckets."""
+    for level in range(_LEVELS):
+        key = _max_key(level, start >> _shift(level))
+        current = txn.get(key, db=db)
+        if current is not None and current >= end:
+            break  # Ancestors cover at least as much
+        txn.put(key, end, db=db)
+
+
+def _lower_max(txn: Any, db: Any, start: int, end: bytes) -> None:
+    """Recompute the summaries a removed range may have defined."""
+    for level in range(_LEVELS):
+        bucket = start >> _shift(level)
+        key = _max_key(level, bucket)
+        if txn.get(key, db=db) != end:
+            break  # Another range holds the maximum here and above
+        
+        new = _bucket_max(txn, db, level, bucket)
+        if new is None:
+            txn.delete(key, db=db)
+        else:
+            txn.put(key, new, db=db)
+            if new == end:
+                break
+
+
+def _bucket_max(txn: Any, db: Any, level: int, bucket: int) -> bytes | None:
+    """Latest end in a bucket, from its ranges (leaves) or child summaries."""
+    if level == 0:
+        prefix = _START_PREFIX
+        first = _START_PREFIX + struct.pack(">Q", bucket << _LEAF_SHIFT)
+        last = struct.pack(">Q", ((bucket + 1) << _LEAF_SHIFT) - 1)
+        key_bound = slice(1, 9)
+    else:
+        prefix = _MAX_PREFIX + bytes([level - 1])
+        first = prefix + struct.pack(">Q", bucket << _FANOUT_BITS)
+        last = struct.pack(">Q", ((bucket + 1) << _FANOUT_BITS) - 1)
+        key_bound = slice(2, 10)
+    
+    found = None
+    cursor = txn.cursor(db=db)
+    if cursor.set_range(first):
+        for key, end in cursor:
+            if not key.startswith(prefix) or key[key_bound] > last:
+                break
+            if found is None or end > found:
+                found = end
+    return found
+
+
+def rebuild_validity_summaries(txn: Any, db: Any) -> int:
+    """
+    Recompute the count and max-end summaries from the stored ranges
+    (for databases written before they existed).
+    
+    Returns:
+        Number of ranges
+    """
+    cursor = txn.cursor(db=db)
+    stale = []
+    if cursor.set_range(_MAX_PREFIX):
+        for key in cursor.iternext(values=False):
+            if not key.startswith(_MAX_PREFIX):
+                break
+            stale.append(key)
+    for key in stale:
+        txn.delete(key, db=db)
+    
+    ranges = []
+    if cursor.set_range(_START_PREFIX):
+        for key, end in cursor:
+            if not key.startswith(_START_PREFIX):
+                break
+            ranges.append((struct.unpack(">Q", key[1:9])[0], end))
+    for start, end in ranges:
+        _raise_max(txn, db, start, end)
+    
+    txn.put(_COUNT_KEY, struct.pack(">Q", len(ranges)), db=db)
+    return len(ranges)
+
+
+def query_validity(
+    txn: Any,
+    db: Any,
+    lo_ms: int | None,
+    hi_ms: int | None,
+) -> Iterator[bytes]:
+    """
+    Ids of items whose range overlaps [lo_ms, hi_ms], read in place.
+    
+    Walks the max-end summaries from the top level down, skipping
+    buckets that start after `hi_ms` or whose latest end is before
+    `lo_ms`, and scans only the leaf buckets left. Nested and
+    unbounded ranges are handled; cost grows with the matches plus the
+    ranges sharing a leaf bucket with them.
+    
+    Args:
+        txn: LMDB read transaction
+        db: The validity database handle
+        lo_ms: Start of the query (None is unbounded)
+        hi_ms: End of the query (None is unbounded)
+    
+    Yields:
+        Item ids in order of range start
+    """
+    if lo_ms is not None and hi_ms is not None and hi_ms < lo_ms:
+        return
+    
+    lo = _pack_start(lo_ms)
+    hi = struct.unpack(">Q", _pack_end(hi_ms))[0]
+    top = _LEVELS - 1
+    yield from _search(txn, db, top, 0, hi >> _shift(top), lo, hi)
+
+
+def _search(
+    txn: Any, db: Any, level: int, first: int, last: int, lo: bytes, hi: int
+) -> Iterator[bytes]:
+    """Yield matches from buckets first..last of a level."""
+    prefix = _MAX_PREFIX + bytes([level])
+    cursor = txn.cursor(db=db)
+    if not cursor.set_range(prefix + struct.pack(">Q", first)):
+        return
+    
+    for key, max_end in cursor:
+        if not key.startswith(prefix):
+            break
+        bucket = struct.unpack(">Q", key[2:])[0]
+        if bucket > last:
+            break
+        if max_end < lo:
+            continue
+        
+        if level == 0:
+            yield from _scan_leaf(txn, db, bucket, lo, hi)
+        else:
+            child_first = bucket << _FANOUT_BITS
+            child_last = min(child_first + (1 << _FANOUT_BITS) - 1, hi >> _shift(level - 1))
+            yield from _search(txn, db, level - 1, child_first, child_last, lo, hi)
+
+
+def _scan_leaf(txn: Any, db: Any, bucket: int, lo: bytes, hi: int) -> Iterator[bytes]:
+    """Yield the ranges of a leaf bucket that start by `hi` and end after `lo`."""
+    first = bucket << _LEAF_SHIFT
+    last = min(first + (1 << _LEAF_SHIFT) - 1, hi)
+    cursor = txn.cursor(db=db)
+    if not cursor.set_range(_START_PREFIX + struct.pack(">Q", first)):
+        return
+    
+    for key, end in cursor:
+        if not key.startswith(_START_PREFIX) or struct.unpack(">Q", key[1:9])[0] > last:
+            break
+        if end >= lo:
+            yield key[9:]
+
+
+def load_validity_index(txn: Any, db: Any) -> IntervalIndex[bytes]:
+    """
+    Load every stored range into an index of item ids (times in ms).
+    
+    Args:
+        txn: LMDB read transaction
+        db: The validity database handle
+    
+    Returns:
+        IntervalIndex of item ids
+    """
+    index: IntervalIndex[bytes] = IntervalIndex()
+    
+    cursor = txn.cursor(db=db)
+    if cursor.set_range(_START_PREFIX):
+        for key, value in cursor:
+            if not key.startswith(_START_PREFIX):
+                break
+            index.add(
+                _unpack(key[1:9], _UNBOUNDED_START, -math.inf),
+                _unpack(value, _UNBOUNDED_END, math.inf),
+                key[9:],
+            )
+    
+    return index
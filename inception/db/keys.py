@@ -71,6 +71,7 @@ class NodeKind(IntEnum):
     QUESTION = 7
     GAP = 8
     SIGN = 9  # Semiotic sign
+    FUSED_CLAIM = 10  # Claim fused from corroborating claims
 
 
 class SourceType(IntEnum):
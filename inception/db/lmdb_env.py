@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import threading
 from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Iterator, Generator
+from typing import Any, Iterable, Iterator, Generator
 
 import lmdb
+import msgpack
 
 from inception.config import Config, get_config
 from inception.db.keys import (
@@ -53,6 +55,12 @@ DB_GT2NID = b"gt2nid"
 DB_TINDEX = b"tindex"
 DB_PINDEX = b"pindex"
 
+# DB_META key prefix for per-feed ingestion watermarks
+WATERMARK_PREFIX = b"watermark:"
+
+# DB_META key prefix for per-site crawl validators
+CRAWL_PREFIX = b"crawl:"
+
 ALL_DBS = [DB_META, DB_SRC, DB_ART, DB_SPAN, DB_NODE, DB_EDGE, DB_GT2NID, DB_TINDEX, DB_PINDEX]
 
 
@@ -161,8 +169,6 @@ class InceptionDB:
     
     def update_meta(self, **kwargs) -> MetaRecord:
         """Update metadata fields."""
-        from datetime import datetime
-        
         with self.env.begin(write=True) as txn:
             db = self._dbs[DB_META]
             data = txn.get(b"config", db=db)
@@ -176,6 +182,83 @@ class InceptionDB:
             txn.put(b"config", meta.pack(), db=db)
             return meta
     
+    def put_watermark(
+        self,
+        feed_uri: str,
+        watermark: str,
+        timestamp: datetime | None = None,
+        txn: lmdb.Transaction | None = None,
+    ) -> None:
+        """Persist the ingestion watermark for a feed (channel, playlist, site)."""
+        key = WATERMARK_PREFIX + feed_uri.encode("utf-8")
+        value = msgpack.packb({
+            "watermark": watermark,
+            "timestamp": (timestamp or datetime.utcnow()).isoformat(),
+        })
+        
+        def _put(t: lmdb.Transaction) -> None:
+            t.put(key, value, db=self._dbs[DB_META])
+        
+        if txn:
+            _put(txn)
+        else:
+            with self.write_txn() as t:
+                _put(t)
+    
+    def get_watermark(
+        self,
+        feed_uri: str,
+        txn: lmdb.Transaction | None = None,
+    ) -> dict | None:
+        """Get the persisted watermark for a feed as {'watermark', 'timestamp'}."""
+        key = WATERMARK_PREFIX + feed_uri.encode("utf-8")
+        
+        def _get(t: lmdb.Transaction) -> dict | None:
+            data = t.get(key, db=self._dbs[DB_META])
+            if data is None:
+                return None
+            record = msgpack.unpackb(data)
+            return {
+                "watermark": record["watermark"],
+                "timestamp": datetime.fromisoformat(record["timestamp"]),
+            }
+        
+        if txn:
+            return _get(txn)
+        with self.read_txn() as t:
+            return _get(t)
+    
+    def put_crawl_validators(
+        self,
+        site_uri: str,
+        validators: dict[str, dict[str, Any]],
+        txn: lmdb.Transaction | None = None,
+    ) -> None:
+        """Persist a site crawl's validators (URL -> etag, last_modified, links)."""
+        key = CRAWL_PREFIX + site_uri.encode("utf-8")
+        value = msgpack.packb(validators)
+        
+        if txn:
+            txn.put(key, value, db=self._dbs[DB_META])
+        else:
+            with self.write_txn() as t:
+                t.put(key, value, db=self._dbs[DB_META])
+    
+    def get_crawl_validators(
+        self,
+        site_uri: str,
+        txn: lmdb.Transaction | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get the validators persisted by the last crawl of a site (empty if none)."""
+        key = CRAWL_PREFIX + site_uri.encode("utf-8")
+        
+        if txn:
+            data = txn.get(key, db=self._dbs[DB_META])
+        else:
+            with self.read_txn() as t:
+                data = t.get(key, db=self._dbs[DB_META])
+        return msgpack.unpackb(data) if data else {}
+    
     # === Source operations ===
     
     def put_source(self, source: SourceRecord, txn: lmdb.Transaction | None = None) -> None:
@@ -341,8 +424,13 @@ class InceptionDB:
         with self.read_txn() as t:
             return _get(t)
     
-    def iter_nodes(self, reverse: bool = False, txn: lmdb.Transaction | None = None) -> Iterator[NodeRecord]:
-        """Iterate over all node records."""
+    def iter_nodes(
+        self,
+        reverse: bool = False,
+        txn: lmdb.Transaction | None = None,
+        after_nid: int | None = None,
+    ) -> Iterator[NodeRecord]:
+        """Iterate over node records in NID order (only those after `after_nid` if given)."""
         def _iter(t: lmdb.Transaction) -> Iterator[NodeRecord]:
             cursor = t.cursor(self._dbs[DB_NODE])
             if reverse:
@@ -350,6 +438,10 @@ class InceptionDB:
                     yield NodeRecord.unpack(cursor.value())
                     while cursor.prev():
                         yield NodeRecord.unpack(cursor.value())
+            elif after_nid is not None:
+                if cursor.set_range(encode_nid_key(after_nid + 1)):
+                    for _, value in cursor:
+                        yield NodeRecord.unpack(value)
             else:
                 for _, value in cursor:
                     yield NodeRecord.unpack(value)
@@ -360,6 +452,18 @@ class InceptionDB:
             with self.read_txn() as t:
                 yield from _iter(t)
     
+    def delete_node(self, nid: int, txn: lmdb.Transaction | None = None) -> bool:
+        """Delete a node record; returns whether it existed."""
+        key = encode_nid_key(nid)
+        
+        def _delete(t: lmdb.Transaction) -> bool:
+            return t.delete(key, db=self._dbs[DB_NODE])
+        
+        if txn:
+            return _delete(txn)
+        with self.write_txn() as t:
+            return _delete(t)
+    
     # === Edge operations ===
     
     def put_edge(
@@ -382,6 +486,37 @@ class InceptionDB:
             with self.write_txn() as t:
                 _put(t)
     
+    def put_edges(
+        self,
+        edges: Iterable[tuple[int, EdgeType, int, EdgeRecord]],
+        txn: lmdb.Transaction | None = None,
+    ) -> int:
+        """
+        Store many edge records in one cursor pass.
+        
+        Args:
+            edges: (from_nid, edge_type, to_nid, edge) tuples
+            txn: Write transaction (one is opened if not given)
+        
+        Returns:
+            Number of edges written
+        """
+        items = sorted(
+            (encode_edge_key(from_nid, edge_type, to_nid), edge.pack())
+            for from_nid, edge_type, to_nid, edge in edges
+        )
+        
+        def _put(t: lmdb.Transaction) -> int:
+            if not items:
+                return 0
+            t.cursor(self._dbs[DB_EDGE]).putmulti(items)
+            return len(items)
+        
+        if txn:
+            return _put(txn)
+        with self.write_txn() as t:
+            return _put(t)
+    
     def get_edge(
         self,
         from_nid: int,
@@ -401,6 +536,24 @@ class InceptionDB:
         with self.read_txn() as t:
             return _get(t)
     
+    def delete_edge(
+        self,
+        from_nid: int,
+        edge_type: EdgeType,
+        to_nid: int,
+        txn: lmdb.Transaction | None = None,
+    ) -> bool:
+        """Delete an edge record; returns whether it existed."""
+        key = encode_edge_key(from_nid, edge_type, to_nid)
+        
+        def _delete(t: lmdb.Transaction) -> bool:
+            return t.delete(key, db=self._dbs[DB_EDGE])
+        
+        if txn:
+            return _delete(txn)
+        with self.write_txn() as t:
+            return _delete(t)
+    
     def get_edges_from(
         self,
         from_nid: int,
@@ -467,6 +620,35 @@ class InceptionDB:
         with self.read_txn() as t:
             return _get(t)
     
+    def get_nids_by_graphtags(
+        self,
+        graphtags: list[str],
+        txn: lmdb.Transaction | None = None,
+    ) -> dict[str, tuple[ObjectType, int]]:
+        """
+        Look up many graphtags at once.
+        
+        Keys are probed in sorted order with a single cursor, so
+        neighbouring lookups hit the same B-tree pages.
+        
+        Returns:
+            Dict of graphtag -> (ObjectType, NID) for graphtags that exist
+        """
+        keys = sorted({graphtag_to_bytes(gt): gt for gt in graphtags}.items())
+        
+        def _get(t: lmdb.Transaction) -> dict[str, tuple[ObjectType, int]]:
+            found: dict[str, tuple[ObjectType, int]] = {}
+            cursor = t.cursor(self._dbs[DB_GT2NID])
+            for key, graphtag in keys:
+                if cursor.set_key(key):
+                    found[graphtag] = decode_gt2nid_value(cursor.value())
+            return found
+        
+        if txn:
+            return _get(txn)
+        with self.read_txn() as t:
+            return _get(t)
+    
     # === Statistics ===
     
     def stats(self) -> dict[str, int]:
@@ -0,0 +1,127 @@
+"""
+LRU bookkeeping for size-bounded LMDB stores.
+
+`LRUIndex` keeps access order and a running byte total in two
+sub-databases next to a store's own entries:
+
+    lru:    last_access (ms, big-endian) + key  ->  b""
+    state:  b"lru_clock"                          ->  last clock value (8)
+            b"total_bytes"                        ->  stored size (8)
+
+The store records each entry's `last_access` clock value alongside the
+entry itself, so an entry can be moved or removed without a scan. All
+methods run inside the caller's transaction.
+"""
+
+from __future__ import annotations
+
+import struct
+import time
+from typing import Callable
+
+import lmdb
+
+LRU_DB = b"lru"
+STATE_DB = b"state"
+
+_CLOCK_KEY = b"lru_clock"
+_TOTAL_KEY = b"total_bytes"
+
+
+def _pack(value: int) -> bytes:
+    return struct.pack(">Q", value)
+
+
+def _unpack(raw: bytes | None) -> int:
+    return struct.unpack(">Q", raw)[0] if raw else 0
+
+
+class LRUIndex:
+    """Access order and size total for the entries of one LMDB store."""
+    
+    def __init__(self, env: lmdb.Environment, txn: lmdb.Transaction):
+        """
+        Open (or create) the index sub-databases.
+        
+        Args:
+            env: Store environment (needs two spare named databases)
+            txn: Write transaction to create them in
+        """
+        self._lru = env.open_db(LRU_DB, txn=txn, create=True)
+        self._state = env.open_db(STATE_DB, txn=txn, create=True)
+    
+    def touch(self, txn: lmdb.Transaction, key: bytes, last_access: int = 0) -> int:
+        """
+        Move an entry to the most-recently-used end.
+        
+        Args:
+            txn: Write transaction
+            key: Entry key
+            last_access: The entry's previous clock value (0 if new)
+        
+        Returns:
+            The entry's new clock value, to store with it
+        """
+        if last_access:
+            txn.delete(_pack(last_access) + key, db=self._lru)
+        
+        # Strictly increasing across entries so LRU order never ties
+        now = max(int(time.time() * 1000), _unpack(txn.get(_CLOCK_KEY, db=self._state)) + 1)
+        txn.put(_CLOCK_KEY, _pack(now), db=self._state)
+        txn.put(_pack(now) + key, b"", db=self._lru)
+        return now
+    
+    def forget(self, txn: lmdb.Transaction, key: bytes, last_access: int, size: int) -> None:
+        """Drop a removed entry from the order and the size total."""
+        if last_access:
+            txn.delete(_pack(last_access) + key, db=self._lru)
+        self.add_total(txn, -size)
+    
+    def add_total(self, txn: lmdb.Transaction, delta: int) -> None:
+        """Adjust the running size total."""
+        txn.put(_TOTAL_KEY, _pack(max(self.total(txn) + delta, 0)), db=self._state)
+    
+    def total(self, txn: lmdb.Transaction) -> int:
+        """Total size of the stored entries."""
+        return _unpack(txn.get(_TOTAL_KEY, db=self._state))
+    
+    def victims(
+        self,
+        txn: lmdb.Transaction,
+        target_bytes: int,
+        size_of: Callable[[bytes], int | None],
+        keep: bytes | None = None,
+    ) -> list[bytes]:
+        """
+        Least recently used keys to remove to get down to `target_bytes`.
+        
+        Args:
+            txn: Transaction to read in
+            target_bytes: Size to shrink to
+            size_of: Size of an entry by key (None if it no longer exists)
+            keep: Key never to choose
+        
+        Returns:
+            Keys in LRU order
+        """
+        total = self.total(txn)
+        victims = []
+        
+        for lru_key, _ in txn.cursor(self._lru):
+            if total <= target_bytes:
+                break
+            key = lru_key[8:]
+            if key == keep:
+                continue
+            size = size_of(key)
+            if size is None:
+                continue
+            total -= size
+            victims.append(key)
+        
+        return victims
+    
+    def clear(self, txn: lmdb.Transaction) -> None:
+        """Forget all entries (the clock keeps running)."""
+        txn.drop(self._lru, delete=False)
+        txn.put(_TOTAL_KEY, _pack(0), db=self._state)
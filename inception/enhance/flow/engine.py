@@ -6,8 +6,9 @@ It handles state management, node execution, and GRPO trajectory recording.
 """
 
 import asyncio
+import json
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List
 from datetime import datetime
 
 from inception.enhance.flow.schema import (
@@ -15,16 +16,42 @@ from inception.enhance.flow.schema import (
     FlowTrajectory, FlowRole
 )
 
+from inception.enhance.llm.providers import LLMProvider
+
 logger = logging.getLogger(__name__)
 
+PLANNER_PROMPT = """You are planning step "{step}" of the flow "{flow}": {description}
+
+Context:
+{context}
+
+Respond with a JSON object of the form {{"plan": "<short plan>"}}."""
+
+GENERATOR_PROMPT = """You are producing the final output of the flow "{flow}" ({description}).
+
+Context:
+{context}
+
+Write the final output."""
+
 class FlowRunner:
     """Executes a FlowSpec with optimization hooks."""
     
-    def __init__(self, spec: FlowSpec, grpo_callback: Callable[[FlowTrajectory], None] | None = None):
+    def __init__(
+        self,
+        spec: FlowSpec,
+        grpo_callback: Callable[[FlowTrajectory], None] | None = None,
+        provider: LLMProvider | None = None,
+    ):
         self.spec = spec
         self.steps_map = {s.name: s for s in spec.steps}
         self.grpo_callback = grpo_callback
-        
+        self.provider = provider  # LLM for planner/generator steps (async calls)
+    
+    async def run_many(self, contexts: List[Dict[str, Any]]) -> List[FlowTrajectory]:
+        """Run the flow over many inputs concurrently (LLM calls are bounded by the provider's limiter)."""
+        return list(await asyncio.gather(*(self.run(c) for c in contexts)))
+    
     async def run(self, input_context: Dict[str, Any]) -> FlowTrajectory:
         """Execute the flow from entry point to completion."""
         trajectory = FlowTrajectory(flow_id=self.spec.id)
@@ -96,8 +123,14 @@ class FlowRunner:
         logger.debug(f"Executing {step.role}: {step.name}")
         
         if step.role == FlowRole.PLANNER:
-            # TODO: Invoke LLM to plan/refine
-            return {"plan": "execute_default"}
+            if self.provider is None:
+                return {"plan": "execute_default"}
+            return await self.provider.acomplete_json(PLANNER_PROMPT.format(
+                step=step.name,
+                flow=self.spec.id,
+                description=step.description,
+                context=json.dumps(state.context, default=str),
+            ))
             
         elif step.role == FlowRole.EXECUTOR:
             # TODO: Invoke Tool
@@ -110,7 +143,13 @@ class FlowRunner:
             return {"valid": True, "score": 0.9}
             
         elif step.role == FlowRole.GENERATOR:
-            # TODO: Synthesize final output
-            return "Final Output"
+            if self.provider is None:
+                return "Final Output"
+            response = await self.provider.acomplete(GENERATOR_PROMPT.format(
+                flow=self.spec.id,
+                description=step.description,
+                context=json.dumps(state.context, default=str),
+            ))
+            return response.content
             
         return None
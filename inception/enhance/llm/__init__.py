@@ -10,11 +10,27 @@ from inception.enhance.llm.providers import (
     OllamaProvider,
     OpenRouterProvider,
     CloudProvider,
+    RequestLimiter,
     get_provider,
+    get_async_client,
+    close_async_client,
+)
+from inception.enhance.llm.registry import (
+    CircuitBreaker,
+    ProviderRegistry,
+    get_provider_registry,
 )
 from inception.enhance.llm.extractor import (
     LLMExtractor,
     LLMExtractionResult,
+    TextChunk,
+    chunk_text,
+)
+from inception.enhance.llm.streaming import StreamingJSONParser
+from inception.enhance.llm.cache import (
+    LLMCacheStats,
+    LLMResponseCache,
+    get_llm_cache,
 )
 from inception.enhance.llm.prompts import (
     CLAIM_EXTRACTION_PROMPT,
@@ -27,9 +43,21 @@ __all__ = [
     "OllamaProvider",
     "OpenRouterProvider",
     "CloudProvider",
+    "RequestLimiter",
     "get_provider",
+    "get_async_client",
+    "close_async_client",
+    "CircuitBreaker",
+    "ProviderRegistry",
+    "get_provider_registry",
     "LLMExtractor",
     "LLMExtractionResult",
+    "TextChunk",
+    "chunk_text",
+    "StreamingJSONParser",
+    "LLMCacheStats",
+    "LLMResponseCache",
+    "get_llm_cache",
     "CLAIM_EXTRACTION_PROMPT",
     "ENTITY_EXTRACTION_PROMPT",
     "PROCEDURE_EXTRACTION_PROMPT",
@@ -0,0 +1,305 @@
+"""
+Persistent LLM response cache.
+
+Stores completions on disk keyed by an xxh128 hash of (provider, model,
+system prompt, prompt, temperature), so re-running extraction on
+unchanged text costs nothing. Entries expire after a TTL and the cache
+is kept under a size budget with LRU eviction. The index is an LMDB
+environment, safe to share between API workers and CLI processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import lmdb
+import msgpack
+
+from inception.config import get_config
+from inception.db.graphtag import compute_content_hash
+from inception.db.lru import LRUIndex
+from inception.enhance.llm.providers import LLMResponse
+
+
+# Cache sub-database (plus the LRUIndex order and size total)
+DB_RESP = b"resp"  # key -> {content, model, provider, tokens_used, cost_usd, size, expires_at, last_access}
+
+
+@dataclass
+class LLMCacheStats:
+    """Counters for cache effectiveness."""
+    
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    tokens_saved: int = 0
+    cost_saved: float = 0.0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    system: str | None,
+    prompt: str,
+    temperature: float = 0.0,
+) -> str:
+    """Hash the inputs that determine a completion into a cache key."""
+    data = msgpack.packb([provider, model, system or "", prompt, float(temperature)])
+    return compute_content_hash(data, algorithm="xxh128")
+
+
+class LLMResponseCache:
+    """
+    On-disk completion cache with TTL and LRU eviction.
+    
+    All updates (including the running size total) happen inside LMDB
+    write transactions, which LMDB serializes across threads and
+    processes. Lookups only read: hits are recorded in the LRU index in
+    batches, and always before this cache evicts, so the order is
+    approximate only between processes.
+    """
+    
+    TOUCH_BATCH = 64  # Hits recorded in the LRU index per write transaction
+    
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        max_bytes: int | None = None,
+        ttl_seconds: int | None = None,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Cache directory (default: <cache_dir>/llm)
+            max_bytes: Size budget for cached responses
+            ttl_seconds: Time-to-live for entries
+        """
+        config = get_config()
+        
+        self.path = Path(path) if path else config.cache_dir / "llm"
+        self.max_bytes = max_bytes or config.pipeline.llm_cache_max_bytes
+        self.ttl_seconds = ttl_seconds or config.pipeline.llm_cache_ttl_seconds
+        self.stats = LLMCacheStats()
+        
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.env = lmdb.open(
+            str(self.path),
+            map_size=max(2 * self.max_bytes, 64 * 1024 * 1024),
+            max_dbs=3,
+            create=True,
+        )
+        with self.env.begin(write=True) as txn:
+            self._dbs = {DB_RESP: self.env.open_db(DB_RESP, txn=txn, create=True)}
+            self._lru = LRUIndex(self.env, txn)
+        
+        self._lock = threading.Lock()
+        self._touched: dict[bytes, None] = {}  # Lookups not yet applied to the index
+    
+    def close(self) -> None:
+        """Close the cache."""
+        self.flush()
+        self.env.close()
+    
+    def __enter__(self) -> LLMResponseCache:
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        with self.env.begin() as txn:
+            return txn.stat(self._dbs[DB_RESP])["entries"]
+    
+    def get(self, key: str) -> LLMResponse | None:
+        """
+        Look up a cached response, marking it recently used.
+        
+        Runs in a read transaction. Hits join a batch recorded in the
+        LRU index by `flush`, and expired entries one removed by it.
+        
+        Returns:
+            The cached LLMResponse (with the original token and cost
+            figures), or None on a miss or expired entry
+        """
+        raw_key = key.encode()
+        
+        with self.env.begin() as txn:
+            raw = txn.get(raw_key, db=self._dbs[DB_RESP])
+        if raw is None:
+            self._count(misses=1)
+            return None
+        
+        entry = msgpack.unpackb(raw)
+        expired = entry["expires_at"] <= time.time()
+        
+        with self._lock:
+            self._touched.pop(raw_key, None)
+            self._touched[raw_key] = None
+            pending = len(self._touched)
+        if pending >= self.TOUCH_BATCH:
+            self.flush()
+        
+        if expired:
+            self._count(misses=1, expired=1)
+            return None
+        
+        self._count(hits=1, tokens_saved=entry["tokens_used"], cost_saved=entry["cost_usd"])
+        return LLMResponse(
+            content=entry["content"],
+            model=entry["model"],
+            provider=entry["provider"],
+            tokens_used=entry["tokens_used"],
+            cost_usd=entry["cost_usd"],
+        )
+    
+    def put(self, key: str, response: LLMResponse, ttl_seconds: int | None = None) -> None:
+        """Store a response (raw provider payloads are not kept)."""
+        raw_key = key.encode()
+        entry = {
+            "content": response.content,
+            "model": response.model,
+            "provider": response.provider,
+            "tokens_used": response.tokens_used,
+            "cost_usd": response.cost_usd,
+            "expires_at": time.time() + (ttl_seconds or self.ttl_seconds),
+            "last_access": 0,
+        }
+        entry["size"] = len(raw_key) + len(msgpack.packb(entry))
+        
+        with self.env.begin(write=True) as txn:
+            old = txn.get(raw_key, db=self._dbs[DB_RESP])
+            if old is not None:
+                self._remove(txn, raw_key, msgpack.unpackb(old))
+            self._lru.add_total(txn, entry["size"])
+            self._touch(txn, raw_key, entry)
+        
+        if self.total_bytes() > self.max_bytes:
+            self.evict(keep=key)
+    
+    def evict(self, target_bytes: int | None = None, keep: str | None = None) -> int:
+        """
+        Evict least recently used entries until under the size budget.
+        
+        Args:
+            target_bytes: Size to shrink to (default: max_bytes)
+            keep: Key never to evict (e.g. the entry just stored)
+        
+        Returns:
+            Number of entries evicted
+        """
+        self.flush()
+        
+        target = self.max_bytes if target_bytes is None else target_bytes
+        keep_key = keep.encode() if keep else None
+        evicted = 0
+        
+        with self.env.begin(write=True) as txn:
+            entries = {}
+            
+            def size_of(raw_key: bytes) -> int | None:
+                raw = txn.get(raw_key, db=self._dbs[DB_RESP])
+                if raw is None:
+                    return None
+                entries[raw_key] = msgpack.unpackb(raw)
+                return entries[raw_key]["size"]
+            
+            for raw_key in self._lru.victims(txn, target, size_of, keep=keep_key):
+                self._remove(txn, raw_key, entries[raw_key])
+                evicted += 1
+        
+        self._count(evictions=evicted)
+        return evicted
+    
+    def flush(self) -> None:
+        """
+        Apply pending lookups: record hits in the LRU index, in the order
+        they happened, and remove the expired entries found.
+        """
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if not touched:
+            return
+        
+        now = time.time()
+        with self.env.begin(write=True) as txn:
+            for raw_key in touched:
+                raw = txn.get(raw_key, db=self._dbs[DB_RESP])
+                if raw is None:
+                    continue
+                entry = msgpack.unpackb(raw)
+                if entry["expires_at"] <= now:
+                    self._remove(txn, raw_key, entry)
+                else:
+                    self._touch(txn, raw_key, entry)
+    
+    def purge_expired(self) -> int:
+        """Remove all expired entries and return how many were removed."""
+        now = time.time()
+        
+        with self.env.begin(write=True) as txn:
+            expired = []
+            for raw_key, raw in txn.cursor(self._dbs[DB_RESP]):
+                entry = msgpack.unpackb(raw)
+                if entry["expires_at"] <= now:
+                    expired.append((raw_key, entry))
+            
+            for raw_key, entry in expired:
+                self._remove(txn, raw_key, entry)
+        
+        self._count(expired=len(expired))
+        return len(expired)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self.env.begin(write=True) as txn:
+            txn.drop(self._dbs[DB_RESP], delete=False)
+            self._lru.clear(txn)
+    
+    def total_bytes(self) -> int:
+        """Total size of cached entries."""
+        with self.env.begin() as txn:
+            return self._lru.total(txn)
+    
+    def _count(self, **deltas) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+    
+    def _touch(self, txn: lmdb.Transaction, raw_key: bytes, entry: dict) -> None:
+        """Write an entry and move it to the most-recently-used end of the LRU index."""
+        entry["last_access"] = self._lru.touch(txn, raw_key, entry.get("last_access", 0))
+        txn.put(raw_key, msgpack.packb(entry), db=self._dbs[DB_RESP])
+    
+    def _remove(self, txn: lmdb.Transaction, raw_key: bytes, entry: dict) -> None:
+        txn.delete(raw_key, db=self._dbs[DB_RESP])
+        self._lru.forget(txn, raw_key, entry.get("last_access", 0), entry["size"])
+
+
+# Global cache instance
+_cache: LLMResponseCache | None = None
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """Get or create the global LLM response cache."""
+    global _cache
+    if _cache is None:
+        _cache = LLMResponseCache()
+    return _cache
+
+
+def close_llm_cache() -> None:
+    """Close the global LLM response cache."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
@@ -7,11 +7,26 @@ provider selection and fallback.
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache, reduce
+from typing import Any, AsyncIterator, Callable, TypeVar, Union
 
-from inception.enhance.llm.providers import LLMProvider, get_provider, LLMResponse
+from inception.enhance.llm.cache import LLMCacheStats, LLMResponseCache, cache_key
+from inception.enhance.llm.providers import (
+    LLMProvider,
+    LLMResponse,
+    get_provider,
+    parse_json_content,
+)
+from inception.enhance.llm.registry import is_provider_failure
+from inception.enhance.llm.streaming import StreamingJSONParser
 from inception.enhance.llm.prompts import (
     SYSTEM_PROMPT,
     CLAIM_EXTRACTION_PROMPT,
@@ -23,6 +38,155 @@ from inception.enhance.llm.prompts import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Chunking defaults (in tokens)
+DEFAULT_CONTEXT_WINDOW = 8192
+DEFAULT_CHUNK_TOKENS = 3000
+DEFAULT_OVERLAP_TOKENS = 150
+MIN_CHUNK_TOKENS = 256
+COMPLETION_TOKENS = 2048
+
+# Sentence ends, or line breaks between transcript segments
+_BOUNDARY_RE = re.compile(r"(?<=[.!?])\s+|\n\s*")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding, or None if unavailable (e.g. offline)."""
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count tokens in text.
+    
+    Uses tiktoken when its encoding is available and falls back to a
+    ~4 characters per token estimate otherwise.
+    """
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return math.ceil(len(text) / 4)
+
+
+@dataclass
+class TextChunk:
+    """A contiguous slice of a longer text sent to the LLM on its own."""
+    
+    index: int
+    text: str
+    start_char: int
+    end_char: int
+    tokens: int
+
+
+def _split_units(text: str) -> list[tuple[int, int]]:
+    """Split text into (start, end) sentence/segment units."""
+    units = []
+    pos = 0
+    for match in _BOUNDARY_RE.finditer(text):
+        if match.start() > pos:
+            units.append((pos, match.start()))
+        pos = match.end()
+    if pos < len(text):
+        units.append((pos, len(text)))
+    return units
+
+
+def _split_long_unit(text: str, start: int, end: int, tokens: int, max_tokens: int) -> list[tuple[int, int]]:
+    """Split a unit larger than a chunk at whitespace into roughly equal pieces."""
+    pieces = math.ceil(tokens / max_tokens)
+    step = math.ceil((end - start) / pieces)
+    
+    parts = []
+    pos = start
+    while pos < end:
+        cut = min(pos + step, end)
+        if cut < end:
+            space = text.rfind(" ", pos + 1, cut)
+            if space > pos:
+                cut = space
+        parts.append((pos, cut))
+        pos = cut
+        while pos < end and text[pos].isspace():
+            pos += 1
+    return parts
+
+
+def chunk_text(
+    text: str,
+    max_tokens: int = DEFAULT_CHUNK_TOKENS,
+    overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+) -> list[TextChunk]:
+    """
+    Split text into chunks on sentence/segment boundaries.
+    
+    Consecutive chunks share up to `overlap_tokens` of trailing sentences
+    so claims spanning a boundary are seen whole by at least one chunk.
+    
+    Args:
+        text: Input text
+        max_tokens: Maximum tokens per chunk
+        overlap_tokens: Tokens of context repeated from the previous chunk
+    
+    Returns:
+        List of TextChunk in document order
+    """
+    units: list[tuple[int, int, int]] = []
+    for start, end in _split_units(text):
+        tokens = count_tokens(text[start:end])
+        if tokens > max_tokens:
+            for s, e in _split_long_unit(text, start, end, tokens, max_tokens):
+                units.append((s, e, count_tokens(text[s:e])))
+        else:
+            units.append((start, end, tokens))
+    
+    chunks: list[TextChunk] = []
+    current: list[tuple[int, int, int]] = []
+    current_tokens = 0
+    
+    def _flush() -> None:
+        start, end = current[0][0], current[-1][1]
+        chunks.append(TextChunk(
+            index=len(chunks),
+            text=text[start:end],
+            start_char=start,
+            end_char=end,
+            tokens=current_tokens,
+        ))
+    
+    for unit in units:
+        if current and current_tokens + unit[2] > max_tokens:
+            _flush()
+            
+            # Carry trailing units over as overlap, keeping room for this unit
+            overlap: list[tuple[int, int, int]] = []
+            overlap_size = 0
+            for prev in reversed(current[1:]):
+                if overlap_size + prev[2] > min(overlap_tokens, max_tokens - unit[2]):
+                    break
+                overlap.insert(0, prev)
+                overlap_size += prev[2]
+            current, current_tokens = overlap, overlap_size
+        
+        current.append(unit)
+        current_tokens += unit[2]
+    
+    if current:
+        _flush()
+    
+    return chunks
+
+
+def _dedup_key(text: str) -> str:
+    """Normalize text for duplicate detection across chunks."""
+    return " ".join(text.casefold().split()).strip(" .,;:!?")
+
 
 @dataclass
 class ExtractedEntity:
@@ -83,6 +247,92 @@ class ExtractedGap:
     resolution_hints: list[str] = field(default_factory=list)
 
 
+ExtractedItem = Union[ExtractedEntity, ExtractedClaim, ExtractedProcedure, ExtractedGap]
+
+
+def _is_json(content: str) -> bool:
+    """Check whether a completion parses as a JSON document."""
+    try:
+        parse_json_content(content)
+    except ValueError:
+        return False
+    return True
+
+
+def _entity_from_json(e: dict[str, Any]) -> ExtractedEntity:
+    return ExtractedEntity(
+        name=e.get("name", ""),
+        entity_type=e.get("type", "OTHER"),
+        aliases=e.get("aliases", []),
+        description=e.get("description"),
+        confidence=e.get("confidence", 0.9),
+    )
+
+
+def _claim_from_json(c: dict[str, Any]) -> ExtractedClaim:
+    return ExtractedClaim(
+        text=c.get("text", ""),
+        subject=c.get("subject"),
+        predicate=c.get("predicate"),
+        object=c.get("object"),
+        modality=c.get("modality", "assertion"),
+        hedging=c.get("hedging", []),
+        negated=c.get("negated", False),
+        confidence=c.get("confidence", 0.9),
+    )
+
+
+def _procedure_from_json(p: dict[str, Any]) -> ExtractedProcedure:
+    steps = []
+    for s in p.get("steps", []):
+        steps.append(ExtractedStep(
+            index=s.get("index", 0),
+            text=s.get("text", ""),
+            action_verb=s.get("action_verb", ""),
+            optional=s.get("optional", False),
+            prerequisites=s.get("prerequisites", []),
+        ))
+    
+    return ExtractedProcedure(
+        title=p.get("title", ""),
+        goal=p.get("goal", ""),
+        prerequisites=p.get("prerequisites", []),
+        steps=steps,
+        warnings=p.get("warnings", []),
+        outcomes=p.get("outcomes", []),
+    )
+
+
+def _gap_from_json(g: dict[str, Any]) -> ExtractedGap:
+    return ExtractedGap(
+        gap_type=g.get("type", "unknown"),
+        description=g.get("description", ""),
+        location_hint=g.get("location_hint", ""),
+        severity=g.get("severity", "medium"),
+        resolution_hints=g.get("resolution_hints", []),
+    )
+
+
+# Synthesis prompt output key -> item builder
+SYNTHESIS_ITEMS = {
+    "entities": _entity_from_json,
+    "claims": _claim_from_json,
+    "procedures": _procedure_from_json,
+    "gaps": _gap_from_json,
+}
+
+
+def _item_key(item: ExtractedItem) -> tuple:
+    """Identity of an item for deduplication across chunks."""
+    if isinstance(item, ExtractedEntity):
+        return ("entity", _dedup_key(item.name), item.entity_type.upper())
+    if isinstance(item, ExtractedClaim):
+        return ("claim", _dedup_key(item.text))
+    if isinstance(item, ExtractedProcedure):
+        return ("procedure", _dedup_key(item.title))
+    return ("gap", item.gap_type, _dedup_key(item.description))
+
+
 @dataclass
 class LLMExtractionResult:
     """Complete extraction result from LLM."""
@@ -98,6 +348,9 @@ class LLMExtractionResult:
     tokens_used: int = 0
     cost_usd: float = 0.0
     
+    # Errors of chunks whose extraction failed (their items are missing)
+    errors: list[str] = field(default_factory=list)
+    
     def merge(self, other: LLMExtractionResult) -> LLMExtractionResult:
         """Merge another result into this one."""
         return LLMExtractionResult(
@@ -109,6 +362,60 @@ class LLMExtractionResult:
             model=self.model or other.model,
             tokens_used=self.tokens_used + other.tokens_used,
             cost_usd=self.cost_usd + other.cost_usd,
+            errors=self.errors + other.errors,
+        )
+    
+    def deduplicate(self) -> LLMExtractionResult:
+        """
+        Collapse items extracted more than once (e.g. from overlapping chunks).
+        
+        Entities are keyed by normalized name and type (aliases are unioned),
+        claims by normalized text, procedures by title and gaps by type and
+        description; the highest-confidence (or most complete) copy is kept.
+        """
+        entities: dict[tuple[str, str], ExtractedEntity] = {}
+        for e in self.entities:
+            key = (_dedup_key(e.name), e.entity_type.upper())
+            seen = entities.get(key)
+            if seen is None:
+                entities[key] = ExtractedEntity(
+                    name=e.name,
+                    entity_type=e.entity_type,
+                    aliases=list(e.aliases),
+                    description=e.description,
+                    confidence=e.confidence,
+                )
+            else:
+                seen.aliases.extend(a for a in e.aliases if a not in seen.aliases)
+                seen.description = seen.description or e.description
+                seen.confidence = max(seen.confidence, e.confidence)
+        
+        claims: dict[str, ExtractedClaim] = {}
+        for c in self.claims:
+            key = _dedup_key(c.text)
+            if key not in claims or c.confidence > claims[key].confidence:
+                claims[key] = c
+        
+        procedures: dict[str, ExtractedProcedure] = {}
+        for p in self.procedures:
+            key = _dedup_key(p.title)
+            if key not in procedures or len(p.steps) > len(procedures[key].steps):
+                procedures[key] = p
+        
+        gaps: dict[tuple[str, str], ExtractedGap] = {}
+        for g in self.gaps:
+            gaps.setdefault((g.gap_type, _dedup_key(g.description)), g)
+        
+        return LLMExtractionResult(
+            entities=list(entities.values()),
+            claims=list(claims.values()),
+            procedures=list(procedures.values()),
+            gaps=list(gaps.values()),
+            provider=self.provider,
+            model=self.model,
+            tokens_used=self.tokens_used,
+            cost_usd=self.cost_usd,
+            errors=list(self.errors),
         )
 
 
@@ -126,6 +433,10 @@ class LLMExtractor:
         provider_name: str = "auto",
         offline: bool = False,
         model: str | None = None,
+        max_chunk_tokens: int = DEFAULT_CHUNK_TOKENS,
+        overlap_tokens: int = DEFAULT_OVERLAP_TOKENS,
+        max_concurrency: int = 4,
+        cache: LLMResponseCache | None = None,
     ):
         """
         Initialize the LLM extractor.
@@ -135,31 +446,214 @@ class LLMExtractor:
             provider_name: Provider name for auto-selection
             offline: Use only offline-capable providers
             model: Model override
+            max_chunk_tokens: Upper bound on tokens per chunk for long texts
+            overlap_tokens: Tokens shared between consecutive chunks
+            max_concurrency: Maximum chunks extracted in parallel
+            cache: Persistent response cache (e.g. `get_llm_cache()`)
         """
         self.provider = provider or get_provider(
             name=provider_name,
             offline=offline,
             model=model,
         )
+        self.offline = offline
+        # Auto-selected providers can be swapped mid-batch when one fails
+        self.failover = provider is None and provider_name == "auto" and model is None
+        self.max_chunk_tokens = max_chunk_tokens
+        self.overlap_tokens = overlap_tokens
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        self.cache_stats = LLMCacheStats()
         self._total_tokens = 0
         self._total_cost = 0.0
+        self._stats_lock = threading.Lock()
     
     @property
     def total_tokens(self) -> int:
-        """Total tokens used across all extractions."""
+        """
+        Total tokens used across all extractions.
+        
+        Cache hits cost nothing; tokens they avoided are counted in
+        `cache_stats.tokens_saved`.
+        """
         return self._total_tokens
     
     @property
     def total_cost(self) -> float:
-        """Total cost in USD across all extractions."""
+        """Total cost in USD across all extractions (see `cache_stats.cost_saved`)."""
         return self._total_cost
     
+    def _provider_identity(self) -> tuple[str, str]:
+        """(provider, model) pair that, with the prompts, keys the cache."""
+        provider = str(getattr(self.provider, "name", type(self.provider).__name__))
+        provider_type = getattr(self.provider, "provider_type", None)
+        if isinstance(provider_type, str):
+            provider = f"{provider}/{provider_type}"
+        model = getattr(self.provider, "model", "")
+        return provider, model if isinstance(model, str) else ""
+    
+    def _cache_key(self, prompt: str, system: str | None, temperature: float = 0.0) -> str:
+        provider, model = self._provider_identity()
+        return cache_key(provider, model, system, prompt, temperature)
+    
+    def _lookup(self, key: str) -> LLMResponse | None:
+        """Check the cache and update this extractor's hit/miss counters."""
+        cached = self.cache.get(key)
+        with self._stats_lock:
+            if cached is None:
+                self.cache_stats.misses += 1
+            else:
+                self.cache_stats.hits += 1
+                self.cache_stats.tokens_saved += cached.tokens_used
+                self.cache_stats.cost_saved += cached.cost_usd
+        return cached
+    
+    def _next_provider(self) -> bool:
+        """
+        After a failed call, switch to the registry's best other provider.
+        
+        The failed provider is passed over even while its circuit is
+        still closed (e.g. after a first 5xx), so one failure is enough
+        to fail over.
+        
+        Returns:
+            True if the provider changed and the call should be retried
+        """
+        if not self.failover:
+            return False
+        
+        from inception.enhance.llm.registry import get_provider_registry
+        
+        provider = get_provider_registry().get(
+            "auto", offline=self.offline, exclude=self.provider
+        )
+        if provider is None:
+            return False
+        
+        logger.warning(f"Failing over to LLM provider {getattr(provider, 'name', provider)}")
+        self.provider = provider
+        return True
+    
+    def _call(self, method: str, prompt: str, system: str | None) -> Any:
+        """
+        Call a provider method, failing over to another provider if it is down.
+        
+        Only errors that say the provider is unreachable, unavailable or
+        rate limited fail over; anything else (e.g. a response that does
+        not parse) would fail the same way elsewhere and is raised.
+        """
+        try:
+            return getattr(self.provider, method)(prompt, system=system)
+        except Exception as e:
+            if not is_provider_failure(e) or not self._next_provider():
+                raise
+            return getattr(self.provider, method)(prompt, system=system)
+    
+    async def _acall(self, method: str, prompt: str, system: str | None) -> Any:
+        """Async version of `_call`."""
+        try:
+            return await getattr(self.provider, method)(prompt, system=system)
+        except Exception as e:
+            if not is_provider_failure(e) or not self._next_provider():
+                raise
+            return await getattr(self.provider, method)(prompt, system=system)
+    
+    def _complete(
+        self,
+        prompt: str,
+        parse: Callable[[LLMResponse], T],
+        system: str | None = SYSTEM_PROMPT,
+    ) -> T:
+        """
+        Complete a prompt and parse the response, consulting the response cache first.
+        
+        A response is cached only once `parse` has accepted it, so a
+        malformed completion is requested again next time rather than
+        replayed from the cache. Cache hits are parsed with zero tokens
+        and cost, since nothing was spent on them.
+        """
+        if self.cache is None:
+            return parse(self._call("complete", prompt, system))
+        
+        key = self._cache_key(prompt, system)
+        cached = self._lookup(key)
+        if cached is not None:
+            return parse(LLMResponse(
+                content=cached.content,
+                model=cached.model,
+                provider=cached.provider,
+            ))
+        
+        response = self._call("complete", prompt, system)
+        parsed = parse(response)
+        self.cache.put(key, response)
+        return parsed
+    
+    async def _acomplete(
+        self,
+        prompt: str,
+        parse: Callable[[LLMResponse], T],
+        system: str | None = SYSTEM_PROMPT,
+    ) -> T:
+        """Async counterpart of `_complete`."""
+        if self.cache is None:
+            return parse(await self._acall("acomplete", prompt, system))
+        
+        key = self._cache_key(prompt, system)
+        cached = self._lookup(key)
+        if cached is not None:
+            return parse(LLMResponse(
+                content=cached.content,
+                model=cached.model,
+                provider=cached.provider,
+            ))
+        
+        response = await self._acall("acomplete", prompt, system)
+        parsed = parse(response)
+        self.cache.put(key, response)
+        return parsed
+    
+    def _complete_json(self, prompt: str, system: str | None = SYSTEM_PROMPT) -> dict[str, Any]:
+        """Complete a prompt as JSON, consulting the response cache first."""
+        if self.cache is None:
+            return self._call("complete_json", prompt, system)
+        
+        key = self._cache_key(prompt, system)
+        cached = self._lookup(key)
+        if cached is not None:
+            return json.loads(cached.content)
+        
+        data = self._call("complete_json", prompt, system)
+        provider, model = self._provider_identity()
+        self.cache.put(
+            key,
+            LLMResponse(content=json.dumps(data), model=model, provider=provider),
+        )
+        return data
+    
+    @property
+    def chunk_tokens(self) -> int:
+        """
+        Tokens of input text per chunk.
+        
+        Bounded by `max_chunk_tokens` (to keep per-call latency down) and
+        by what fits in the provider's context window next to the prompt
+        template and the completion.
+        """
+        window = getattr(self.provider, "context_window", None)
+        if not isinstance(window, int):
+            window = DEFAULT_CONTEXT_WINDOW
+        
+        overhead = count_tokens(SYSTEM_PROMPT) + count_tokens(SYNTHESIS_PROMPT)
+        available = window - overhead - COMPLETION_TOKENS
+        return max(MIN_CHUNK_TOKENS, min(self.max_chunk_tokens, available))
+    
     def extract_entities(self, text: str) -> list[ExtractedEntity]:
         """Extract entities from text."""
         prompt = ENTITY_EXTRACTION_PROMPT.format(text=text)
         
         try:
-            data = self.provider.complete_json(prompt, system=SYSTEM_PROMPT)
+            data = self._complete_json(prompt)
             self._update_stats(data)
             
             entities = []
@@ -181,7 +675,7 @@ class LLMExtractor:
         prompt = CLAIM_EXTRACTION_PROMPT.format(text=text)
         
         try:
-            data = self.provider.complete_json(prompt, system=SYSTEM_PROMPT)
+            data = self._complete_json(prompt)
             self._update_stats(data)
             
             claims = []
@@ -206,7 +700,7 @@ class LLMExtractor:
         prompt = PROCEDURE_EXTRACTION_PROMPT.format(text=text)
         
         try:
-            data = self.provider.complete_json(prompt, system=SYSTEM_PROMPT)
+            data = self._complete_json(prompt)
             self._update_stats(data)
             
             procedures = []
@@ -239,7 +733,7 @@ class LLMExtractor:
         prompt = GAP_DETECTION_PROMPT.format(text=text)
         
         try:
-            data = self.provider.complete_json(prompt, system=SYSTEM_PROMPT)
+            data = self._complete_json(prompt)
             self._update_stats(data)
             
             gaps = []
@@ -258,96 +752,163 @@ class LLMExtractor:
     
     def extract_all(self, text: str) -> LLMExtractionResult:
         """
-        Perform comprehensive extraction in a single LLM call.
+        Perform comprehensive extraction with one LLM call per chunk.
         
-        More efficient than calling individual methods separately.
+        More efficient than calling individual methods separately. Text
+        longer than `chunk_tokens` is split on sentence boundaries, the
+        chunks are extracted concurrently, and the per-chunk results are
+        merged and deduplicated. A chunk whose extraction fails adds its
+        error to the result's `errors` instead of items.
         """
-        prompt = SYNTHESIS_PROMPT.format(text=text)
+        chunks = chunk_text(text, self.chunk_tokens, self.overlap_tokens)
+        
+        if len(chunks) <= 1:
+            result = self._extract_all_chunk(text)
+        else:
+            workers = min(self.max_concurrency, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._extract_all_chunk, [c.text for c in chunks]))
+            result = reduce(LLMExtractionResult.merge, results).deduplicate()
+        
+        with self._stats_lock:
+            self._total_tokens += result.tokens_used
+            self._total_cost += result.cost_usd
+        return result
+    
+    async def aextract_all(self, text: str) -> LLMExtractionResult:
+        """
+        Async version of `extract_all`.
+        
+        Chunks are extracted concurrently on the event loop; the provider's
+        limiter, not a thread pool, bounds the requests in flight.
+        """
+        chunks = chunk_text(text, self.chunk_tokens, self.overlap_tokens)
+        
+        if len(chunks) <= 1:
+            result = await self._aextract_all_chunk(text)
+        else:
+            results = await asyncio.gather(
+                *(self._aextract_all_chunk(c.text) for c in chunks)
+            )
+            result = reduce(LLMExtractionResult.merge, results).deduplicate()
+        
+        with self._stats_lock:
+            self._total_tokens += result.tokens_used
+            self._total_cost += result.cost_usd
+        return result
+    
+    async def astream_all(self, text: str) -> AsyncIterator[ExtractedItem]:
+        """
+        Streaming version of `aextract_all`.
+        
+        Yields each entity, claim, procedure and gap as soon as the model
+        finishes writing it, rather than after the whole completion.
+        Chunks of long texts stream concurrently; items already yielded
+        for an earlier chunk (by normalized name or text) are skipped.
+        Streamed token counts are estimates and cost is not tracked.
+        """
+        chunks = [c.text for c in chunk_text(text, self.chunk_tokens, self.overlap_tokens)] or [text]
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        
+        async def produce(chunk: str) -> None:
+            try:
+                async for item in self._astream_chunk(chunk):
+                    await queue.put(item)
+            except Exception as e:
+                logger.error(f"Streaming extraction failed: {e}")
+            finally:
+                await queue.put(done)
+        
+        tasks = [asyncio.create_task(produce(chunk)) for chunk in chunks]
+        seen: set[tuple] = set()
+        remaining = len(tasks)
         
         try:
-            response = self.provider.complete(prompt, system=SYSTEM_PROMPT)
-            self._total_tokens += response.tokens_used
-            self._total_cost += response.cost_usd
-            
-            # Parse JSON from response
-            content = response.content.strip()
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            
-            import json
-            data = json.loads(content.strip())
-            
-            # Build result
-            result = LLMExtractionResult(
-                provider=response.provider,
-                model=response.model,
-                tokens_used=response.tokens_used,
-                cost_usd=response.cost_usd,
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                key = _item_key(item)
+                if key not in seen:
+                    seen.add(key)
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _astream_chunk(self, text: str) -> AsyncIterator[ExtractedItem]:
+        """Stream the synthesis prompt over one chunk, consulting the cache first."""
+        prompt = SYNTHESIS_PROMPT.format(text=text)
+        key = self._cache_key(prompt, SYSTEM_PROMPT) if self.cache is not None else None
+        
+        if key is not None:
+            cached = self._lookup(key)
+            if cached is not None:
+                data = parse_json_content(cached.content)
+                for name, build in SYNTHESIS_ITEMS.items():
+                    for element in data.get(name, []):
+                        yield build(element)
+                return
+        
+        parser = StreamingJSONParser()
+        content = []
+        
+        async for delta in self.provider.astream(prompt, system=SYSTEM_PROMPT):
+            content.append(delta)
+            for name, element in parser.feed(delta):
+                build = SYNTHESIS_ITEMS.get(name)
+                if build is not None and isinstance(element, dict):
+                    yield build(element)
+        
+        content = "".join(content)
+        tokens = count_tokens(SYSTEM_PROMPT) + count_tokens(prompt) + count_tokens(content)
+        with self._stats_lock:
+            self._total_tokens += tokens
+        
+        # A stream cut short or garbled must not be replayed from the cache
+        if key is not None and parser.done and _is_json(content):
+            provider, model = self._provider_identity()
+            self.cache.put(
+                key,
+                LLMResponse(content=content, model=model, provider=provider, tokens_used=tokens),
             )
-            
-            # Parse entities
-            for e in data.get("entities", []):
-                result.entities.append(ExtractedEntity(
-                    name=e.get("name", ""),
-                    entity_type=e.get("type", "OTHER"),
-                    aliases=e.get("aliases", []),
-                    description=e.get("description"),
-                    confidence=e.get("confidence", 0.9),
-                ))
-            
-            # Parse claims
-            for c in data.get("claims", []):
-                result.claims.append(ExtractedClaim(
-                    text=c.get("text", ""),
-                    subject=c.get("subject"),
-                    predicate=c.get("predicate"),
-                    object=c.get("object"),
-                    modality=c.get("modality", "assertion"),
-                    hedging=c.get("hedging", []),
-                    negated=c.get("negated", False),
-                    confidence=c.get("confidence", 0.9),
-                ))
-            
-            # Parse procedures
-            for p in data.get("procedures", []):
-                steps = []
-                for s in p.get("steps", []):
-                    steps.append(ExtractedStep(
-                        index=s.get("index", 0),
-                        text=s.get("text", ""),
-                        action_verb=s.get("action_verb", ""),
-                        optional=s.get("optional", False),
-                        prerequisites=s.get("prerequisites", []),
-                    ))
-                
-                result.procedures.append(ExtractedProcedure(
-                    title=p.get("title", ""),
-                    goal=p.get("goal", ""),
-                    prerequisites=p.get("prerequisites", []),
-                    steps=steps,
-                    warnings=p.get("warnings", []),
-                    outcomes=p.get("outcomes", []),
-                ))
-            
-            # Parse gaps
-            for g in data.get("gaps", []):
-                result.gaps.append(ExtractedGap(
-                    gap_type=g.get("type", "unknown"),
-                    description=g.get("description", ""),
-                    location_hint=g.get("location_hint", ""),
-                    severity=g.get("severity", "medium"),
-                    resolution_hints=g.get("resolution_hints", []),
-                ))
-            
-            return result
-            
+    
+    def _extract_all_chunk(self, text: str) -> LLMExtractionResult:
+        """Run the synthesis prompt over a single chunk of text."""
+        try:
+            return self._complete(SYNTHESIS_PROMPT.format(text=text), self._parse_synthesis)
+        except Exception as e:
+            logger.error(f"Comprehensive extraction failed: {e}")
+            return LLMExtractionResult(errors=[str(e)])
+    
+    async def _aextract_all_chunk(self, text: str) -> LLMExtractionResult:
+        """Async version of `_extract_all_chunk`."""
+        try:
+            return await self._acomplete(SYNTHESIS_PROMPT.format(text=text), self._parse_synthesis)
         except Exception as e:
             logger.error(f"Comprehensive extraction failed: {e}")
-            return LLMExtractionResult()
+            return LLMExtractionResult(errors=[str(e)])
+    
+    def _parse_synthesis(self, response: LLMResponse) -> LLMExtractionResult:
+        """Build an extraction result from a synthesis prompt response."""
+        data = parse_json_content(response.content)
+        
+        result = LLMExtractionResult(
+            provider=response.provider,
+            model=response.model,
+            tokens_used=response.tokens_used,
+            cost_usd=response.cost_usd,
+        )
+        
+        result.entities = [_entity_from_json(e) for e in data.get("entities", [])]
+        result.claims = [_claim_from_json(c) for c in data.get("claims", [])]
+        result.procedures = [_procedure_from_json(p) for p in data.get("procedures", [])]
+        result.gaps = [_gap_from_json(g) for g in data.get("gaps", [])]
+        
+        return result
     
     def _update_stats(self, data: dict[str, Any]) -> None:
         """Update token and cost statistics."""
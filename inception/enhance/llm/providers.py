@@ -9,14 +9,25 @@ Supports:
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import os
+import threading
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Literal
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
 
 import httpx
 
+if TYPE_CHECKING:
+    from inception.enhance.llm.registry import ProviderRegistry
+
 
 @dataclass
 class LLMResponse:
@@ -30,10 +41,185 @@ class LLMResponse:
     raw_response: dict[str, Any] = field(default_factory=dict)
 
 
+def parse_json_content(content: str) -> dict[str, Any]:
+    """Parse a JSON completion, tolerating markdown code fences."""
+    content = content.strip()
+    if content.startswith("```json"):
+        content = content[7:]
+    if content.startswith("```"):
+        content = content[3:]
+    if content.endswith("```"):
+        content = content[:-3]
+    
+    return json.loads(content.strip())
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date)."""
+    if not value:
+        return None
+    
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RequestLimiter:
+    """
+    Adaptive concurrency limit for requests to one LLM endpoint.
+    
+    Caps in-flight requests at `limit`, which starts at `max_concurrency`.
+    A 429 halves the limit and pauses new requests for the Retry-After
+    delay (or an exponential backoff); each run of `limit` successful
+    requests raises it by one again. Bound to one event loop; providers
+    get one per loop from their `limiter` property.
+    """
+    
+    def __init__(self, max_concurrency: int = 8, max_backoff: float = 60.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_backoff = max_backoff
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        
+        self._resume_at = 0.0
+        self._successes = 0
+        self._rate_limited = 0  # Consecutive 429s, for backoff
+        self._waiters: deque[asyncio.Future] = deque()
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot outside any rate-limit pause."""
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            
+            if self.in_flight < self.limit:
+                self.in_flight += 1
+                return
+            
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif waiter.done() and not waiter.cancelled():
+                    self._wake()  # Pass the wakeup on
+                raise
+    
+    def release(self) -> None:
+        """Free a slot."""
+        self.in_flight -= 1
+        self._wake()
+    
+    async def __aenter__(self) -> RequestLimiter:
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.release()
+    
+    def on_success(self) -> None:
+        """Record a successful request, growing the limit back over time."""
+        self._rate_limited = 0
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+            self._wake()
+    
+    def on_rate_limited(self, retry_after: float | None = None) -> float:
+        """
+        Record a 429 response.
+        
+        Args:
+            retry_after: Delay requested by the server, in seconds
+        
+        Returns:
+            Seconds until requests resume
+        """
+        self._rate_limited += 1
+        self._successes = 0
+        self.limit = max(1, self.limit // 2)
+        
+        if retry_after is None:
+            retry_after = min(2.0 ** (self._rate_limited - 1), self.max_backoff)
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+        return retry_after
+    
+    def _wake(self) -> None:
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+# Limiters shared by all provider instances talking to the same endpoint,
+# per event loop: loop -> limiter key -> limiter
+_limiters: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, ...], RequestLimiter]
+] = weakref.WeakKeyDictionary()
+_limiters_lock = threading.Lock()
+
+# Shared async HTTP clients (connection pools), one per event loop
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+_async_clients_lock = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared keep-alive AsyncClient for the running event loop.
+    
+    Connections cannot cross loops, so each loop (e.g. successive
+    `asyncio.run` calls, or loops in other threads) gets its own
+    client. A loop's client is dropped along with the loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = _async_clients[loop] = httpx.AsyncClient(
+                timeout=120.0,
+                limits=httpx.Limits(
+                    max_connections=200,
+                    max_keepalive_connections=50,
+                    keepalive_expiry=60.0,
+                ),
+            )
+        return client
+
+
+async def close_async_client() -> None:
+    """Close the running event loop's shared AsyncClient."""
+    with _async_clients_lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
     
     name: str
+    context_window: int = 8192  # Prompt + completion tokens per request
+    max_concurrency: int = 8  # In-flight async requests per endpoint
+    max_retries: int = 3  # Retries after a 429
+    breaker: Any = None  # CircuitBreaker, set by the provider registry
     
     @abstractmethod
     def complete(
@@ -60,37 +246,222 @@ class LLMProvider(ABC):
     ) -> dict[str, Any]:
         """Generate a completion and parse as JSON."""
         response = self.complete(prompt, system, temperature, max_tokens)
+        return parse_json_content(response.content)
+    
+    async def acomplete(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2048,
+    ) -> LLMResponse:
+        """
+        Generate a completion without blocking the event loop.
+        
+        Requests go through the shared AsyncClient and this endpoint's
+        `limiter`. Providers that don't describe their HTTP request via
+        `_build_request` run `complete` in a worker thread instead.
+        """
+        try:
+            url, headers, payload = self._build_request(prompt, system, temperature, max_tokens)
+        except NotImplementedError:
+            async with self.limiter:
+                return await asyncio.to_thread(
+                    self.complete, prompt, system, temperature, max_tokens
+                )
+        
+        response = await self._apost(url, headers, payload)
+        return self._parse_response(response.json())
+    
+    async def acomplete_json(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2048,
+    ) -> dict[str, Any]:
+        """Generate a completion asynchronously and parse as JSON."""
+        response = await self.acomplete(prompt, system, temperature, max_tokens)
+        return parse_json_content(response.content)
+    
+    async def astream(
+        self,
+        prompt: str,
+        system: str | None = None,
+        temperature: float = 0.0,
+        max_tokens: int = 2048,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion, yielding text deltas as they are generated.
+        
+        Holds one limiter slot for the whole stream. Providers without an
+        HTTP request description yield the full completion once.
+        """
+        try:
+            url, headers, payload = self._build_request(prompt, system, temperature, max_tokens)
+        except NotImplementedError:
+            response = await self.acomplete(prompt, system, temperature, max_tokens)
+            yield response.content
+            return
+        
+        payload = {**payload, "stream": True}
+        client = get_async_client()
+        limiter = self.limiter
+        
+        try:
+            for attempt in range(self.max_retries + 1):
+                async with limiter:
+                    async with client.stream("POST", url, headers=headers, json=payload) as response:
+                        if response.status_code == 429 and attempt < self.max_retries:
+                            limiter.on_rate_limited(
+                                parse_retry_after(response.headers.get("retry-after"))
+                            )
+                            continue
+                        if response.is_error:
+                            await response.aread()
+                        response.raise_for_status()
+                        
+                        async for line in response.aiter_lines():
+                            delta = self._parse_stream_line(line)
+                            if delta:
+                                yield delta
+                        break
+        except Exception as e:
+            if self.breaker is not None:
+                self.breaker.record_exception(e)
+            raise
+        
+        limiter.on_success()
+        if self.breaker is not None:
+            self.breaker.record_success()
+    
+    def _parse_stream_line(self, line: str) -> str:
+        """Text delta from one line of a streamed response (NDJSON or SSE)."""
+        line = line.strip()
+        if not line or line.startswith(("event:", ":")):
+            return ""
+        if line.startswith("data:"):
+            line = line[5:].strip()
+        if line == "[DONE]":
+            return ""
+        return self._stream_delta(json.loads(line))
+    
+    def _stream_delta(self, event: dict[str, Any]) -> str:
+        """Text delta from a streamed event (OpenAI chat completion chunks by default)."""
+        choices = event.get("choices") or [{}]
+        return choices[0].get("delta", {}).get("content") or ""
+    
+    @property
+    def limiter(self) -> RequestLimiter:
+        """Concurrency limiter shared by providers for the same endpoint on the running loop."""
+        loop = asyncio.get_running_loop()
+        key = self._limiter_key()
+        with _limiters_lock:
+            limiters = _limiters.setdefault(loop, {})
+            limiter = limiters.get(key)
+            if limiter is None:
+                limiter = limiters[key] = RequestLimiter(self.max_concurrency)
+            return limiter
+    
+    def _limiter_key(self) -> tuple[str, ...]:
+        return (self.name,)
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build the (url, headers, json body) of a completion request."""
+        raise NotImplementedError
+    
+    def _parse_response(self, data: dict[str, Any]) -> LLMResponse:
+        """Convert a completion response body into an LLMResponse."""
+        raise NotImplementedError
+    
+    def _post(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+    ) -> httpx.Response:
+        """
+        POST with the sync client, retrying 429s after the requested delay.
+        
+        The outcome is reported to the circuit breaker.
+        """
+        try:
+            for attempt in range(self.max_retries + 1):
+                response = self._client.post(url, headers=headers, json=payload)
+                if response.status_code != 429 or attempt == self.max_retries:
+                    break
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                time.sleep(retry_after if retry_after is not None else min(2.0 ** attempt, 60.0))
+            
+            response.raise_for_status()
+        except Exception as e:
+            if self.breaker is not None:
+                self.breaker.record_exception(e)
+            raise
         
-        # Extract JSON from response (handle markdown code blocks)
-        content = response.content.strip()
-        if content.startswith("```json"):
-            content = content[7:]
-        if content.startswith("```"):
-            content = content[3:]
-        if content.endswith("```"):
-            content = content[:-3]
+        if self.breaker is not None:
+            self.breaker.record_success()
+        return response
+    
+    async def _apost(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+    ) -> httpx.Response:
+        """POST through the limiter, retrying 429s after the requested delay."""
+        client = get_async_client()
+        limiter = self.limiter
         
-        return json.loads(content.strip())
+        try:
+            for attempt in range(self.max_retries + 1):
+                async with limiter:
+                    response = await client.post(url, headers=headers, json=payload)
+                
+                if response.status_code != 429:
+                    break
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                limiter.on_rate_limited(retry_after)
+            
+            response.raise_for_status()
+        except Exception as e:
+            if self.breaker is not None:
+                self.breaker.record_exception(e)
+            raise
+        
+        limiter.on_success()
+        if self.breaker is not None:
+            self.breaker.record_success()
+        return response
 
 
 class OllamaProvider(LLMProvider):
     """Local Ollama provider for offline extraction."""
     
     name = "ollama"
+    max_concurrency = 4  # Local inference is compute-bound
     
     def __init__(
         self,
         model: str = "llama3.2",
         base_url: str = "http://localhost:11434",
+        context_window: int = 8192,
     ):
         self.model = model
         self.base_url = base_url
+        self.context_window = context_window
         self._client = httpx.Client(timeout=120.0)
     
     def is_available(self) -> bool:
         """Check if Ollama is running and model is available."""
         try:
-            response = self._client.get(f"{self.base_url}/api/tags")
+            response = self._client.get(f"{self.base_url}/api/tags", timeout=5.0)
             if response.status_code != 200:
                 return False
             
@@ -108,26 +479,39 @@ class OllamaProvider(LLMProvider):
         max_tokens: int = 2048,
     ) -> LLMResponse:
         """Generate completion using Ollama."""
+        url, headers, payload = self._build_request(prompt, system, temperature, max_tokens)
+        return self._parse_response(self._post(url, headers, payload).json())
+    
+    def _limiter_key(self) -> tuple[str, ...]:
+        return (self.name, self.base_url)
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
         
-        response = self._client.post(
-            f"{self.base_url}/api/chat",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                },
+        return f"{self.base_url}/api/chat", {}, {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+                "num_ctx": self.context_window,
             },
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+        }
+    
+    def _stream_delta(self, event: dict[str, Any]) -> str:
+        return event.get("message", {}).get("content", "")
+    
+    def _parse_response(self, data: dict[str, Any]) -> LLMResponse:
         return LLMResponse(
             content=data.get("message", {}).get("content", ""),
             model=self.model,
@@ -142,6 +526,8 @@ class OpenRouterProvider(LLMProvider):
     """OpenRouter provider for cost-effective cloud access."""
     
     name = "openrouter"
+    context_window = 128_000
+    max_concurrency = 16
     
     # Pricing per 1M tokens (approximate)
     PRICING = {
@@ -159,10 +545,8 @@ class OpenRouterProvider(LLMProvider):
     ):
         self.model = model
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY")
-        self._client = httpx.Client(
-            base_url="https://openrouter.ai/api/v1",
-            timeout=120.0,
-        )
+        self._base_url = "https://openrouter.ai/api/v1"
+        self._client = httpx.Client(base_url=self._base_url, timeout=120.0)
     
     def is_available(self) -> bool:
         """Check if API key is configured."""
@@ -176,28 +560,34 @@ class OpenRouterProvider(LLMProvider):
         max_tokens: int = 2048,
     ) -> LLMResponse:
         """Generate completion using OpenRouter."""
+        url, headers, payload = self._build_request(prompt, system, temperature, max_tokens)
+        return self._parse_response(self._post(url, headers, payload).json())
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
         
-        response = self._client.post(
-            "/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "HTTP-Referer": "https://github.com/inception",
-                "X-Title": "Inception",
-            },
-            json={
-                "model": self.model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "HTTP-Referer": "https://github.com/inception",
+            "X-Title": "Inception",
+        }
+        return f"{self._base_url}/chat/completions", headers, {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    
+    def _parse_response(self, data: dict[str, Any]) -> LLMResponse:
         # Calculate cost
         usage = data.get("usage", {})
         input_tokens = usage.get("prompt_tokens", 0)
@@ -220,6 +610,7 @@ class CloudProvider(LLMProvider):
     """Direct cloud provider (Claude or OpenAI)."""
     
     name = "cloud"
+    max_concurrency = 16
     
     def __init__(
         self,
@@ -233,10 +624,12 @@ class CloudProvider(LLMProvider):
             self.model = model or "claude-3-5-sonnet-20241022"
             self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
             self._base_url = "https://api.anthropic.com/v1"
+            self.context_window = 200_000
         else:
             self.model = model or "gpt-4o"
             self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
             self._base_url = "https://api.openai.com/v1"
+            self.context_window = 128_000
         
         self._client = httpx.Client(timeout=120.0)
     
@@ -252,37 +645,60 @@ class CloudProvider(LLMProvider):
         max_tokens: int = 2048,
     ) -> LLMResponse:
         """Generate completion using direct API."""
+        url, headers, payload = self._build_request(prompt, system, temperature, max_tokens)
+        return self._parse_response(self._post(url, headers, payload).json())
+    
+    def _limiter_key(self) -> tuple[str, ...]:
+        return (self.name, self.provider_type)
+    
+    def _build_request(
+        self,
+        prompt: str,
+        system: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
         if self.provider_type == "anthropic":
-            return self._complete_anthropic(prompt, system, temperature, max_tokens)
+            return self._build_anthropic(prompt, system, temperature, max_tokens)
         else:
-            return self._complete_openai(prompt, system, temperature, max_tokens)
+            return self._build_openai(prompt, system, temperature, max_tokens)
     
-    def _complete_anthropic(
+    def _parse_response(self, data: dict[str, Any]) -> LLMResponse:
+        if self.provider_type == "anthropic":
+            return self._parse_anthropic(data)
+        else:
+            return self._parse_openai(data)
+    
+    def _stream_delta(self, event: dict[str, Any]) -> str:
+        if self.provider_type == "anthropic":
+            if event.get("type") != "content_block_delta":
+                return ""
+            return event.get("delta", {}).get("text", "")
+        return super()._stream_delta(event)
+    
+    def _build_anthropic(
         self,
         prompt: str,
         system: str | None,
         temperature: float,
         max_tokens: int,
-    ) -> LLMResponse:
-        """Complete using Anthropic API."""
-        response = self._client.post(
-            f"{self._base_url}/messages",
-            headers={
-                "x-api-key": self.api_key,
-                "anthropic-version": "2023-06-01",
-                "content-type": "application/json",
-            },
-            json={
-                "model": self.model,
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "system": system or "You are a helpful assistant.",
-                "messages": [{"role": "user", "content": prompt}],
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build an Anthropic Messages API request."""
+        headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "content-type": "application/json",
+        }
+        return f"{self._base_url}/messages", headers, {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": system or "You are a helpful assistant.",
+            "messages": [{"role": "user", "content": prompt}],
+        }
+    
+    def _parse_anthropic(self, data: dict[str, Any]) -> LLMResponse:
+        """Parse an Anthropic Messages API response."""
         usage = data.get("usage", {})
         input_tokens = usage.get("input_tokens", 0)
         output_tokens = usage.get("output_tokens", 0)
@@ -299,35 +715,32 @@ class CloudProvider(LLMProvider):
             raw_response=data,
         )
     
-    def _complete_openai(
+    def _build_openai(
         self,
         prompt: str,
         system: str | None,
         temperature: float,
         max_tokens: int,
-    ) -> LLMResponse:
-        """Complete using OpenAI API."""
+    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+        """Build an OpenAI Chat Completions request."""
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
         
-        response = self._client.post(
-            f"{self._base_url}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": self.model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
-        )
-        response.raise_for_status()
-        data = response.json()
-        
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        return f"{self._base_url}/chat/completions", headers, {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    
+    def _parse_openai(self, data: dict[str, Any]) -> LLMResponse:
+        """Parse an OpenAI Chat Completions response."""
         usage = data.get("usage", {})
         input_tokens = usage.get("prompt_tokens", 0)
         output_tokens = usage.get("completion_tokens", 0)
@@ -359,6 +772,10 @@ def get_provider(
     3. OpenRouter (API key fallback)
     4. Direct Cloud (API key fallback)
     
+    Availability comes from the provider registry's cached health, so
+    selection does not probe providers on every call (see
+    `inception.enhance.llm.registry`).
+    
     Args:
         name: Provider name ("ollama", "openrouter", "cloud", "clawdbot", "moltbot", "auto")
         offline: If True, only use local providers
@@ -370,77 +787,68 @@ def get_provider(
     Raises:
         RuntimeError: If no provider is available
     """
-    # Import OAuth providers (lazy to avoid circular imports)
-    try:
-        from inception.auth.oauth_providers import (
-            ClawdBotProvider, MoltBotProvider, get_oauth_provider
-        )
-        oauth_available = True
-    except ImportError:
-        oauth_available = False
+    from inception.enhance.llm.registry import NO_PROVIDER_MESSAGE, get_provider_registry
     
-    # Explicit OAuth provider requests
-    if name == "clawdbot" and oauth_available:
-        return get_oauth_provider("clawdbot", model=model)
+    registry = get_provider_registry()
     
-    if name == "moltbot" and oauth_available:
-        return get_oauth_provider("moltbot", model=model)
+    # Explicit OAuth provider requests
+    if name in ("clawdbot", "moltbot") and registry.entry(name) is not None:
+        from inception.auth.oauth_providers import get_oauth_provider
+        return get_oauth_provider(name, model=model)
     
     # Offline mode - Ollama only
     if name == "ollama" or (name == "auto" and offline):
-        provider = OllamaProvider(model=model or "llama3.2")
-        if provider.is_available():
+        provider = _with_model(registry, "ollama", model)
+        if provider is not None:
             return provider
         if name == "ollama":
-            raise RuntimeError("Ollama not available. Run: ollama pull llama3.2")
+            raise RuntimeError(f"Ollama not available. Run: ollama pull {model or 'llama3.2'}")
     
     if offline:
         raise RuntimeError("No offline provider available. Install Ollama.")
     
     if name == "openrouter":
-        provider = OpenRouterProvider(model=model or "anthropic/claude-3-haiku")
-        if provider.is_available():
+        provider = _with_model(registry, "openrouter", model)
+        if provider is not None:
             return provider
         raise RuntimeError("OpenRouter API key not configured.")
     
     if name == "cloud":
-        provider = CloudProvider(model=model)
-        if provider.is_available():
+        provider = _with_model(registry, "cloud", model)
+        if provider is not None:
             return provider
         raise RuntimeError("Cloud API key not configured.")
     
-    # Auto mode: OAuth-first priority order
+    # Auto mode: best healthy provider in priority order
     if name == "auto":
-        # Priority 1: OAuth providers (ClawdBot/MoltBot)
-        if oauth_available:
-            try:
-                return get_oauth_provider("auto", model=model)
-            except RuntimeError:
-                pass  # Fall through to other providers
-        
-        # Priority 2: Ollama (free, local, private)
-        ollama = OllamaProvider()
-        if ollama.is_available():
-            return ollama
-        
-        # Priority 3: OpenRouter (cost-effective fallback)
-        openrouter = OpenRouterProvider()
-        if openrouter.is_available():
-            return openrouter
-        
-        # Priority 4: Direct cloud APIs
-        cloud = CloudProvider()
-        if cloud.is_available():
-            return cloud
-        
-        raise RuntimeError(
-            "No LLM provider available. Options:\n"
-            "1. Authenticate with ClawdBot: OAuth flow for Claude Max\n"
-            "2. Authenticate with MoltBot: OAuth flow for Gemini Ultra\n"
-            "3. Install Ollama: brew install ollama && ollama pull llama3.2\n"
-            "4. Set OPENROUTER_API_KEY environment variable\n"
-            "5. Set ANTHROPIC_API_KEY or OPENAI_API_KEY"
-        )
+        provider = registry.get("auto")
+        if provider is None:
+            raise RuntimeError(NO_PROVIDER_MESSAGE)
+        if model is not None and not isinstance(provider, LLMProvider):
+            from inception.auth.oauth_providers import get_oauth_provider
+            return get_oauth_provider(provider.name, model=model)
+        return provider
     
     raise ValueError(f"Unknown provider: {name}")
 
+
+def _with_model(registry: ProviderRegistry, name: str, model: str | None) -> LLMProvider | None:
+    """
+    The registry's provider, or a copy using another model.
+    
+    The copy shares the original's HTTP client and circuit breaker,
+    since those belong to the endpoint. The registry's health only
+    covers the default model, though, so whether the provider serves
+    the requested one (e.g. whether Ollama has pulled it) is checked
+    through the registry, which caches the answer.
+    
+    Returns:
+        The provider, or None if it is missing or lacks the model
+    """
+    provider = registry.get(name)
+    if provider is None or model is None or model == getattr(provider, "model", None):
+        return provider
+    
+    clone = copy.copy(provider)
+    clone.model = model
+    return clone if registry.model_available(name, model, clone.is_available) else None
@@ -0,0 +1,436 @@
+"""
+Provider registry with cached health and circuit breakers.
+
+`get_provider("auto")` used to probe every provider on each call, so
+with Ollama down every request paid a connection timeout before falling
+back. The registry probes once, keeps the health of each provider, and
+re-probes in a background thread (exponential backoff for providers that
+are down). Request failures trip per-provider circuit breakers, so the
+next selection skips a failing provider immediately.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from threading import Event, Thread
+from typing import Any, Callable
+
+import httpx
+
+from inception.enhance.llm.providers import (
+    CloudProvider,
+    OllamaProvider,
+    OpenRouterProvider,
+)
+
+logger = logging.getLogger(__name__)
+
+
+NO_PROVIDER_MESSAGE = (
+    "No LLM provider available. Options:\n"
+    "1. Authenticate with ClawdBot: OAuth flow for Claude Max\n"
+    "2. Authenticate with MoltBot: OAuth flow for Gemini Ultra\n"
+    "3. Install Ollama: brew install ollama && ollama pull llama3.2\n"
+    "4. Set OPENROUTER_API_KEY environment variable\n"
+    "5. Set ANTHROPIC_API_KEY or OPENAI_API_KEY"
+)
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """
+    Whether an error says the provider (not the request) is broken.
+    
+    Connection errors, timeouts, server errors, auth failures and
+    exhausted rate limits count; other 4xx responses are the caller's
+    fault and don't.
+    """
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status in (401, 403, 429)
+    return False
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker for one provider.
+    
+    Closed: requests flow. Open: the provider is skipped until
+    `retry_at`, which backs off exponentially each time the circuit
+    re-opens. Half-open: one trial (a probe or a request) decides
+    whether to close or re-open.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        on_change: Callable[[CircuitBreaker], None] | None = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.on_change = on_change
+        
+        self.state = self.CLOSED
+        self.failures = 0  # Consecutive failures while closed
+        self.trips = 0  # Consecutive openings, for backoff
+        self.retry_at = 0.0
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+    
+    def record_success(self) -> None:
+        """Record a successful request or probe."""
+        with self._lock:
+            changed = self.state != self.CLOSED
+            self.state = self.CLOSED
+            self.failures = 0
+            self.trips = 0
+        if changed and self.on_change:
+            self.on_change(self)
+    
+    def record_failure(self, immediate: bool = False) -> None:
+        """
+        Record a failed request or probe.
+        
+        Args:
+            immediate: Open without waiting for the threshold (e.g. the
+                host refused the connection)
+        """
+        with self._lock:
+            self.failures += 1
+            if not (immediate or self.state == self.HALF_OPEN
+                    or self.failures >= self.failure_threshold):
+                return
+            changed = self.state != self.OPEN
+            self.state = self.OPEN
+            self.failures = 0
+            self.trips += 1
+            backoff = min(self.base_backoff * 2 ** (self.trips - 1), self.max_backoff)
+            self.retry_at = time.monotonic() + backoff
+        if changed and self.on_change:
+            self.on_change(self)
+    
+    def record_exception(self, exc: BaseException) -> None:
+        """Record a request error if it indicates a provider failure."""
+        if is_provider_failure(exc):
+            self.record_failure(immediate=isinstance(exc, httpx.TransportError))
+    
+    def half_open(self) -> bool:
+        """Move an open circuit whose backoff has elapsed to half-open."""
+        with self._lock:
+            if self.state != self.OPEN or time.monotonic() < self.retry_at:
+                return False
+            self.state = self.HALF_OPEN
+            return True
+
+
+@dataclass
+class ProviderEntry:
+    """A registered provider and its health."""
+    
+    name: str
+    factory: Callable[[], Any]
+    local: bool = False  # Usable offline
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    
+    provider: Any = None
+    available: bool | None = None  # None until first probed
+    models: dict[str, tuple[bool, float]] = field(default_factory=dict)  # -> (available, probed at)
+    last_probe: float = 0.0
+    next_probe: float = 0.0
+    last_error: str | None = None
+    
+    @property
+    def healthy(self) -> bool:
+        return bool(self.available) and not self.breaker.is_open
+
+
+class ProviderRegistry:
+    """
+    Health-tracked providers in priority order.
+    
+    Selection reads a precomputed ranking of healthy providers, which is
+    rebuilt only when a provider's health changes.
+    """
+    
+    def __init__(
+        self,
+        probe_interval: float = 60.0,
+        failure_threshold: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        background: bool = True,
+    ):
+        """
+        Initialize the registry.
+        
+        Args:
+            probe_interval: Seconds between re-probes of healthy providers
+            failure_threshold: Consecutive request failures that open a circuit
+            base_backoff: First re-probe delay for a failing provider
+            max_backoff: Cap on the re-probe delay
+            background: Re-probe in a background thread
+        """
+        self.probe_interval = probe_interval
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.background = background
+        
+        self._entries: dict[str, ProviderEntry] = {}
+        self._ranking: tuple[ProviderEntry, ...] = ()
+        self._offline_ranking: tuple[ProviderEntry, ...] = ()
+        self._lock = threading.Lock()
+        self._probe_lock = threading.Lock()
+        self._probed = False
+        
+        self._stop_event = Event()
+        self._wake_event = Event()
+        self._thread: Thread | None = None
+    
+    def register(self, name: str, factory: Callable[[], Any], local: bool = False) -> None:
+        """Register a provider; registration order is priority order."""
+        breaker = CircuitBreaker(
+            failure_threshold=self.failure_threshold,
+            base_backoff=self.base_backoff,
+            max_backoff=self.max_backoff,
+            on_change=lambda _: self._on_breaker_change(),
+        )
+        with self._lock:
+            self._entries[name] = ProviderEntry(
+                name=name, factory=factory, local=local, breaker=breaker
+            )
+    
+    def entry(self, name: str) -> ProviderEntry | None:
+        return self._entries.get(name)
+    
+    def get(self, name: str = "auto", offline: bool = False, exclude: Any = None) -> Any | None:
+        """
+        Get a healthy provider.
+        
+        Args:
+            name: Registered provider name, or "auto" for the best one
+            offline: Only consider local providers
+            exclude: Provider to pass over in "auto" selection (e.g. one
+                that just failed but has not yet tripped its breaker)
+        
+        Returns:
+            The provider, or None if it (or every candidate) is unhealthy
+        """
+        self._ensure_probed()
+        
+        if name == "auto":
+            ranking = self._offline_ranking if offline else self._ranking
+            for entry in ranking:
+                if entry.provider is not exclude:
+                    return entry.provider
+            return None
+        
+        entry = self._entries.get(name)
+        if entry is None or not entry.healthy or (offline and not entry.local):
+            return None
+        return entry.provider
+    
+    def probe(self, name: str) -> bool:
+        """Probe one provider now and update its health."""
+        entry = self._entries[name]
+        
+        try:
+            if entry.provider is None:
+                entry.provider = entry.factory()
+                if hasattr(entry.provider, "breaker"):
+                    entry.provider.breaker = entry.breaker
+            available = bool(entry.provider.is_available())
+            entry.last_error = None
+        except Exception as e:
+            available = False
+            entry.last_error = str(e)
+        
+        now = time.monotonic()
+        entry.last_probe = now
+        entry.available = available
+        if available:
+            entry.breaker.record_success()
+            entry.next_probe = now + self.probe_interval
+        else:
+            entry.breaker.record_failure(immediate=True)
+            entry.next_probe = entry.breaker.retry_at
+        
+        self._rerank()
+        return available
+    
+    def model_available(self, name: str, model: str, check: Callable[[], bool]) -> bool:
+        """
+        Whether a provider serves a model other than its default.
+        
+        The answer is kept in the provider's entry and re-checked at
+        most once per probe interval.
+        
+        Args:
+            name: Registered provider name
+            model: Model name
+            check: Probe for the model (e.g. a copy's `is_available`)
+        """
+        entry = self._entries[name]
+        now = time.monotonic()
+        
+        cached = entry.models.get(model)
+        if cached is not None and now - cached[1] < self.probe_interval:
+            return cached[0]
+        
+        try:
+            available = bool(check())
+        except Exception:
+            available = False
+        entry.models[model] = (available, now)
+        return available
+    
+    def probe_all(self) -> None:
+        """Probe every provider concurrently."""
+        threads = [
+            Thread(target=self.probe, args=(name,), daemon=True)
+            for name in self._entries
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    def status(self) -> dict[str, dict[str, Any]]:
+        """Health summary per provider (for diagnostics)."""
+        return {
+            name: {
+                "available": entry.available,
+                "circuit": entry.breaker.state,
+                "last_error": entry.last_error,
+            }
+            for name, entry in self._entries.items()
+        }
+    
+    def start(self) -> None:
+        """Start re-probing in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = Thread(target=self._probe_loop, daemon=True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """Stop the background thread."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+    
+    def _ensure_probed(self) -> None:
+        if self._probed:
+            return
+        with self._probe_lock:
+            if self._probed:
+                return
+            self.probe_all()
+            self._probed = True
+        if self.background:
+            self.start()
+    
+    def _probe_loop(self) -> None:
+        """Re-probe providers as they come due."""
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            
+            for name, entry in list(self._entries.items()):
+                if self._stop_event.is_set():
+                    return
+                if entry.next_probe > now:
+                    continue
+                if entry.breaker.is_open and not entry.breaker.half_open():
+                    continue
+                self.probe(name)
+            
+            due = [entry.next_probe for entry in self._entries.values()]
+            delay = max(min(due, default=self.probe_interval) - time.monotonic(), 0.05)
+            self._wake_event.wait(delay)
+            self._wake_event.clear()
+    
+    def _on_breaker_change(self) -> None:
+        """A request opened or closed a circuit: re-rank and reschedule probes."""
+        for entry in self._entries.values():
+            if entry.breaker.is_open:
+                entry.next_probe = min(entry.next_probe, entry.breaker.retry_at)
+        self._rerank()
+        self._wake_event.set()
+    
+    def _rerank(self) -> None:
+        with self._lock:
+            ranking = tuple(e for e in self._entries.values() if e.healthy)
+            self._ranking = ranking
+            self._offline_ranking = tuple(e for e in ranking if e.local)
+
+
+def _oauth_factory(name: str) -> Callable[[], Any]:
+    def factory():
+        from inception.auth.oauth_providers import ClawdBotProvider, MoltBotProvider
+        return ClawdBotProvider() if name == "clawdbot" else MoltBotProvider()
+    return factory
+
+
+def create_default_registry(**kwargs: Any) -> ProviderRegistry:
+    """
+    Create a registry with the built-in providers in priority order.
+    
+    OAuth providers (subscription-based) first, then Ollama (local, free),
+    OpenRouter and direct cloud APIs.
+    """
+    registry = ProviderRegistry(**kwargs)
+    
+    try:
+        import inception.auth.oauth_providers  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        registry.register("clawdbot", _oauth_factory("clawdbot"))
+        registry.register("moltbot", _oauth_factory("moltbot"))
+    
+    registry.register("ollama", OllamaProvider, local=True)
+    registry.register("openrouter", OpenRouterProvider)
+    registry.register("cloud", CloudProvider)
+    return registry
+
+
+# Global registry instance
+_registry: ProviderRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_provider_registry() -> ProviderRegistry:
+    """Get or create the global provider registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = create_default_registry()
+    return _registry
+
+
+def close_provider_registry() -> None:
+    """Stop and discard the global provider registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is not None:
+            _registry.stop()
+            _registry = None
@@ -0,0 +1,122 @@
+"""
+Incremental JSON parsing for streamed LLM output.
+
+Extraction prompts ask for one JSON object of arrays
+(`{"entities": [...], "claims": [...], ...}`). `StreamingJSONParser`
+scans the text as it arrives and hands back each array element as soon
+as its closing brace is seen, so callers can act on the first entity
+long before generation finishes.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingJSONParser:
+    """
+    Incremental parser yielding elements of a top-level object's arrays.
+    
+    Each character is scanned once; only the text of the element (or
+    key) currently being read is kept. Text before the opening brace,
+    such as a markdown code fence, is ignored.
+    
+    Example:
+        parser = StreamingJSONParser()
+        for delta in stream:
+            for key, element in parser.feed(delta):
+                ...  # key is e.g. "entities", element a dict
+    """
+    
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._element_start: int | None = None
+        
+        self._last_string: str | None = None  # Last string read at depth 1
+        self._key: str | None = None  # Key of the current member of the top object
+        self._array: str | None = None  # Key of the array being read
+        self.done = False  # Top-level object closed
+    
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """
+        Consume more text.
+        
+        Returns:
+            (array key, element) for each array element completed by
+            this chunk, in order
+        """
+        if self.done:
+            return []
+        
+        completed = []
+        text = self._text + chunk
+        i = self._pos
+        
+        while i < len(text):
+            ch = text[i]
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._last_string = json.loads(text[self._string_start:i + 1])
+            elif ch == '"':
+                if self._depth > 0:
+                    self._in_string = True
+                    self._string_start = i
+            elif ch in "{[":
+                if self._depth == 1 and ch == "[":
+                    self._array = self._key
+                elif self._depth == 2 and ch == "{" and self._array is not None:
+                    self._element_start = i
+                if self._depth > 0 or ch == "{":
+                    self._depth += 1
+            elif ch in "}]":
+                if self._depth > 0:
+                    self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    element = text[self._element_start:i + 1]
+                    self._element_start = None
+                    try:
+                        completed.append((self._array, json.loads(element)))
+                    except json.JSONDecodeError as e:
+                        logger.debug(f"Skipping malformed element: {e}")
+                elif self._depth == 1:
+                    self._array = None
+                elif self._depth == 0 and ch == "}":
+                    self.done = True
+                    break
+            elif ch == ":" and self._depth == 1:
+                self._key = self._last_string
+            
+            i += 1
+        
+        # Keep only text still needed: the open element or string
+        if self._element_start is not None:
+            keep = self._element_start
+        elif self._in_string:
+            keep = self._string_start
+        else:
+            keep = i
+        
+        self._text = text[keep:]
+        self._pos = i - keep
+        if self._element_start is not None:
+            self._element_start -= keep
+        if self._in_string:
+            self._string_start -= keep
+        
+        return completed
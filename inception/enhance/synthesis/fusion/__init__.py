@@ -15,12 +15,24 @@ from inception.enhance.synthesis.fusion.resolver import (
 from inception.enhance.synthesis.fusion.uncertainty import (
     UncertainClaim,
     bayesian_fuse,
+    bayesian_fuse_segments,
+    dempster_shafer_combine_segments,
 )
 from inception.enhance.synthesis.fusion.engine import FusionEngine, FusionResult
+from inception.enhance.synthesis.fusion.index import ClaimIndex
+from inception.enhance.synthesis.fusion.job import (
+    FusionJobResult,
+    IncrementalFusionJob,
+    run_incremental_fusion,
+)
 
 __all__ = [
     "FusionEngine",
     "FusionResult",
+    "IncrementalFusionJob",
+    "FusionJobResult",
+    "run_incremental_fusion",
+    "ClaimIndex",
     "SourceRegistry",
     "SourceInfo",
     "ClaimMatcher",
@@ -30,4 +42,6 @@ __all__ = [
     "Resolution",
     "UncertainClaim",
     "bayesian_fuse",
+    "bayesian_fuse_segments",
+    "dempster_shafer_combine_segments",
 ]
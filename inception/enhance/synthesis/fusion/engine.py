@@ -11,7 +11,7 @@ from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from inception.enhance.synthesis.fusion.sources import SourceRegistry, SourceInfo
-from inception.enhance.synthesis.fusion.matcher import ClaimMatcher, ClaimInfo, MatchResult, MatchType
+from inception.enhance.synthesis.fusion.matcher import ClaimMatcher, ClaimInfo, MatchResult
 from inception.enhance.synthesis.fusion.resolver import ConflictResolver, Resolution, ContradictionType
 from inception.enhance.synthesis.fusion.uncertainty import (
     UncertainClaim,
@@ -23,6 +23,39 @@ from inception.enhance.synthesis.fusion.uncertainty import (
 logger = logging.getLogger(__name__)
 
 
+class UnionFind:
+    """
+    Array-backed disjoint sets over 0..n-1.
+    
+    Path compression (halving) plus union by rank make each operation
+    effectively constant time.
+    """
+    
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+    
+    def find(self, x: int) -> int:
+        """Root of x's set."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+    
+    def union(self, x: int, y: int) -> int:
+        """Merge the sets of x and y; returns the new root."""
+        root_x, root_y = self.find(x), self.find(y)
+        if root_x == root_y:
+            return root_x
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        if self.rank[root_x] == self.rank[root_y]:
+            self.rank[root_x] += 1
+        return root_x
+
+
 @dataclass
 class FusedClaim:
     """A claim after fusion with multiple sources."""
@@ -50,6 +83,7 @@ class FusionResult:
     conflicts_resolved: int
     unresolved_conflicts: int
     stats: FusionStats
+    resolutions: list[tuple[MatchResult, Resolution]] = field(default_factory=list)  # Per conflict
     
     @property
     def success_rate(self) -> float:
@@ -109,20 +143,18 @@ class FusionEngine:
         # Find all matches
         matches = self.claim_matcher.find_matches(claims, threshold=0.65)
         
-        # Group claims by similarity clusters
-        clusters = self._cluster_claims(claims, matches)
+        # Group claims by similarity clusters, with each cluster's conflicts
+        clusters, cluster_conflicts = self._cluster_claims(claims, matches)
         
         fused_claims = []
+        resolutions = []
         conflicts_resolved = 0
         unresolved = 0
         
-        for i, cluster in enumerate(clusters):
+        for i, (cluster, conflicts) in enumerate(zip(clusters, cluster_conflicts)):
             if progress_callback:
                 progress_callback(i + 1, len(clusters))
             
-            # Separate agreeing and conflicting claims
-            conflicts = [m for m in matches if m.is_conflict and self._in_cluster(m, cluster)]
-            
             # Resolve conflicts
             if conflicts:
                 for conflict_match in conflicts:
@@ -131,6 +163,7 @@ class FusionEngine:
                         conflict_claims,
                         self.conflict_resolver.detect_type(conflict_claims[0], conflict_claims[1]) if len(conflict_claims) >= 2 else None,
                     )
+                    resolutions.append((conflict_match, resolution))
                     
                     if resolution.is_resolved:
                         conflicts_resolved += 1
@@ -167,6 +200,7 @@ class FusionEngine:
             conflicts_resolved=conflicts_resolved,
             unresolved_conflicts=unresolved,
             stats=stats,
+            resolutions=resolutions,
         )
         
         self._log_fusion(result)
@@ -177,45 +211,46 @@ class FusionEngine:
         self,
         claims: list[ClaimInfo],
         matches: list[MatchResult],
-    ) -> list[list[ClaimInfo]]:
-        """Cluster claims by similarity using union-find."""
-        # Simple clustering: group by strong matches
-        claim_map = {c.nid: c for c in claims}
-        clusters: dict[int, set[int]] = {}
+    ) -> tuple[list[list[ClaimInfo]], list[list[MatchResult]]]:
+        """
+        Cluster claims by agreeing matches using union-find.
         
-        # Initialize each claim in its own cluster
-        for claim in claims:
-            clusters[claim.nid] = {claim.nid}
+        Returns:
+            (clusters, conflicts): claim clusters in order of first
+            member, and for each the conflict matches touching it
+        """
+        claim_map = {c.nid: c for c in claims}
+        index = {nid: i for i, nid in enumerate(claim_map)}
+        nids = list(claim_map)
+        sets = UnionFind(len(nids))
         
         # Merge clusters for matching claims
         for match in matches:
-            if match.match_type in (MatchType.IDENTICAL, MatchType.PARAPHRASE, MatchType.SUBSUMES):
-                nid1, nid2 = match.claim1_nid, match.claim2_nid
-                
-                # Find clusters
-                cluster1 = None
-                cluster2 = None
-                for root, members in clusters.items():
-                    if nid1 in members:
-                        cluster1 = root
-                    if nid2 in members:
-                        cluster2 = root
-                
-                # Merge if different clusters
-                if cluster1 is not None and cluster2 is not None and cluster1 != cluster2:
-                    clusters[cluster1] |= clusters[cluster2]
-                    del clusters[cluster2]
+            if match.is_agreement:
+                i = index.get(match.claim1_nid)
+                j = index.get(match.claim2_nid)
+                if i is not None and j is not None:
+                    sets.union(i, j)
         
-        # Convert to claim lists
-        return [
-            [claim_map[nid] for nid in members if nid in claim_map]
-            for members in clusters.values()
-        ]
-    
-    def _in_cluster(self, match: MatchResult, cluster: list[ClaimInfo]) -> bool:
-        """Check if match involves claims in cluster."""
-        nids = {c.nid for c in cluster}
-        return match.claim1_nid in nids or match.claim2_nid in nids
+        # Bucket claims, then conflict matches, by root in one pass each
+        roots = [sets.find(i) for i in range(len(nids))]
+        members: dict[int, list[ClaimInfo]] = {}
+        for i, root in enumerate(roots):
+            members.setdefault(root, []).append(claim_map[nids[i]])
+        
+        conflicts: dict[int, list[MatchResult]] = {root: [] for root in members}
+        for match in matches:
+            if not match.is_conflict:
+                continue
+            touched = {
+                roots[index[nid]]
+                for nid in (match.claim1_nid, match.claim2_nid)
+                if nid in index
+            }
+            for root in touched:
+                conflicts[root].append(match)
+        
+        return list(members.values()), [conflicts[root] for root in members]
     
     def _fuse_cluster(self, cluster: list[ClaimInfo]) -> FusedClaim:
         """Fuse a cluster of related claims."""
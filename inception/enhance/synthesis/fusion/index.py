@@ -0,0 +1,297 @@
+"""
+Persistent candidate index for incremental fusion.
+
+Keeps the matcher's view of every claim seen by `IncrementalFusionJob`
+in the graph's LMDB environment, so a run only reads, embeds and probes
+the claims ingested since the last one instead of rebuilding its
+candidate structures from the whole store:
+
+    fusion_claims:   nid (8)    ->  claim fields + float32 embedding
+    fusion_words:    word       ->  nid (8), one duplicate per claim
+    fusion_vectors:  block (4)  ->  rows, dim (8) + nids (rows x 8)
+                                    + unit float32 embeddings (rows x dim)
+
+The vector blocks are an append-only matrix of the embedded claims, so
+dense candidate search scores the new claims against it block by block
+without unpacking a claim record.
+
+The word postings stand in for the matcher's prefix filter. With Jaccard
+similarity t, two word sets x and y share at least ceil(t * |x|) words,
+so any |x| - ceil(t * |x|) + 1 words of x include one of y; probing the
+rarest ones finds every candidate for x while reading short postings.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from typing import Iterable
+
+import msgpack
+import numpy as np
+
+from inception.db import InceptionDB
+from inception.db.keys import decode_nid_key, encode_nid_key
+from inception.enhance.synthesis.fusion.matcher import ClaimInfo
+
+CLAIMS_DB = b"fusion_claims"
+WORDS_DB = b"fusion_words"
+VECTORS_DB = b"fusion_vectors"
+
+# Embeddings per vector block
+VECTOR_BLOCK = 4096
+
+# Similarity entries scored at once in `ClaimIndex.nearest`
+MAX_SCORE_ELEMENTS = 1 << 24
+
+# Highest node NID scanned into the index (a DB_META watermark)
+INDEX_WATERMARK_KEY = "fusion:index"
+
+
+def claim_words(text: str) -> set[str]:
+    """The word set the matcher compares claims by."""
+    return set(text.lower().split())
+
+
+def _pack(claim: ClaimInfo) -> bytes:
+    embedding = None
+    if claim.embedding:
+        embedding = np.asarray(claim.embedding, dtype=np.float32).tobytes()
+    return msgpack.packb({
+        "text": claim.text,
+        "subject": claim.subject,
+        "predicate": claim.predicate,
+        "object": claim.obj,
+        "source_nid": claim.source_nid,
+        "metadata": claim.metadata,
+        "embedding": embedding,
+    })
+
+
+def _unpack(nid: int, raw: bytes) -> ClaimInfo:
+    data = msgpack.unpackb(raw)
+    embedding = data["embedding"]
+    return ClaimInfo(
+        nid=nid,
+        text=data["text"],
+        subject=data["subject"],
+        predicate=data["predicate"],
+        obj=data["object"],
+        source_nid=data["source_nid"],
+        metadata=data["metadata"],
+        embedding=np.frombuffer(embedding, dtype=np.float32).tolist() if embedding else None,
+    )
+
+
+def _unit_rows(vectors: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit length as float32 (zero rows stay zero), like the matcher."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+def _pack_block(nids: np.ndarray, vectors: np.ndarray) -> bytes:
+    rows, dim = vectors.shape
+    return (
+        struct.pack(">II", rows, dim)
+        + nids.astype("<i8").tobytes()
+        + vectors.astype("<f4").tobytes()
+    )
+
+
+def _unpack_block(raw: bytes) -> tuple[np.ndarray, np.ndarray]:
+    rows, dim = struct.unpack_from(">II", raw)
+    nids = np.frombuffer(raw, dtype="<i8", count=rows, offset=8)
+    vectors = np.frombuffer(raw, dtype="<f4", count=rows * dim, offset=8 + rows * 8)
+    return nids, vectors.reshape(rows, dim)
+
+
+class ClaimIndex:
+    """
+    Claims and word postings for fusion candidate search, stored in the graph.
+    
+    Claims are only ever added: a claim node's text does not change
+    after ingestion, and fused claims are not indexed.
+    """
+    
+    def __init__(self, db: InceptionDB):
+        self.db = db
+        with db.env.begin(write=True) as txn:
+            self._claims = db.env.open_db(CLAIMS_DB, txn=txn, create=True)
+            self._words = db.env.open_db(
+                WORDS_DB, txn=txn, create=True, dupsort=True, dupfixed=True
+            )
+            self._vectors = db.env.open_db(VECTORS_DB, txn=txn, create=True)
+    
+    def __len__(self) -> int:
+        with self.db.read_txn() as txn:
+            return txn.stat(self._claims)["entries"]
+    
+    def indexed_nid(self) -> int | None:
+        """Highest node NID scanned into the index, or None if nothing was."""
+        mark = self.db.get_watermark(INDEX_WATERMARK_KEY)
+        return int(mark["watermark"]) if mark else None
+    
+    def add(self, claims: Iterable[ClaimInfo], scanned_nid: int | None = None) -> None:
+        """
+        Store claims (replacing earlier entries for the same NIDs).
+        
+        Args:
+            claims: Claims to store
+            scanned_nid: Highest node NID scanned, recorded in the same
+                transaction so a crash never leaves claims unindexed
+        """
+        with self.db.write_txn() as txn:
+            embedded = []
+            for claim in claims:
+                key = encode_nid_key(claim.nid)
+                old = txn.get(key, db=self._claims)
+                if claim.embedding and (old is None or not msgpack.unpackb(old)["embedding"]):
+                    embedded.append(claim)
+                
+                txn.put(key, _pack(claim), db=self._claims)
+                for word in claim_words(claim.text):
+                    txn.put(word.encode(), key, db=self._words)
+            
+            if embedded:
+                self._append_vectors(
+                    txn,
+                    np.array([c.nid for c in embedded], dtype=np.int64),
+                    _unit_rows([c.embedding for c in embedded]),
+                )
+            
+            if scanned_nid is not None:
+                self.db.put_watermark(INDEX_WATERMARK_KEY, str(scanned_nid), txn=txn)
+    
+    def _append_vectors(self, txn, nids: np.ndarray, vectors: np.ndarray) -> None:
+        """Append embeddings to the vector blocks, filling the last one first."""
+        cursor = txn.cursor(self._vectors)
+        block = 0
+        if cursor.last():
+            block = struct.unpack(">I", cursor.key())[0]
+            last_nids, last_vectors = _unpack_block(cursor.value())
+            if last_vectors.shape[1] != vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"the indexed {last_vectors.shape[1]}"
+                )
+            if len(last_nids) < VECTOR_BLOCK:
+                nids = np.concatenate([last_nids, nids])
+                vectors = np.concatenate([last_vectors, vectors])
+            else:
+                block += 1
+        
+        for start in range(0, len(nids), VECTOR_BLOCK):
+            end = start + VECTOR_BLOCK
+            txn.put(
+                struct.pack(">I", block),
+                _pack_block(nids[start:end], vectors[start:end]),
+                db=self._vectors,
+            )
+            block += 1
+    
+    def vector_count(self) -> int:
+        """Number of claims in the vector blocks."""
+        with self.db.read_txn() as txn:
+            cursor = txn.cursor(self._vectors)
+            if not cursor.last():
+                return 0
+            block = struct.unpack(">I", cursor.key())[0]
+            return block * VECTOR_BLOCK + struct.unpack_from(">I", cursor.value())[0]
+    
+    def nearest(self, vectors: np.ndarray, k: int, threshold: float) -> set[int]:
+        """
+        NIDs among the `k` most similar embedded claims of any query vector.
+        
+        An exact scan: each block is scored against all queries with one
+        matrix product, keeping a running top k per query.
+        
+        Args:
+            vectors: Query embeddings, one per row
+            k: Neighbors per query (a query's own claim counts if indexed)
+            threshold: Minimum cosine similarity
+        
+        Returns:
+            The neighbors' NIDs
+        """
+        queries = _unit_rows(vectors)
+        if not len(queries) or k <= 0:
+            return set()
+        
+        # A little slack for float32 rounding; the matcher applies the
+        # exact threshold to the candidates
+        floor = threshold - 1e-5
+        chunk = max(1, MAX_SCORE_ELEMENTS // VECTOR_BLOCK)
+        found: set[int] = set()
+        
+        with self.db.read_txn() as txn:
+            for start in range(0, len(queries), chunk):
+                block_queries = queries[start:start + chunk]
+                top_sims = np.empty((len(block_queries), 0), dtype=np.float32)
+                top_nids = np.empty((len(block_queries), 0), dtype=np.int64)
+                
+                for _, raw in txn.cursor(self._vectors):
+                    nids, block_vectors = _unpack_block(raw)
+                    sims = np.concatenate([top_sims, block_queries @ block_vectors.T], axis=1)
+                    cols = np.concatenate(
+                        [top_nids, np.broadcast_to(nids, (len(block_queries), len(nids)))],
+                        axis=1,
+                    )
+                    if sims.shape[1] > k:
+                        keep = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+                        sims = np.take_along_axis(sims, keep, axis=1)
+                        cols = np.take_along_axis(cols, keep, axis=1)
+                    top_sims, top_nids = sims, cols
+                
+                found.update(top_nids[top_sims >= floor].tolist())
+        
+        return found
+    
+    def get(self, nids: Iterable[int]) -> dict[int, ClaimInfo]:
+        """Look up claims by NID (unknown NIDs are left out)."""
+        found = {}
+        with self.db.read_txn() as txn:
+            for nid in nids:
+                raw = txn.get(encode_nid_key(nid), db=self._claims)
+                if raw is not None:
+                    found[nid] = _unpack(nid, raw)
+        return found
+    
+    def claims(self, after_nid: int | None = None) -> list[ClaimInfo]:
+        """Indexed claims in NID order (only those after `after_nid` if given)."""
+        with self.db.read_txn() as txn:
+            cursor = txn.cursor(self._claims)
+            if after_nid is not None and not cursor.set_range(encode_nid_key(after_nid + 1)):
+                return []
+            return [_unpack(decode_nid_key(key), raw) for key, raw in cursor]
+    
+    def candidates(self, claims: list[ClaimInfo], threshold: float) -> list[ClaimInfo]:
+        """
+        Indexed claims whose word overlap with any of `claims` may reach `threshold`.
+        
+        Args:
+            claims: Claims to find candidates for
+            threshold: Minimum Jaccard similarity
+        
+        Returns:
+            The candidates, plus `claims` themselves, in NID order
+        """
+        if threshold <= 0:
+            return self.claims()
+        
+        nids = {claim.nid for claim in claims}
+        with self.db.read_txn() as txn:
+            cursor = txn.cursor(self._words)
+            
+            def frequency(word: str) -> int:
+                return cursor.count() if cursor.set_key(word.encode()) else 0
+            
+            for claim in claims:
+                words = sorted(claim_words(claim.text), key=lambda w: (frequency(w), w))
+                for word in words[:len(words) - math.ceil(threshold * len(words)) + 1]:
+                    if cursor.set_key(word.encode()):
+                        nids.update(decode_nid_key(key) for key in cursor.iternext_dup())
+        
+        found = self.get(sorted(nids))
+        found.update((claim.nid, claim) for claim in claims)
+        return [found[nid] for nid in sorted(found)]
@@ -0,0 +1,415 @@
+"""
+Incremental fusion over the persisted claim store.
+
+`FusionEngine.fuse` works on an in-memory list and starts from scratch.
+`IncrementalFusionJob` runs it against `InceptionDB` instead: claims
+ingested since the last run (tracked by a NID watermark) are matched
+against the store, and only the clusters they touch are re-fused.
+Independent groups of touched clusters are fused in a process pool.
+
+Candidates come from a `ClaimIndex` kept in the same environment, which
+stores each claim's embedding and word postings when it is first seen,
+so a run (in a new job or process) only reads, embeds and probes the
+claims ingested since the last one: with an embedding model, their
+nearest neighbors are found by scoring just the new embeddings against
+the index's stored matrix.
+
+Results are persisted in the graph:
+- a fused claim is a FUSED_CLAIM node (so claim counts and listings
+  don't include it twice) with `fused_from` in its payload, and each
+  member claim has a SAME_AS edge to it;
+- each conflict between members becomes a CONTRADICTS edge (loser to
+  winner when resolved) with `fusion` set in its metadata.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from inception.db import InceptionDB, get_db
+from inception.db.keys import EdgeType, NodeKind
+from inception.db.records import Confidence, EdgeRecord, NodeRecord
+from inception.enhance.synthesis.fusion.engine import (
+    FusedClaim,
+    FusionEngine,
+    FusionResult,
+    UnionFind,
+)
+from inception.enhance.synthesis.fusion.index import ClaimIndex
+from inception.enhance.synthesis.fusion.matcher import ClaimInfo
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_KEY = "fusion:claims"
+
+
+@dataclass
+class FusionJobResult:
+    """Result of one incremental fusion run."""
+    
+    new_claims: int = 0
+    groups: int = 0  # Independent groups re-fused
+    fused_nodes: int = 0  # Fused claim nodes written
+    replaced_nodes: int = 0  # Stale fused nodes removed
+    conflicts_resolved: int = 0
+    unresolved_conflicts: int = 0
+    watermark: int | None = None
+
+
+def is_fused_claim(node: NodeRecord) -> bool:
+    """Whether a node is a fused claim written by the fusion job."""
+    return node.kind == NodeKind.FUSED_CLAIM
+
+
+def claim_info_from_node(node: NodeRecord) -> ClaimInfo:
+    """Build the matcher's view of a claim node."""
+    payload = node.payload
+    return ClaimInfo(
+        nid=node.nid,
+        text=payload.get("text", ""),
+        subject=payload.get("subject") or "",
+        predicate=payload.get("predicate") or "",
+        obj=payload.get("object") or "",
+        source_nid=node.source_nids[0] if node.source_nids else None,
+        metadata={"confidence": node.confidence.combined},
+    )
+
+
+def _fuse_group(engine: FusionEngine, claims: list[ClaimInfo]) -> FusionResult:
+    """Fuse one group of claims (runs in a worker process)."""
+    return engine.fuse(claims)
+
+
+class IncrementalFusionJob:
+    """
+    Fuses newly ingested claims into the persisted fused-claim graph.
+    
+    Each run indexes (and, if the matcher has a model, embeds) the claims
+    written since the index's own watermark, then matches only the new
+    claims against their indexed candidates; re-fusion is limited to the
+    clusters those claims touch.
+    """
+    
+    def __init__(
+        self,
+        db: InceptionDB | None = None,
+        engine: FusionEngine | None = None,
+        max_workers: int | None = None,
+        threshold: float = 0.65,
+        top_k: int = 50,
+    ):
+        """
+        Initialize the job.
+        
+        Args:
+            db: Database instance (uses default if not provided)
+            engine: Fusion engine (its source registry and matcher are used)
+            max_workers: Fusion processes (1 fuses in this process)
+            threshold: Minimum similarity for a new claim to touch a cluster
+            top_k: Neighbors considered per new claim
+        """
+        self.db = db or get_db()
+        self.engine = engine or FusionEngine()
+        self.max_workers = max_workers
+        self.threshold = threshold
+        self.top_k = top_k
+        
+        self.index = ClaimIndex(self.db)
+        self._scanned_nid: int | None = None
+    
+    def run(self) -> FusionJobResult:
+        """
+        Fuse claims ingested since the last run.
+        
+        Returns:
+            FusionJobResult summarizing the run
+        """
+        mark = self.db.get_watermark(WATERMARK_KEY)
+        watermark = int(mark["watermark"]) if mark else None
+        result = FusionJobResult(watermark=watermark)
+        
+        new_claims = self._scan(watermark)
+        result.new_claims = len(new_claims)
+        
+        if new_claims:
+            groups, stale = self._touched_groups(new_claims)
+            result.groups = len(groups)
+            fusions = self._fuse(groups)
+            self._persist(fusions, stale, result)
+        
+        if self._scanned_nid is not None and self._scanned_nid != watermark:
+            self.db.put_watermark(WATERMARK_KEY, str(self._scanned_nid))
+            result.watermark = self._scanned_nid
+        
+        return result
+    
+    def _scan(self, watermark: int | None) -> list[ClaimInfo]:
+        """Index claims written since the last scan; return those past the watermark."""
+        indexed = self.index.indexed_nid()
+        self._scanned_nid = indexed
+        
+        claims = []
+        for node in self.db.iter_nodes(after_nid=indexed):
+            self._scanned_nid = node.nid
+            if node.kind == NodeKind.CLAIM:
+                claims.append(claim_info_from_node(node))
+        
+        if self._scanned_nid != indexed:
+            self._embed(claims)
+            self.index.add(claims, self._scanned_nid)
+        
+        if indexed is not None and (watermark is None or watermark < indexed):
+            # Include claims indexed by a run that stopped before fusing them
+            return self.index.claims(after_nid=watermark)
+        return [c for c in claims if watermark is None or c.nid > watermark]
+    
+    def _embed(self, claims: list[ClaimInfo]) -> None:
+        """Encode claims without an embedding, if the matcher has a model."""
+        matcher = self.engine.claim_matcher
+        missing = [c for c in claims if not c.embedding]
+        if getattr(matcher, "_embedding_model", None) is None or not missing:
+            return
+        
+        vectors = matcher._embedding_matrix(missing)
+        for claim, vector in zip(missing, vectors):
+            claim.embedding = vector.tolist()
+    
+    def _candidates(self, new_claims: list[ClaimInfo]) -> list[ClaimInfo]:
+        """Indexed claims the new ones may match, including the new ones."""
+        if getattr(self.engine.claim_matcher, "_embedding_model", None) is None:
+            return self.index.candidates(new_claims, self.threshold)
+        
+        # Claims indexed before a model was set are encoded once and stored
+        if self.index.vector_count() < len(self.index):
+            missing = [c for c in self.index.claims() if not c.embedding]
+            self._embed(missing)
+            self.index.add(missing)
+            
+            embedded = {claim.nid: claim.embedding for claim in missing}
+            for claim in new_claims:
+                claim.embedding = claim.embedding or embedded.get(claim.nid)
+        
+        # Each new claim's top k neighbors (plus itself) over the whole
+        # store are among these, so the matcher's top k is unchanged
+        neighbors = self.index.nearest(
+            np.asarray([c.embedding for c in new_claims], dtype=np.float32),
+            self.top_k + 1,
+            self.threshold,
+        )
+        found = self.index.get(sorted(neighbors))
+        found.update((claim.nid, claim) for claim in new_claims)
+        return [found[nid] for nid in sorted(found)]
+    
+    def _touched_groups(
+        self,
+        new_claims: list[ClaimInfo],
+    ) -> tuple[list[list[ClaimInfo]], list[int]]:
+        """
+        Group new claims with the clusters they match.
+        
+        Returns:
+            (groups, stale): claim groups that can be fused independently,
+            and the fused nodes they replace
+        """
+        matches = self.engine.claim_matcher.find_matches(
+            self._candidates(new_claims),
+            threshold=self.threshold,
+            top_k=self.top_k,
+            queries=[c.nid for c in new_claims],
+        )
+        
+        # A unit is an existing fused cluster or a claim outside any cluster
+        units: dict[int, int] = {}  # unit nid -> index
+        claim_unit: dict[int, int] = {}
+        
+        def unit_of(nid: int) -> int:
+            if nid not in claim_unit:
+                unit = self._cluster_of(nid)
+                claim_unit[nid] = nid if unit is None else unit
+                units.setdefault(claim_unit[nid], len(units))
+            return units[claim_unit[nid]]
+        
+        for claim in new_claims:
+            unit_of(claim.nid)
+        
+        pairs = [(unit_of(m.claim1_nid), unit_of(m.claim2_nid)) for m in matches]
+        sets = UnionFind(len(units))
+        for i, j in pairs:
+            sets.union(i, j)
+        
+        # Collect each component's claims, expanding clusters to their members
+        unit_nids = list(units)
+        components: dict[int, list[int]] = {}
+        for index, unit in enumerate(unit_nids):
+            components.setdefault(sets.find(index), []).append(unit)
+        
+        group_nids = []
+        stale = []
+        for members in components.values():
+            nids: dict[int, None] = {}
+            for unit in members:
+                cluster = self._cluster_members(unit)
+                if cluster is None:
+                    nids[unit] = None
+                else:
+                    stale.append(unit)
+                    nids.update(dict.fromkeys(cluster))
+            group_nids.append(nids)
+        
+        claims = self.index.get(nid for nids in group_nids for nid in nids)
+        groups = [[claims[nid] for nid in nids if nid in claims] for nids in group_nids]
+        return groups, stale
+    
+    def _cluster_of(self, claim_nid: int) -> int | None:
+        """The fused node a claim belongs to (directly, or via the claim that overruled it)."""
+        for _, fused_nid, _ in self.db.get_edges_from(claim_nid, EdgeType.SAME_AS):
+            return fused_nid
+        
+        for _, winner_nid, edge in self.db.get_edges_from(claim_nid, EdgeType.CONTRADICTS):
+            if edge.metadata.get("fusion") and edge.metadata.get("resolved"):
+                for _, fused_nid, _ in self.db.get_edges_from(winner_nid, EdgeType.SAME_AS):
+                    return fused_nid
+        
+        return None
+    
+    def _cluster_members(self, unit_nid: int, txn=None) -> list[int] | None:
+        """Member and overruled claim NIDs of a fused node, or None if not one."""
+        node = self.db.get_node(unit_nid, txn)
+        if node is None or not is_fused_claim(node):
+            return None
+        return node.payload["fused_from"] + node.payload.get("overruled_nids", [])
+    
+    def _fuse(self, groups: list[list[ClaimInfo]]) -> list[FusionResult]:
+        """Fuse groups, in a process pool when there is more than one."""
+        if len(groups) < 2 or self.max_workers == 1:
+            return [self.engine.fuse(claims) for claims in groups]
+        
+        engine = self._worker_engine()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(_fuse_group, [engine] * len(groups), groups))
+    
+    def _worker_engine(self) -> FusionEngine:
+        """
+        A copy of the engine to send to fusion workers.
+        
+        Keeps the registry, resolver and matcher settings; the embedding
+        model stays in this process, since indexed claims already carry
+        their embeddings.
+        """
+        matcher = copy.copy(self.engine.claim_matcher)
+        matcher._embedding_model = None
+        matcher._cache = {}
+        
+        engine = copy.copy(self.engine)
+        engine.claim_matcher = matcher
+        engine._fusion_log = []
+        return engine
+    
+    def _persist(
+        self,
+        fusions: list[FusionResult],
+        stale: list[int],
+        result: FusionJobResult,
+    ) -> None:
+        """Replace stale fused nodes and conflict edges with the new results."""
+        with self.db.write_txn() as txn:
+            for fused_nid in stale:
+                self._remove_fused(fused_nid, txn)
+                result.replaced_nodes += 1
+            
+            for fusion in fusions:
+                result.conflicts_resolved += fusion.conflicts_resolved
+                result.unresolved_conflicts += fusion.unresolved_conflicts
+                
+                edges: dict[tuple[int, int], EdgeRecord] = {}
+                overruled: dict[int, list[int]] = {}  # winner -> losers
+                
+                for match, resolution in fusion.resolutions:
+                    metadata: dict[str, Any] = {
+                        "fusion": True,
+                        "resolved": resolution.is_resolved,
+                        "strategy": resolution.strategy.name,
+                        "explanation": resolution.explanation,
+                    }
+                    if resolution.is_resolved and resolution.winning_nid is not None:
+                        for loser in resolution.losing_nids:
+                            overruled.setdefault(resolution.winning_nid, []).append(loser)
+                            edges[(loser, resolution.winning_nid)] = EdgeRecord(
+                                edge_type=EdgeType.CONTRADICTS, polarity=-1,
+                                weight=resolution.confidence, metadata=metadata,
+                            )
+                    else:
+                        edges.setdefault((match.claim1_nid, match.claim2_nid), EdgeRecord(
+                            edge_type=EdgeType.CONTRADICTS, polarity=-1,
+                            weight=match.confidence, metadata=metadata,
+                        ))
+                
+                for fused in fusion.fused_claims:
+                    if len(fused.nids) < 2:
+                        continue
+                    losers = [n for winner in fused.nids for n in overruled.get(winner, [])]
+                    fused_nid = self._write_fused(fused, losers, txn)
+                    result.fused_nodes += 1
+                    for nid in fused.nids:
+                        edges[(nid, fused_nid)] = EdgeRecord(
+                            edge_type=EdgeType.SAME_AS, polarity=1, weight=1.0,
+                        )
+                
+                self.db.put_edges(
+                    ((a, edge.edge_type, b, edge) for (a, b), edge in edges.items()),
+                    txn,
+                )
+    
+    def _remove_fused(self, fused_nid: int, txn) -> None:
+        """Delete a fused node with its SAME_AS edges and its members' fusion conflict edges."""
+        for member in self._cluster_members(fused_nid, txn) or []:
+            self.db.delete_edge(member, EdgeType.SAME_AS, fused_nid, txn)
+            for _, other, edge in self.db.get_edges_from(member, EdgeType.CONTRADICTS, txn):
+                if edge.metadata.get("fusion"):
+                    self.db.delete_edge(member, EdgeType.CONTRADICTS, other, txn)
+        self.db.delete_node(fused_nid, txn)
+    
+    def _write_fused(self, fused: FusedClaim, overruled: list[int], txn) -> int:
+        """Write a fused claim node and return its NID."""
+        nid = self.db.allocate_nid()
+        source_nids = list(dict.fromkeys(fused.source_nids))
+        
+        node = NodeRecord(
+            nid=nid,
+            kind=NodeKind.FUSED_CLAIM,
+            payload={
+                "text": fused.text,
+                "fused_from": fused.nids,
+                "overruled_nids": overruled,
+                "provenance": fused.provenance,
+                "uncertainty": fused.uncertainty,
+            },
+            source_nids=source_nids,
+            confidence=Confidence(epistemic=min(max(fused.confidence, 0.0), 1.0)),
+            verification_state="corroborated" if len(source_nids) >= 2 else "internal",
+        )
+        self.db.put_node(node, txn)
+        return nid
+
+
+def run_incremental_fusion(
+    db: InceptionDB | None = None,
+    max_workers: int | None = None,
+) -> FusionJobResult:
+    """
+    Convenience function to fuse claims ingested since the last run.
+    
+    Args:
+        db: Database instance (uses default if not provided)
+        max_workers: Fusion processes
+    
+    Returns:
+        FusionJobResult
+    """
+    return IncrementalFusionJob(db=db, max_workers=max_workers).run()
@@ -7,9 +7,13 @@ Design by OPUS-2: Uses vector embeddings for semantic matching.
 from __future__ import annotations
 
 import logging
+import math
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import Any, Collection
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +77,10 @@ class ClaimMatcher:
     1. Compute embeddings for all claims
     2. Find similar claims using cosine similarity
     3. Classify match type (paraphrase, contradiction, etc.)
+    
+    `find_matches` only classifies candidate pairs: each claim's top-k
+    most similar claims, found with a blocked matrix product over the
+    embeddings (or word-set prefix filtering without them).
     """
     
     # Thresholds for match types
@@ -80,6 +88,9 @@ class ClaimMatcher:
     PARAPHRASE_THRESHOLD = 0.85
     RELATED_THRESHOLD = 0.65
     
+    # Rows of the similarity matrix computed at once (bounds memory)
+    MAX_BLOCK_ELEMENTS = 1 << 24
+    
     def __init__(
         self,
         embedding_model: Any = None,  # EmbeddingModel from vectors
@@ -96,13 +107,19 @@ class ClaimMatcher:
         self._use_llm = use_llm_for_contradiction
         self._cache: dict[tuple[int, int], MatchResult] = {}
     
-    def match(self, claim1: ClaimInfo, claim2: ClaimInfo) -> MatchResult:
+    def match(
+        self,
+        claim1: ClaimInfo,
+        claim2: ClaimInfo,
+        similarity: float | None = None,
+    ) -> MatchResult:
         """
         Match two claims and determine their relationship.
         
         Args:
             claim1: First claim
             claim2: Second claim
+            similarity: Similarity if already known (computed otherwise)
         
         Returns:
             Match result with type and similarity
@@ -113,7 +130,8 @@ class ClaimMatcher:
             return self._cache[key]
         
         # Compute similarity
-        similarity = self._compute_similarity(claim1, claim2)
+        if similarity is None:
+            similarity = self._compute_similarity(claim1, claim2)
         
         # Determine match type
         match_type, confidence = self._classify_match(
@@ -137,28 +155,170 @@ class ClaimMatcher:
         self,
         claims: list[ClaimInfo],
         threshold: float = 0.65,
+        top_k: int = 50,
+        queries: Collection[int] | None = None,
     ) -> list[MatchResult]:
         """
-        Find all matching claim pairs above threshold.
+        Find matching claim pairs above threshold.
+        
+        Only each claim's `top_k` most similar claims are classified, so
+        the work is O(n·k); with fewer than `top_k + 1` claims every pair
+        above threshold is found.
         
         Args:
             claims: List of claims to compare
             threshold: Minimum similarity threshold
+            top_k: Neighbors considered per claim
+            queries: NIDs of claims to find matches for (default: all);
+                only pairs involving one of them are returned
         
         Returns:
-            List of match results
+            List of match results, most similar first
         """
-        matches = []
+        if len(claims) < 2:
+            return []
+        
+        rows = None
+        if queries is not None:
+            queries = set(queries)
+            rows = [i for i, c in enumerate(claims) if c.nid in queries]
+            if not rows:
+                return []
+        
+        if self._embedding_model or all(c.embedding for c in claims):
+            candidates = self._embedding_candidates(claims, threshold, top_k, rows)
+        else:
+            candidates = self._overlap_candidates(claims, threshold, top_k, rows)
         
-        for i, claim1 in enumerate(claims):
-            for claim2 in claims[i + 1:]:
-                result = self.match(claim1, claim2)
-                
-                if result.similarity >= threshold:
-                    matches.append(result)
+        matches = []
+        for (i, j), similarity in sorted(candidates.items()):
+            result = self.match(claims[i], claims[j], similarity)
+            if result.similarity >= threshold:
+                matches.append(result)
         
         return sorted(matches, key=lambda m: m.similarity, reverse=True)
     
+    def _embedding_candidates(
+        self,
+        claims: list[ClaimInfo],
+        threshold: float,
+        top_k: int,
+        rows: list[int] | None = None,
+    ) -> dict[tuple[int, int], float]:
+        """Top-k cosine neighbors per claim (or per query row) from a blocked matrix product."""
+        vectors = self._embedding_matrix(claims)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        
+        n = len(claims)
+        query_rows = np.arange(n) if rows is None else np.asarray(rows)
+        k = min(top_k, n - 1)
+        block = max(1, min(n, self.MAX_BLOCK_ELEMENTS // n))
+        candidates: dict[tuple[int, int], float] = {}
+        
+        for start in range(0, len(query_rows), block):
+            block_rows = query_rows[start:start + block]
+            sims = vectors[block_rows] @ vectors.T
+            sims[np.arange(len(block_rows)), block_rows] = -np.inf  # Exclude self-matches
+            
+            if k < n - 1:
+                neighbors = np.argpartition(sims, -k, axis=1)[:, -k:]
+            else:
+                neighbors = np.broadcast_to(np.arange(n), sims.shape)
+            
+            for row, cols in enumerate(neighbors):
+                i = int(block_rows[row])
+                row_sims = sims[row, cols]
+                for j, sim in zip(cols[row_sims >= threshold].tolist(),
+                                  row_sims[row_sims >= threshold].tolist()):
+                    candidates[(min(i, j), max(i, j))] = sim
+        
+        return candidates
+    
+    def _embedding_matrix(self, claims: list[ClaimInfo]) -> np.ndarray:
+        """Stack claim embeddings as float32, batch-encoding missing ones."""
+        missing = [i for i, c in enumerate(claims) if not c.embedding]
+        encoded: dict[int, Any] = {}
+        
+        if missing:
+            texts = [claims[i].text for i in missing]
+            model = self._embedding_model
+            if hasattr(model, "encode_batch"):
+                vectors = model.encode_batch(texts)
+            else:
+                vectors = model.encode(texts)
+            encoded = dict(zip(missing, vectors))
+        
+        return np.asarray(
+            [encoded[i] if i in encoded else c.embedding for i, c in enumerate(claims)],
+            dtype=np.float32,
+        )
+    
+    def _overlap_candidates(
+        self,
+        claims: list[ClaimInfo],
+        threshold: float,
+        top_k: int,
+        rows: list[int] | None = None,
+    ) -> dict[tuple[int, int], float]:
+        """
+        Top-k word-overlap neighbors per claim (or per query row).
+        
+        Uses prefix filtering: with words ordered rarest first, two sets
+        whose Jaccard similarity reaches the threshold share a word among
+        the first `|x| - ceil(threshold·|x|) + 1` of each, so only those
+        words are indexed and probed.
+        """
+        n = len(claims)
+        word_sets = [set(c.text.lower().split()) for c in claims]
+        
+        if threshold <= 0:
+            if rows is None:
+                pairs = {(i, j) for i in range(n) for j in range(i + 1, n)}
+            else:
+                pairs = {(min(i, j), max(i, j)) for i in rows for j in range(n) if j != i}
+        else:
+            frequency = Counter(word for words in word_sets for word in words)
+            prefixes = []
+            for words in word_sets:
+                ordered = sorted(words, key=lambda w: (frequency[w], w))
+                prefixes.append(ordered[:len(ordered) - math.ceil(threshold * len(ordered)) + 1])
+            
+            index: dict[str, list[int]] = defaultdict(list)
+            pairs = set()
+            
+            if rows is None:
+                # Probe each claim against those indexed before it
+                for i, prefix in enumerate(prefixes):
+                    for word in prefix:
+                        for j in index[word]:
+                            pairs.add((j, i))
+                        index[word].append(i)
+            else:
+                for i, prefix in enumerate(prefixes):
+                    for word in prefix:
+                        index[word].append(i)
+                for i in rows:
+                    for word in prefixes[i]:
+                        for j in index[word]:
+                            if j != i:
+                                pairs.add((min(i, j), max(i, j)))
+        
+        neighbors: dict[int, list[tuple[float, int]]] = defaultdict(list)
+        for i, j in pairs:
+            similarity = self._jaccard(word_sets[i], word_sets[j])
+            if similarity >= threshold:
+                neighbors[i].append((similarity, j))
+                neighbors[j].append((similarity, i))
+        
+        candidates: dict[tuple[int, int], float] = {}
+        for i, scored in neighbors.items():
+            scored.sort(key=lambda s: s[0], reverse=True)
+            for similarity, j in scored[:top_k]:
+                candidates[(min(i, j), max(i, j))] = similarity
+        
+        return candidates
+    
     def find_contradictions(
         self,
         claims: list[ClaimInfo],
@@ -189,22 +349,23 @@ class ClaimMatcher:
     
     def _cosine_similarity(self, v1: list[float], v2: list[float]) -> float:
         """Compute cosine similarity between vectors."""
-        import math
+        a = np.asarray(v1, dtype=np.float64)
+        b = np.asarray(v2, dtype=np.float64)
         
-        dot = sum(a * b for a, b in zip(v1, v2))
-        norm1 = math.sqrt(sum(a * a for a in v1))
-        norm2 = math.sqrt(sum(b * b for b in v2))
+        norm1 = np.linalg.norm(a)
+        norm2 = np.linalg.norm(b)
         
         if norm1 == 0 or norm2 == 0:
             return 0.0
         
-        return dot / (norm1 * norm2)
+        return float(a @ b / (norm1 * norm2))
     
     def _word_overlap(self, text1: str, text2: str) -> float:
         """Compute word overlap similarity."""
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-        
+        return self._jaccard(set(text1.lower().split()), set(text2.lower().split()))
+    
+    def _jaccard(self, words1: set[str], words2: set[str]) -> float:
+        """Jaccard similarity of two word sets."""
         if not words1 or not words2:
             return 0.0
         
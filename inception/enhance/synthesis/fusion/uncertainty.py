@@ -2,14 +2,23 @@
 Uncertainty quantification for claims.
 
 Design by OPUS-2: Bayesian fusion of uncertain claims.
+
+The `*_segments` kernels fuse many groups in one call. Claims are laid
+out flat in numpy arrays, and group g is the slice
+`offsets[g]:offsets[g + 1]` (so `offsets` has one more entry than there
+are groups). Sums run left to right within each group, in the same
+order as the scalar functions, so the results are bit-identical.
 """
 
 from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
+from functools import reduce
 from typing import Sequence
 
+import numpy as np
+
 
 @dataclass
 class UncertainClaim:
@@ -38,7 +47,9 @@ class UncertainClaim:
         """Get precision (inverse variance)."""
         if self.std_confidence <= 0:
             return 100.0  # High precision for certain claims
-        return 1.0 / (self.std_confidence ** 2)
+        # Squared by multiplication: libm pow() can round differently
+        # from numpy's square, and the segmented kernels must agree
+        return 1.0 / (self.std_confidence * self.std_confidence)
     
     @property
     def lower_bound(self) -> float:
@@ -209,3 +220,278 @@ def compute_fusion_stats(
         fused_uncertainty=fused_claim.std_confidence,
         uncertainty_reduction=original_uncertainty - fused_claim.std_confidence,
     )
+
+
+# === Segmented (batched) kernels ===
+
+class _Segments:
+    """
+    Ragged group layout for per-group reductions.
+    
+    Most groups are reduced column by column, all at once: step j
+    combines the j-th claim of every group that long, so that loop runs
+    as many times as the longest group has claims. The few longest
+    groups are instead reduced one by one (a sequential numpy accumulate
+    for sums), so one huge group does not mean a Python-level step per
+    claim. How many go that way is picked from rough relative costs.
+    """
+    
+    def __init__(
+        self,
+        offsets: Sequence[int] | np.ndarray,
+        column_cost: float = 1.5,
+        row_cost: float = 0.001,
+    ):
+        """
+        Args:
+            offsets: Group boundaries (length groups + 1)
+            column_cost: Cost of one column step, relative to the fixed
+                cost of reducing one group on its own
+            row_cost: Cost per claim of reducing a group on its own
+        """
+        offsets = np.asarray(offsets, dtype=np.int64)
+        self.starts = offsets[:-1]
+        self.lengths = np.diff(offsets)
+        self.count = len(self.lengths)
+        
+        # Claims covered by the groups (offsets need not start at 0)
+        self.first = int(offsets[0]) if len(offsets) else 0
+        self.end = int(offsets[-1]) if len(offsets) else 0
+        
+        # Reducing the k longest groups on their own leaves the (k+1)-th
+        # longest to set the number of column steps
+        by_length = np.argsort(-self.lengths, kind="stable")
+        sorted_lengths = self.lengths[by_length]
+        separate = np.arange(self.count + 1) + row_cost * np.concatenate(
+            [[0], np.cumsum(sorted_lengths)]
+        )
+        columns = column_cost * np.concatenate([sorted_lengths, [0]])
+        k = int(np.argmin(separate + columns))
+        self.long_groups = by_length[:k].tolist()
+        
+        # Sorted by length descending, the other groups still active at
+        # position j are a prefix of length active[j]
+        self.order = by_length[k:]
+        self.sorted_starts = self.starts[self.order]
+        max_length = int(sorted_lengths[k]) if k < self.count else 0
+        self.active = np.searchsorted(
+            -sorted_lengths[k:], -np.arange(max_length), side="left"
+        )
+    
+    def rows(self, group: int) -> slice:
+        """The claims of one group."""
+        start = int(self.starts[group])
+        return slice(start, start + int(self.lengths[group]))
+    
+    def spread(self, per_group: np.ndarray, size: int) -> np.ndarray:
+        """A per-group value repeated for each of the group's claims (1 outside groups)."""
+        out = np.ones(size)
+        out[self.first:self.end] = np.repeat(per_group, self.lengths)
+        return out
+    
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        """Per-group sums, accumulated left to right like Python's sum()."""
+        acc = np.zeros(len(self.order))
+        for j, active in enumerate(self.active):
+            acc[:active] += values[self.sorted_starts[:active] + j]
+        
+        out = np.zeros(self.count)
+        out[self.order] = acc
+        for group in self.long_groups:
+            # accumulate (unlike add.reduce) never sums pairwise
+            out[group] = np.add.accumulate(values[self.rows(group)])[-1]
+        return out
+    
+    def fold(self, values: np.ndarray, combine, scalar, empty) -> np.ndarray:
+        """
+        Left fold over each group's rows.
+        
+        Args:
+            values: One row per claim
+            combine: Vectorized binary function over stacked rows
+            scalar: The same function over rows as tuples, for groups
+                reduced on their own
+            empty: Result for empty groups
+        """
+        acc = np.empty((len(self.order),) + values.shape[1:])
+        acc[:] = empty
+        
+        nonempty = int(self.active[0]) if len(self.active) else 0
+        acc[:nonempty] = values[self.sorted_starts[:nonempty]]
+        for j, active in enumerate(self.active[1:], start=1):
+            acc[:active] = combine(acc[:active], values[self.sorted_starts[:active] + j])
+        
+        out = np.empty((self.count,) + values.shape[1:])
+        out[self.order] = acc
+        for group in self.long_groups:
+            out[group] = reduce(scalar, map(tuple, values[self.rows(group)].tolist()))
+        return out
+
+
+def bayesian_fuse_segments(
+    means: np.ndarray,
+    stds: np.ndarray,
+    source_weights: np.ndarray,
+    offsets: Sequence[int] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    `bayesian_fuse` over many groups at once.
+    
+    Args:
+        means: Mean confidence per claim
+        stds: Confidence standard deviation per claim
+        source_weights: Source weight per claim
+        offsets: Group boundaries (length groups + 1)
+    
+    Returns:
+        (fused means, fused stds), one entry per group
+    """
+    means = np.asarray(means, dtype=np.float64)
+    stds = np.asarray(stds, dtype=np.float64)
+    segments = _Segments(offsets)
+    
+    precision = np.full_like(stds, 100.0)
+    positive = stds > 0
+    precision[positive] = 1.0 / (stds[positive] * stds[positive])
+    weights = precision * np.asarray(source_weights, dtype=np.float64)
+    
+    total_weight = segments.sum(weights)
+    weighted_sum = segments.sum(weights * means)
+    
+    divisor = np.where(total_weight == 0, 1.0, total_weight)
+    fused_mean = np.clip(weighted_sum / divisor, 0, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fused_std = np.where(total_weight > 0, 1.0 / np.sqrt(total_weight), 1.0)
+    fused_std = np.clip(fused_std, 0.01, 1)
+    
+    return _with_trivial_groups(segments, means, stds, fused_mean, fused_std)
+
+
+def entropy_fusion_segments(
+    means: np.ndarray,
+    stds: np.ndarray,
+    offsets: Sequence[int] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    `entropy_fusion` over many groups at once.
+    
+    Args:
+        means: Mean confidence per claim
+        stds: Confidence standard deviation per claim
+        offsets: Group boundaries (length groups + 1)
+    
+    Returns:
+        (fused means, fused stds), one entry per group
+    """
+    means = np.asarray(means, dtype=np.float64)
+    stds = np.asarray(stds, dtype=np.float64)
+    segments = _Segments(offsets)
+    
+    inv_entropies = 1.0 / (stds + 0.01)
+    total_inv = segments.sum(inv_entropies)
+    
+    # Each claim's weight uses its own group's total
+    weights = inv_entropies / segments.spread(total_inv, len(inv_entropies))
+    
+    fused_mean = segments.sum(weights * means)
+    fused_std = segments.sum(weights * stds)
+    
+    return _with_trivial_groups(segments, means, stds, fused_mean, fused_std)
+
+
+def _with_trivial_groups(
+    segments: _Segments,
+    means: np.ndarray,
+    stds: np.ndarray,
+    fused_mean: np.ndarray,
+    fused_std: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Apply the scalar rules for empty (0.5, 1.0) and single-claim (unchanged) groups."""
+    empty = segments.lengths == 0
+    fused_mean[empty] = 0.5
+    fused_std[empty] = 1.0
+    
+    single = segments.lengths == 1
+    fused_mean[single] = means[segments.starts[single]]
+    fused_std[single] = stds[segments.starts[single]]
+    
+    return fused_mean, fused_std
+
+
+def dempster_shafer_combine_segments(
+    beliefs: np.ndarray,
+    plausibilities: np.ndarray,
+    offsets: Sequence[int] | np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fold `dempster_shafer_combine` over each group, left to right.
+    
+    Args:
+        beliefs: Belief per claim
+        plausibilities: Plausibility per claim
+        offsets: Group boundaries (length groups + 1)
+    
+    Returns:
+        (combined beliefs, combined plausibilities), one entry per group;
+        empty groups get the vacuous (0.0, 1.0)
+    """
+    segments = _Segments(offsets, column_cost=12.0, row_cost=0.3)
+    pairs = np.stack([
+        np.asarray(beliefs, dtype=np.float64),
+        np.asarray(plausibilities, dtype=np.float64),
+    ], axis=1)
+    
+    combined = segments.fold(
+        pairs, _dempster_shafer_pairs, dempster_shafer_combine, empty=(0.0, 1.0)
+    )
+    return combined[:, 0], combined[:, 1]
+
+
+def _dempster_shafer_pairs(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """Vectorized `dempster_shafer_combine` over rows of (belief, plausibility)."""
+    b1, p1 = left[:, 0], left[:, 1]
+    b2, p2 = right[:, 0], right[:, 1]
+    
+    conflict = b1 * (1 - p2) + b2 * (1 - p1)
+    total = conflict >= 1
+    norm = np.where(total, 1.0, 1 - conflict)
+    
+    belief = np.where(total, 0.0, (b1 * b2) / norm)
+    plausibility = np.where(total, 1.0, 1 - ((1 - p1) * (1 - p2)) / norm)
+    return np.stack([belief, plausibility], axis=1)
+
+
+def compute_fusion_stats_segments(
+    stds: np.ndarray,
+    offsets: Sequence[int] | np.ndarray,
+    fused_stds: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    `compute_fusion_stats` over many groups at once.
+    
+    Args:
+        stds: Original standard deviation per claim
+        offsets: Group boundaries (length groups + 1)
+        fused_stds: Fused standard deviation per group
+    
+    Returns:
+        Arrays keyed by FusionStats field name, one entry per group
+        (zeros for empty groups)
+    """
+    segments = _Segments(offsets)
+    fused_stds = np.asarray(fused_stds, dtype=np.float64)
+    
+    totals = segments.sum(np.asarray(stds, dtype=np.float64))
+    counts = segments.lengths
+    nonempty = counts > 0
+    
+    original = np.zeros(segments.count)
+    original[nonempty] = totals[nonempty] / counts[nonempty]
+    fused = np.where(nonempty, fused_stds, 0.0)
+    
+    return {
+        "claims_fused": counts,
+        "original_uncertainty": original,
+        "fused_uncertainty": fused,
+        "uncertainty_reduction": np.where(nonempty, original - fused, 0.0),
+    }
@@ -5,7 +5,13 @@ Design by OPUS-1: Entity linking to Wikidata, DBpedia, Schema.org.
 Integration by GEMINI-PRO: SPARQL queries and federated access.
 """
 
+from inception.enhance.synthesis.ontology.cache import LinkCache, close_link_cache, get_link_cache
 from inception.enhance.synthesis.ontology.linker import OntologyLinker, LinkedEntity
+from inception.enhance.synthesis.ontology.snapshot import (
+    OntologySnapshot,
+    SnapshotEntry,
+    build_snapshot,
+)
 from inception.enhance.synthesis.ontology.wikidata import WikidataClient
 from inception.enhance.synthesis.ontology.dbpedia import DBpediaClient
 
@@ -14,4 +20,10 @@ __all__ = [
     "LinkedEntity",
     "WikidataClient",
     "DBpediaClient",
+    "LinkCache",
+    "get_link_cache",
+    "close_link_cache",
+    "OntologySnapshot",
+    "SnapshotEntry",
+    "build_snapshot",
 ]
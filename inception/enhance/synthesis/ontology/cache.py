@@ -0,0 +1,204 @@
+"""
+Persistent entity link cache.
+
+Stores linking decisions on disk keyed by normalized (name, type), so
+re-linking a corpus only queries Wikidata and DBpedia for names not
+seen before. NIL results are cached too, with a shorter TTL, since a
+knowledge base may gain the entity later. The index is an LMDB
+environment, safe to share between API workers and CLI processes.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+import lmdb
+import msgpack
+
+from inception.config import get_config
+from inception.enhance.synthesis.ontology.snapshot import normalize_label
+
+
+DB_LINKS = b"links"  # normalized name + b"\0" + type -> {fields..., expires_at}
+
+# LinkedEntity fields that are kept; the rest depend on the mention
+LINK_FIELDS = (
+    "wikidata_qid",
+    "wikidata_label",
+    "dbpedia_uri",
+    "dbpedia_label",
+    "linking_confidence",
+    "is_nil",
+)
+
+
+@dataclass
+class LinkCacheStats:
+    """Counters for cache effectiveness."""
+    
+    hits: int = 0
+    nil_hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def link_cache_key(name: str, entity_type: str = "") -> str:
+    """Normalize a name and type into a cache key (case and spacing ignored)."""
+    return f"{normalize_label(name)}\0{normalize_label(entity_type)}"
+
+
+class LinkCache:
+    """
+    On-disk linking decisions with TTL and negative caching.
+    
+    Lookups run in read transactions and never write; expired entries
+    are replaced on the next `put` or removed by `purge_expired`.
+    """
+    
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        ttl_seconds: int | None = None,
+        nil_ttl_seconds: int | None = None,
+        map_size: int = 256 * 1024 * 1024,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            path: Cache directory (default: <cache_dir>/links)
+            ttl_seconds: Time-to-live for linked entries
+            nil_ttl_seconds: Time-to-live for NIL entries
+            map_size: LMDB map size
+        """
+        config = get_config()
+        
+        self.path = Path(path) if path else config.cache_dir / "links"
+        self.ttl_seconds = ttl_seconds or config.pipeline.link_cache_ttl_seconds
+        self.nil_ttl_seconds = nil_ttl_seconds or config.pipeline.link_cache_nil_ttl_seconds
+        self.stats = LinkCacheStats()
+        
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.env = lmdb.open(str(self.path), map_size=map_size, max_dbs=1, create=True)
+        with self.env.begin(write=True) as txn:
+            self._db = self.env.open_db(DB_LINKS, txn=txn, create=True)
+        
+        self._lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the cache."""
+        self.env.close()
+    
+    def __enter__(self) -> LinkCache:
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        with self.env.begin() as txn:
+            return txn.stat(self._db)["entries"]
+    
+    def get(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up a linking decision.
+        
+        Returns:
+            The cached LINK_FIELDS values, or None on a miss or expired entry
+        """
+        return self.get_many([key]).get(key)
+    
+    def get_many(self, keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Look up many keys in one transaction, returning the live hits."""
+        now = time.time()
+        found = {}
+        misses = expired = nil_hits = 0
+        
+        with self.env.begin() as txn:
+            for key in keys:
+                raw = txn.get(key.encode(), db=self._db)
+                if raw is None:
+                    misses += 1
+                    continue
+                
+                entry = msgpack.unpackb(raw)
+                if entry.pop("expires_at") <= now:
+                    misses += 1
+                    expired += 1
+                    continue
+                
+                found[key] = entry
+                nil_hits += entry["is_nil"]
+        
+        self._count(hits=len(found), nil_hits=nil_hits, misses=misses, expired=expired)
+        return found
+    
+    def put(self, key: str, fields: Mapping[str, Any]) -> None:
+        """Store a decision's LINK_FIELDS (other keys are ignored)."""
+        self.put_many([(key, fields)])
+    
+    def put_many(self, items: Iterable[tuple[str, Mapping[str, Any]]]) -> None:
+        """Store many (key, fields) pairs in one transaction."""
+        now = time.time()
+        
+        with self.env.begin(write=True) as txn:
+            for key, fields in items:
+                entry = {name: fields[name] for name in LINK_FIELDS}
+                ttl = self.nil_ttl_seconds if fields["is_nil"] else self.ttl_seconds
+                entry["expires_at"] = now + ttl
+                txn.put(key.encode(), msgpack.packb(entry), db=self._db)
+    
+    def purge_expired(self) -> int:
+        """Remove all expired entries and return how many were removed."""
+        now = time.time()
+        
+        with self.env.begin(write=True) as txn:
+            expired = [
+                raw_key
+                for raw_key, raw in txn.cursor(self._db)
+                if msgpack.unpackb(raw)["expires_at"] <= now
+            ]
+            for raw_key in expired:
+                txn.delete(raw_key, db=self._db)
+        
+        self._count(expired=len(expired))
+        return len(expired)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self.env.begin(write=True) as txn:
+            txn.drop(self._db, delete=False)
+    
+    def _count(self, **deltas) -> None:
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+
+# Global cache instance
+_cache: LinkCache | None = None
+
+
+def get_link_cache() -> LinkCache:
+    """Get or create the global entity link cache."""
+    global _cache
+    if _cache is None:
+        _cache = LinkCache()
+    return _cache
+
+
+def close_link_cache() -> None:
+    """Close the global entity link cache."""
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
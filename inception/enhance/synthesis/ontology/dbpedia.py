@@ -13,6 +13,8 @@ from urllib.parse import quote
 
 import httpx
 
+from inception.enhance.synthesis.ontology.throttle import get_rate_limiter, throttled_get
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,40 +54,60 @@ class DBpediaClient:
     SPARQL_URL = "https://dbpedia.org/sparql"
     LOOKUP_URL = "https://lookup.dbpedia.org/api/search"
     
-    def __init__(self, timeout: float = 30.0):
-        """Initialize DBpedia client."""
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        requests_per_second: float = 20.0,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize DBpedia client.
+        
+        Args:
+            timeout: Request timeout in seconds
+            requests_per_second: Lookup rate limit, shared by all clients
+            max_retries: Retries after a 429 or 503
+        """
         self._client = httpx.Client(
             timeout=timeout,
             headers={"User-Agent": "InceptionBot/1.0"},
         )
         self._cache: dict[str, DBpediaEntity] = {}
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
     
     def lookup(
         self,
         query: str,
         limit: int = 5,
+        raise_on_error: bool = False,
     ) -> list[DBpediaEntity]:
         """
         Lookup entities by name.
         
+        Safe to call from several threads; requests are spaced to the
+        endpoint's rate limit.
+        
         Args:
             query: Search query
             limit: Maximum results
+            raise_on_error: Raise on failure instead of returning []
         
         Returns:
             List of matching entities
         """
         try:
-            response = self._client.get(
+            data = throttled_get(
+                self._client,
                 self.LOOKUP_URL,
                 params={
                     "query": query,
                     "maxResults": limit,
                     "format": "json",
                 },
+                limiter=get_rate_limiter(self.LOOKUP_URL, self.requests_per_second),
+                max_retries=self.max_retries,
             )
-            response.raise_for_status()
-            data = response.json()
             
             entities = []
             for doc in data.get("docs", []):
@@ -98,8 +120,10 @@ class DBpediaClient:
                 ))
             
             return entities
-            
+        
         except Exception as e:
+            if raise_on_error:
+                raise
             logger.error(f"DBpedia lookup failed: {e}")
             return []
     
@@ -179,7 +203,7 @@ class DBpediaClient:
                 results.append(result)
             
             return results
-            
+        
         except Exception as e:
             logger.error(f"DBpedia SPARQL failed: {e}")
             return []
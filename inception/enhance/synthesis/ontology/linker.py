@@ -7,16 +7,35 @@ Design by OPUS-1: Multi-ontology linking with NIL detection.
 from __future__ import annotations
 
 import logging
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable, Iterator
 from difflib import SequenceMatcher
 
+from inception.config import get_config
+from inception.enhance.synthesis.ontology.cache import (
+    LINK_FIELDS,
+    LinkCache,
+    get_link_cache,
+    link_cache_key,
+)
+from inception.enhance.synthesis.ontology.snapshot import OntologySnapshot, SnapshotEntry
 from inception.enhance.synthesis.ontology.wikidata import WikidataClient, WikidataEntity
 from inception.enhance.synthesis.ontology.dbpedia import DBpediaClient, DBpediaEntity
 
 logger = logging.getLogger(__name__)
 
 
+class _NotQueried(LookupError):
+    """A knowledge base was skipped in offline mode; its answer is unknown."""
+
+
+def _not_queried(knowledge_base: str) -> str:
+    return f"{knowledge_base} not queried (offline mode)"
+
+
 @dataclass
 class LinkedEntity:
     """An entity linked to ontology resources."""
@@ -78,23 +97,54 @@ class OntologyLinker:
     2. Candidate ranking (string + context similarity)
     3. NIL detection (no match above threshold)
     4. Link validation (type consistency)
+    
+    Decisions are cached per normalized (name, type) in the shared
+    persistent `LinkCache`, with the most recent ones also kept in
+    memory; lookups that fail are not cached. With an
+    `OntologySnapshot`, a knowledge base is only searched over the
+    network when the snapshot has no link for it, and never in offline
+    mode, where a snapshot miss counts as a failed lookup (neither NIL
+    nor cached).
     """
     
     # Thresholds
     LINK_THRESHOLD = 0.7  # Minimum confidence to accept a link
     NIL_THRESHOLD = 0.4   # Below this, mark as NIL
     
+    STORE_BATCH = 500  # Decisions written to the persistent cache per transaction
+    MEMORY_ENTRIES = 10_000  # Decisions kept in memory (least recently used evicted)
+    SNAPSHOT_MAX_DISTANCE = 1  # Edit distance for fuzzy snapshot matches
+    
     def __init__(
         self,
         wikidata_client: WikidataClient | None = None,
         dbpedia_client: DBpediaClient | None = None,
+        cache: LinkCache | bool = True,
+        max_concurrency: int = 16,
+        snapshot: OntologySnapshot | None = None,
     ):
-        """Initialize ontology linker."""
+        """
+        Initialize ontology linker.
+        
+        Args:
+            wikidata_client: Wikidata client
+            dbpedia_client: DBpedia client
+            cache: Persistent link cache; True uses `get_link_cache()` unless
+                `pipeline.cache_enabled` is off, False caches in memory only
+            max_concurrency: Maximum lookups in flight in `link_entities`
+            snapshot: Offline label index, consulted before the network
+        """
         self.wikidata = wikidata_client or WikidataClient()
         self.dbpedia = dbpedia_client or DBpediaClient()
+        if cache is True:
+            cache = get_link_cache() if get_config().pipeline.cache_enabled else False
+        self.cache: LinkCache | None = None if cache is False else cache
+        self.max_concurrency = max_concurrency
+        self.snapshot = snapshot
         
         self._schema_org_types = self._init_schema_org()
-        self._cache: dict[str, LinkedEntity] = {}
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def _init_schema_org(self) -> dict[str, str]:
         """Initialize Schema.org type mappings."""
@@ -147,55 +197,31 @@ class OntologyLinker:
         Returns:
             Linked entity with ontology connections
         """
-        # Check cache
-        cache_key = f"{name}:{entity_type}"
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
-            return LinkedEntity(
-                nid=nid,
-                name=name,
-                entity_type=entity_type,
-                wikidata_qid=cached.wikidata_qid,
-                wikidata_label=cached.wikidata_label,
-                dbpedia_uri=cached.dbpedia_uri,
-                dbpedia_label=cached.dbpedia_label,
-                schema_org_type=cached.schema_org_type,
-                linking_confidence=cached.linking_confidence,
-                is_nil=cached.is_nil,
-            )
-        
-        result = LinkedEntity(
-            nid=nid,
-            name=name,
-            entity_type=entity_type,
-        )
-        
-        # Try Wikidata first
-        wikidata_result = self._link_wikidata(name, entity_type, context)
-        if wikidata_result:
-            result.wikidata_qid = wikidata_result.qid
-            result.wikidata_label = wikidata_result.label
-            result.linking_confidence = max(result.linking_confidence, 0.8)
-        
-        # Try DBpedia
-        dbpedia_result = self._link_dbpedia(name, entity_type)
-        if dbpedia_result:
-            result.dbpedia_uri = dbpedia_result.uri
-            result.dbpedia_label = dbpedia_result.label
-            result.linking_confidence = max(result.linking_confidence, 0.7)
+        key = link_cache_key(name, entity_type)
+        fields = self._cached([key]).get(key)
+        if fields is not None:
+            return self._entity(nid, name, entity_type, fields)
         
-        # Map to Schema.org type
-        result.schema_org_type = self._map_schema_org(entity_type)
+        errors = []
+        offline = get_config().pipeline.offline_mode
+        wikidata_result, dbpedia_result = self._link_snapshot(name, entity_type, context)
+        if wikidata_result is None:
+            if offline:
+                errors.append(_not_queried("Wikidata"))
+            else:
+                wikidata_result = self._attempt(
+                    self._link_wikidata, errors, name, entity_type, context
+                )
+        if dbpedia_result is None:
+            if offline:
+                errors.append(_not_queried("DBpedia"))
+            else:
+                dbpedia_result = self._attempt(self._link_dbpedia, errors, name, entity_type)
         
-        # Check if NIL
-        if not result.is_linked:
-            result.is_nil = True
-            result.linking_confidence = 0.0
-        
-        # Cache result
-        self._cache[cache_key] = result
-        
-        return result
+        fields = self._decide(wikidata_result, dbpedia_result, errors)
+        if not errors:
+            self._store([(key, fields)])
+        return self._entity(nid, name, entity_type, fields)
     
     def link_entities(
         self,
@@ -206,6 +232,12 @@ class OntologyLinker:
         """
         Link multiple entities.
         
+        Each distinct (name, type) is resolved once: from the in-memory
+        and persistent caches if possible, then the offline snapshot,
+        and otherwise by Wikidata and DBpedia searches run concurrently
+        within each endpoint's rate limit. The first mention's context
+        is used for disambiguation.
+        
         Args:
             entities: List of (nid, name, type) tuples
             context_map: Optional context for each NID
@@ -215,29 +247,243 @@ class OntologyLinker:
             Linking result with all entities
         """
         context_map = context_map or {}
-        linked = []
-        nil_count = 0
+        total = len(entities)
+        keys = [link_cache_key(name, entity_type) for _, name, entity_type in entities]
         
-        for i, (nid, name, entity_type) in enumerate(entities):
-            if progress_callback:
-                progress_callback(i + 1, len(entities))
-            
-            context = context_map.get(nid, "")
-            result = self.link_entity(nid, name, entity_type, context)
-            linked.append(result)
-            
-            if result.is_nil:
-                nil_count += 1
+        decided = self._cached(dict.fromkeys(keys))
+        pending: dict[str, tuple[str, str, str]] = {}
+        for (nid, name, entity_type), key in zip(entities, keys):
+            if key not in decided and key not in pending:
+                pending[key] = (name, entity_type, context_map.get(nid, ""))
         
-        linked_count = sum(1 for e in linked if e.is_linked)
+        mentions = Counter(keys)
+        done = total - sum(mentions[key] for key in pending)
+        if progress_callback and done:
+            progress_callback(done, total)
+        
+        if pending:
+            for key, fields in self._resolve(pending):
+                decided[key] = fields
+                done += mentions[key]
+                if progress_callback:
+                    progress_callback(done, total)
+        
+        linked = [
+            self._entity(nid, name, entity_type, decided[key])
+            for (nid, name, entity_type), key in zip(entities, keys)
+        ]
         
         return LinkingResult(
             linked_entities=linked,
-            total_entities=len(entities),
-            linked_count=linked_count,
-            nil_count=nil_count,
+            total_entities=total,
+            linked_count=sum(1 for e in linked if e.is_linked),
+            nil_count=sum(1 for e in linked if e.is_nil),
         )
     
+    def _resolve(
+        self,
+        pending: dict[str, tuple[str, str, str]],
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Look up uncached keys concurrently, yielding (key, fields) in order."""
+        offline = get_config().pipeline.offline_mode
+        workers = max(1, min(self.max_concurrency, 2 * len(pending)))
+        to_store = []
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for key, (name, entity_type, context) in pending.items():
+                wikidata_result, dbpedia_result = self._link_snapshot(name, entity_type, context)
+                futures[key] = (
+                    self._submit(
+                        pool, wikidata_result, offline, "Wikidata",
+                        self._link_wikidata, name, entity_type, context,
+                    ),
+                    self._submit(
+                        pool, dbpedia_result, offline, "DBpedia",
+                        self._link_dbpedia, name, entity_type,
+                    ),
+                )
+            
+            for key, (wikidata_future, dbpedia_future) in futures.items():
+                errors = []
+                wikidata_result = self._attempt(wikidata_future.result, errors)
+                dbpedia_result = self._attempt(dbpedia_future.result, errors)
+                
+                fields = self._decide(wikidata_result, dbpedia_result, errors)
+                if not errors:
+                    to_store.append((key, fields))
+                    if len(to_store) >= self.STORE_BATCH:
+                        self._store(to_store)
+                        to_store = []
+                yield key, fields
+        
+        self._store(to_store)
+    
+    def _submit(
+        self,
+        pool: ThreadPoolExecutor,
+        found,
+        offline: bool,
+        knowledge_base: str,
+        lookup,
+        *args,
+    ) -> Future:
+        """
+        Schedule a network lookup unless the snapshot answered.
+        
+        In offline mode a snapshot miss fails with `_NotQueried`, so the
+        decision is treated like one after a failed lookup.
+        """
+        if found is not None or offline:
+            future: Future = Future()
+            if found is None:
+                future.set_exception(_NotQueried(_not_queried(knowledge_base)))
+            else:
+                future.set_result(found)
+            return future
+        return pool.submit(lookup, *args)
+    
+    def _attempt(self, fn, errors: list[str], *args):
+        """Call a lookup, recording its error instead of raising."""
+        try:
+            return fn(*args)
+        except _NotQueried as e:
+            errors.append(str(e))
+            return None
+        except Exception as e:
+            logger.warning(f"Entity lookup failed: {e}")
+            errors.append(str(e))
+            return None
+    
+    def _decide(
+        self,
+        wikidata_result: WikidataEntity | None,
+        dbpedia_result: DBpediaEntity | None,
+        errors: list[str],
+    ) -> dict[str, Any]:
+        """Combine the best candidates into linking fields."""
+        fields: dict[str, Any] = {
+            "wikidata_qid": None,
+            "wikidata_label": "",
+            "dbpedia_uri": None,
+            "dbpedia_label": "",
+            "linking_confidence": 0.0,
+            "is_nil": False,
+        }
+        
+        if wikidata_result:
+            fields["wikidata_qid"] = wikidata_result.qid
+            fields["wikidata_label"] = wikidata_result.label
+            fields["linking_confidence"] = 0.8
+        
+        if dbpedia_result:
+            fields["dbpedia_uri"] = dbpedia_result.uri
+            fields["dbpedia_label"] = dbpedia_result.label
+            fields["linking_confidence"] = max(fields["linking_confidence"], 0.7)
+        
+        # NIL only when both knowledge bases answered; a failed or skipped
+        # lookup says nothing about whether the entity exists
+        if errors:
+            fields["link_errors"] = errors
+        elif not (wikidata_result or dbpedia_result):
+            fields["is_nil"] = True
+        
+        return fields
+    
+    def _entity(
+        self,
+        nid: int,
+        name: str,
+        entity_type: str,
+        fields: dict[str, Any],
+    ) -> LinkedEntity:
+        """Build the LinkedEntity for one mention from linking fields."""
+        entity = LinkedEntity(
+            nid=nid,
+            name=name,
+            entity_type=entity_type,
+            schema_org_type=self._map_schema_org(entity_type),
+            **{field_name: fields[field_name] for field_name in LINK_FIELDS},
+        )
+        if "link_errors" in fields:
+            entity.metadata["link_errors"] = list(fields["link_errors"])
+        return entity
+    
+    def _cached(self, keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Linking fields known for keys, from memory then the persistent cache."""
+        found = {}
+        missing = []
+        with self._cache_lock:
+            for key in keys:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    found[key] = self._cache[key]
+                else:
+                    missing.append(key)
+        
+        if missing and self.cache is not None:
+            stored = self.cache.get_many(missing)
+            self._remember(stored.items())
+            found.update(stored)
+        
+        return found
+    
+    def _store(self, items: list[tuple[str, dict[str, Any]]]) -> None:
+        """Remember successful decisions in memory and the persistent cache."""
+        if not items:
+            return
+        
+        self._remember(items)
+        if self.cache is not None:
+            self.cache.put_many(items)
+    
+    def _remember(self, items: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Add decisions to the in-memory layer, evicting the least recently used."""
+        with self._cache_lock:
+            for key, fields in items:
+                self._cache[key] = fields
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.MEMORY_ENTRIES:
+                self._cache.popitem(last=False)
+    
+    def _link_snapshot(
+        self,
+        name: str,
+        entity_type: str,
+        context: str,
+    ) -> tuple[WikidataEntity | None, DBpediaEntity | None]:
+        """Try to link from the offline snapshot, exact labels first."""
+        if self.snapshot is None:
+            return None, None
+        
+        candidates = self.snapshot.lookup(name) or self.snapshot.fuzzy(
+            name, max_distance=self.SNAPSHOT_MAX_DISTANCE, limit=5, prefix_length=1,
+        )
+        
+        # Scored against the label or alias that matched, so aliases
+        # ("Python" for "Python (programming language)") can link
+        best: dict[str, tuple[float, SnapshotEntry]] = {}
+        for candidate in candidates:
+            score = self._score_candidate(
+                name, entity_type, context if candidate.source == "wikidata" else "",
+                candidate.matched, candidate.description,
+            )
+            if score >= self.LINK_THRESHOLD and score > best.get(candidate.source, (0.0, None))[0]:
+                best[candidate.source] = (score, candidate)
+        
+        wikidata_result = dbpedia_result = None
+        if "wikidata" in best:
+            entry = best["wikidata"][1]
+            wikidata_result = WikidataEntity(
+                qid=entry.id, label=entry.label, description=entry.description,
+            )
+        if "dbpedia" in best:
+            entry = best["dbpedia"][1]
+            dbpedia_result = DBpediaEntity(
+                uri=entry.id, label=entry.label, abstract=entry.description,
+            )
+        return wikidata_result, dbpedia_result
+    
     def _link_wikidata(
         self,
         name: str,
@@ -245,7 +491,7 @@ class OntologyLinker:
         context: str,
     ) -> WikidataEntity | None:
         """Try to link to Wikidata."""
-        candidates = self.wikidata.search(name, limit=5)
+        candidates = self.wikidata.search(name, limit=5, raise_on_error=True)
         
         if not candidates:
             return None
@@ -271,7 +517,7 @@ class OntologyLinker:
         entity_type: str,
     ) -> DBpediaEntity | None:
         """Try to link to DBpedia."""
-        candidates = self.dbpedia.lookup(name, limit=3)
+        candidates = self.dbpedia.lookup(name, limit=3, raise_on_error=True)
         
         if not candidates:
             return None
@@ -0,0 +1,417 @@
+"""
+Offline ontology snapshot index.
+
+Maps normalized labels and aliases to Wikidata QIDs and DBpedia URIs
+from a dump subset, so entities can be linked without network calls
+(or at all, in air-gapped deployments). The index is a sorted string
+table read through mmap, so opening it is instant and lookups only
+touch the pages they need:
+
+    magic (8) + key count n (8)
+    n + 1 big-endian offsets (8 each) into the record region
+    records, sorted by key: key (UTF-8) + b"\\0" + msgpack candidates
+
+Each record's candidates are [source, id, label, description] lists.
+Because UTF-8 byte order is code point order, the sorted keys form an
+implicit trie: prefix lookup is a range scan, and fuzzy lookup walks
+the keys sharing edit-distance rows between common prefixes, skipping
+every key under a prefix that is already too far from the query.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+import msgpack
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"INCKBIX1"
+_HEADER = struct.Struct(">8sQ")
+_OFFSET = struct.Struct(">Q")
+
+RDFS_LABEL = "http://www.w3.org/2000/01/rdf-schema#label"
+_NTRIPLE_LITERAL = re.compile(r'^<([^>]+)>\s+<([^>]+)>\s+"((?:[^"\\]|\\.)*)"(?:@([\w-]+))?')
+
+
+@dataclass
+class SnapshotEntry:
+    """A knowledge base entity found in the snapshot."""
+    
+    source: str  # "wikidata" or "dbpedia"
+    id: str  # QID or resource URI
+    label: str
+    description: str = ""
+    matched: str = ""  # Normalized label or alias that matched
+    distance: int = 0  # Edit distance from the query
+
+
+class OntologySnapshot:
+    """
+    Read-only label/alias index over a snapshot file.
+    
+    Example:
+        with OntologySnapshot("kb.idx") as snapshot:
+            snapshot.lookup("Douglas Adams")
+            snapshot.prefix("douglas a")
+            snapshot.fuzzy("Duglas Adams", max_distance=1)
+    """
+    
+    def __init__(self, path: Path | str):
+        """
+        Open a snapshot built by `write_snapshot`.
+        
+        Args:
+            path: Snapshot file
+        
+        Raises:
+            ValueError: If the file is not a snapshot index
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        magic, self._count = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not an ontology snapshot: {self.path}")
+        self._records = _HEADER.size + (self._count + 1) * _OFFSET.size
+    
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self._mm.close()
+        self._file.close()
+    
+    def __enter__(self) -> OntologySnapshot:
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        """Number of distinct labels and aliases."""
+        return self._count
+    
+    def lookup(self, name: str) -> list[SnapshotEntry]:
+        """Entities with a label or alias equal to name (normalized)."""
+        key = normalize_label(name).encode()
+        i = self._lower_bound(key)
+        if i < self._count and self._key(i) == key:
+            return self._entries(i, 0)
+        return []
+    
+    def prefix(self, prefix: str, limit: int = 20) -> list[SnapshotEntry]:
+        """
+        Entities with a label or alias starting with prefix.
+        
+        Args:
+            prefix: Label prefix (normalized before matching)
+            limit: Maximum labels to return entities for
+        
+        Returns:
+            Entities in label order
+        """
+        key = normalize_label(prefix).encode()
+        start = self._lower_bound(key)
+        end = min(self._prefix_end(key, start), start + limit)
+        return [entry for i in range(start, end) for entry in self._entries(i, 0)]
+    
+    def fuzzy(
+        self,
+        name: str,
+        max_distance: int = 2,
+        limit: int = 10,
+        prefix_length: int = 0,
+    ) -> list[SnapshotEntry]:
+        """
+        Entities with a label or alias within an edit distance of name.
+        
+        Args:
+            name: Query (normalized before matching)
+            max_distance: Maximum Levenshtein distance, in characters
+            limit: Maximum labels to return entities for
+            prefix_length: Leading characters that must match exactly;
+                each one narrows the scan to a smaller key range
+        
+        Returns:
+            Entities ordered by distance, then label
+        """
+        query = normalize_label(name)
+        width = len(query) + 1
+        cap = max_distance + 1  # Any larger distance is as good as infinite
+        matches: list[tuple[int, int]] = []
+        
+        # rows[d] is the edit-distance row after the first d characters
+        # of the current key; rows for a shared prefix are reused. Only
+        # the band of cells within max_distance of the diagonal can stay
+        # in range, so the rest are left at the cap
+        rows = [[min(j, cap) for j in range(width)]]
+        previous = ""
+        prefix = query[:prefix_length].encode()
+        i = self._lower_bound(prefix)
+        end = self._prefix_end(prefix, i)
+        
+        while i < end:
+            key = self._key(i).decode()
+            common = min(_common_prefix(previous, key), len(rows) - 1)
+            del rows[common + 1:]
+            
+            pruned = 0
+            for depth in range(common + 1, len(key) + 1):
+                ch = key[depth - 1]
+                above = rows[-1]
+                row = [cap] * width
+                row[0] = min(depth, cap)
+                lo = max(1, depth - max_distance)
+                best = row[0] if lo == 1 else cap
+                for j in range(lo, min(width, depth + max_distance + 1)):
+                    cost = above[j - 1] + (query[j - 1] != ch)
+                    if above[j] + 1 < cost:
+                        cost = above[j] + 1
+                    if row[j - 1] + 1 < cost:
+                        cost = row[j - 1] + 1
+                    row[j] = cost if cost < cap else cap
+                    if cost < best:
+                        best = cost
+                rows.append(row)
+                if best > max_distance:
+                    pruned = depth
+                    break
+            
+            if pruned:
+                # No key under this prefix can come back within range
+                previous = key[:pruned]
+                i = self._prefix_end(previous.encode(), i)
+                continue
+            
+            if rows[-1][-1] <= max_distance:
+                matches.append((rows[-1][-1], i))
+            previous = key
+            i += 1
+        
+        matches.sort()
+        return [
+            entry
+            for distance, i in matches[:limit]
+            for entry in self._entries(i, distance)
+        ]
+    
+    def _offset(self, i: int) -> int:
+        return _OFFSET.unpack_from(self._mm, _HEADER.size + i * _OFFSET.size)[0] + self._records
+    
+    def _key(self, i: int) -> bytes:
+        start = self._offset(i)
+        return self._mm[start:self._mm.find(b"\0", start)]
+    
+    def _entries(self, i: int, distance: int) -> list[SnapshotEntry]:
+        start = self._offset(i)
+        split = self._mm.find(b"\0", start)
+        matched = self._mm[start:split].decode()
+        return [
+            SnapshotEntry(source, entity_id, label, description, matched, distance)
+            for source, entity_id, label, description in msgpack.unpackb(
+                self._mm[split + 1:self._offset(i + 1)]
+            )
+        ]
+    
+    def _lower_bound(self, key: bytes, lo: int = 0, hi: int | None = None) -> int:
+        """Index of the first key >= key in [lo, hi)."""
+        hi = self._count if hi is None else hi
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+    
+    def _prefix_end(self, prefix: bytes, start: int) -> int:
+        """Index of the first key at or after start not starting with prefix."""
+        if not prefix:
+            return self._count
+        # UTF-8 never uses 0xFF, so the last byte can always be bumped
+        bound = prefix[:-1] + bytes([prefix[-1] + 1])
+        
+        # Gallop: the range under a prefix is usually short
+        lo, step = start, 1
+        while start + step < self._count and self._key(start + step) < bound:
+            lo = start + step + 1
+            step *= 2
+        return self._lower_bound(bound, lo, min(start + step, self._count))
+
+
+def normalize_label(text: str) -> str:
+    """Lowercase and collapse whitespace, the form labels are keyed by."""
+    return " ".join(text.lower().split())
+
+
+def _common_prefix(a: str, b: str) -> int:
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+# === Building ===
+
+def write_snapshot(
+    path: Path | str,
+    entities: Iterable[tuple[Iterable[str], SnapshotEntry]],
+) -> int:
+    """
+    Write a snapshot index.
+    
+    The labels are grouped in memory, so this suits dump subsets
+    (millions of labels), not full dumps.
+    
+    Args:
+        path: Output file (replaced atomically)
+        entities: (labels and aliases, entity) pairs
+    
+    Returns:
+        Number of distinct labels written
+    """
+    path = Path(path)
+    by_key: dict[bytes, dict[tuple[str, str], list[str]]] = {}
+    
+    for names, entry in entities:
+        candidate = [entry.source, entry.id, entry.label, entry.description]
+        for name in names:
+            key = normalize_label(name)
+            if key and "\0" not in key:
+                by_key.setdefault(key.encode(), {})[(entry.source, entry.id)] = candidate
+    
+    keys = sorted(by_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, len(keys)))
+        
+        offsets = [0]
+        records = []
+        for key in keys:
+            record = key + b"\0" + msgpack.packb(list(by_key[key].values()))
+            records.append(record)
+            offsets.append(offsets[-1] + len(record))
+        
+        f.write(b"".join(_OFFSET.pack(offset) for offset in offsets))
+        f.writelines(records)
+    
+    os.replace(tmp_path, path)
+    return len(keys)
+
+
+def build_snapshot(
+    path: Path | str,
+    wikidata_dumps: Iterable[Path | str] = (),
+    dbpedia_dumps: Iterable[Path | str] = (),
+    language: str = "en",
+) -> int:
+    """
+    Build a snapshot index from Wikidata JSON and DBpedia label dumps.
+    
+    Args:
+        path: Output file
+        wikidata_dumps: Wikidata JSON dumps (one entity per line)
+        dbpedia_dumps: DBpedia rdfs:label N-Triples files
+        language: Label language to keep
+    
+    Returns:
+        Number of distinct labels written
+    """
+    def entities() -> Iterator[tuple[list[str], SnapshotEntry]]:
+        for dump in wikidata_dumps:
+            yield from read_wikidata_dump(dump, language)
+        for dump in dbpedia_dumps:
+            yield from read_dbpedia_labels(dump, language)
+    
+    count = write_snapshot(path, entities())
+    logger.info(f"Wrote ontology snapshot with {count} labels to {path}")
+    return count
+
+
+def read_wikidata_dump(
+    path: Path | str,
+    language: str = "en",
+) -> Iterator[tuple[list[str], SnapshotEntry]]:
+    """
+    Read entities from a Wikidata JSON dump (optionally .gz or .bz2).
+    
+    Yields:
+        ([label, *aliases], entry) for each entity with a label
+    """
+    with _open_text(path) as f:
+        for line in f:
+            line = line.strip().rstrip(",")
+            if not line or line in ("[", "]"):
+                continue
+            
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping malformed Wikidata dump line in {path}")
+                continue
+            
+            label = item.get("labels", {}).get(language, {}).get("value")
+            if not label or not item.get("id"):
+                continue
+            
+            aliases = [a.get("value", "") for a in item.get("aliases", {}).get(language, [])]
+            description = item.get("descriptions", {}).get(language, {}).get("value", "")
+            yield [label, *aliases], SnapshotEntry("wikidata", item["id"], label, description)
+
+
+def read_dbpedia_labels(
+    path: Path | str,
+    language: str = "en",
+) -> Iterator[tuple[list[str], SnapshotEntry]]:
+    """
+    Read rdfs:label triples from a DBpedia N-Triples dump (optionally .gz or .bz2).
+    
+    Yields:
+        ([label], entry) for each label in the language (or untagged)
+    """
+    with _open_text(path) as f:
+        for line in f:
+            match = _NTRIPLE_LITERAL.match(line)
+            if not match:
+                continue
+            
+            uri, predicate, literal, tag = match.groups()
+            if predicate != RDFS_LABEL or (tag and tag != language):
+                continue
+            
+            label = _unescape_literal(literal)
+            yield [label], SnapshotEntry("dbpedia", uri, label)
+
+
+def _open_text(path: Path | str) -> IO[str]:
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".bz2":
+        return bz2.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def _unescape_literal(literal: str) -> str:
+    """Decode N-Triples string escapes (a superset of JSON's but for \\U)."""
+    if "\\" not in literal:
+        return literal
+    literal = re.sub(r"\\U([0-9A-Fa-f]{8})", lambda m: chr(int(m.group(1), 16)), literal)
+    try:
+        return json.loads(f'"{literal}"')
+    except json.JSONDecodeError:
+        return literal
@@ -0,0 +1,124 @@
+"""
+Per-endpoint request rate limits for knowledge base clients.
+
+Public Wikidata and DBpedia endpoints throttle or ban clients that
+send bursts, so every client talking to one endpoint shares a
+`RateLimiter` that spaces requests out across threads. A 429 or 503
+pauses the whole endpoint for the Retry-After delay before retrying.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any
+
+import httpx
+
+from inception.enhance.llm.providers import parse_retry_after
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 503)
+
+
+class RateLimiter:
+    """
+    Spaces requests to one endpoint at most `rate` per second.
+    
+    Thread-safe: each caller reserves the next free slot under a lock
+    and sleeps until that slot outside the lock.
+    """
+    
+    def __init__(self, rate: float, max_backoff: float = 60.0):
+        self.rate = rate
+        self.max_backoff = max_backoff
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block until this caller may send a request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def set_rate(self, rate: float) -> None:
+        """Change the rate; slots already reserved are kept."""
+        with self._lock:
+            self.rate = rate
+            self._interval = 1.0 / rate if rate > 0 else 0.0
+    
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for a while (after a 429)."""
+        seconds = min(seconds, self.max_backoff)
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
+
+
+# Limiters shared by all clients talking to the same endpoint
+_limiters: dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(endpoint: str, rate: float) -> RateLimiter:
+    """
+    Get the shared limiter for an endpoint at `rate`.
+    
+    The limiter is created on first use; a later call asking for a
+    different rate changes it for every client of the endpoint.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(endpoint)
+        if limiter is None:
+            limiter = _limiters[endpoint] = RateLimiter(rate)
+        elif limiter.rate != rate:
+            logger.warning(
+                "Changing rate limit for %s from %s to %s requests/s",
+                endpoint, limiter.rate, rate,
+            )
+            limiter.set_rate(rate)
+        return limiter
+
+
+def throttled_get(
+    client: httpx.Client,
+    url: str,
+    params: dict[str, Any],
+    limiter: RateLimiter,
+    max_retries: int = 3,
+    headers: dict[str, str] | None = None,
+) -> Any:
+    """
+    GET a JSON resource within an endpoint's rate limit.
+    
+    Args:
+        client: HTTP client
+        url: Endpoint URL
+        params: Query parameters
+        limiter: The endpoint's limiter
+        max_retries: Retries after a 429 or 503
+        headers: Extra request headers
+    
+    Returns:
+        Decoded JSON body
+    
+    Raises:
+        httpx.HTTPError: On failure after retries
+    """
+    for attempt in range(max_retries + 1):
+        limiter.wait()
+        response = client.get(url, params=params, headers=headers)
+        
+        if response.status_code in RETRY_STATUSES and attempt < max_retries:
+            delay = parse_retry_after(response.headers.get("retry-after"))
+            limiter.pause(delay if delay is not None else 2.0 ** attempt)
+            continue
+        
+        response.raise_for_status()
+        return response.json()
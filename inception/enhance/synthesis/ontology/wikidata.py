@@ -12,6 +12,8 @@ from typing import Any
 
 import httpx
 
+from inception.enhance.synthesis.ontology.throttle import get_rate_limiter, throttled_get
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,33 +56,53 @@ class WikidataClient:
     API_URL = "https://www.wikidata.org/w/api.php"
     SPARQL_URL = "https://query.wikidata.org/sparql"
     
-    def __init__(self, timeout: float = 30.0):
-        """Initialize Wikidata client."""
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        requests_per_second: float = 20.0,
+        max_retries: int = 3,
+    ):
+        """
+        Initialize Wikidata client.
+        
+        Args:
+            timeout: Request timeout in seconds
+            requests_per_second: Search rate limit, shared by all clients
+            max_retries: Retries after a 429 or 503
+        """
         self._client = httpx.Client(
             timeout=timeout,
             headers={"User-Agent": "InceptionBot/1.0"},
         )
         self._cache: dict[str, WikidataEntity] = {}
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
     
     def search(
         self,
         query: str,
         language: str = "en",
         limit: int = 5,
+        raise_on_error: bool = False,
     ) -> list[WikidataEntity]:
         """
         Search for entities matching query.
         
+        Safe to call from several threads; requests are spaced to the
+        endpoint's rate limit.
+        
         Args:
             query: Search query
             language: Language code
             limit: Maximum results
+            raise_on_error: Raise on failure instead of returning []
         
         Returns:
             List of matching entities
         """
         try:
-            response = self._client.get(
+            data = throttled_get(
+                self._client,
                 self.API_URL,
                 params={
                     "action": "wbsearchentities",
@@ -89,9 +111,9 @@ class WikidataClient:
                     "limit": limit,
                     "format": "json",
                 },
+                limiter=get_rate_limiter(self.API_URL, self.requests_per_second),
+                max_retries=self.max_retries,
             )
-            response.raise_for_status()
-            data = response.json()
             
             entities = []
             for item in data.get("search", []):
@@ -103,8 +125,10 @@ class WikidataClient:
                 ))
             
             return entities
-            
+        
         except Exception as e:
+            if raise_on_error:
+                raise
             logger.error(f"Wikidata search failed: {e}")
             return []
     
@@ -175,7 +199,7 @@ class WikidataClient:
             
             self._cache[qid] = entity
             return entity
-            
+        
         except Exception as e:
             logger.error(f"Failed to get entity {qid}: {e}")
             return None
@@ -207,7 +231,7 @@ class WikidataClient:
                 results.append(result)
             
             return results
-            
+        
         except Exception as e:
             logger.error(f"SPARQL query failed: {e}")
             return []
@@ -8,18 +8,27 @@ Extension by OPUS-2: Constraint propagation and SAT solving.
 from inception.enhance.synthesis.temporal.relations import (
     TemporalRelation,
     AllenRelation,
+    COMPOSITION_MASKS,
     allen_compose,
+    compose_masks,
+    mask_to_relations,
+    relation_mask,
 )
 from inception.enhance.synthesis.temporal.parser import TemporalParser, TemporalExpression
 from inception.enhance.synthesis.temporal.network import TemporalNetwork, TemporalConstraint
-from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner, TemporalFact
+from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner, TemporalFact, EventOrdering
 
 __all__ = [
     "TemporalReasoner",
     "TemporalFact",
+    "EventOrdering",
     "TemporalRelation",
     "AllenRelation",
     "allen_compose",
+    "COMPOSITION_MASKS",
+    "compose_masks",
+    "relation_mask",
+    "mask_to_relations",
     "TemporalParser",
     "TemporalExpression",
     "TemporalNetwork",
@@ -2,18 +2,29 @@
 Temporal constraint network for reasoning.
 
 Design by OPUS-1: Constraint propagation using Allen's Interval Algebra.
+
+Propagation is PC-2 path consistency: each pair of events holds a
+13-bit mask of possible relations, and a queue of pairs whose mask
+narrowed drives the revision of the triangles through them. Pairs
+with no constraint allow every relation and are not stored, so sparse
+networks only touch the triangles their constraints form.
 """
 
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Set
+from typing import Any, Callable, Set
 
 from inception.enhance.synthesis.temporal.relations import (
+    ALL_RELATIONS_MASK,
     AllenRelation,
-    allen_compose,
     allen_inverse,
+    compose_masks,
+    inverse_mask,
+    mask_to_relations,
+    relation_mask,
 )
 
 logger = logging.getLogger(__name__)
@@ -90,6 +101,19 @@ class TemporalNetwork:
         self._events: set[int] = set()
         self._inferred: list[InferredRelation] = []
         self._inconsistencies: list[Inconsistency] = []
+        self._adjacent: dict[int, set[int]] = {}  # Events each event has a constraint with
+        
+        # Path consistency state: masks of constrained pairs (both
+        # directions), who each event is constrained against, and the
+        # pairs still to propagate
+        self._masks: dict[tuple[int, int], int] = {}
+        self._neighbors: dict[int, set[int]] = {}
+        self._queue: deque[tuple[int, int]] = deque()
+        self._stale = False  # A constraint was replaced; rebuild masks
+        
+        self._reported: dict[tuple[int, int], int] = {}  # Masks already reported as inferred
+        self._conflicts: set[tuple[int, int, int]] = set()  # Paths already reported inconsistent
+        self._cycles: set[tuple[int, ...]] = set()  # Precedence cycles already reported
     
     @property
     def events(self) -> set[int]:
@@ -139,6 +163,17 @@ class TemporalNetwork:
         # Also store inverse
         inv_key = (constraint.event2_nid, constraint.event1_nid)
         self._constraints[inv_key] = constraint.inverse()
+        self._link(*key)
+        
+        # Narrowing a pair propagates incrementally; anything else
+        # (a replaced or contradicted relation) invalidates the masks
+        mask = relation_mask(constraint.relation)
+        current = self._masks.get(key, ALL_RELATIONS_MASK)
+        if mask & current != mask:
+            self._stale = True
+        elif mask != current:
+            _set_mask(self._masks, self._neighbors, key, mask)
+            self._queue.append(key)
         
         if propagate:
             return self.propagate()
@@ -152,90 +187,177 @@ class TemporalNetwork:
         """Get constraint between two events."""
         return self._constraints.get((event1_nid, event2_nid))
     
+    def constrained_with(self, event_nid: int) -> set[int]:
+        """Events with a constraint (stated or inferred) against an event."""
+        return set(self._adjacent.get(event_nid, ()))
+    
+    def _link(self, a: int, b: int) -> None:
+        self._adjacent.setdefault(a, set()).add(b)
+        self._adjacent.setdefault(b, set()).add(a)
+    
+    def get_relations(self, event1_nid: int, event2_nid: int) -> Set[AllenRelation]:
+        """Get the relations still possible between two events."""
+        return mask_to_relations(self._masks.get((event1_nid, event2_nid), ALL_RELATIONS_MASK))
+    
     def propagate(self) -> list[InferredRelation]:
         """
-        Propagate constraints using Allen's composition.
+        Propagate constraints to path consistency.
         
-        For each pair of constraints A->B and B->C, infer A->C.
+        Every pair whose possible relations narrowed is reported once
+        per change; pairs narrowed to a single relation become inferred
+        constraints. A path contradicting a single relation is recorded
+        as an inconsistency and leaves that pair unchanged.
         
         Returns:
             List of newly inferred relations
         """
-        inferred = []
+        if self._stale:
+            self._rebuild()
+        
+        paths: dict[tuple[int, int], list[int]] = {}
+        confidence: dict[tuple[int, int], float] = {}
+        
+        def pair_confidence(a: int, b: int) -> float:
+            constraint = self._constraints.get((a, b))
+            if constraint is not None:
+                return constraint.confidence
+            return confidence.get((a, b), confidence.get((b, a), 1.0))
         
-        # Group constraints by event
-        outgoing: dict[int, list[TemporalConstraint]] = {}
-        for c in self._constraints.values():
-            if c.event1_nid not in outgoing:
-                outgoing[c.event1_nid] = []
-            outgoing[c.event1_nid].append(c)
+        def on_revise(a: int, b: int, c: int) -> None:
+            paths[(a, c)] = [a, b, c]
+            confidence[(a, c)] = pair_confidence(a, b) * pair_confidence(b, c)
         
-        # For each event B, find A->B->C chains
-        for b in self._events:
-            # Constraints into B (A->B)
-            into_b = [
-                c for c in self._constraints.values()
-                if c.event2_nid == b
-            ]
+        _propagate_masks(
+            self._masks, self._neighbors, self._queue,
+            fixed=self._constraints,
+            on_revise=on_revise,
+            on_conflict=self._record_conflict,
+        )
+        
+        inferred = []
+        for (a, c), path in paths.items():
+            if (a, c) in self._constraints:
+                continue
             
-            # Constraints out of B (B->C)
-            out_of_b = outgoing.get(b, [])
+            mask = self._masks[(a, c)]
+            relations = mask_to_relations(mask)
             
-            for ab in into_b:
-                for bc in out_of_b:
-                    if ab.event1_nid == bc.event2_nid:
-                        continue  # Skip A->B->A
-                    
-                    a = ab.event1_nid
-                    c = bc.event2_nid
-                    
-                    # Check if we already have A->C
-                    existing = self.get_constraint(a, c)
-                    
-                    # Compose relations
-                    possible = allen_compose(ab.relation, bc.relation)
-                    
-                    if existing:
-                        # Check consistency
-                        if existing.relation not in possible:
-                            self._inconsistencies.append(Inconsistency(
-                                constraint1=ab,
-                                constraint2=bc,
-                                inferred=InferredRelation(
-                                    event1_nid=a,
-                                    event2_nid=c,
-                                    possible_relations=possible,
-                                    inference_path=[a, b, c],
-                                ),
-                                existing=existing,
-                                explanation=f"Inferred {possible} but have {existing.relation}",
-                            ))
-                    else:
-                        # Record inference
-                        inf = InferredRelation(
-                            event1_nid=a,
-                            event2_nid=c,
-                            possible_relations=possible,
-                            inference_path=[a, b, c],
-                            confidence=ab.confidence * bc.confidence,
-                        )
-                        inferred.append(inf)
-                        self._inferred.append(inf)
-                        
-                        # If determinate, add as constraint
-                        if inf.is_determinate:
-                            new_constraint = TemporalConstraint(
-                                event1_nid=a,
-                                event2_nid=c,
-                                relation=inf.single_relation,
-                                confidence=inf.confidence,
-                                is_inferred=True,
-                            )
-                            self._constraints[(a, c)] = new_constraint
-                            self._constraints[(c, a)] = new_constraint.inverse()
+            # If determinate, add as constraint
+            if len(relations) == 1:
+                new_constraint = TemporalConstraint(
+                    event1_nid=a,
+                    event2_nid=c,
+                    relation=next(iter(relations)),
+                    confidence=confidence[(a, c)],
+                    is_inferred=True,
+                )
+                self._constraints[(a, c)] = new_constraint
+                self._constraints[(c, a)] = new_constraint.inverse()
+                self._link(a, c)
+            
+            if self._reported.get((a, c)) == mask:
+                continue
+            self._reported[(a, c)] = mask
+            self._reported[(c, a)] = inverse_mask(mask)
+            
+            inf = InferredRelation(
+                event1_nid=a,
+                event2_nid=c,
+                possible_relations=relations,
+                inference_path=path,
+                confidence=confidence[(a, c)],
+            )
+            inferred.append(inf)
+            self._inferred.append(inf)
         
         return inferred
     
+    def _rebuild(self) -> None:
+        """Reset the masks to the stated constraints and requeue them all."""
+        self._constraints = {
+            key: c for key, c in self._constraints.items() if not c.is_inferred
+        }
+        self._adjacent = {}
+        for a, b in self._constraints:
+            self._link(a, b)
+        self._masks, self._neighbors, self._queue = _initial_state(self._constraints)
+        self._stale = False
+    
+    def _record_conflict(self, a: int, b: int, c: int, possible: int) -> None:
+        """Record that the path a -> b -> c rules out every relation left for (a, c)."""
+        if (a, b, c) in self._conflicts:
+            return
+        
+        constraint1 = self._definite(a, b)
+        constraint2 = self._definite(b, c)
+        existing = self._definite(a, c)
+        if constraint1 is None or constraint2 is None or existing is None:
+            logger.debug(f"Inconsistent path {a} -> {b} -> {c}")
+            return
+        
+        self._conflicts.add((a, b, c))
+        inferred = InferredRelation(
+            event1_nid=a,
+            event2_nid=c,
+            possible_relations=mask_to_relations(possible),
+            inference_path=[a, b, c],
+        )
+        self._inconsistencies.append(Inconsistency(
+            constraint1=constraint1,
+            constraint2=constraint2,
+            inferred=inferred,
+            existing=existing,
+            explanation=f"Inferred {inferred.possible_relations} but have {existing.relation}",
+        ))
+    
+    def record_cycle(self, path: list[int]) -> None:
+        """
+        Record a cycle of BEFORE/MEETS constraints as an inconsistency.
+        
+        Args:
+            path: Events on the cycle, each constrained to precede the
+                next and the last to precede the first. The chain from
+                the first event to the last implies BEFORE, which the
+                constraint closing the cycle contradicts.
+        """
+        start = path.index(min(path))
+        key = tuple(path[start:] + path[:start])
+        if len(path) < 3 or key in self._cycles:
+            return
+        self._cycles.add(key)
+        
+        first, last = path[0], path[-1]
+        inferred = InferredRelation(
+            event1_nid=first,
+            event2_nid=last,
+            possible_relations={AllenRelation.BEFORE},
+            inference_path=list(path),
+        )
+        existing = self._constraints[(first, last)]
+        self._inconsistencies.append(Inconsistency(
+            constraint1=self._constraints[(path[0], path[1])],
+            constraint2=self._constraints[(path[-2], path[-1])],
+            inferred=inferred,
+            existing=existing,
+            explanation=(
+                f"Events {path} form a precedence cycle: inferred "
+                f"{inferred.possible_relations} but have {existing.relation}"
+            ),
+        ))
+    
+    def _definite(self, a: int, b: int) -> TemporalConstraint | None:
+        """The single relation known between two events, as a constraint."""
+        constraint = self._constraints.get((a, b))
+        if constraint is not None:
+            return constraint
+        
+        relations = mask_to_relations(self._masks.get((a, b), ALL_RELATIONS_MASK))
+        if len(relations) != 1:
+            return None
+        return TemporalConstraint(
+            event1_nid=a, event2_nid=b, relation=relations.pop(), is_inferred=True,
+        )
+    
     def get_inconsistencies(self) -> list[Inconsistency]:
         """Get all detected inconsistencies."""
         return self._inconsistencies.copy()
@@ -248,45 +370,127 @@ class TemporalNetwork:
         """
         Compute transitive closure of the network.
         
+        Propagates a copy of the network, leaving its own state as is.
+        
         Returns:
-            Mapping from event pairs to possible relations
+            Mapping from event pairs to possible relations, for every
+            pair narrower than "any relation"
         """
-        closure: dict[tuple[int, int], Set[AllenRelation]] = {}
+        if self._stale:
+            masks, neighbors, queue = _initial_state(self._constraints)
+        else:
+            masks = dict(self._masks)
+            neighbors = {event: set(others) for event, others in self._neighbors.items()}
+            queue = deque(self._queue)
         
-        # Initialize with known constraints
-        for (e1, e2), c in self._constraints.items():
-            closure[(e1, e2)] = {c.relation}
+        _propagate_masks(masks, neighbors, queue, fixed=self._constraints)
         
-        # Iterate until fixed point
-        changed = True
-        while changed:
-            changed = False
-            
-            for e1 in self._events:
-                for e2 in self._events:
-                    if e1 == e2:
-                        continue
-                    
-                    for e3 in self._events:
-                        if e3 in (e1, e2):
-                            continue
-                        
-                        r12 = closure.get((e1, e2))
-                        r23 = closure.get((e2, e3))
-                        
-                        if r12 and r23:
-                            # Compute composition
-                            composed: Set[AllenRelation] = set()
-                            for r1 in r12:
-                                for r2 in r23:
-                                    composed |= allen_compose(r1, r2)
-                            
-                            key = (e1, e3)
-                            if key not in closure:
-                                closure[key] = composed
-                                changed = True
-                            elif not composed.issubset(closure[key]):
-                                closure[key] |= composed
-                                changed = True
+        return {pair: mask_to_relations(mask) for pair, mask in masks.items()}
+
+
+def _set_mask(
+    masks: dict[tuple[int, int], int],
+    neighbors: dict[int, set[int]],
+    pair: tuple[int, int],
+    mask: int,
+) -> None:
+    """Store a pair's mask and its inverse."""
+    a, b = pair
+    masks[pair] = mask
+    masks[(b, a)] = inverse_mask(mask)
+    neighbors.setdefault(a, set()).add(b)
+    neighbors.setdefault(b, set()).add(a)
+
+
+def _initial_state(
+    constraints: dict[tuple[int, int], TemporalConstraint],
+) -> tuple[dict[tuple[int, int], int], dict[int, set[int]], deque[tuple[int, int]]]:
+    """Masks, neighbors and a full queue for a set of constraints."""
+    masks: dict[tuple[int, int], int] = {}
+    neighbors: dict[int, set[int]] = {}
+    queue: deque[tuple[int, int]] = deque()
+    
+    for (a, b), constraint in constraints.items():
+        if a < b:
+            _set_mask(masks, neighbors, (a, b), relation_mask(constraint.relation))
+            queue.append((a, b))
+    
+    return masks, neighbors, queue
+
+
+def _propagate_masks(
+    masks: dict[tuple[int, int], int],
+    neighbors: dict[int, set[int]],
+    queue: deque[tuple[int, int]],
+    fixed: dict[tuple[int, int], Any],
+    on_revise: Callable[[int, int, int], None] | None = None,
+    on_conflict: Callable[[int, int, int, int], None] | None = None,
+) -> None:
+    """
+    PC-2: revise the triangles through each queued pair until none narrows.
+    
+    When (i, j) changed, (i, k) is revised through j for every k
+    constrained against j, and (k, j) through i for every k constrained
+    against i. Unconstrained pairs compose to every relation, so only
+    neighbors need visiting.
+    
+    Args:
+        masks: Pair masks, updated in place (both directions)
+        neighbors: Constrained events per event, updated in place
+        queue: Pairs whose mask changed, drained
+        fixed: Pairs that may not be narrowed (stated constraints)
+        on_revise: Called with (a, b, c) when (a, c) narrows via b
+        on_conflict: Called with (a, b, c, composed) when the path via
+            b leaves (a, c) no relation
+    """
+    queued = set(queue)
+    
+    def revise(a: int, b: int, c: int, composed: int) -> None:
+        pair = (a, c)
+        current = masks.get(pair, ALL_RELATIONS_MASK)
+        narrowed = current & composed
+        if narrowed == current:
+            return
+        
+        if narrowed == 0 or pair in fixed:
+            if on_conflict is not None:
+                on_conflict(a, b, c, composed)
+            return
+        
+        _set_mask(masks, neighbors, pair, narrowed)
+        if on_revise is not None:
+            on_revise(a, b, c)
+        if pair not in queued and (c, a) not in queued:
+            queue.append(pair)
+            queued.add(pair)
+    
+    # Compositions seen so far, keyed by mask1 << 13 | mask2
+    composed_cache: dict[int, int] = {}
+    
+    while queue:
+        pair = queue.popleft()
+        queued.discard(pair)
+        i, j = pair
+        r_ij = masks[pair]
+        
+        for k in list(neighbors[j]):
+            if k == i:
+                continue
+            r_jk = masks[(j, k)]
+            key = r_ij << 13 | r_jk
+            composed = composed_cache.get(key)
+            if composed is None:
+                composed = composed_cache[key] = compose_masks(r_ij, r_jk)
+            if composed != ALL_RELATIONS_MASK:
+                revise(i, j, k, composed)
         
-        return closure
+        for k in list(neighbors[i]):
+            if k == j:
+                continue
+            r_ki = masks[(k, i)]
+            key = r_ki << 13 | r_ij
+            composed = composed_cache.get(key)
+            if composed is None:
+                composed = composed_cache[key] = compose_masks(r_ki, r_ij)
+            if composed != ALL_RELATIONS_MASK:
+                revise(k, i, j, composed)
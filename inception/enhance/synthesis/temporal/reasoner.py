@@ -7,10 +7,12 @@ Combines parsing, constraint networks, and validation.
 from __future__ import annotations
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Callable
 
+from inception.db.intervals import IntervalIndex
 from inception.enhance.synthesis.temporal.relations import (
     AllenRelation,
     TemporalRelation,
@@ -27,6 +29,11 @@ from inception.enhance.synthesis.temporal.network import (
 logger = logging.getLogger(__name__)
 
 
+def _epoch(time: datetime | None) -> float | None:
+    """Seconds since the epoch, for indexing (naive times are local)."""
+    return None if time is None else time.timestamp()
+
+
 @dataclass
 class TemporalFact:
     """A fact with temporal scope."""
@@ -77,6 +84,20 @@ class TemporalFact:
         return True
 
 
+@dataclass
+class EventOrdering:
+    """Events in temporal order, as far as the constraints determine it."""
+    
+    order: list[int]  # A linear order consistent with the constraints
+    levels: list[list[int]]  # Layers; events within one are not ordered against each other
+    cycles: list[list[int]]  # Events on cycles of BEFORE/MEETS constraints
+    
+    @property
+    def is_total(self) -> bool:
+        """Check if the constraints fix a single order."""
+        return not self.cycles and all(len(layer) == 1 for layer in self.levels)
+
+
 @dataclass
 class TemporalReasoningResult:
     """Result of temporal reasoning."""
@@ -114,6 +135,7 @@ class TemporalReasoner:
         self.network = network or TemporalNetwork()
         
         self._facts: dict[int, list[TemporalFact]] = {}  # By subject NID
+        self._fact_index: dict[int, IntervalIndex[int]] = {}  # Validity -> position in _facts
     
     def add_event(
         self,
@@ -191,21 +213,26 @@ class TemporalReasoner:
         """Add a temporal fact."""
         if fact.subject_nid not in self._facts:
             self._facts[fact.subject_nid] = []
-        self._facts[fact.subject_nid].append(fact)
+            self._fact_index[fact.subject_nid] = IntervalIndex()
+        
+        facts = self._facts[fact.subject_nid]
+        self._fact_index[fact.subject_nid].add(
+            _epoch(fact.valid_from), _epoch(fact.valid_to), len(facts)
+        )
+        facts.append(fact)
     
     def get_facts_at_time(
         self,
         subject_nid: int,
         time: datetime,
     ) -> list[TemporalFact]:
-        """Get facts valid at a specific time."""
-        facts = self._facts.get(subject_nid, [])
+        """Get facts valid at a specific time, in the order they were added."""
+        index = self._fact_index.get(subject_nid)
+        if index is None:
+            return []
         
-        return [
-            f for f in facts
-            if (f.valid_from is None or f.valid_from <= time) and
-               (f.valid_to is None or f.valid_to >= time)
-        ]
+        facts = self._facts[subject_nid]
+        return [facts[i] for i in sorted(index.at(_epoch(time)))]
     
     def get_current_facts(self, subject_nid: int) -> list[TemporalFact]:
         """Get currently valid facts for a subject."""
@@ -224,34 +251,73 @@ class TemporalReasoner:
         Returns:
             NIDs in temporal order (earliest first)
         """
-        if len(event_nids) <= 1:
-            return event_nids
+        return self.partial_order(event_nids).order
+    
+    def partial_order(self, event_nids: list[int]) -> EventOrdering:
+        """
+        Order events by their BEFORE/MEETS constraints, in O(V + E).
         
-        # Build ordering from constraints
-        before_count: dict[int, int] = {nid: 0 for nid in event_nids}
+        A topological sort of the precedence graph: events are layered
+        by the longest chain of predecessors leading to them, so events
+        in one layer are not ordered against each other. Events on a
+        cycle (A before B before A) are inconsistent; each cycle is
+        recorded as a network inconsistency (so `validate_consistency`
+        reports it) and its events are kept together in one layer.
         
-        for e1 in event_nids:
-            for e2 in event_nids:
-                if e1 == e2:
-                    continue
-                
-                constraint = self.network.get_constraint(e1, e2)
-                if constraint:
-                    if constraint.relation in (
-                        AllenRelation.BEFORE,
-                        AllenRelation.MEETS,
-                    ):
-                        # e1 is before e2
-                        before_count[e2] = before_count.get(e2, 0) + 1
-                    elif constraint.relation in (
-                        AllenRelation.AFTER,
-                        AllenRelation.MET_BY,
-                    ):
-                        # e1 is after e2
-                        before_count[e1] = before_count.get(e1, 0) + 1
-        
-        # Sort by before count (fewer = earlier)
-        return sorted(event_nids, key=lambda n: before_count.get(n, 0))
+        Args:
+            event_nids: NIDs of events to order
+        
+        Returns:
+            EventOrdering with a linear order, layers and cycles
+        """
+        position = {nid: i for i, nid in enumerate(event_nids)}
+        
+        # Precedence edges, each taken from the earlier event's side
+        successors: dict[int, list[int]] = {nid: [] for nid in position}
+        for a in position:
+            for b in self.network.constrained_with(a):
+                if b in position:
+                    constraint = self.network.get_constraint(a, b)
+                    if constraint.relation in (AllenRelation.BEFORE, AllenRelation.MEETS):
+                        successors[a].append(b)
+        
+        # Components come out of Tarjan's algorithm in reverse
+        # topological order
+        components = _strongly_connected(list(position), successors)
+        components.reverse()
+        
+        component_of = {}
+        for c, members in enumerate(components):
+            for nid in members:
+                component_of[nid] = c
+        
+        level = [0] * len(components)
+        for c, members in enumerate(components):
+            for nid in members:
+                for succ in successors[nid]:
+                    d = component_of[succ]
+                    if d != c and level[d] <= level[c]:
+                        level[d] = level[c] + 1
+        
+        # Bucket by layer, keeping input order within a layer
+        levels: list[list[int]] = [[] for _ in range(max(level, default=-1) + 1)]
+        for nid in event_nids:
+            levels[level[component_of[nid]]].append(nid)
+        
+        cycles = [
+            sorted(members, key=position.__getitem__)
+            for members in components
+            if len(members) > 1
+        ]
+        for cycle in cycles:
+            logger.warning(f"Temporal cycle among events {cycle}")
+            self.network.record_cycle(_cycle_through(cycle[0], set(cycle), successors))
+        
+        return EventOrdering(
+            order=[nid for layer in levels for nid in layer],
+            levels=levels,
+            cycles=cycles,
+        )
     
     def validate_consistency(self) -> list[Inconsistency]:
         """
@@ -341,3 +407,83 @@ class TemporalReasoner:
             inferences_made=len(inferred),
             inconsistencies_found=len(self.network.get_inconsistencies()),
         )
+
+
+def _cycle_through(
+    start: int,
+    members: set[int],
+    successors: dict[int, list[int]],
+) -> list[int]:
+    """Shortest cycle through `start` within its component, as a path from `start`."""
+    parent: dict[int, int | None] = {start: None}
+    queue = deque([start])
+    
+    while queue:
+        nid = queue.popleft()
+        for succ in successors[nid]:
+            if succ == start:
+                path = [nid]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                return path[::-1]
+            if succ in members and succ not in parent:
+                parent[succ] = nid
+                queue.append(succ)
+    
+    return [start]
+
+
+def _strongly_connected(
+    nodes: list[int],
+    successors: dict[int, list[int]],
+) -> list[list[int]]:
+    """
+    Tarjan's strongly connected components, without recursion.
+    
+    Returns:
+        Components in reverse topological order
+    """
+    index: dict[int, int] = {}
+    lowlink: dict[int, int] = {}
+    on_stack: set[int] = set()
+    stack: list[int] = []
+    components: list[list[int]] = []
+    
+    for root in nodes:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        
+        while work:
+            node, edges = work[-1]
+            for succ in edges:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(successors[succ])))
+                    break
+                if succ in on_stack and index[succ] < lowlink[node]:
+                    lowlink[node] = index[succ]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if lowlink[node] < lowlink[parent]:
+                        lowlink[parent] = lowlink[node]
+                
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    
+    return components
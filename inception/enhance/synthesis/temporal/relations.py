@@ -3,12 +3,16 @@ Allen's Interval Algebra for temporal relations.
 
 Design by OPUS-1: Full implementation of the 13 Allen relations
 with composition table for inference.
+
+The composition table is generated at import from interval semantics
+and kept as a 169-entry array of 13-bit relation masks.
 """
 
 from __future__ import annotations
 
+from array import array
 from enum import Enum, auto
-from typing import Set
+from typing import Iterable, Set
 
 
 class AllenRelation(Enum):
@@ -70,60 +74,26 @@ class TemporalRelation(Enum):
             return cls.UNKNOWN
 
 
-# Allen's composition table (partial - full table has 169 entries)
-# Maps (R1, R2) -> set of possible resulting relations
-ALLEN_COMPOSITION: dict[tuple[AllenRelation, AllenRelation], Set[AllenRelation]] = {
-    # BEFORE compositions
-    (AllenRelation.BEFORE, AllenRelation.BEFORE): {AllenRelation.BEFORE},
-    (AllenRelation.BEFORE, AllenRelation.MEETS): {AllenRelation.BEFORE},
-    (AllenRelation.BEFORE, AllenRelation.OVERLAPS): {AllenRelation.BEFORE},
-    (AllenRelation.BEFORE, AllenRelation.STARTS): {AllenRelation.BEFORE},
-    (AllenRelation.BEFORE, AllenRelation.DURING): {AllenRelation.BEFORE, AllenRelation.MEETS, AllenRelation.OVERLAPS, AllenRelation.STARTS, AllenRelation.DURING},
-    
-    # AFTER compositions
-    (AllenRelation.AFTER, AllenRelation.AFTER): {AllenRelation.AFTER},
-    (AllenRelation.AFTER, AllenRelation.MET_BY): {AllenRelation.AFTER},
-    (AllenRelation.AFTER, AllenRelation.OVERLAPPED_BY): {AllenRelation.AFTER},
-    
-    # MEETS compositions
-    (AllenRelation.MEETS, AllenRelation.BEFORE): {AllenRelation.BEFORE},
-    (AllenRelation.MEETS, AllenRelation.MEETS): {AllenRelation.BEFORE},
-    (AllenRelation.MEETS, AllenRelation.OVERLAPS): {AllenRelation.BEFORE},
-    (AllenRelation.MEETS, AllenRelation.STARTS): {AllenRelation.MEETS},
-    
-    # EQUALS compositions
-    (AllenRelation.EQUALS, AllenRelation.EQUALS): {AllenRelation.EQUALS},
-    (AllenRelation.EQUALS, AllenRelation.BEFORE): {AllenRelation.BEFORE},
-    (AllenRelation.EQUALS, AllenRelation.AFTER): {AllenRelation.AFTER},
-    
-    # DURING compositions
-    (AllenRelation.DURING, AllenRelation.CONTAINS): {AllenRelation.BEFORE, AllenRelation.MEETS, AllenRelation.OVERLAPS, AllenRelation.STARTS, AllenRelation.DURING, AllenRelation.FINISHES, AllenRelation.OVERLAPPED_BY, AllenRelation.MET_BY, AllenRelation.AFTER},
-    (AllenRelation.DURING, AllenRelation.EQUALS): {AllenRelation.DURING},
-    
-    # CONTAINS compositions  
-    (AllenRelation.CONTAINS, AllenRelation.DURING): {AllenRelation.CONTAINS, AllenRelation.EQUALS, AllenRelation.DURING, AllenRelation.OVERLAPS, AllenRelation.OVERLAPPED_BY, AllenRelation.STARTS, AllenRelation.STARTED_BY, AllenRelation.FINISHES, AllenRelation.FINISHED_BY},
-    (AllenRelation.CONTAINS, AllenRelation.EQUALS): {AllenRelation.CONTAINS},
+_INVERSES = {
+    AllenRelation.BEFORE: AllenRelation.AFTER,
+    AllenRelation.AFTER: AllenRelation.BEFORE,
+    AllenRelation.MEETS: AllenRelation.MET_BY,
+    AllenRelation.MET_BY: AllenRelation.MEETS,
+    AllenRelation.OVERLAPS: AllenRelation.OVERLAPPED_BY,
+    AllenRelation.OVERLAPPED_BY: AllenRelation.OVERLAPS,
+    AllenRelation.STARTS: AllenRelation.STARTED_BY,
+    AllenRelation.STARTED_BY: AllenRelation.STARTS,
+    AllenRelation.FINISHES: AllenRelation.FINISHED_BY,
+    AllenRelation.FINISHED_BY: AllenRelation.FINISHES,
+    AllenRelation.DURING: AllenRelation.CONTAINS,
+    AllenRelation.CONTAINS: AllenRelation.DURING,
+    AllenRelation.EQUALS: AllenRelation.EQUALS,
 }
 
 
 def allen_inverse(relation: AllenRelation) -> AllenRelation:
     """Get the inverse of an Allen relation."""
-    inverse_map = {
-        AllenRelation.BEFORE: AllenRelation.AFTER,
-        AllenRelation.AFTER: AllenRelation.BEFORE,
-        AllenRelation.MEETS: AllenRelation.MET_BY,
-        AllenRelation.MET_BY: AllenRelation.MEETS,
-        AllenRelation.OVERLAPS: AllenRelation.OVERLAPPED_BY,
-        AllenRelation.OVERLAPPED_BY: AllenRelation.OVERLAPS,
-        AllenRelation.STARTS: AllenRelation.STARTED_BY,
-        AllenRelation.STARTED_BY: AllenRelation.STARTS,
-        AllenRelation.FINISHES: AllenRelation.FINISHED_BY,
-        AllenRelation.FINISHED_BY: AllenRelation.FINISHES,
-        AllenRelation.DURING: AllenRelation.CONTAINS,
-        AllenRelation.CONTAINS: AllenRelation.DURING,
-        AllenRelation.EQUALS: AllenRelation.EQUALS,
-    }
-    return inverse_map[relation]
+    return _INVERSES[relation]
 
 
 def allen_compose(
@@ -142,15 +112,7 @@ def allen_compose(
     Returns:
         Set of possible relations (A ? C)
     """
-    # Look up in composition table
-    if (r1, r2) in ALLEN_COMPOSITION:
-        return ALLEN_COMPOSITION[(r1, r2)]
-    
-    # Try with inverses for symmetric lookup
-    # If A r1 B and B r2 C, we can use inverse(r1^-1) and inverse(r2^-1)
-    
-    # Default: return all possible relations (unknown)
-    return set(AllenRelation)
+    return mask_to_relations(COMPOSITION_MASKS[13 * (r1.value - 1) + r2.value - 1])
 
 
 def is_consistent(
@@ -166,8 +128,8 @@ def is_consistent(
     if r_direct is None:
         return True
     
-    composed = allen_compose(r1, r2)
-    return r_direct in composed
+    composed = COMPOSITION_MASKS[13 * (r1.value - 1) + r2.value - 1]
+    return bool(composed & relation_mask(r_direct))
 
 
 def relation_from_timestamps(
@@ -229,3 +191,115 @@ def relation_from_timestamps(
         return AllenRelation.OVERLAPPED_BY
     
     return AllenRelation.BEFORE  # Default
+
+
+# === Bitmask representation ===
+#
+# A set of Allen relations is a 13-bit int, bit i set for the i-th
+# relation in declaration order. Constraint propagation works on masks:
+# intersection is `&`, union `|`, and composition a table lookup.
+
+ALL_RELATIONS_MASK = (1 << len(AllenRelation)) - 1
+
+_RELATIONS = tuple(AllenRelation)
+
+
+def relation_mask(relation: AllenRelation) -> int:
+    """Get the single-bit mask of a relation."""
+    return 1 << (relation.value - 1)
+
+
+def relations_to_mask(relations: Iterable[AllenRelation]) -> int:
+    """Get the mask of a set of relations."""
+    mask = 0
+    for relation in relations:
+        mask |= 1 << (relation.value - 1)
+    return mask
+
+
+def mask_to_relations(mask: int) -> Set[AllenRelation]:
+    """Get the set of relations in a mask."""
+    return {r for i, r in enumerate(_RELATIONS) if mask >> i & 1}
+
+
+def _mask_table(bit_values: list[int]) -> list[int]:
+    """Extend a per-relation mask table to all 2^13 masks by union."""
+    table = [0] * (ALL_RELATIONS_MASK + 1)
+    for mask in range(1, ALL_RELATIONS_MASK + 1):
+        low = mask & -mask
+        table[mask] = table[mask ^ low] | bit_values[low.bit_length() - 1]
+    return table
+
+
+# Inverse of every mask
+_INVERSE_MASKS = _mask_table([relation_mask(allen_inverse(r)) for r in _RELATIONS])
+
+
+def _generate_composition() -> array:
+    """
+    Derive the composition table from interval semantics.
+    
+    Three intervals have at most six distinct endpoints, so every way
+    of placing A, B and C is realized by some triple of intervals over
+    six integer points; each triple sets the bit of rel(A, C) in the
+    entry for (rel(A, B), rel(B, C)).
+    """
+    intervals = [(s, e) for s in range(6) for e in range(s + 1, 6)]
+    relation = {
+        (x, y): relation_from_timestamps(*x, *y).value - 1
+        for x in intervals for y in intervals
+    }
+    
+    table = array("H", [0] * 169)
+    for a in intervals:
+        for b in intervals:
+            row = 13 * relation[(a, b)]
+            for c in intervals:
+                table[row + relation[(b, c)]] |= 1 << relation[(a, c)]
+    return table
+
+
+# COMPOSITION_MASKS[13 * i + j] is the mask of the composition of the
+# i-th and j-th relations (all 169 pairs)
+COMPOSITION_MASKS = _generate_composition()
+
+# Maps (R1, R2) -> set of possible resulting relations
+ALLEN_COMPOSITION: dict[tuple[AllenRelation, AllenRelation], Set[AllenRelation]] = {
+    (r1, r2): mask_to_relations(COMPOSITION_MASKS[13 * i + j])
+    for i, r1 in enumerate(_RELATIONS) for j, r2 in enumerate(_RELATIONS)
+}
+
+# _COMPOSE_ROWS[i][mask] is the composition of relation i with a mask
+_COMPOSE_ROWS = [
+    _mask_table(list(COMPOSITION_MASKS[13 * i:13 * i + 13])) for i in range(len(_RELATIONS))
+]
+
+
+def inverse_mask(mask: int) -> int:
+    """Get the mask of the inverses of a mask's relations."""
+    return _INVERSE_MASKS[mask]
+
+
+def compose_masks(mask1: int, mask2: int) -> int:
+    """
+    Compose two relation masks.
+    
+    If A mask1 B and B mask2 C, the mask of possible relations A ? C.
+    
+    Args:
+        mask1: Relations between A and B
+        mask2: Relations between B and C
+    
+    Returns:
+        Mask of possible relations between A and C
+    """
+    rows = _COMPOSE_ROWS
+    if not mask1 & (mask1 - 1):
+        return rows[mask1.bit_length() - 1][mask2] if mask1 else 0
+    
+    composed = 0
+    while mask1:
+        low = mask1 & -mask1
+        composed |= rows[low.bit_length() - 1][mask2]
+        mask1 ^= low
+    return composed
@@ -21,9 +21,15 @@ from inception.extract.ocr import (
     TextBox,
     OCRResult,
     OCREngine,
+    OCRCache,
+    OCRCacheStats,
+    FrameSignature,
+    compute_dhash,
+    frame_signature,
     ocr_image,
     ocr_keyframes,
     merge_duplicate_boxes,
+    merge_boxes_across_frames,
 )
 from inception.extract.alignment import (
     AlignedSpan,
@@ -54,9 +60,15 @@ __all__ = [
     "TextBox",
     "OCRResult",
     "OCREngine",
+    "OCRCache",
+    "OCRCacheStats",
+    "FrameSignature",
+    "compute_dhash",
+    "frame_signature",
     "ocr_image",
     "ocr_keyframes",
     "merge_duplicate_boxes",
+    "merge_boxes_across_frames",
     # Alignment
     "AlignedSpan",
     "AlignmentResult",
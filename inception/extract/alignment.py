@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from inception.db.intervals import IntervalIndex
 from inception.extract.transcription import TranscriptResult, Segment, Word
 from inception.extract.scenes import SceneDetectionResult, SceneInfo, KeyframeInfo
 from inception.extract.ocr import OCRResult, TextBox
@@ -68,6 +69,37 @@ class AlignedSpan:
         return " ".join(parts)
 
 
+class _SpanIndex:
+    """
+    Overlap and point queries over (start_ms, end_ms) intervals.
+    
+    Backed by the shared `IntervalIndex`, so nested intervals (a long
+    span covering many short ones) cost O(log^2 n + k) like any others.
+    Results are indices in input order.
+    """
+    
+    def __init__(self, intervals: list[tuple[int, int]]):
+        self._intervals = intervals
+        self._index: IntervalIndex[int] = IntervalIndex(
+            (start, end, i) for i, (start, end) in enumerate(intervals)
+        )
+    
+    def __len__(self) -> int:
+        return len(self._intervals)
+    
+    def overlapping(self, start: int, end: int) -> list[int]:
+        """Indices of intervals with s < end and e > start, in input order."""
+        # The closed-interval query also returns those merely touching
+        return sorted(
+            i for i in self._index.overlapping(start, end)
+            if self._intervals[i][0] < end and self._intervals[i][1] > start
+        )
+    
+    def containing(self, point: int) -> list[int]:
+        """Indices of intervals with s <= point <= e, in input order."""
+        return sorted(self._index.at(point))
+
+
 @dataclass
 class AlignmentResult:
     """Result of multimodal alignment."""
@@ -82,15 +114,29 @@ class AlignmentResult:
     transcript_coverage: float = 0.0
     ocr_coverage: float = 0.0
     
+    _span_index: _SpanIndex = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self.index_spans()
+    
     @property
     def span_count(self) -> int:
         return len(self.spans)
     
+    def index_spans(self) -> None:
+        """
+        Build the index behind the time queries.
+        
+        Done when the result is created; call it again after adding,
+        removing, reordering or moving spans.
+        """
+        self._span_index = _SpanIndex([(span.start_ms, span.end_ms) for span in self.spans])
+    
     def get_spans_at_time(self, timestamp_ms: int) -> list[AlignedSpan]:
         """Get spans that contain a timestamp."""
         return [
-            span for span in self.spans
-            if span.start_ms <= timestamp_ms <= span.end_ms
+            self.spans[i]
+            for i in self._span_index.containing(timestamp_ms)
         ]
     
     def get_spans_in_range(
@@ -100,8 +146,8 @@ class AlignmentResult:
     ) -> list[AlignedSpan]:
         """Get spans that overlap with a time range."""
         return [
-            span for span in self.spans
-            if span.start_ms < end_ms and span.end_ms > start_ms
+            self.spans[i]
+            for i in self._span_index.overlapping(start_ms, end_ms)
         ]
 
 
@@ -159,6 +205,12 @@ class MultimodalAligner:
         spans: list[AlignedSpan] = []
         
         if scenes and scenes.scenes:
+            segment_index = None
+            if transcript:
+                segment_index = _SpanIndex(
+                    [(seg.start_ms, seg.end_ms) for seg in transcript.segments]
+                )
+            
             for scene in scenes.scenes:
                 span = AlignedSpan(
                     start_ms=scene.start_ms,
@@ -171,7 +223,7 @@ class MultimodalAligner:
                 # Align transcript segments to this span
                 if transcript:
                     aligned_segments = self._align_transcript_to_span(
-                        transcript, span.start_ms, span.end_ms
+                        transcript, span.start_ms, span.end_ms, segment_index
                     )
                     if aligned_segments:
                         span.transcript_segments = aligned_segments
@@ -224,16 +276,23 @@ class MultimodalAligner:
         transcript: TranscriptResult,
         start_ms: int,
         end_ms: int,
+        segment_index: _SpanIndex | None = None,
     ) -> list[Segment]:
-        """Get transcript segments that overlap with a time range."""
-        aligned = []
+        """
+        Get transcript segments that overlap with a time range.
         
-        for segment in transcript.segments:
-            # Check overlap
-            if segment.start_ms < end_ms and segment.end_ms > start_ms:
-                aligned.append(segment)
+        Pass a prebuilt `segment_index` when aligning many spans against
+        the same transcript to avoid a linear scan per span.
+        """
+        if segment_index is None:
+            segment_index = _SpanIndex(
+                [(seg.start_ms, seg.end_ms) for seg in transcript.segments]
+            )
         
-        return aligned
+        return [
+            transcript.segments[i]
+            for i in segment_index.overlapping(start_ms, end_ms)
+        ]
     
     def _create_spans_from_transcript(
         self,
@@ -6,7 +6,8 @@ Supports PaddleOCR as primary engine with Tesseract fallback.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Any
 
@@ -232,14 +233,7 @@ class OCREngine:
         denoised = cv2.fastNlMeansDenoising(gray, h=10)
         
         # Adaptive threshold for better text contrast
-        binary = cv2.adaptiveThreshold(
-            denoised,
-            255,
-            cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-            cv2.THRESH_BINARY,
-            11,
-            2,
-        )
+        binary = _binarize(denoised)
         
         # Convert back to BGR for PaddleOCR
         return cv2.cvtColor(binary, cv2.COLOR_GRAY2BGR)
@@ -353,35 +347,445 @@ def ocr_image(
     return ocr_engine.recognize(image_path)
 
 
+def compute_dhash(image: np.ndarray, hash_size: int = 16) -> int:
+    """
+    Compute a difference hash (dHash) of an image.
+    
+    Args:
+        image: Image array (BGR or grayscale)
+        hash_size: Hash grid size (hash has hash_size² bits)
+    
+    Returns:
+        Hash as an integer
+    """
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+    
+    thumb = cv2.resize(gray, (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA)
+    diff = thumb[:, 1:] > thumb[:, :-1]
+    
+    return int.from_bytes(np.packbits(diff.flatten()).tobytes(), "big")
+
+
+def hamming_distance(hash1: int, hash2: int) -> int:
+    """Number of differing bits between two perceptual hashes."""
+    return (hash1 ^ hash2).bit_count()
+
+
+def _binarize(gray: np.ndarray) -> np.ndarray:
+    """Adaptive threshold used to bring out text before OCR."""
+    return cv2.adaptiveThreshold(
+        gray,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        11,
+        2,
+    )
+
+
+# Width keyframes are reduced to before hashing and comparing text ink
+SIGNATURE_WIDTH = 960
+INK_TILE = 16
+
+
+@dataclass
+class FrameSignature:
+    """
+    Dedup key of a keyframe: dHash plus the ink map it was hashed from.
+    
+    The hash only finds candidate frames; a 16×16 grid cannot tell
+    "point two" from "point 2". Two frames count as the same text only
+    if their ink maps also agree tile by tile.
+    """
+    
+    phash: int
+    ink: np.ndarray  # Packed bits, True where the binarized frame has ink
+    shape: tuple[int, int]
+    
+    def ink_difference(self, other: FrameSignature) -> int:
+        """
+        Most ink pixels in any INK_TILE² tile that have no ink within
+        one pixel in the other frame (compression noise moves edges by
+        about a pixel; a changed glyph or bullet leaves whole strokes).
+        """
+        if self.shape != other.shape:
+            return INK_TILE * INK_TILE
+        
+        a = self._unpacked()
+        b = other._unpacked()
+        kernel = np.ones((3, 3), np.uint8)
+        stray = (a & ~cv2.dilate(b, kernel)) | (b & ~cv2.dilate(a, kernel))
+        
+        height, width = self.shape
+        rows, cols = height // INK_TILE, width // INK_TILE
+        if rows == 0 or cols == 0:
+            return int(stray.sum())
+        tiles = stray[:rows * INK_TILE, :cols * INK_TILE].reshape(
+            rows, INK_TILE, cols, INK_TILE
+        )
+        return int(tiles.sum(axis=(1, 3), dtype=np.int32).max())
+    
+    def _unpacked(self) -> np.ndarray:
+        height, width = self.shape
+        return np.unpackbits(self.ink, count=height * width).reshape(height, width)
+
+
+def frame_signature(image: np.ndarray, hash_size: int = 16) -> FrameSignature:
+    """
+    Sign a keyframe by its preprocessed (binarized) form.
+    
+    The frame goes through the OCR preprocessing at SIGNATURE_WIDTH,
+    with a median blur standing in for non-local-means denoising (which
+    costs about as much as OCR itself on a 1080p frame).
+    
+    Args:
+        image: Image array (BGR or grayscale)
+        hash_size: dHash grid size
+    
+    Returns:
+        FrameSignature of the frame
+    """
+    if len(image.shape) == 3:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    else:
+        gray = image
+    
+    height, width = gray.shape
+    if width > SIGNATURE_WIDTH:
+        size = (SIGNATURE_WIDTH, max(1, round(height * SIGNATURE_WIDTH / width)))
+        gray = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    
+    binary = _binarize(cv2.medianBlur(gray, 3))
+    return FrameSignature(
+        phash=compute_dhash(binary, hash_size),
+        ink=np.packbits(binary == 0),
+        shape=binary.shape,
+    )
+
+
+class _HashIndex:
+    """
+    Multi-index hash for Hamming-radius search.
+    
+    Hashes are split into max_distance + 1 chunks; by pigeonhole a hash
+    within max_distance bits of a query equals it on at least one chunk,
+    so a query only compares against entries sharing a chunk.
+    """
+    
+    def __init__(self, bits: int, max_distance: int):
+        self.max_distance = max_distance
+        chunks = min(max_distance + 1, bits)
+        bounds = [bits * i // chunks for i in range(chunks + 1)]
+        self._masks = [
+            (lo, (1 << (hi - lo)) - 1) for lo, hi in zip(bounds, bounds[1:])
+        ]
+        self._tables: list[dict[int, set[int]]] = [{} for _ in self._masks]
+        self._hashes: dict[int, int] = {}
+    
+    def add(self, key: int, phash: int) -> None:
+        self._hashes[key] = phash
+        for (shift, mask), table in zip(self._masks, self._tables):
+            table.setdefault((phash >> shift) & mask, set()).add(key)
+    
+    def remove(self, key: int) -> None:
+        phash = self._hashes.pop(key)
+        for (shift, mask), table in zip(self._masks, self._tables):
+            chunk = (phash >> shift) & mask
+            table[chunk].discard(key)
+            if not table[chunk]:
+                del table[chunk]
+    
+    def clear(self) -> None:
+        self._hashes.clear()
+        for table in self._tables:
+            table.clear()
+    
+    def near(self, phash: int) -> list[int]:
+        """Keys within max_distance bits of `phash`, nearest first."""
+        found: dict[int, int] = {}
+        for (shift, mask), table in zip(self._masks, self._tables):
+            for key in table.get((phash >> shift) & mask, ()):
+                if key not in found:
+                    distance = hamming_distance(self._hashes[key], phash)
+                    if distance <= self.max_distance:
+                        found[key] = distance
+        return sorted(found, key=lambda key: (found[key], key))
+
+
+@dataclass
+class OCRCacheStats:
+    """Hit/miss counters for an OCRCache."""
+    
+    hits: int = 0
+    misses: int = 0
+    
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+    
+    @property
+    def hit_rate(self) -> float:
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+
+class OCRCache:
+    """
+    Perceptual-hash cache of OCR results.
+    
+    A keyframe reuses a cached OCRResult when its dHash is within
+    `max_distance` bits of the cached frame's and, when both frames
+    have signatures, their ink maps agree in every tile, so slides that
+    stay on screen across several scenes are recognized once while a
+    revealed bullet or an edited word is not.
+    """
+    
+    def __init__(
+        self,
+        max_distance: int = 0,
+        hash_size: int = 16,
+        max_entries: int = 256,
+        max_ink_difference: int = 1,
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_distance: Max Hamming distance between candidate hashes
+                (0 requires the same hash)
+            hash_size: dHash grid size
+            max_entries: Max cached results (least recently used evicted)
+            max_ink_difference: Max unmatched ink pixels per tile for
+                two frames to count as the same text
+        """
+        self.max_distance = max_distance
+        self.hash_size = hash_size
+        self.max_entries = max_entries
+        self.max_ink_difference = max_ink_difference
+        
+        self.stats = OCRCacheStats()
+        # Entry key -> (hash, signature, result)
+        self._entries: OrderedDict[int, tuple[int, FrameSignature | None, OCRResult]] = (
+            OrderedDict()
+        )
+        self._index = _HashIndex(hash_size * hash_size, max_distance)
+        self._next_key = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def signature(self, image_path: Path | str) -> FrameSignature | None:
+        """Sign an image file, or None if it cannot be loaded."""
+        image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if image is None:
+            return None
+        return frame_signature(image, self.hash_size)
+    
+    def same_text(self, a: FrameSignature | None, b: FrameSignature | None) -> bool:
+        """Whether two signed frames show the same text (unsigned frames match on hash alone)."""
+        if a is None or b is None:
+            return True
+        return a.ink_difference(b) <= self.max_ink_difference
+    
+    def _find_key(self, phash: int, signature: FrameSignature | None) -> int | None:
+        for key in self._index.near(phash):
+            if self.same_text(self._entries[key][1], signature):
+                return key
+        return None
+    
+    def find(self, phash: int, signature: FrameSignature | None = None) -> OCRResult | None:
+        """Find a cached result matching a frame, without touching stats or order."""
+        key = self._find_key(phash, signature)
+        return None if key is None else self._entries[key][2]
+    
+    def get(self, phash: int, signature: FrameSignature | None = None) -> OCRResult | None:
+        """Look up a result for a frame, recording a hit or miss."""
+        key = self._find_key(phash, signature)
+        if key is None:
+            self.stats.misses += 1
+            return None
+        
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][2]
+    
+    def put(
+        self,
+        phash: int,
+        result: OCRResult,
+        signature: FrameSignature | None = None,
+    ) -> None:
+        """Store a result for a frame (replacing a cached one for the same frame)."""
+        key = self._find_key(phash, signature)
+        if key is not None and self._entries[key][0] == phash:
+            self._index.remove(key)
+            del self._entries[key]
+        
+        key = self._next_key
+        self._next_key += 1
+        self._entries[key] = (phash, signature, result)
+        self._index.add(key, phash)
+        
+        while len(self._entries) > self.max_entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self._index.remove(old_key)
+    
+    def clear(self) -> None:
+        """Drop all cached results and reset stats."""
+        self._entries.clear()
+        self._index.clear()
+        self.stats = OCRCacheStats()
+
+
+# Per-process engine for process-pool OCR (set by _init_ocr_worker)
+_worker_engine: OCREngine | None = None
+
+
+def _init_ocr_worker(
+    engine: str,
+    languages: list[str],
+    use_gpu: bool,
+) -> None:
+    """Create the OCR engine once per worker process."""
+    global _worker_engine
+    _worker_engine = OCREngine(engine=engine, languages=languages, use_gpu=use_gpu)
+
+
+def _ocr_in_worker(image_path: Path) -> OCRResult:
+    """Run OCR with the worker's persistent engine."""
+    if _worker_engine is None:
+        raise RuntimeError("OCR worker not initialized")
+    return _worker_engine.recognize(image_path)
+
+
+def _reuse_result(result: OCRResult, image_path: Path) -> OCRResult:
+    """Copy a cached result for a different frame showing the same text."""
+    return replace(
+        result,
+        image_path=image_path,
+        text_boxes=list(result.text_boxes),
+        processing_time_seconds=0.0,
+    )
+
+
 def ocr_keyframes(
     keyframe_paths: list[Path],
     engine: str | None = None,
     parallel: bool = True,
+    use_processes: bool = False,
+    max_workers: int | None = None,
+    cache: OCRCache | None = None,
+    dedup: bool = False,
 ) -> list[OCRResult]:
     """
     OCR multiple keyframes.
     
+    With dedup, frames showing the same text (see `OCRCache`) are
+    recognized once and share the result. Pass a long-lived `cache` to
+    dedup across calls and to read hit-rate stats afterwards.
+    
     Args:
         keyframe_paths: List of keyframe image paths
         engine: Optional engine override
         parallel: Whether to process in parallel
+        use_processes: Use a process pool with one engine per worker
+            instead of threads (PaddleOCR/Tesseract are GIL-bound)
+        max_workers: Pool size (defaults to pipeline.max_workers)
+        cache: Cache shared across calls (implies dedup)
+        dedup: Whether to dedup frames with a per-call cache
     
     Returns:
-        List of OCRResult objects
+        List of OCRResult objects, in input order
     """
+    keyframe_paths = [Path(p) for p in keyframe_paths]
     ocr_engine = OCREngine(engine=engine)
     
-    if parallel:
+    if cache is None and dedup:
+        cache = OCRCache()
+    
+    results: list[OCRResult | None] = [None] * len(keyframe_paths)
+    signatures: list[FrameSignature | None] = [None] * len(keyframe_paths)
+    to_run: list[int] = []
+    aliases: dict[int, int] = {}
+    
+    # Frames sent to OCR in this batch, for near-duplicates later in it
+    batch = None if cache is None else _HashIndex(cache.hash_size ** 2, cache.max_distance)
+    
+    for i, path in enumerate(keyframe_paths):
+        if cache is None:
+            to_run.append(i)
+            continue
+        
+        signature = cache.signature(path)
+        signatures[i] = signature
+        if signature is None:
+            # Unreadable frame: let the engine raise its usual error
+            to_run.append(i)
+            continue
+        
+        rep = next(
+            (
+                j for j in batch.near(signature.phash)
+                if cache.same_text(signatures[j], signature)
+            ),
+            None,
+        )
+        if rep is not None:
+            cache.stats.hits += 1
+            aliases[i] = rep
+            continue
+        
+        cached = cache.get(signature.phash, signature)
+        if cached is not None:
+            results[i] = _reuse_result(cached, path)
+        else:
+            to_run.append(i)
+            batch.add(i, signature.phash)
+    
+    run_paths = [keyframe_paths[i] for i in to_run]
+    workers = max_workers or get_config().pipeline.max_workers
+    
+    if parallel and use_processes and len(run_paths) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_ocr_worker,
+            initargs=(ocr_engine.engine, ocr_engine.languages, ocr_engine.use_gpu),
+        ) as executor:
+            run_results = list(executor.map(_ocr_in_worker, run_paths))
+    elif parallel and len(run_paths) > 1:
         from concurrent.futures import ThreadPoolExecutor
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            results = list(executor.map(ocr_engine.recognize, keyframe_paths))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            run_results = list(executor.map(ocr_engine.recognize, run_paths))
     else:
-        results = [ocr_engine.recognize(path) for path in keyframe_paths]
+        run_results = [ocr_engine.recognize(path) for path in run_paths]
+    
+    for i, result in zip(to_run, run_results):
+        results[i] = result
+        if cache is not None and signatures[i] is not None:
+            cache.put(signatures[i].phash, result, signatures[i])
+    
+    for i, rep in aliases.items():
+        results[i] = _reuse_result(results[rep], keyframe_paths[i])
     
     return results
 
 
+# Above this many boxes, IoU is computed only against grid-bucketed
+# candidates instead of the full n×n matrix.
+DENSE_IOU_MAX_BOXES = 2048
+
+# IoU entries computed at once on the dense path (rows are taken in
+# blocks of this size, so each temporary stays around 2 MB)
+IOU_BLOCK_ELEMENTS = 1 << 18
+
+
 def merge_duplicate_boxes(
     boxes: list[TextBox],
     iou_threshold: float = 0.5,
@@ -389,6 +793,11 @@ def merge_duplicate_boxes(
     """
     Merge duplicate text boxes based on IoU overlap.
     
+    Boxes are visited in descending confidence order and any box whose
+    IoU with an already kept box exceeds the threshold is dropped. Small
+    inputs use a vectorized IoU matrix, computed a block of rows at a
+    time; large ones use a grid index so only nearby boxes are compared.
+    
     Args:
         boxes: List of text boxes
         iou_threshold: IoU threshold for merging
@@ -399,31 +808,169 @@ def merge_duplicate_boxes(
     if not boxes:
         return []
     
-    # Sort by confidence
+    # Sort by confidence (stable, so ties keep input order)
     boxes = sorted(boxes, key=lambda b: b.confidence, reverse=True)
+    coords = _box_array(boxes)
+    n = len(boxes)
     
+    suppressed = np.zeros(n, dtype=bool)
     merged = []
-    used = set()
     
-    for i, box in enumerate(boxes):
-        if i in used:
-            continue
+    if n <= DENSE_IOU_MAX_BOXES:
+        block_rows = max(1, IOU_BLOCK_ELEMENTS // n)
         
-        merged.append(box)
-        used.add(i)
+        for start in range(0, n, block_rows):
+            block = np.arange(start, min(start + block_rows, n))
+            block = block[~suppressed[block]]
+            if not block.size:
+                continue
+            
+            iou = _iou_matrix(coords[block], coords)
+            for i, row in zip(block, iou):
+                if suppressed[i]:
+                    continue
+                merged.append(boxes[i])
+                suppressed |= row > iou_threshold
+                suppressed[i] = True
+    else:
+        grid = _BoxGrid(coords)
         
-        for j in range(i + 1, len(boxes)):
-            if j in used:
+        for i in range(n):
+            if suppressed[i]:
                 continue
+            merged.append(boxes[i])
+            suppressed[i] = True
             
-            # Check IoU
-            iou = _compute_iou(box, boxes[j])
-            if iou > iou_threshold:
-                used.add(j)
+            candidates = grid.candidates(coords[i])
+            candidates = candidates[~suppressed[candidates]]
+            if candidates.size:
+                iou = _iou_matrix(coords[i:i + 1], coords[candidates])[0]
+                suppressed[candidates[iou > iou_threshold]] = True
     
     return merged
 
 
+def merge_boxes_across_frames(
+    results: list[OCRResult],
+    iou_threshold: float = 0.5,
+) -> list[OCRResult]:
+    """
+    Drop text boxes repeated from the previous keyframe.
+    
+    A box is repeated when the previous frame has a box with the same
+    (case/whitespace-normalized) text and IoU above the threshold. Text
+    that stays on screen across consecutive keyframes is then attributed
+    only to the frame where it first appeared.
+    
+    Args:
+        results: OCR results for consecutive keyframes, in time order
+        iou_threshold: IoU threshold for two boxes to be the same region
+    
+    Returns:
+        New OCRResult list with repeated boxes removed
+    """
+    merged = []
+    prev_boxes: list[TextBox] = []
+    
+    for result in results:
+        boxes = result.text_boxes
+        kept = boxes
+        
+        if boxes and prev_boxes:
+            kept = []
+            coords = _box_array(boxes)
+            prev_coords = _box_array(prev_boxes)
+            prev_texts = [_normalize_box_text(b.text) for b in prev_boxes]
+            
+            if len(boxes) * len(prev_boxes) <= DENSE_IOU_MAX_BOXES ** 2:
+                block_rows = max(1, IOU_BLOCK_ELEMENTS // len(prev_boxes))
+                candidate_lists = []
+                for start in range(0, len(boxes), block_rows):
+                    iou = _iou_matrix(coords[start:start + block_rows], prev_coords)
+                    candidate_lists.extend(np.flatnonzero(row > iou_threshold) for row in iou)
+            else:
+                grid = _BoxGrid(prev_coords)
+                candidate_lists = []
+                for i in range(len(boxes)):
+                    candidates = grid.candidates(coords[i])
+                    if candidates.size:
+                        iou = _iou_matrix(coords[i:i + 1], prev_coords[candidates])[0]
+                        candidates = candidates[iou > iou_threshold]
+                    candidate_lists.append(candidates)
+            
+            for box, candidates in zip(boxes, candidate_lists):
+                text = _normalize_box_text(box.text)
+                if not any(prev_texts[j] == text for j in candidates):
+                    kept.append(box)
+        
+        merged.append(replace(result, text_boxes=list(kept)))
+        prev_boxes = boxes
+    
+    return merged
+
+
+def _normalize_box_text(text: str) -> str:
+    """Normalize OCR text for duplicate comparison."""
+    return " ".join(text.lower().split())
+
+
+def _box_array(boxes: list[TextBox]) -> np.ndarray:
+    """Stack box coordinates into an (n, 4) array of x0, y0, x1, y1."""
+    return np.array([(b.x0, b.y0, b.x1, b.y1) for b in boxes], dtype=np.float64)
+
+
+def _iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Pairwise IoU between (n, 4) and (m, 4) box arrays."""
+    x0 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y0 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x1 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y1 = np.minimum(a[:, None, 3], b[None, :, 3])
+    
+    inter_w = x1 - x0
+    inter_h = y1 - y0
+    intersection = np.where((inter_w > 0) & (inter_h > 0), inter_w * inter_h, 0.0)
+    
+    area_a = (a[:, 2] - a[:, 0]) * (a[:, 3] - a[:, 1])
+    area_b = (b[:, 2] - b[:, 0]) * (b[:, 3] - b[:, 1])
+    union = area_a[:, None] + area_b[None, :] - intersection
+    
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(union > 0, intersection / union, 0.0)
+
+
+class _BoxGrid:
+    """Uniform grid bucketing boxes by the cells they overlap."""
+    
+    def __init__(self, coords: np.ndarray, cell_size: float | None = None):
+        if cell_size is None:
+            # Cells about twice the typical box extent keep buckets small
+            extents = np.maximum(coords[:, 2] - coords[:, 0], coords[:, 3] - coords[:, 1])
+            cell_size = max(float(np.median(extents)) * 2, 1e-3)
+        
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        
+        for idx, box in enumerate(coords):
+            for cell in self._cells_for(box):
+                self._cells.setdefault(cell, []).append(idx)
+    
+    def _cells_for(self, box: np.ndarray) -> list[tuple[int, int]]:
+        cx0, cy0 = int(box[0] // self.cell_size), int(box[1] // self.cell_size)
+        cx1, cy1 = int(box[2] // self.cell_size), int(box[3] // self.cell_size)
+        return [
+            (cx, cy)
+            for cx in range(cx0, cx1 + 1)
+            for cy in range(cy0, cy1 + 1)
+        ]
+    
+    def candidates(self, box: np.ndarray) -> np.ndarray:
+        """Indices of boxes sharing at least one cell with `box`."""
+        found: set[int] = set()
+        for cell in self._cells_for(box):
+            found.update(self._cells.get(cell, ()))
+        return np.fromiter(sorted(found), dtype=np.intp, count=len(found))
+
+
 def _compute_iou(box1: TextBox, box2: TextBox) -> float:
     """Compute Intersection over Union for two boxes."""
     x0 = max(box1.x0, box2.x0)
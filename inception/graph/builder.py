@@ -17,6 +17,7 @@ from inception.db.records import (
     EdgeRecord,
     Confidence,
     VideoAnchor,
+    WebAnchor,
 )
 from inception.db.keys import (
     SourceType,
@@ -28,6 +29,7 @@ from inception.db.keys import (
 from inception.db.graphtag import compute_graphtag
 
 from inception.analyze.entities import Entity, EntityExtractionResult
+from inception.analyze.matcher import PhraseSet, normalize_phrase
 from inception.analyze.claims import Claim, ClaimExtractionResult
 from inception.analyze.procedures import Procedure, ProcedureExtractionResult
 from inception.analyze.gaps import Gap, GapDetectionResult
@@ -75,6 +77,7 @@ class GraphBuilder:
         claims: ClaimExtractionResult | None = None,
         procedures: ProcedureExtractionResult | None = None,
         gaps: GapDetectionResult | None = None,
+        source: SourceRecord | None = None,
     ) -> GraphBuildResult:
         """
         Build graph from extracted components.
@@ -86,6 +89,8 @@ class GraphBuilder:
             claims: Extracted claims
             procedures: Extracted procedures
             gaps: Detected gaps
+            source: Source record to store (with its graphtag) in the same
+                transaction, so it is never recorded without its graph
         
         Returns:
             GraphBuildResult with created record info
@@ -101,13 +106,28 @@ class GraphBuilder:
                 result.span_nids.append(span_nid)
             
             # Create entity nodes
-            entity_nid_map: dict[str, int] = {}  # normalized text -> nid
+            entity_nid_map: dict[str, int] = {}  # normalized surface form -> nid
             if entities:
+                cluster_nids: dict[int, int] = {}
                 for entity in entities.get_unique_entities():
                     node_nid = self._create_entity_node(entity, source_nid, txn)
-                    entity_nid_map[entity.normalized or entity.text.lower()] = node_nid
+                    entity_nid_map[normalize_phrase(entity.normalized or entity.text)] = node_nid
+                    if entity.coreferent_cluster is not None:
+                        cluster_nids[entity.coreferent_cluster] = node_nid
                     result.node_nids.append(node_nid)
                     result.entity_count += 1
+                
+                # Other mentions in a coreference cluster are aliases
+                for entity in entities.entities:
+                    if not entity.is_representative and entity.coreferent_cluster in cluster_nids:
+                        entity_nid_map.setdefault(
+                            normalize_phrase(entity.normalized or entity.text),
+                            cluster_nids[entity.coreferent_cluster],
+                        )
+            
+            # One automaton over all surface forms; each claim is scanned once
+            mention_phrases = PhraseSet(list(entity_nid_map)) if entity_nid_map else None
+            mention_edges: dict[tuple[int, int], EdgeRecord] = {}
             
             # Create claim nodes
             claim_nid_map: dict[int, int] = {}  # sentence_idx -> nid
@@ -123,14 +143,19 @@ class GraphBuilder:
                     result.node_nids.append(node_nid)
                     result.claim_count += 1
                     
-                    # Create edges to mentioned entities
-                    for entity_text, entity_nid in entity_nid_map.items():
-                        if entity_text in claim.text.lower():
-                            self._create_edge(
-                                node_nid, EdgeType.MENTIONS, entity_nid,
-                                weight=0.8, txn=txn
-                            )
-                            result.edge_count += 1
+                    # Collect edges to mentioned entities
+                    if mention_phrases:
+                        for match in mention_phrases.finditer(claim.text, overlapping=True):
+                            entity_nid = entity_nid_map[match.phrase]
+                            mention_edges.setdefault((node_nid, entity_nid), EdgeRecord(
+                                edge_type=EdgeType.MENTIONS, polarity=1, weight=0.8,
+                            ))
+            
+            result.edge_count += self.db.put_edges(
+                ((claim_nid, EdgeType.MENTIONS, entity_nid, edge)
+                 for (claim_nid, entity_nid), edge in mention_edges.items()),
+                txn,
+            )
             
             # Create procedure nodes
             if procedures:
@@ -152,6 +177,12 @@ class GraphBuilder:
                     claims.claims, claim_nid_map, txn
                 )
                 result.edge_count += edge_count
+            
+            if source is not None:
+                self.db.put_source(source, txn)
+                self.db.put_graphtag(
+                    compute_graphtag({"uri": source.uri}), ObjectType.SOURCE, source.nid, txn
+                )
         
         return result
     
@@ -164,12 +195,19 @@ class GraphBuilder:
         """Create a span record."""
         nid = self.db.allocate_nid()
         
-        # Determine span type and anchor
-        span_type = SpanType.VIDEO
-        anchor: Any = VideoAnchor(
-            t0_ms=span_data.get("start_ms", 0),
-            t1_ms=span_data.get("end_ms", 0),
-        )
+        # Determine span type and anchor (character offsets mean web text)
+        if "char_start" in span_data:
+            span_type = SpanType.WEB
+            anchor: Any = WebAnchor(
+                char_start=span_data["char_start"],
+                char_end=span_data.get("char_end"),
+            )
+        else:
+            span_type = SpanType.VIDEO
+            anchor = VideoAnchor(
+                t0_ms=span_data.get("start_ms", 0),
+                t1_ms=span_data.get("end_ms", 0),
+            )
         
         span = SpanRecord(
             nid=nid,
@@ -180,13 +218,7 @@ class GraphBuilder:
             scene_type=span_data.get("scene_type"),
         )
         
-        self.db.put_span(span, txn)
-        
-        # Index by time
-        if span_data.get("start_ms") is not None:
-            self.db.index_span_by_time(
-                source_nid, span_data["start_ms"], nid, txn
-            )
+        self.db.put_span(span, txn)  # Also indexes video spans by time
         
         return nid
     
@@ -8,14 +8,19 @@ from inception.ingest.youtube import (
     download_video,
     list_channel_videos,
     list_playlist_videos,
+    aiter_feed_videos,
 )
 from inception.ingest.web import (
     WebPageContent,
     CrawlResult,
+    AsyncCrawler,
     fetch_page,
     extract_content,
+    extract_links,
+    normalize_url,
     save_page,
     crawl_site,
+    acrawl_site,
 )
 from inception.ingest.documents import (
     DocumentInfo,
@@ -30,12 +35,29 @@ from inception.ingest.documents import (
     extract_xlsx,
     detect_document_type,
 )
+from inception.ingest.artifact_store import (
+    CachedURL,
+    ArtifactStore,
+    get_artifact_store,
+)
 from inception.ingest.source_manager import (
     SourceFeed,
     IngestJob,
     SourceManager,
     parse_batch_file,
 )
+from inception.ingest.channel import (
+    ChannelItemResult,
+    ChannelIngestResult,
+    ChannelIngestor,
+    ingest_feed,
+)
+from inception.ingest.site import (
+    SitePageResult,
+    SiteIngestResult,
+    SiteIngestor,
+    ingest_site,
+)
 
 __all__ = [
     # YouTube
@@ -46,13 +68,18 @@ __all__ = [
     "download_video",
     "list_channel_videos",
     "list_playlist_videos",
+    "aiter_feed_videos",
     # Web
     "WebPageContent",
     "CrawlResult",
+    "AsyncCrawler",
     "fetch_page",
     "extract_content",
+    "extract_links",
+    "normalize_url",
     "save_page",
     "crawl_site",
+    "acrawl_site",
     # Documents
     "DocumentInfo",
     "PDFPage",
@@ -65,9 +92,23 @@ __all__ = [
     "extract_docx",
     "extract_xlsx",
     "detect_document_type",
+    # Artifact Store
+    "CachedURL",
+    "ArtifactStore",
+    "get_artifact_store",
     # Source Manager
     "SourceFeed",
     "IngestJob",
     "SourceManager",
     "parse_batch_file",
+    # Channels
+    "ChannelItemResult",
+    "ChannelIngestResult",
+    "ChannelIngestor",
+    "ingest_feed",
+    # Sites
+    "SitePageResult",
+    "SiteIngestResult",
+    "SiteIngestor",
+    "ingest_site",
 ]
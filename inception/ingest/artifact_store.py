@@ -0,0 +1,492 @@
+"""
+Content-addressed artifact store.
+
+Stores downloaded and copied artifacts once, keyed by content hash,
+under the artifacts directory. A URL index with HTTP validators lets
+repeat ingests revalidate or skip downloads entirely, and the store is
+kept under a size budget with LRU eviction.
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+import lmdb
+import msgpack
+
+from inception.config import get_config
+from inception.db.graphtag import compute_content_hash, compute_file_hash
+from inception.db.lru import LRUIndex
+
+
+# Index sub-databases (plus the LRUIndex order and size total)
+DB_BLOB = b"blob"  # content hash -> {size, last_access}
+DB_URL = b"url"  # url -> {content_hash, etag, last_modified, fetched_at, content_type}
+
+
+@dataclass
+class CachedURL:
+    """A URL resolved to stored content, with HTTP validators."""
+    
+    url: str
+    content_hash: str
+    etag: str | None = None
+    last_modified: str | None = None
+    content_type: str | None = None
+    fetched_at: float = 0.0
+    
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "content_hash": self.content_hash,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_type": self.content_type,
+            "fetched_at": self.fetched_at,
+        }
+
+
+@dataclass
+class ArtifactStoreStats:
+    """Counters for store effectiveness."""
+    
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    bytes_deduplicated: int = 0
+    evictions: int = 0
+
+
+def _clone_or_copy(src: Path, dst: Path) -> str:
+    """
+    Place an independent copy of `src` at `dst`.
+    
+    Tries a reflink (copy-on-write clone, Linux FICLONE), which shares
+    data blocks until either file is written, then falls back to a
+    regular copy. Never hardlinks: a shared inode would let the copy
+    outlive eviction of the blob and keep its space in use.
+    
+    Returns:
+        Method used: 'reflink' or 'copy'
+    """
+    try:
+        import fcntl
+        
+        ficlone = 0x40049409
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), ficlone, fsrc.fileno())
+        shutil.copystat(src, dst)
+        return "reflink"
+    except (ImportError, OSError):
+        if dst.exists():
+            dst.unlink()
+    
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+class ArtifactStore:
+    """
+    Content-addressed file store with a URL index and LRU eviction.
+    
+    Blobs live at `<root>/objects/<hash[:2]>/<hash>` and are made
+    read-only; materialized files are separate clones, so they can be
+    edited and evicting a blob frees its space. The index is
+    a small LMDB environment, safe to share between processes.
+    """
+    
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        max_bytes: int | None = None,
+        algorithm: str = "sha256",
+    ):
+        """
+        Initialize the store.
+        
+        Args:
+            root: Store directory (default: <artifacts_dir>/cas)
+            max_bytes: Size budget for stored blobs
+            algorithm: Content hash ('sha256', 'xxh128')
+        """
+        config = get_config()
+        
+        self.root = Path(root) if root else config.artifacts_dir / "cas"
+        self.max_bytes = max_bytes or config.pipeline.cache_max_bytes
+        self.algorithm = algorithm
+        self.stats = ArtifactStoreStats()
+        
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.env = lmdb.open(
+            str(self.root / "index"),
+            map_size=256 * 1024 * 1024,
+            max_dbs=4,
+            create=True,
+        )
+        with self.env.begin(write=True) as txn:
+            self._dbs = {
+                name: self.env.open_db(name, txn=txn, create=True)
+                for name in (DB_BLOB, DB_URL)
+            }
+            self._lru = LRUIndex(self.env, txn)
+        
+        self._lock = threading.Lock()
+    
+    def close(self) -> None:
+        """Close the index."""
+        self.env.close()
+    
+    def __enter__(self) -> ArtifactStore:
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+    
+    # === Blob operations ===
+    
+    def blob_path(self, content_hash: str) -> Path:
+        """Path where a blob with this hash is stored."""
+        return self.objects_dir / content_hash[:2] / content_hash
+    
+    def has(self, content_hash: str) -> bool:
+        """Check whether a blob is stored."""
+        with self.env.begin() as txn:
+            return txn.get(content_hash.encode(), db=self._dbs[DB_BLOB]) is not None
+    
+    def get_path(self, content_hash: str) -> Path | None:
+        """Get the stored path for a hash, marking it recently used."""
+        path = self.blob_path(content_hash)
+        
+        with self.env.begin(write=True) as txn:
+            if txn.get(content_hash.encode(), db=self._dbs[DB_BLOB]) is None:
+                self.stats.misses += 1
+                return None
+            if not path.exists():
+                # Blob removed behind our back: forget it
+                self._remove_blob(txn, content_hash)
+                self.stats.misses += 1
+                return None
+            self._touch(txn, content_hash)
+        
+        self.stats.hits += 1
+        return path
+    
+    def put_file(self, path: Path | str, move: bool = False) -> str:
+        """
+        Store a file by content.
+        
+        Args:
+            path: File to store
+            move: Move the file into the store instead of cloning/copying
+                (use for temporary downloads)
+        
+        Returns:
+            Content hash
+        """
+        path = Path(path)
+        content_hash = self.hash_file(path)
+        size = path.stat().st_size
+        
+        if self.has(content_hash) and self.blob_path(content_hash).exists():
+            self.stats.bytes_deduplicated += size
+            if move:
+                path.unlink()
+        else:
+            dest = self.blob_path(content_hash)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.{os.getpid()}.{threading.get_ident()}")
+            if move:
+                shutil.move(str(path), tmp)
+            else:
+                _clone_or_copy(path, tmp)
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, dest)
+        
+        self._register(content_hash, size)
+        return content_hash
+    
+    def put_bytes(self, data: bytes) -> str:
+        """Store raw bytes by content and return the content hash."""
+        content_hash = compute_content_hash(data, algorithm=self.algorithm)
+        
+        if self.has(content_hash) and self.blob_path(content_hash).exists():
+            self.stats.bytes_deduplicated += len(data)
+        else:
+            dest = self.blob_path(content_hash)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.chmod(tmp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            os.replace(tmp, dest)
+        
+        self._register(content_hash, len(data))
+        return content_hash
+    
+    def hash_file(self, path: Path | str) -> str:
+        """Content hash of a file, as the store keys it."""
+        return compute_file_hash(str(path), algorithm=self.algorithm)
+    
+    def materialize(
+        self,
+        content_hash: str,
+        dest: Path | str,
+        source: Path | str | None = None,
+    ) -> Path:
+        """
+        Make stored content available at `dest`.
+        
+        Uses a reflink when the filesystem supports it, so no data is
+        copied, and a regular copy otherwise. The result is writable and
+        independent of the blob. An existing `dest` with the same content
+        is left as is.
+        
+        Args:
+            content_hash: Content to materialize
+            dest: Where to place it
+            source: A local file known to hold the content, cloned from
+                directly instead of the blob (which need not be stored),
+                so a local file is copied once rather than into the
+                store and out again
+        
+        Raises:
+            KeyError: If no source is given and the hash is not stored
+        """
+        dest = Path(dest)
+        src = Path(source) if source is not None else self.get_path(content_hash)
+        if src is None:
+            raise KeyError(f"Artifact not in store: {content_hash}")
+        
+        if dest.exists():
+            if self.matches(dest, content_hash):
+                return dest
+            dest.unlink()
+        
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        _clone_or_copy(src, dest)
+        os.chmod(dest, stat.S_IMODE(dest.stat().st_mode) | stat.S_IWUSR)
+        return dest
+    
+    def matches(self, path: Path | str, content_hash: str) -> bool:
+        """Check whether a file holds the given content (cheap on a size mismatch)."""
+        path = Path(path)
+        blob = self.blob_path(content_hash)
+        
+        if blob.exists():
+            if path.samefile(blob):
+                return True
+            if path.stat().st_size != blob.stat().st_size:
+                return False
+        
+        return self.hash_file(path) == content_hash
+    
+    def _register(self, content_hash: str, size: int) -> None:
+        """Record a blob in the index and enforce the size budget."""
+        key = content_hash.encode()
+        
+        with self.env.begin(write=True) as txn:
+            if txn.get(key, db=self._dbs[DB_BLOB]) is None:
+                txn.put(key, msgpack.packb({"size": size, "last_access": 0}),
+                        db=self._dbs[DB_BLOB])
+                self._lru.add_total(txn, size)
+            self._touch(txn, content_hash)
+        
+        if self.total_bytes() > self.max_bytes:
+            self.evict(keep=content_hash)
+    
+    def _touch(self, txn: lmdb.Transaction, content_hash: str) -> None:
+        """Move a blob to the most-recently-used end of the LRU index."""
+        key = content_hash.encode()
+        info = msgpack.unpackb(txn.get(key, db=self._dbs[DB_BLOB]))
+        info["last_access"] = self._lru.touch(txn, key, info.get("last_access", 0))
+        txn.put(key, msgpack.packb(info), db=self._dbs[DB_BLOB])
+    
+    def _remove_blob(self, txn: lmdb.Transaction, content_hash: str) -> int:
+        """Drop a blob from the index and disk, returning its size."""
+        key = content_hash.encode()
+        raw = txn.get(key, db=self._dbs[DB_BLOB])
+        if raw is None:
+            return 0
+        
+        info = msgpack.unpackb(raw)
+        txn.delete(key, db=self._dbs[DB_BLOB])
+        self._lru.forget(txn, key, info.get("last_access", 0), info["size"])
+        
+        path = self.blob_path(content_hash)
+        if path.exists():
+            os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+            path.unlink()
+        
+        return info["size"]
+    
+    def total_bytes(self) -> int:
+        """Total size of stored blobs."""
+        with self.env.begin() as txn:
+            return self._lru.total(txn)
+    
+    def evict(self, target_bytes: int | None = None, keep: str | None = None) -> int:
+        """
+        Evict least recently used blobs until under the size budget.
+        
+        URL entries pointing at evicted blobs are left in place; they
+        are treated as misses and refetched on next use.
+        
+        Args:
+            target_bytes: Size to shrink to (default: max_bytes)
+            keep: Hash never to evict (e.g. the blob just stored)
+        
+        Returns:
+            Number of blobs evicted
+        """
+        target = self.max_bytes if target_bytes is None else target_bytes
+        evicted = 0
+        
+        with self._lock, self.env.begin(write=True) as txn:
+            def size_of(key: bytes) -> int | None:
+                raw = txn.get(key, db=self._dbs[DB_BLOB])
+                return msgpack.unpackb(raw)["size"] if raw else None
+            
+            keep_key = keep.encode() if keep else None
+            for key in self._lru.victims(txn, target, size_of, keep=keep_key):
+                self._remove_blob(txn, key.decode())
+                evicted += 1
+        
+        self.stats.evictions += evicted
+        return evicted
+    
+    # === URL index ===
+    
+    def lookup_url(self, url: str) -> CachedURL | None:
+        """Get the cached entry for a URL if its content is still stored."""
+        with self.env.begin() as txn:
+            raw = txn.get(url.encode(), db=self._dbs[DB_URL])
+        if raw is None:
+            return None
+        
+        entry = CachedURL(url=url, **msgpack.unpackb(raw))
+        if not self.has(entry.content_hash):
+            return None
+        return entry
+    
+    def record_url(
+        self,
+        url: str,
+        content_hash: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        content_type: str | None = None,
+    ) -> CachedURL:
+        """Associate a URL with stored content and its HTTP validators."""
+        entry = CachedURL(
+            url=url,
+            content_hash=content_hash,
+            etag=etag,
+            last_modified=last_modified,
+            content_type=content_type,
+            fetched_at=time.time(),
+        )
+        with self.env.begin(write=True) as txn:
+            txn.put(url.encode(), msgpack.packb(entry.to_dict()), db=self._dbs[DB_URL])
+        return entry
+    
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """HTTP headers for revalidating a cached URL."""
+        entry = self.lookup_url(url)
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+    
+    def fetch_url(
+        self,
+        url: str,
+        client: httpx.Client,
+        timeout: float = 30.0,
+    ) -> CachedURL:
+        """
+        Fetch a URL through the store.
+        
+        Sends a conditional GET when the URL was fetched before; a 304
+        reuses the stored body without downloading it again.
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        return self.fetch_content(url, client, timeout=timeout)[0]
+    
+    def fetch_content(
+        self,
+        url: str,
+        client: httpx.Client,
+        timeout: float = 30.0,
+    ) -> tuple[CachedURL, bytes]:
+        """
+        Fetch a URL through the store, returning its entry and body.
+        
+        Like `fetch_url`, but the body comes from the response (or the
+        stored blob after a 304), so callers never refetch to read it.
+        
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        headers = self.conditional_headers(url)
+        response = client.get(url, headers=headers, timeout=timeout)
+        
+        if response.status_code == 304 and headers:
+            entry = self.lookup_url(url)
+            path = self.get_path(entry.content_hash) if entry else None
+            try:
+                content = path.read_bytes() if path is not None else None
+            except FileNotFoundError:
+                content = None
+            if content is not None:
+                self.stats.revalidated += 1
+                return entry, content
+            # Stored body vanished between lookup and revalidation: refetch
+            response = client.get(url, timeout=timeout)
+        
+        response.raise_for_status()
+        self.stats.misses += 1
+        
+        content_hash = self.put_bytes(response.content)
+        entry = self.record_url(
+            url,
+            content_hash,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            content_type=response.headers.get("content-type"),
+        )
+        return entry, response.content
+
+
+# Global store instance
+_store: ArtifactStore | None = None
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Get or create the global artifact store."""
+    global _store
+    if _store is None:
+        _store = ArtifactStore()
+    return _store
+
+
+def close_artifact_store() -> None:
+    """Close the global artifact store."""
+    global _store
+    if _store is not None:
+        _store.close()
+        _store = None
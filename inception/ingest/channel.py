@@ -0,0 +1,457 @@
+"""
+Channel and playlist ingestion.
+
+Runs a bounded-concurrency pipeline over a YouTube channel or playlist:
+list videos, skip already-ingested ones and those outside the feed's
+topic rules, then download, transcribe and extract each video in
+overlapping stages. Per-feed watermarks are
+persisted so incremental runs only touch new uploads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable
+
+from inception.config import get_config
+from inception.db.keys import SourceType
+from inception.db.records import SourceRecord
+from inception.ingest.source_manager import SourceFeed, SourceManager
+from inception.ingest.youtube import (
+    DownloadResult,
+    aiter_feed_videos,
+    download_video,
+    parse_youtube_url,
+)
+
+
+@dataclass
+class ChannelItemResult:
+    """Outcome of ingesting a single video from a feed."""
+    
+    video_id: str
+    url: str
+    title: str | None = None
+    
+    status: str = "pending"  # pending, completed, failed, skipped, filtered
+    stage: str | None = None  # Stage that was running (or failed)
+    error: str | None = None
+    source_nid: int | None = None
+
+
+@dataclass
+class ChannelIngestResult:
+    """Result of a channel or playlist ingestion run."""
+    
+    feed_uri: str
+    items: list[ChannelItemResult] = field(default_factory=list)
+    
+    previous_watermark: str | None = None
+    watermark: str | None = None
+    
+    @property
+    def completed(self) -> list[ChannelItemResult]:
+        return [item for item in self.items if item.status == "completed"]
+    
+    @property
+    def failed(self) -> list[ChannelItemResult]:
+        return [item for item in self.items if item.status == "failed"]
+    
+    @property
+    def skipped(self) -> list[ChannelItemResult]:
+        return [item for item in self.items if item.status == "skipped"]
+    
+    @property
+    def filtered(self) -> list[ChannelItemResult]:
+        return [item for item in self.items if item.status == "filtered"]
+
+
+def default_download(url: str) -> DownloadResult:
+    """Download audio and subtitles for a video."""
+    return download_video(url, download_thumbnail=False)
+
+
+def default_transcribe(download: DownloadResult) -> Any:
+    """
+    Produce a transcript for a downloaded video.
+    
+    Prefers downloaded subtitles (cheap to parse) and falls back to
+    Whisper transcription of the audio track.
+    """
+    from inception.extract.transcription import parse_vtt_subtitles, transcribe_audio
+    
+    vtt_paths = [p for p in download.subtitle_paths.values() if p.suffix == ".vtt"]
+    if vtt_paths:
+        preferred = download.subtitle_paths.get("en")
+        return parse_vtt_subtitles(preferred if preferred in vtt_paths else vtt_paths[0])
+    
+    if download.audio_path:
+        return transcribe_audio(download.audio_path)
+    
+    return None
+
+
+def default_extract(
+    manager: SourceManager,
+    source: SourceRecord,
+    download: DownloadResult,
+    transcript: Any,
+) -> None:
+    """Run semantic analysis on a transcript and write the results to the graph."""
+    if transcript is None or not transcript.segments:
+        return
+    
+    from inception.analyze import analyze_text
+    from inception.graph.builder import GraphBuilder
+    
+    analysis = analyze_text(transcript.full_text)
+    spans = [
+        {"start_ms": seg.start_ms, "end_ms": seg.end_ms, "text": seg.text}
+        for seg in transcript.segments
+    ]
+    
+    GraphBuilder(manager.db).build_from_extraction(
+        source.nid,
+        spans,
+        entities=analysis.entities,
+        claims=analysis.claims,
+        procedures=analysis.procedures,
+        gaps=analysis.gaps,
+        source=source,
+    )
+
+
+class ChannelIngestor:
+    """
+    Bounded-concurrency ingestion pipeline for channels and playlists.
+    
+    Each stage has its own concurrency limit, so downloads for later
+    videos overlap transcription and extraction of earlier ones, and a
+    cap on in-flight items applies backpressure to the listing.
+    
+    Stage callables run in worker threads and can be replaced (e.g. to
+    plug in LLM extraction):
+    - download(url) -> DownloadResult
+    - transcribe(download) -> TranscriptResult | None
+    - extract(manager, source, download, transcript) -> None
+    
+    An extract stage that writes the graph should store the source in
+    the same transaction (`GraphBuilder.build_from_extraction(source=...)`),
+    so a crash in between cannot leave a graph to be written again on
+    retry; otherwise the source is recorded after the stage returns.
+    """
+    
+    def __init__(
+        self,
+        manager: SourceManager | None = None,
+        download: Callable[[str], DownloadResult] | None = None,
+        transcribe: Callable[[DownloadResult], Any] | None = None,
+        extract: Callable[..., Any] | None = None,
+        list_videos: Callable[..., AsyncIterator[dict[str, Any]]] | None = None,
+        download_concurrency: int | None = None,
+        transcribe_concurrency: int = 1,
+        extract_concurrency: int | None = None,
+        max_in_flight: int | None = None,
+    ):
+        """
+        Initialize the ingestor.
+        
+        Args:
+            manager: Source manager (uses default database if not provided)
+            download: Download stage
+            transcribe: Transcription stage
+            extract: Extraction stage
+            list_videos: Async video lister (default: yt-dlp streaming listing)
+            download_concurrency: Parallel downloads (default: config max_workers)
+            transcribe_concurrency: Parallel transcriptions
+            extract_concurrency: Parallel extractions (default: config max_workers)
+            max_in_flight: Max videos between listing and completion
+        """
+        workers = get_config().pipeline.max_workers
+        
+        self.manager = manager or SourceManager()
+        self.download = download or default_download
+        self.transcribe = transcribe or default_transcribe
+        self.extract = extract or default_extract
+        self.list_videos = list_videos or aiter_feed_videos
+        
+        self.download_concurrency = download_concurrency or workers
+        self.transcribe_concurrency = transcribe_concurrency
+        self.extract_concurrency = extract_concurrency or workers
+        self.max_in_flight = max_in_flight or (
+            self.download_concurrency
+            + self.transcribe_concurrency
+            + self.extract_concurrency
+        )
+    
+    async def run(
+        self,
+        feed: SourceFeed,
+        max_items: int | None = None,
+        on_item: Callable[[ChannelItemResult], None] | None = None,
+    ) -> ChannelIngestResult:
+        """
+        Ingest new videos from a feed.
+        
+        Channels list newest uploads first, so listing stops at the stored
+        watermark. Listed videos are checked against the ingested sources
+        in batches, and videos whose title matches none of the feed's
+        topic rules are filtered out. The watermark then advances to the
+        newest video for which it and every older listed video completed,
+        was skipped or was filtered; a failed video holds it back so the
+        next run retries it.
+        
+        Args:
+            feed: Channel or playlist feed
+            max_items: Maximum number of videos to consider
+            on_item: Callback invoked as each video finishes
+        
+        Returns:
+            ChannelIngestResult with per-video outcomes
+        """
+        incremental = feed.feed_type == "youtube_channel"
+        previous = self.manager.get_watermark(feed.uri) if incremental else None
+        stop_at = previous["watermark"] if previous else None
+        
+        result = ChannelIngestResult(feed_uri=feed.uri, previous_watermark=stop_at)
+        
+        parent_type = (
+            SourceType.YOUTUBE_CHANNEL if incremental else SourceType.YOUTUBE_PLAYLIST
+        )
+        parent, _ = await asyncio.to_thread(
+            self.manager.get_or_create_source, feed.uri, parent_type
+        )
+        
+        stages = {
+            "download": asyncio.Semaphore(self.download_concurrency),
+            "transcribe": asyncio.Semaphore(self.transcribe_concurrency),
+            "extract": asyncio.Semaphore(self.extract_concurrency),
+        }
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        tasks: list[asyncio.Task] = []
+        batch: list[ChannelItemResult] = []
+        queued: set[str] = set()
+        truncated = False
+        
+        async def dispatch() -> None:
+            new_urls = set(await asyncio.to_thread(
+                self.manager.filter_new_uris, [item.url for item in batch]
+            ))
+            for item in batch:
+                if item.url not in new_urls or item.url in queued:  # Listed twice: ingest once
+                    item.status = "skipped"
+                    if on_item:
+                        on_item(item)
+                    continue
+                queued.add(item.url)
+                
+                await in_flight.acquire()
+                tasks.append(asyncio.create_task(
+                    self._process(item, parent.nid, stages, in_flight, on_item)
+                ))
+            batch.clear()
+        
+        listing = self.list_videos(
+            feed.uri, since=feed.since, until=feed.until, stop_at=stop_at
+        )
+        
+        try:
+            async with aclosing(listing) as videos:
+                async for video in videos:
+                    if max_items is not None and len(result.items) >= max_items:
+                        truncated = True
+                        break
+                    
+                    item = ChannelItemResult(
+                        video_id=video["id"],
+                        url=video["url"],
+                        title=video.get("title"),
+                    )
+                    result.items.append(item)
+                    
+                    if not feed.matches_topics(item.title or ""):
+                        item.status = "filtered"
+                        if on_item:
+                            on_item(item)
+                        continue
+                    
+                    batch.append(item)
+                    if len(batch) >= self.max_in_flight:
+                        await dispatch()
+            
+            await dispatch()
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        if incremental and not truncated:
+            watermark = self._advance_watermark(result.items)
+            if watermark and watermark != stop_at:
+                self.manager.update_watermark(feed.uri, watermark)
+            result.watermark = watermark or stop_at
+        else:
+            result.watermark = stop_at
+        
+        return result
+    
+    async def ingest_videos(
+        self,
+        urls: list[str],
+        on_item: Callable[[ChannelItemResult], None] | None = None,
+    ) -> list[ChannelItemResult]:
+        """
+        Ingest individual videos through the same stages as a feed.
+        
+        Videos already ingested are skipped; each completed one is
+        recorded as a source, so a later call skips it.
+        
+        Args:
+            urls: Video URLs
+            on_item: Callback invoked as each video finishes
+        
+        Returns:
+            Per-video outcomes, in input order
+        """
+        new_urls = set(await asyncio.to_thread(self.manager.filter_new_uris, urls))
+        stages = {
+            "download": asyncio.Semaphore(self.download_concurrency),
+            "transcribe": asyncio.Semaphore(self.transcribe_concurrency),
+            "extract": asyncio.Semaphore(self.extract_concurrency),
+        }
+        in_flight = asyncio.Semaphore(self.max_in_flight)
+        items: list[ChannelItemResult] = []
+        tasks: list[asyncio.Task] = []
+        
+        try:
+            for url in urls:
+                item = ChannelItemResult(
+                    video_id=parse_youtube_url(url).get("video_id") or url,
+                    url=url,
+                )
+                items.append(item)
+                
+                if url not in new_urls:
+                    item.status = "skipped"
+                    if on_item:
+                        on_item(item)
+                    continue
+                new_urls.discard(url)  # Listed twice: ingest once
+                
+                await in_flight.acquire()
+                tasks.append(asyncio.create_task(
+                    self._process(item, None, stages, in_flight, on_item)
+                ))
+            
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        return items
+    
+    async def _process(
+        self,
+        item: ChannelItemResult,
+        parent_nid: int | None,
+        stages: dict[str, asyncio.Semaphore],
+        in_flight: asyncio.Semaphore,
+        on_item: Callable[[ChannelItemResult], None] | None,
+    ) -> None:
+        """Run one video through the download, transcribe and extract stages."""
+        try:
+            item.status = "running"
+            
+            item.stage = "download"
+            async with stages["download"]:
+                download = await asyncio.to_thread(self.download, item.url)
+            
+            item.stage = "transcribe"
+            async with stages["transcribe"]:
+                transcript = await asyncio.to_thread(self.transcribe, download)
+            
+            item.stage = "extract"
+            source = self._build_source(item, download, parent_nid)
+            async with stages["extract"]:
+                await asyncio.to_thread(
+                    self.extract, self.manager, source, download, transcript
+                )
+            
+            item.stage = "record"
+            await asyncio.to_thread(self._record_source, source)
+            
+            item.stage = None
+            item.status = "completed"
+            item.source_nid = source.nid
+        except Exception as e:
+            item.status = "failed"
+            item.error = str(e)
+        finally:
+            in_flight.release()
+            if on_item:
+                on_item(item)
+    
+    def _build_source(
+        self,
+        item: ChannelItemResult,
+        download: DownloadResult,
+        parent_nid: int | None,
+    ) -> SourceRecord:
+        """Build (but do not store) the source record for a video."""
+        metadata = download.metadata
+        duration = metadata.duration_seconds
+        
+        return SourceRecord(
+            nid=self.manager.db.allocate_nid(),
+            source_type=SourceType.YOUTUBE_VIDEO,
+            uri=item.url,
+            title=metadata.title or item.title,
+            description=metadata.description,
+            author=metadata.channel,
+            duration_ms=duration * 1000 if duration else None,
+            parent_nid=parent_nid,
+        )
+    
+    def _record_source(self, source: SourceRecord) -> None:
+        """Record a finished video unless its extraction already did."""
+        self.manager.record_source(source)
+    
+    @staticmethod
+    def _advance_watermark(items: list[ChannelItemResult]) -> str | None:
+        """Newest video id with no unfinished videos at or below it in the listing."""
+        watermark = None
+        for item in reversed(items):
+            if item.status not in ("completed", "skipped", "filtered"):
+                break
+            watermark = item.video_id
+        return watermark
+
+
+def ingest_feed(
+    feed: SourceFeed,
+    manager: SourceManager | None = None,
+    max_items: int | None = None,
+    on_item: Callable[[ChannelItemResult], None] | None = None,
+    **kwargs: Any,
+) -> ChannelIngestResult:
+    """
+    Convenience function to ingest a channel or playlist synchronously.
+    
+    Args:
+        feed: Channel or playlist feed
+        manager: Source manager
+        max_items: Maximum number of videos to consider
+        on_item: Callback invoked as each video finishes
+        **kwargs: Additional ChannelIngestor options
+    
+    Returns:
+        ChannelIngestResult
+    """
+    ingestor = ChannelIngestor(manager=manager, **kwargs)
+    return asyncio.run(ingestor.run(feed, max_items=max_items, on_item=on_item))
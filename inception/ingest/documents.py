@@ -389,13 +389,21 @@ def copy_to_artifacts(
     """
     Copy a document to the artifacts directory.
     
+    With `pipeline.cache_enabled`, the document is hashed as the
+    content-addressed artifact store keys it and cloned into place,
+    reusing an identical existing copy, so re-ingesting identical
+    content creates no `name_1`, `name_2` duplicates. Otherwise it is
+    copied under a free name.
+    
     Args:
         source_path: Path to source document
         preserve_name: Whether to preserve original filename
     
     Returns:
-        Path to copied file in artifacts directory
+        Path to the file in artifacts directory
     """
+    from inception.ingest.artifact_store import get_artifact_store
+    
     config = get_config()
     
     artifacts_dir = config.artifacts_dir / "documents"
@@ -403,24 +411,42 @@ def copy_to_artifacts(
     
     source_path = Path(source_path)
     
-    if preserve_name:
-        dest_path = artifacts_dir / source_path.name
-        # Handle duplicates
-        if dest_path.exists():
+    if not config.pipeline.cache_enabled:
+        if preserve_name:
+            dest_path = artifacts_dir / source_path.name
             stem = source_path.stem
             suffix = source_path.suffix
             counter = 1
             while dest_path.exists():
                 dest_path = artifacts_dir / f"{stem}_{counter}{suffix}"
                 counter += 1
+        else:
+            info = get_document_info(source_path)
+            dest_path = artifacts_dir / f"{info.content_hash[:16]}{source_path.suffix}"
+        
+        shutil.copy2(source_path, dest_path)
+        return dest_path
+    
+    # The source is already local, so only its hash goes through the
+    # store: the document is copied once, straight to its destination
+    store = get_artifact_store()
+    content_hash = store.hash_file(source_path)
+    
+    if preserve_name:
+        dest_path = artifacts_dir / source_path.name
+        # Reuse an identical existing copy, otherwise find a free name
+        stem = source_path.stem
+        suffix = source_path.suffix
+        counter = 1
+        while dest_path.exists() and not store.matches(dest_path, content_hash):
+            dest_path = artifacts_dir / f"{stem}_{counter}{suffix}"
+            counter += 1
     else:
         # Use content hash as filename
-        info = get_document_info(source_path)
         suffix = source_path.suffix
-        dest_path = artifacts_dir / f"{info.content_hash[:16]}{suffix}"
+        dest_path = artifacts_dir / f"{content_hash[:16]}{suffix}"
     
-    shutil.copy2(source_path, dest_path)
-    return dest_path
+    return store.materialize(content_hash, dest_path, source=source_path)
 
 
 def detect_document_type(path: Path) -> str:
@@ -0,0 +1,237 @@
+"""
+Website ingestion.
+
+Streams pages from `AsyncCrawler` into the graph as they are extracted:
+each page not ingested before is analyzed and recorded as a WEB_PAGE
+source, overlapping with the rest of the crawl. The crawler's
+validators (ETag / Last-Modified and outgoing links per URL) are
+persisted per site, so a re-crawl sends conditional GETs and follows
+the links of unchanged pages without refetching them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from inception.config import get_config
+from inception.db.keys import SourceType
+from inception.db.records import SourceRecord
+from inception.ingest.source_manager import SourceManager
+from inception.ingest.web import AsyncCrawler, WebPageContent, normalize_url
+
+
+@dataclass
+class SitePageResult:
+    """Outcome of ingesting a single crawled page."""
+    
+    url: str
+    title: str | None = None
+    
+    status: str = "pending"  # pending, completed, failed, skipped
+    error: str | None = None
+    source_nid: int | None = None
+
+
+@dataclass
+class SiteIngestResult:
+    """Result of a site ingestion run."""
+    
+    root_url: str
+    pages: list[SitePageResult] = field(default_factory=list)
+    not_modified: list[str] = field(default_factory=list)  # Unchanged since the last crawl
+    crawl_errors: list[dict[str, str]] = field(default_factory=list)
+    
+    @property
+    def completed(self) -> list[SitePageResult]:
+        return [page for page in self.pages if page.status == "completed"]
+    
+    @property
+    def failed(self) -> list[SitePageResult]:
+        return [page for page in self.pages if page.status == "failed"]
+    
+    @property
+    def skipped(self) -> list[SitePageResult]:
+        return [page for page in self.pages if page.status == "skipped"]
+
+
+def default_extract(manager: SourceManager, source: SourceRecord, page: WebPageContent) -> None:
+    """Run semantic analysis on a page's text and write the results to the graph."""
+    if not page.text:
+        return
+    
+    from inception.analyze import analyze_text
+    from inception.graph.builder import GraphBuilder
+    
+    analysis = analyze_text(page.text)
+    spans = [{"text": page.text, "char_start": 0, "char_end": len(page.text)}]
+    
+    GraphBuilder(manager.db).build_from_extraction(
+        source.nid,
+        spans,
+        entities=analysis.entities,
+        claims=analysis.claims,
+        procedures=analysis.procedures,
+        gaps=analysis.gaps,
+        source=source,
+    )
+
+
+class SiteIngestor:
+    """
+    Crawl-and-ingest pipeline for a website.
+    
+    Pages are handed to the extraction stage as the crawler yields them,
+    with at most `extract_concurrency` extractions running at once. The
+    extract callable runs in a worker thread and can be replaced:
+    - extract(manager, source, page) -> None
+    
+    As with `ChannelIngestor`, an extract stage that writes the graph
+    should store the source in the same transaction; otherwise it is
+    recorded after the stage returns.
+    """
+    
+    def __init__(
+        self,
+        manager: SourceManager | None = None,
+        extract: Callable[..., Any] | None = None,
+        extract_concurrency: int | None = None,
+        **crawler_options: Any,
+    ):
+        """
+        Initialize the ingestor.
+        
+        Args:
+            manager: Source manager (uses default database if not provided)
+            extract: Extraction stage
+            extract_concurrency: Parallel extractions (default: config max_workers)
+            **crawler_options: AsyncCrawler options (max_pages, max_depth, ...)
+        """
+        self.manager = manager or SourceManager()
+        self.extract = extract or default_extract
+        self.extract_concurrency = extract_concurrency or get_config().pipeline.max_workers
+        self.crawler_options = crawler_options
+    
+    async def run(
+        self,
+        root_url: str,
+        on_page: Callable[[SitePageResult], None] | None = None,
+    ) -> SiteIngestResult:
+        """
+        Crawl a site and ingest the pages not ingested before.
+        
+        Validators are only persisted for pages that were ingested (or
+        already had been), so a page whose extraction failed is fetched
+        in full again by the next crawl.
+        
+        Args:
+            root_url: Starting URL
+            on_page: Callback invoked as each page finishes
+        
+        Returns:
+            SiteIngestResult with per-page outcomes
+        """
+        root_url = normalize_url(root_url)
+        result = SiteIngestResult(root_url=root_url)
+        db = self.manager.db
+        
+        crawler = AsyncCrawler(
+            validators=await asyncio.to_thread(db.get_crawl_validators, root_url),
+            **self.crawler_options,
+        )
+        
+        semaphore = asyncio.Semaphore(self.extract_concurrency)
+        tasks: list[asyncio.Task] = []
+        seen: set[str] = set()
+        
+        try:
+            async for page in crawler.crawl(root_url):
+                if page.url in seen:  # Two links redirected to one page
+                    continue
+                seen.add(page.url)
+                
+                item = SitePageResult(url=page.url, title=page.title)
+                result.pages.append(item)
+                
+                if not await asyncio.to_thread(self.manager.filter_new_uris, [page.url]):
+                    item.status = "skipped"
+                    if on_page:
+                        on_page(item)
+                    continue
+                
+                tasks.append(asyncio.create_task(
+                    self._process(item, page, semaphore, on_page)
+                ))
+            
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        
+        result.not_modified = crawler.not_modified
+        result.crawl_errors = crawler.errors
+        
+        validators = dict(crawler.validators)
+        for item in result.failed:
+            validators.pop(normalize_url(item.url), None)
+        await asyncio.to_thread(db.put_crawl_validators, root_url, validators)
+        
+        return result
+    
+    async def _process(
+        self,
+        item: SitePageResult,
+        page: WebPageContent,
+        semaphore: asyncio.Semaphore,
+        on_page: Callable[[SitePageResult], None] | None,
+    ) -> None:
+        """Extract one page into the graph, then record it as a source."""
+        try:
+            item.status = "running"
+            source = SourceRecord(
+                nid=self.manager.db.allocate_nid(),
+                source_type=SourceType.WEB_PAGE,
+                uri=page.url,
+                content_hash=page.content_hash,
+                title=page.title,
+                description=page.description,
+                author=page.author,
+            )
+            
+            async with semaphore:
+                await asyncio.to_thread(self.extract, self.manager, source, page)
+            await asyncio.to_thread(self.manager.record_source, source)
+            
+            item.status = "completed"
+            item.source_nid = source.nid
+        except Exception as e:
+            item.status = "failed"
+            item.error = str(e)
+        finally:
+            if on_page:
+                on_page(item)
+
+
+def ingest_site(
+    root_url: str,
+    manager: SourceManager | None = None,
+    on_page: Callable[[SitePageResult], None] | None = None,
+    **kwargs: Any,
+) -> SiteIngestResult:
+    """
+    Convenience function to crawl and ingest a site synchronously.
+    
+    Args:
+        root_url: Starting URL
+        manager: Source manager
+        on_page: Callback invoked as each page finishes
+        **kwargs: Additional SiteIngestor and AsyncCrawler options
+    
+    Returns:
+        SiteIngestResult
+    """
+    ingestor = SiteIngestor(manager=manager, **kwargs)
+    return asyncio.run(ingestor.run(root_url, on_page=on_page))
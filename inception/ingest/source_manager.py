@@ -6,6 +6,7 @@ Handles watermarks, incremental updates, and batch processing.
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +36,17 @@ class SourceFeed:
     # Processing state
     last_processed: datetime | None = None
     watermark: str | None = None  # Last processed item identifier
+    
+    def matches_topics(self, text: str) -> bool:
+        """
+        Check text (e.g. a video title) against the topic rules.
+        
+        Rules are case-insensitive regular expressions; text matching any
+        of them passes, and everything passes when there are no rules.
+        """
+        if not self.topic_rules:
+            return True
+        return any(re.search(rule, text, re.IGNORECASE) for rule in self.topic_rules)
 
 
 @dataclass
@@ -69,7 +81,6 @@ class SourceManager:
     
     def __init__(self, db: InceptionDB | None = None):
         self.db = db or get_db()
-        self._watermarks: dict[str, dict[str, Any]] = {}
     
     def detect_source_type(self, uri: str) -> SourceType:
         """
@@ -200,6 +211,101 @@ class SourceManager:
         
         return source, True
     
+    def filter_new_uris(
+        self,
+        uris: list[str],
+        create: bool = False,
+        source_type: SourceType | None = None,
+        parent_nid: int | None = None,
+    ) -> list[str]:
+        """
+        Return the URIs that have not been ingested yet.
+        
+        Batch counterpart of `should_process`: all URIs are hashed up
+        front and probed against the graphtag index in one read txn.
+        
+        Args:
+            uris: Candidate URIs (duplicates are collapsed)
+            create: Also create source records for the new URIs
+            source_type: Source type for created sources (detected if None)
+            parent_nid: Parent source NID for created sources
+        
+        Returns:
+            New URIs in input order
+        """
+        graphtags: dict[str, str] = {}
+        for uri in uris:
+            if uri not in graphtags:
+                graphtags[uri] = compute_graphtag({"uri": uri})
+        
+        existing = self.db.get_nids_by_graphtags(list(graphtags.values()))
+        new_uris = [uri for uri, gt in graphtags.items() if gt not in existing]
+        
+        if create and new_uris:
+            self.create_sources(new_uris, source_type, parent_nid, graphtags)
+        
+        return new_uris
+    
+    def create_sources(
+        self,
+        uris: list[str],
+        source_type: SourceType | None = None,
+        parent_nid: int | None = None,
+        graphtags: dict[str, str] | None = None,
+    ) -> list[SourceRecord]:
+        """
+        Create source records and graphtag mappings in one write txn.
+        
+        Args:
+            uris: Source URIs (assumed not yet ingested)
+            source_type: Override detected source type
+            parent_nid: Parent source NID (for channel/playlist items)
+            graphtags: Precomputed URI -> graphtag map
+        
+        Returns:
+            Created SourceRecords
+        """
+        from inception.db.keys import ObjectType
+        
+        graphtags = graphtags or {}
+        sources = [
+            SourceRecord(
+                nid=self.db.allocate_nid(),
+                source_type=source_type or self.detect_source_type(uri),
+                uri=uri,
+                ingest_policy=IngestPolicy(),
+                parent_nid=parent_nid,
+            )
+            for uri in uris
+        ]
+        
+        with self.db.write_txn() as txn:
+            for source in sources:
+                graphtag = graphtags.get(source.uri) or compute_graphtag({"uri": source.uri})
+                self.db.put_source(source, txn)
+                self.db.put_graphtag(graphtag, ObjectType.SOURCE, source.nid, txn)
+        
+        return sources
+    
+    def record_source(self, source: SourceRecord) -> None:
+        """
+        Store an ingested source and its graphtag in one transaction.
+        
+        Pipelines call this last, once a source's graph writes are done,
+        so `should_process` and `filter_new_uris` only skip fully
+        ingested sources. A source already stored with its graph (see
+        `GraphBuilder.build_from_extraction`) is left as is.
+        """
+        from inception.db.keys import ObjectType
+        
+        graphtag = compute_graphtag({"uri": source.uri})
+        
+        with self.db.write_txn() as txn:
+            if self.db.get_source(source.nid, txn) is not None:
+                return
+            self.db.put_source(source, txn)
+            self.db.put_graphtag(graphtag, ObjectType.SOURCE, source.nid, txn)
+    
     def update_watermark(
         self,
         feed_uri: str,
@@ -209,15 +315,15 @@ class SourceManager:
         """
         Update the watermark for a feed.
         
+        Watermarks are persisted in the database so incremental runs
+        in later processes resume where the previous run stopped.
+        
         Args:
             feed_uri: Feed URI (channel, playlist, site)
             watermark: New watermark value
             timestamp: Timestamp for the watermark
         """
-        self._watermarks[feed_uri] = {
-            "watermark": watermark,
-            "timestamp": timestamp or datetime.utcnow(),
-        }
+        self.db.put_watermark(feed_uri, watermark, timestamp)
     
     def get_watermark(self, feed_uri: str) -> dict[str, Any] | None:
         """
@@ -229,7 +335,7 @@ class SourceManager:
         Returns:
             Watermark dict with 'watermark' and 'timestamp' keys, or None
         """
-        return self._watermarks.get(feed_uri)
+        return self.db.get_watermark(feed_uri)
     
     def should_process(
         self,
@@ -286,24 +392,22 @@ class SourceManager:
                 max_videos=max_items,
             )
             
-            for video in videos:
-                if self.should_process(video["url"], feed.since, feed.until):
-                    yield video["url"]
-                    count += 1
-                    if max_items and count >= max_items:
-                        return
+            for uri in self.filter_new_uris([video["url"] for video in videos]):
+                yield uri
+                count += 1
+                if max_items and count >= max_items:
+                    return
         
         elif feed.feed_type == "youtube_playlist":
             from inception.ingest.youtube import list_playlist_videos
             
             videos = list_playlist_videos(feed.uri, max_videos=max_items)
             
-            for video in videos:
-                if self.should_process(video["url"]):
-                    yield video["url"]
-                    count += 1
-                    if max_items and count >= max_items:
-                        return
+            for uri in self.filter_new_uris([video["url"] for video in videos]):
+                yield uri
+                count += 1
+                if max_items and count >= max_items:
+                    return
 
 
 def parse_batch_file(path: Path) -> list[IngestJob]:
@@ -326,6 +430,7 @@ def parse_batch_file(path: Path) -> list[IngestJob]:
     import json
     
     jobs = []
+    sm = SourceManager()
     
     with open(path) as f:
         for line_num, line in enumerate(f, 1):
@@ -354,7 +459,6 @@ def parse_batch_file(path: Path) -> list[IngestJob]:
             
             # Try to detect source type
             try:
-                sm = SourceManager()
                 source_type = sm.detect_source_type(uri)
             except ValueError:
                 source_type = SourceType.WEB_PAGE  # Default
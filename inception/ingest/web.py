@@ -6,11 +6,21 @@ Handles fetching and extracting content from web pages using trafilatura.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import hashlib
+import importlib.util
+import re
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
+from email.message import Message
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator, Callable, Coroutine
+from urllib.parse import parse_qsl, urldefrag, urlencode, urljoin, urlparse, urlunparse
+from urllib.robotparser import RobotFileParser
 
 import httpx
 import trafilatura
@@ -53,6 +63,11 @@ class CrawlResult:
     root_url: str
     pages: list[WebPageContent] = field(default_factory=list)
     errors: list[dict[str, str]] = field(default_factory=list)
+    not_modified: list[str] = field(default_factory=list)  # 304s, not re-extracted
+    
+    # Normalized URL -> {"etag", "last_modified", "links"}; pass back as
+    # `validators` for a conditional re-crawl
+    validators: dict[str, dict[str, Any]] = field(default_factory=dict)
     
     @property
     def success_count(self) -> int:
@@ -63,10 +78,123 @@ class CrawlResult:
         return len(self.errors)
 
 
+USER_AGENT = "Mozilla/5.0 (compatible; Inception/0.1; +https://github.com/inception)"
+
+# Shared keep-alive client for synchronous fetches
+_http_client: httpx.Client | None = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared synchronous HTTP client."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.Client(
+            follow_redirects=True,
+            headers={"User-Agent": USER_AGENT},
+        )
+    return _http_client
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL for crawl deduplication.
+    
+    Lowercases scheme and host, drops fragments and default ports,
+    sorts query parameters and gives empty paths a trailing slash.
+    """
+    url, _ = urldefrag(url.strip())
+    parsed = urlparse(url)
+    
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    port = parsed.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    
+    query = urlencode(sorted(parse_qsl(parsed.query, keep_blank_values=True)))
+    
+    return urlunparse((scheme, host, parsed.path or "/", parsed.params, query, ""))
+
+
+class _LinkParser(HTMLParser):
+    """Collect anchor hrefs and their text."""
+    
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: list[dict[str, str]] = []
+        self._current: dict[str, str] | None = None
+        self.base_href: str | None = None
+    
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attr_map = dict(attrs)
+        if tag == "base" and attr_map.get("href") and self.base_href is None:
+            self.base_href = attr_map["href"]
+        elif tag == "a" and attr_map.get("href"):
+            self._current = {"href": attr_map["href"] or "", "text": ""}
+            self.links.append(self._current)
+    
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "a":
+            self._current = None
+    
+    def handle_data(self, data: str) -> None:
+        if self._current is not None:
+            self._current["text"] += data
+
+
+def extract_links(html: str, base_url: str) -> list[dict[str, str]]:
+    """
+    Extract absolute http(s) links from HTML.
+    
+    Args:
+        html: HTML content
+        base_url: URL the HTML was fetched from
+    
+    Returns:
+        List of {"url": ..., "text": ...} dicts, in document order
+    """
+    parser = _LinkParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        pass
+    
+    base = urljoin(base_url, parser.base_href) if parser.base_href else base_url
+    
+    links = []
+    for link in parser.links:
+        url = urljoin(base, link["href"].strip())
+        if urlparse(url).scheme not in ("http", "https"):
+            continue
+        links.append({"url": urldefrag(url)[0], "text": " ".join(link["text"].split())})
+    
+    return links
+
+
+def _decode_body(content: bytes, content_type: str | None) -> str:
+    """Decode a response body by its declared charset (UTF-8 otherwise)."""
+    message = Message()
+    message["content-type"] = content_type or "text/html"
+    try:
+        return content.decode(message.get_content_charset() or "utf-8", errors="replace")
+    except LookupError:
+        return content.decode("utf-8", errors="replace")
+
+
 def fetch_page(url: str, timeout: float = 30.0) -> str:
     """
     Fetch HTML content from a URL.
     
+    With `pipeline.cache_web_pages` (and caching enabled), responses
+    are kept in the artifact store and later fetches send a
+    conditional GET.
+    
     Args:
         url: URL to fetch
         timeout: Request timeout in seconds
@@ -83,12 +211,18 @@ def fetch_page(url: str, timeout: float = 30.0) -> str:
         raise RuntimeError("Cannot fetch web page in offline mode")
     
     try:
-        with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-            response = client.get(url, headers={
-                "User-Agent": "Mozilla/5.0 (compatible; Inception/0.1; +https://github.com/inception)"
-            })
-            response.raise_for_status()
-            return response.text
+        if config.pipeline.cache_enabled and config.pipeline.cache_web_pages:
+            # Revalidate against the artifact store; 304s skip the body
+            from inception.ingest.artifact_store import get_artifact_store
+            
+            entry, content = get_artifact_store().fetch_content(
+                url, _get_http_client(), timeout=timeout
+            )
+            return _decode_body(content, entry.content_type)
+        
+        response = _get_http_client().get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
     except httpx.HTTPError as e:
         raise RuntimeError(f"Failed to fetch {url}: {e}") from e
 
@@ -137,7 +271,7 @@ def extract_content(
     )
     
     # Get metadata
-    metadata = trafilatura.extract_metadata(html, url=url)
+    metadata = trafilatura.extract_metadata(html, default_url=url)
     
     # Parse date if available
     page_date = None
@@ -149,10 +283,8 @@ def extract_content(
     
     # Extract links
     links = []
-    if include_links and metadata:
-        # trafilatura doesn't expose links directly in metadata
-        # We would need to parse HTML for comprehensive link extraction
-        pass
+    if include_links and url:
+        links = extract_links(html, url)
     
     # Extract images
     images = []
@@ -249,15 +381,277 @@ def save_page(
     return html_path, content_path
 
 
-def crawl_site(
+@dataclass
+class CrawlOutcome:
+    """Outcome of fetching a single URL during a crawl."""
+    
+    url: str
+    depth: int
+    page: WebPageContent | None = None
+    error: str | None = None
+    not_modified: bool = False
+    disallowed: bool = False
+
+
+class AsyncCrawler:
+    """
+    Concurrent, polite web crawler.
+    
+    Uses one shared keep-alive `httpx.AsyncClient` (HTTP/2 when `h2` is
+    installed), a breadth-first frontier deduplicated on normalized URLs,
+    per-host concurrency limits, cached robots.txt rules and conditional
+    GETs for re-crawls. Pages are yielded as soon as they are extracted.
+    """
+    
+    def __init__(
+        self,
+        max_pages: int = 10,
+        max_depth: int = 2,
+        include_patterns: list[str] | None = None,
+        exclude_patterns: list[str] | None = None,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 2,
+        same_domain: bool = True,
+        respect_robots: bool = True,
+        timeout: float = 30.0,
+        validators: dict[str, dict[str, Any]] | None = None,
+    ):
+        """
+        Initialize the crawler.
+        
+        Args:
+            max_pages: Maximum number of pages to extract
+            max_depth: Maximum link depth from root
+            include_patterns: URL patterns to include (regex)
+            exclude_patterns: URL patterns to exclude (regex)
+            max_concurrency: Max requests in flight overall
+            per_host_concurrency: Max requests in flight per host
+            same_domain: Only follow links on the root URL's host
+            respect_robots: Honor robots.txt rules and crawl-delay
+            timeout: Request timeout in seconds
+            validators: Normalized URL -> {"etag", "last_modified", "links"}
+                from a previous crawl, used for conditional GETs; the
+                links of unmodified pages are followed without refetching
+        """
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.include_patterns = [re.compile(p) for p in include_patterns or []]
+        self.exclude_patterns = [re.compile(p) for p in exclude_patterns or []]
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.same_domain = same_domain
+        self.respect_robots = respect_robots
+        self.timeout = timeout
+        
+        # Updated in place with validators (and outgoing links) seen during this crawl
+        self.validators: dict[str, dict[str, Any]] = dict(validators or {})
+        
+        self.errors: list[dict[str, str]] = []
+        self.not_modified: list[str] = []
+        
+        self._client: httpx.AsyncClient | None = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._host_next_request: dict[str, float] = {}
+        self._robots: dict[str, RobotFileParser | None] = {}
+        self._robots_locks: dict[str, asyncio.Lock] = {}
+    
+    def _make_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            http2=_http2_available(),
+            follow_redirects=True,
+            timeout=self.timeout,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=self.max_concurrency,
+            ),
+        )
+    
+    def _is_allowed_url(self, url: str, root_host: str) -> bool:
+        """Check scope and include/exclude patterns."""
+        if self.same_domain and urlparse(url).netloc != root_host:
+            return False
+        if self.include_patterns and not any(p.search(url) for p in self.include_patterns):
+            return False
+        if any(p.search(url) for p in self.exclude_patterns):
+            return False
+        return True
+    
+    async def _get_robots(self, url: str) -> RobotFileParser | None:
+        """Fetch and cache robots.txt for the URL's host (None = allow all)."""
+        parsed = urlparse(url)
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+        
+        lock = self._robots_locks.setdefault(origin, asyncio.Lock())
+        async with lock:
+            if origin not in self._robots:
+                rules = None
+                try:
+                    response = await self._client.get(f"{origin}/robots.txt")
+                    if response.status_code == 200:
+                        rules = RobotFileParser()
+                        rules.parse(response.text.splitlines())
+                    elif response.status_code in (401, 403):
+                        # Like RobotFileParser.read: access denied means stay out
+                        rules = RobotFileParser()
+                        rules.disallow_all = True
+                except httpx.HTTPError:
+                    pass
+                self._robots[origin] = rules
+        
+        return self._robots[origin]
+    
+    async def _wait_for_host(self, host: str, delay: float) -> None:
+        """Space out requests to one host by the robots crawl-delay."""
+        if delay <= 0:
+            return
+        now = time.monotonic()
+        next_at = self._host_next_request.get(host, now)
+        self._host_next_request[host] = max(next_at, now) + delay
+        if next_at > now:
+            await asyncio.sleep(next_at - now)
+    
+    async def _fetch(self, url: str, depth: int) -> tuple[CrawlOutcome, list[str]]:
+        """Fetch and extract one URL, returning outcome and outgoing links."""
+        host = urlparse(url).netloc
+        delay = 0.0
+        
+        if self.respect_robots:
+            rules = await self._get_robots(url)
+            if rules is not None:
+                if not rules.can_fetch(USER_AGENT, url):
+                    return CrawlOutcome(url=url, depth=depth, disallowed=True), []
+                delay = float(rules.crawl_delay(USER_AGENT) or 0)
+        
+        headers = {}
+        cached = self.validators.get(url, {})
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        
+        semaphore = self._host_semaphores.setdefault(
+            host, asyncio.Semaphore(self.per_host_concurrency)
+        )
+        
+        try:
+            async with semaphore:
+                await self._wait_for_host(host, delay)
+                response = await self._client.get(url, headers=headers)
+            
+            if response.status_code == 304:
+                # Unchanged: keep crawling from the links it had last time
+                return CrawlOutcome(url=url, depth=depth, not_modified=True), list(
+                    cached.get("links", [])
+                )
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            return CrawlOutcome(url=url, depth=depth, error=f"Failed to fetch {url}: {e}"), []
+        
+        validators: dict[str, Any] = {}
+        if response.headers.get("etag"):
+            validators["etag"] = response.headers["etag"]
+        if response.headers.get("last-modified"):
+            validators["last_modified"] = response.headers["last-modified"]
+        
+        html = response.text
+        final_url = str(response.url)
+        
+        try:
+            # Extraction is CPU-bound; keep the event loop free for fetches
+            page = await asyncio.to_thread(extract_content, final_url, html=html)
+        except Exception as e:
+            return CrawlOutcome(url=url, depth=depth, error=str(e)), []
+        
+        links = [link["url"] for link in page.links]
+        if validators:
+            validators["links"] = links
+            self.validators[url] = validators
+        
+        return CrawlOutcome(url=url, depth=depth, page=page), links
+    
+    async def crawl(self, root_url: str) -> AsyncIterator[WebPageContent]:
+        """
+        Crawl from a root URL, yielding pages as they are extracted.
+        
+        Args:
+            root_url: Starting URL
+        
+        Yields:
+            WebPageContent for each successfully extracted page
+        """
+        config = get_config()
+        
+        if config.pipeline.offline_mode:
+            raise RuntimeError("Cannot crawl in offline mode")
+        
+        root_url = normalize_url(root_url)
+        root_host = urlparse(root_url).netloc
+        
+        frontier: deque[tuple[str, int]] = deque([(root_url, 0)])
+        seen: set[str] = {root_url}
+        in_flight: set[asyncio.Task] = set()
+        extracted = 0
+        
+        owns_client = self._client is None
+        if owns_client:
+            self._client = self._make_client()
+        
+        try:
+            while frontier or in_flight:
+                # Schedule as much of the frontier as the budget allows
+                while (
+                    frontier
+                    and len(in_flight) < self.max_concurrency
+                    and extracted + len(in_flight) < self.max_pages
+                ):
+                    url, depth = frontier.popleft()
+                    if self._is_allowed_url(url, root_host):
+                        in_flight.add(asyncio.create_task(self._fetch(url, depth)))
+                
+                if not in_flight:
+                    break
+                
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    outcome, links = task.result()
+                    
+                    if outcome.error:
+                        self.errors.append({"url": outcome.url, "error": outcome.error})
+                    elif outcome.not_modified:
+                        self.not_modified.append(outcome.url)
+                    
+                    if outcome.page is not None:
+                        extracted += 1
+                        yield outcome.page
+                    
+                    if outcome.depth < self.max_depth:
+                        for link in links:
+                            link = normalize_url(link)
+                            if link not in seen:
+                                seen.add(link)
+                                frontier.append((link, outcome.depth + 1))
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if owns_client:
+                await self._client.aclose()
+                self._client = None
+
+
+async def acrawl_site(
     root_url: str,
     max_pages: int = 10,
     max_depth: int = 2,
     include_patterns: list[str] | None = None,
     exclude_patterns: list[str] | None = None,
-) -> CrawlResult:
+    **crawler_options: Any,
+) -> AsyncIterator[WebPageContent]:
     """
-    Crawl a website starting from a root URL.
+    Crawl a website, streaming pages as they are extracted.
     
     Args:
         root_url: Starting URL
@@ -265,64 +659,80 @@ def crawl_site(
         max_depth: Maximum link depth from root
         include_patterns: URL patterns to include (regex)
         exclude_patterns: URL patterns to exclude (regex)
+        **crawler_options: Extra AsyncCrawler options
     
-    Returns:
-        CrawlResult with all extracted pages
+    Yields:
+        WebPageContent for each extracted page
+    """
+    crawler = AsyncCrawler(
+        max_pages=max_pages,
+        max_depth=max_depth,
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        **crawler_options,
+    )
+    async for page in crawler.crawl(root_url):
+        yield page
+
+
+def _run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine to completion, in a worker thread if this one has a running loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
     
-    Note:
-        This is a simplified implementation. For production use,
-        consider using a proper crawler like Scrapy or crawl4ai.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+def crawl_site(
+    root_url: str,
+    max_pages: int = 10,
+    max_depth: int = 2,
+    include_patterns: list[str] | None = None,
+    exclude_patterns: list[str] | None = None,
+    on_page: Callable[[WebPageContent], None] | None = None,
+    **crawler_options: Any,
+) -> CrawlResult:
     """
-    import re
-    from urllib.parse import urljoin, urlparse
+    Crawl a website starting from a root URL.
     
-    config = get_config()
+    Synchronous wrapper around AsyncCrawler (safe to call from code
+    running inside an event loop, e.g. a sync FastAPI handler); async
+    callers should use `acrawl_site` or `AsyncCrawler.crawl` instead.
     
-    if config.pipeline.offline_mode:
-        raise RuntimeError("Cannot crawl in offline mode")
+    Args:
+        root_url: Starting URL
+        max_pages: Maximum number of pages to crawl
+        max_depth: Maximum link depth from root
+        include_patterns: URL patterns to include (regex)
+        exclude_patterns: URL patterns to exclude (regex)
+        on_page: Called with each page as soon as it is extracted
+        **crawler_options: Extra AsyncCrawler options (e.g. `validators`
+            from a previous CrawlResult)
     
+    Returns:
+        CrawlResult with all extracted pages and the crawl's validators
+    """
+    crawler = AsyncCrawler(
+        max_pages=max_pages,
+        max_depth=max_depth,
+        include_patterns=include_patterns,
+        exclude_patterns=exclude_patterns,
+        **crawler_options,
+    )
     result = CrawlResult(root_url=root_url)
-    visited: set[str] = set()
-    to_visit: list[tuple[str, int]] = [(root_url, 0)]
     
-    root_domain = urlparse(root_url).netloc
+    async def _run() -> None:
+        async for page in crawler.crawl(root_url):
+            result.pages.append(page)
+            if on_page:
+                on_page(page)
     
-    while to_visit and len(result.pages) < max_pages:
-        url, depth = to_visit.pop(0)
-        
-        if url in visited:
-            continue
-        visited.add(url)
-        
-        # Check depth
-        if depth > max_depth:
-            continue
-        
-        # Check domain
-        if urlparse(url).netloc != root_domain:
-            continue
-        
-        # Check include patterns
-        if include_patterns:
-            if not any(re.search(p, url) for p in include_patterns):
-                continue
-        
-        # Check exclude patterns
-        if exclude_patterns:
-            if any(re.search(p, url) for p in exclude_patterns):
-                continue
-        
-        try:
-            content = extract_content(url, include_links=True)
-            result.pages.append(content)
-            
-            # Extract links for further crawling
-            if depth < max_depth:
-                # Would need to parse HTML for proper link extraction
-                # This is simplified
-                pass
-                
-        except Exception as e:
-            result.errors.append({"url": url, "error": str(e)})
+    _run_sync(_run())
+    result.errors.extend(crawler.errors)
+    result.not_modified.extend(crawler.not_modified)
+    result.validators.update(crawler.validators)
     
     return result
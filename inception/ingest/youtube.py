@@ -7,6 +7,7 @@ using yt-dlp.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 import subprocess
@@ -14,7 +15,7 @@ import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 from urllib.parse import parse_qs, urlparse
 
 from inception.config import get_config
@@ -352,6 +353,16 @@ def _extract_lang_from_subtitle_file(path: Path) -> str | None:
     return None
 
 
+def _flat_playlist_entry(info: dict[str, Any]) -> dict[str, Any]:
+    """Convert a yt-dlp --flat-playlist record to a video info dict."""
+    return {
+        "id": info.get("id"),
+        "title": info.get("title"),
+        "url": f"https://www.youtube.com/watch?v={info.get('id')}",
+        "duration": info.get("duration"),
+    }
+
+
 def list_channel_videos(
     channel_url: str,
     since: datetime | None = None,
@@ -399,12 +410,7 @@ def list_channel_videos(
             if line:
                 try:
                     info = json.loads(line)
-                    videos.append({
-                        "id": info.get("id"),
-                        "title": info.get("title"),
-                        "url": f"https://www.youtube.com/watch?v={info.get('id')}",
-                        "duration": info.get("duration"),
-                    })
+                    videos.append(_flat_playlist_entry(info))
                 except json.JSONDecodeError:
                     continue
         
@@ -451,12 +457,7 @@ def list_playlist_videos(
             if line:
                 try:
                     info = json.loads(line)
-                    videos.append({
-                        "id": info.get("id"),
-                        "title": info.get("title"),
-                        "url": f"https://www.youtube.com/watch?v={info.get('id')}",
-                        "duration": info.get("duration"),
-                    })
+                    videos.append(_flat_playlist_entry(info))
                 except json.JSONDecodeError:
                     continue
         
@@ -464,3 +465,86 @@ def list_playlist_videos(
     
     except subprocess.CalledProcessError as e:
         raise RuntimeError(f"yt-dlp failed: {e.stderr}") from e
+
+
+async def aiter_feed_videos(
+    feed_url: str,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    max_videos: int | None = None,
+    stop_at: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream videos from a channel or playlist as yt-dlp lists them.
+    
+    Entries are yielded as soon as yt-dlp emits them, so downstream
+    stages can start before the listing finishes. Listing stops (and
+    yt-dlp is terminated) when the video with id `stop_at` is reached,
+    which lets incremental runs skip paging through older uploads.
+    
+    Args:
+        feed_url: YouTube channel or playlist URL
+        since: Only include videos uploaded after this date
+        until: Only include videos uploaded before this date
+        max_videos: Maximum number of videos to list
+        stop_at: Video id at which to stop listing (exclusive)
+    
+    Yields:
+        Video info dicts with id, title, url, duration
+    """
+    config = get_config()
+    
+    if config.pipeline.offline_mode:
+        raise RuntimeError("Cannot list videos in offline mode")
+    
+    cmd = [
+        "yt-dlp",
+        "--flat-playlist",
+        "--dump-json",
+        feed_url,
+    ]
+    
+    if max_videos:
+        cmd.extend(["--playlist-end", str(max_videos)])
+    
+    if since:
+        cmd.extend(["--dateafter", since.strftime("%Y%m%d")])
+    
+    if until:
+        cmd.extend(["--datebefore", until.strftime("%Y%m%d")])
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError("yt-dlp not installed") from e
+    
+    # Read stderr alongside stdout so a chatty yt-dlp never blocks on a full pipe
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    
+    try:
+        async for raw_line in proc.stdout:
+            line = raw_line.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            try:
+                info = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            
+            if stop_at is not None and info.get("id") == stop_at:
+                return
+            yield _flat_playlist_entry(info)
+        
+        stderr = await stderr_task
+        if await proc.wait() != 0:
+            raise RuntimeError(f"yt-dlp failed: {stderr.decode('utf-8', errors='replace')}")
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        if not stderr_task.done():
+            stderr_task.cancel()
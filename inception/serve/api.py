@@ -58,6 +58,7 @@ class LMDBStorage:
             )
             self._initialized = True
             logger.info(f"LMDB initialized at {self.db_path}")
+            self._backfill_validity()
         except ImportError:
             logger.warning("lmdb not installed, using mock storage")
             self._initialized = True
@@ -126,32 +127,116 @@ class LMDBStorage:
     
     def get_entities_at_time(self, timestamp: datetime, type_filter: str = None, limit: int = 50) -> list:
         """Get entities valid at a specific point in time (Step 278)."""
+        return self.get_entities_in_range(timestamp, timestamp, type_filter=type_filter, limit=limit)
+    
+    def get_entities_in_range(self, start: datetime, end: datetime, type_filter: str = None, limit: int = 50) -> list:
+        """Get entities valid at any time between start and end, in id order."""
         self._ensure_init()
         
-        all_entities = self.get_entities(type_filter=type_filter, limit=limit * 2)
-        result = []
+        if not self._env:
+            return self._filter_valid_in(self._get_sample_entities(), start, end, type_filter, limit)
         
-        for entity in all_entities:
-            valid_from = entity.get('valid_from')
-            valid_until = entity.get('valid_until')
+        try:
+            from inception.db.intervals import VALIDITY_DB, query_validity, to_epoch_ms
             
-            # Parse timestamps if strings
-            if isinstance(valid_from, str):
-                valid_from = datetime.fromisoformat(valid_from.replace('Z', '+00:00'))
-            if isinstance(valid_until, str):
-                valid_until = datetime.fromisoformat(valid_until.replace('Z', '+00:00'))
+            result = []
+            with self._env.begin() as txn:
+                entities_db = self._env.open_db(b'entities', txn=txn)
+                validity_db = self._env.open_db(VALIDITY_DB, txn=txn)
+                entity_ids = sorted(
+                    query_validity(txn, validity_db, to_epoch_ms(start), to_epoch_ms(end))
+                )
+                
+                for entity_id in entity_ids:
+                    value = txn.get(entity_id, db=entities_db)
+                    if value is None:
+                        continue
+                    entity = json.loads(value.decode())
+                    if type_filter and entity.get('type') != type_filter:
+                        continue
+                    result.append(entity)
+                    if len(result) >= limit:
+                        break
+            return result
+        except Exception as e:
+            logger.error(f"Error reading entities by validity: {e}")
+            return self._filter_valid_in(self._get_sample_entities(), start, end, type_filter, limit)
+    
+    def _backfill_validity(self):
+        """
+        Bring the validity database in line with the entities at startup.
+        
+        Writers record each entity's range with `put_validity` (the CLI
+        and seed script do), so queries read it in place. Databases
+        written before it existed, or by other writers, are indexed
+        here: entities missing a range are added and deleted ones
+        dropped. Requests never write.
+        """
+        import lmdb
+        
+        from inception.db.intervals import (
+            VALIDITY_DB,
+            delete_validity,
+            has_validity,
+            put_validity,
+            rebuild_validity_summaries,
+            validity_count,
+            validity_ids,
+        )
+        
+        try:
+            with self._env.begin(write=True) as txn:
+                try:
+                    entities_db = self._env.open_db(b'entities', txn=txn, create=False)
+                except lmdb.NotFoundError:
+                    return  # Nothing stored yet
+                validity_db = self._env.open_db(VALIDITY_DB, txn=txn, create=True)
+                
+                count = validity_count(txn, validity_db)
+                if count is None:
+                    count = rebuild_validity_summaries(txn, validity_db)
+                if count == txn.stat(entities_db)['entries']:
+                    return
+                
+                for key, value in txn.cursor(entities_db):
+                    if not has_validity(txn, validity_db, key):
+                        try:
+                            entity = json.loads(value.decode())
+                        except ValueError:
+                            logger.warning(f"Skipping unreadable entity {key!r}")
+                            continue
+                        put_validity(
+                            txn, validity_db, key,
+                            entity.get('valid_from'), entity.get('valid_until'),
+                        )
+                
+                for key in list(validity_ids(txn, validity_db)):
+                    if txn.get(key, db=entities_db) is None:
+                        delete_validity(txn, validity_db, key)
+        except Exception as e:
+            logger.warning(f"Validity index not updated: {e}")
+    
+    def _filter_valid_in(self, entities: list, start: datetime, end: datetime, type_filter: str, limit: int) -> list:
+        """Filter entities by validity with a linear scan."""
+        from inception.db.intervals import to_epoch_ms, validity_bound
+        
+        lo, hi = to_epoch_ms(start), to_epoch_ms(end)
+        result = []
+        for entity in entities:
+            if type_filter and entity.get('type') != type_filter:
+                continue
             
-            # Check validity: None means unbounded
-            is_valid = True
-            if valid_from and timestamp < valid_from:
-                is_valid = False
-            if valid_until and timestamp > valid_until:
-                is_valid = False
+            # None means unbounded
+            valid_from = validity_bound(entity.get('valid_from'), entity.get('id'))
+            valid_until = validity_bound(entity.get('valid_until'), entity.get('id'))
+            if valid_from is not None and hi < valid_from:
+                continue
+            if valid_until is not None and lo > valid_until:
+                continue
             
-            if is_valid:
-                result.append(entity)
-                if len(result) >= limit:
-                    break
+            result.append(entity)
+            if len(result) >= limit:
+                break
         
         return result
     
@@ -727,12 +812,16 @@ async def get_timeline(entity_id: Optional[str] = None, limit: int = Query(defau
 @app.get("/api/entities/temporal")
 async def get_entities_temporal(
     at: Optional[str] = None,  # ISO timestamp
+    until: Optional[str] = None,  # ISO timestamp; with `at`, a range
     type: Optional[str] = None,
     limit: int = Query(default=50, le=200),
 ):
-    """Get entities valid at a specific time (Step 278)."""
+    """Get entities valid at a specific time, or during [at, until] (Step 278)."""
     if at:
         timestamp = datetime.fromisoformat(at.replace('Z', '+00:00'))
+        if until:
+            end = datetime.fromisoformat(until.replace('Z', '+00:00'))
+            return storage.get_entities_in_range(timestamp, end, type_filter=type, limit=limit)
         return storage.get_entities_at_time(timestamp, type_filter=type, limit=limit)
     return storage.get_entities(type_filter=type, limit=limit)
 
@@ -1063,17 +1152,22 @@ async def ingest_source(request: IngestRequest):
         # Try LLM extraction
         try:
             log("extract", "Initializing LLM extraction pipeline...")
-            from inception.enhance.llm import LLMExtractor, get_provider
+            from inception.config import get_config
+            from inception.enhance.llm import LLMExtractor, get_llm_cache
             
-            # Try to get a provider
+            # Try to get a provider (auto-selected, so it can fail over)
             try:
-                provider = get_provider("auto")
-                extractor = LLMExtractor(provider=provider)
+                extractor = LLMExtractor(
+                    cache=get_llm_cache() if get_config().pipeline.cache_enabled else None,
+                )
+                provider = extractor.provider
                 log("extract", f"Using LLM provider: {provider.__class__.__name__}")
                 
                 # Extract
                 log("extract", "Analyzing content structure...")
-                result = extractor.extract_all(content_text[:8000])  # Limit to avoid token limits
+                result = await extractor.aextract_all(content_text)
+                for error in result.errors:
+                    log("extract", f"Chunk extraction failed: {error}")
                 
                 # Convert to dicts
                 for e in result.entities:
@@ -1168,8 +1262,10 @@ async def ingest_source_stream(uri: str = Query(..., description="Source URI to
     Usage: EventSource('/api/ingest/stream?uri=https://youtube.com/watch?v=xxx')
     
     Each event contains:
-    - event: log | result | error
+    - event: log | entity | claim | gap | result | error
     - data: JSON payload
+    
+    Entities, claims and gaps are sent as the LLM produces them.
     """
     async def event_generator():
         try:
@@ -1252,13 +1348,17 @@ async def ingest_source_stream(uri: str = Query(..., description="Source URI to
             
             if content_text:
                 try:
-                    from inception.enhance.llm import LLMExtractor, get_provider
+                    from inception.config import get_config
+                    from inception.enhance.llm import LLMExtractor, get_llm_cache
                     
                     async for chunk in emit("log", {"phase": "extract", "message": "Initializing LLM..."}):
                         yield chunk
                     
-                    provider = get_provider("auto")
-                    extractor = LLMExtractor(provider=provider)
+                    # Auto-selected, so extraction can fail over between providers
+                    extractor = LLMExtractor(
+                        cache=get_llm_cache() if get_config().pipeline.cache_enabled else None,
+                    )
+                    provider = extractor.provider
                     
                     async for chunk in emit("log", {"phase": "extract", "message": f"Provider: {provider.__class__.__name__}"}):
                         yield chunk
@@ -1266,22 +1366,37 @@ async def ingest_source_stream(uri: str = Query(..., description="Source URI to
                     async for chunk in emit("log", {"phase": "extract", "message": "Analyzing content..."}):
                         yield chunk
                     
-                    result = await asyncio.to_thread(extractor.extract_all, content_text[:8000])
-                    
-                    for e in result.entities:
-                        entities.append({"name": e.name, "type": e.entity_type})
-                        async for chunk in emit("log", {"phase": "extract", "message": f"Entity: {e.name} ({e.entity_type})"}):
-                            yield chunk
-                    
-                    for c in result.claims:
-                        claims.append({"text": c.text[:80]})
-                        async for chunk in emit("log", {"phase": "extract", "message": f"Claim: {c.text[:60]}..."}):
-                            yield chunk
+                    from inception.enhance.llm.extractor import (
+                        ExtractedClaim,
+                        ExtractedEntity,
+                        ExtractedGap,
+                    )
                     
-                    for g in result.gaps:
-                        gaps.append({"description": g.description})
-                        async for chunk in emit("log", {"phase": "extract", "message": f"Gap: {g.description[:60]}..."}):
-                            yield chunk
+                    # Push each item to the client as soon as the model writes it
+                    async for item in extractor.astream_all(content_text):
+                        if isinstance(item, ExtractedEntity):
+                            entity = {"name": item.name, "type": item.entity_type}
+                            entities.append(entity)
+                            async for chunk in emit("entity", entity):
+                                yield chunk
+                            async for chunk in emit("log", {"phase": "extract", "message": f"Entity: {item.name} ({item.entity_type})"}):
+                                yield chunk
+                        
+                        elif isinstance(item, ExtractedClaim):
+                            claim = {"text": item.text[:80]}
+                            claims.append(claim)
+                            async for chunk in emit("claim", claim):
+                                yield chunk
+                            async for chunk in emit("log", {"phase": "extract", "message": f"Claim: {item.text[:60]}..."}):
+                                yield chunk
+                        
+                        elif isinstance(item, ExtractedGap):
+                            gap = {"description": item.description}
+                            gaps.append(gap)
+                            async for chunk in emit("gap", gap):
+                                yield chunk
+                            async for chunk in emit("log", {"phase": "extract", "message": f"Gap: {item.description[:60]}..."}):
+                                yield chunk
                             
                 except Exception as e:
                     async for chunk in emit("log", {"phase": "extract", "message": f"LLM failed: {e}"}):
@@ -352,11 +352,14 @@ def seed_database():
     """Seed LMDB with knowledge graph data."""
     print("🌱 Seeding Inception knowledge database...")
     
+    from inception.db.intervals import VALIDITY_DB, put_validity
+    
     env = get_lmdb_env()
     
     with env.begin(write=True) as txn:
         # Create databases
         entities_db = env.open_db(b'entities', txn=txn, create=True)
+        validity_db = env.open_db(VALIDITY_DB, txn=txn, create=True)
         claims_db = env.open_db(b'claims', txn=txn, create=True)
         procedures_db = env.open_db(b'procedures', txn=txn, create=True)
         gaps_db = env.open_db(b'gaps', txn=txn, create=True)
@@ -369,6 +372,10 @@ def seed_database():
                 json.dumps(entity).encode(),
                 db=entities_db
             )
+            put_validity(
+                txn, validity_db, entity['id'].encode(),
+                entity.get('valid_from'), entity.get('valid_until'),
+            )
         print(f"  ✓ {len(ENTITIES)} entities")
         
         # Seed claims
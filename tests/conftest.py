@@ -28,3 +28,105 @@ def reset_singletons():
     """Reset any singleton state between tests."""
     yield
     # Cleanup after test
+    from inception.enhance.llm.registry import close_provider_registry
+    close_provider_registry()
+
+
+class KnowledgeBaseStandIn:
+    """
+    Local stand-in for the Wikidata search API and DBpedia Lookup.
+    
+    Names starting with "nil" have no matches, names starting with "fail"
+    get a 500, and the first `rate_limited` requests get a 429.
+    """
+    
+    def __init__(self):
+        import http.server
+        import json
+        import threading
+        import zlib
+        from collections import Counter
+        from urllib.parse import parse_qs, urlparse
+        
+        self.requests = Counter()
+        self.rate_limited = 0
+        stand_in = self
+        lock = threading.Lock()
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, as the real endpoints
+            disable_nagle_algorithm = True
+            
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {k: v[0] for k, v in parse_qs(url.query).items()}
+                query = params.get("search") or params.get("query", "")
+                
+                with lock:
+                    stand_in.requests[url.path] += 1
+                    limited = stand_in.rate_limited > 0
+                    stand_in.rate_limited -= limited
+                
+                if limited:
+                    self._send(429, {}, {"Retry-After": "0"})
+                elif query.lower().startswith("fail"):
+                    self._send(500, {})
+                elif query.lower().startswith("nil"):
+                    self._send(200, {"search": [], "docs": []})
+                elif url.path == "/w/api.php":
+                    self._send(200, {"search": [{
+                        "id": f"Q{zlib.crc32(query.lower().encode())}",
+                        "label": query,
+                        "description": "test entity",
+                    }]})
+                else:
+                    resource = query.replace(" ", "_")
+                    self._send(200, {"docs": [{
+                        "resource": [f"http://dbpedia.org/resource/{resource}"],
+                        "label": [query],
+                        "comment": ["test entity"],
+                    }]})
+            
+            def _send(self, status, body, headers=None):
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        class Server(http.server.ThreadingHTTPServer):
+            request_queue_size = 128
+        
+        self.server = Server(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+    
+    def linker(self, cache=False, requests_per_second=1000.0, max_concurrency=16):
+        """An OntologyLinker whose clients talk to this server."""
+        from inception.enhance.synthesis.ontology import DBpediaClient, OntologyLinker, WikidataClient
+        
+        wikidata = WikidataClient(requests_per_second=requests_per_second)
+        wikidata.API_URL = f"{self.url}/w/api.php"
+        dbpedia = DBpediaClient(requests_per_second=requests_per_second)
+        dbpedia.LOOKUP_URL = f"{self.url}/api/search"
+        return OntologyLinker(wikidata, dbpedia, cache=cache, max_concurrency=max_concurrency)
+    
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def kb_server():
+    """Local stand-in for Wikidata and DBpedia search endpoints."""
+    server = KnowledgeBaseStandIn()
+    yield server
+    server.close()
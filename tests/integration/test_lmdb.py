@@ -182,6 +182,21 @@ class TestInceptionDB:
         support_edges = temp_db.get_edges_from(from_nid, EdgeType.SUPPORTS)
         assert len(support_edges) == 1
     
+    def test_put_edges_batch(self, temp_db: InceptionDB):
+        """Test writing many edges in one call."""
+        from_nid = temp_db.allocate_nid()
+        to_nids = [temp_db.allocate_nid() for _ in range(5)]
+        
+        written = temp_db.put_edges(
+            (from_nid, EdgeType.MENTIONS, to_nid, EdgeRecord(edge_type=EdgeType.MENTIONS, weight=0.8))
+            for to_nid in reversed(to_nids)
+        )
+        
+        assert written == 5
+        edges = temp_db.get_edges_from(from_nid, EdgeType.MENTIONS)
+        assert sorted(to for _, to, _ in edges) == to_nids
+        assert temp_db.put_edges([]) == 0
+    
     def test_graphtag_mapping(self, temp_db: InceptionDB):
         """Test graphtag to NID mapping."""
         nid = temp_db.allocate_nid()
@@ -235,6 +250,64 @@ class TestInceptionDB:
         assert retrieved is not None
 
 
+class TestGraphBuilderMentions:
+    """Tests for claim-to-entity MENTIONS edges."""
+    
+    def _build(self, temp_db: InceptionDB, entities: list, claim_texts: list[str]):
+        from inception.analyze.claims import Claim, ClaimExtractionResult
+        from inception.analyze.entities import EntityExtractionResult
+        from inception.graph.builder import GraphBuilder
+        
+        claims = [Claim(text=t, subject="", predicate="", sentence_idx=i)
+                  for i, t in enumerate(claim_texts)]
+        result = GraphBuilder(temp_db).build_from_extraction(
+            temp_db.allocate_nid(), [],
+            entities=EntityExtractionResult(entities=entities),
+            claims=ClaimExtractionResult(claims=claims),
+        )
+        
+        mentioned = {}
+        for node_nid in result.node_nids:
+            node = temp_db.get_node(node_nid)
+            if node.kind == NodeKind.CLAIM:
+                names = set()
+                for _, to_nid, _ in temp_db.get_edges_from(node_nid, EdgeType.MENTIONS):
+                    names.add(temp_db.get_node(to_nid).payload["name"])
+                mentioned[node.payload["text"]] = names
+        return mentioned
+    
+    def test_mentions_use_word_boundaries(self, temp_db: InceptionDB):
+        """Test entities are linked on whole-word, case-insensitive matches."""
+        from inception.analyze.entities import Entity
+        
+        entities = [
+            Entity(text="Python", entity_type="LANGUAGE", normalized="python"),
+            Entity(text="New York", entity_type="GPE", normalized="new york"),
+            Entity(text="York", entity_type="GPE", normalized="york"),
+        ]
+        mentioned = self._build(temp_db, entities, [
+            "Python is popular in New York.",
+            "Pythonic code is idiomatic.",
+        ])
+        
+        assert mentioned["Python is popular in New York."] == {"Python", "New York", "York"}
+        assert mentioned["Pythonic code is idiomatic."] == set()
+    
+    def test_coreferent_aliases_link_representative(self, temp_db: InceptionDB):
+        """Test a mention of an alias links the cluster's representative node."""
+        from inception.analyze.entities import Entity
+        
+        entities = [
+            Entity(text="International Business Machines", entity_type="ORG",
+                   normalized="international business machines", coreferent_cluster=1),
+            Entity(text="IBM", entity_type="ORG", normalized="ibm",
+                   coreferent_cluster=1, is_representative=False),
+        ]
+        mentioned = self._build(temp_db, entities, ["IBM announced a new chip."])
+        
+        assert mentioned["IBM announced a new chip."] == {"International Business Machines"}
+
+
 class TestDatabasePersistence:
     """Tests for database persistence across restarts."""
     
@@ -0,0 +1,74 @@
+"""
+Alignment Benchmarks
+
+Synthetic long-video inputs (10k scenes) for MultimodalAligner and
+AlignmentResult range queries.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("cv2")
+
+from inception.extract.alignment import MultimodalAligner
+from inception.extract.scenes import SceneDetectionResult, SceneInfo
+from inception.extract.transcription import Segment, TranscriptResult
+
+N_SCENES = 10_000
+SEGMENTS_PER_SCENE = 3
+SCENE_MS = 3_000
+
+
+def make_inputs(n_scenes: int = N_SCENES) -> tuple[TranscriptResult, SceneDetectionResult]:
+    """Build fine-grained scenes with segments straddling scene cuts."""
+    scenes = [
+        SceneInfo(scene_num=i, start_ms=i * SCENE_MS, end_ms=(i + 1) * SCENE_MS)
+        for i in range(n_scenes)
+    ]
+    seg_ms = SCENE_MS // SEGMENTS_PER_SCENE
+    offset = seg_ms // 2
+    segments = [
+        Segment(id=i, text=f"segment {i}", start_ms=offset + i * seg_ms,
+                end_ms=offset + (i + 1) * seg_ms)
+        for i in range(n_scenes * SEGMENTS_PER_SCENE)
+    ]
+    transcript = TranscriptResult(audio_path=Path("bench.wav"), segments=segments)
+    detection = SceneDetectionResult(
+        video_path=Path("bench.mp4"),
+        scenes=scenes,
+        duration_ms=n_scenes * SCENE_MS,
+    )
+    return transcript, detection
+
+
+class TestAlignmentPerformance:
+    """Benchmarks for indexed alignment."""
+    
+    def test_align_10k_scenes(self):
+        """Align 10k scenes x 30k segments."""
+        transcript, scenes = make_inputs()
+        
+        start = time.perf_counter()
+        result = MultimodalAligner().align(transcript, scenes)
+        elapsed = time.perf_counter() - start
+        
+        print(f"align {N_SCENES} scenes: {elapsed * 1000:.1f} ms")
+        assert result.span_count == N_SCENES
+        assert all(span.transcript_segments for span in result.spans)
+        assert elapsed < 5.0
+    
+    def test_range_queries_10k_spans(self):
+        """Run 10k point and range queries against 10k spans."""
+        transcript, scenes = make_inputs()
+        result = MultimodalAligner().align(transcript, scenes)
+        
+        start = time.perf_counter()
+        for t in range(0, N_SCENES * SCENE_MS, SCENE_MS):
+            assert result.get_spans_at_time(t + 1)
+            assert result.get_spans_in_range(t, t + SCENE_MS * 2)
+        elapsed = time.perf_counter() - start
+        
+        print(f"{2 * N_SCENES} range queries: {elapsed * 1000:.1f} ms")
+        assert elapsed < 2.0
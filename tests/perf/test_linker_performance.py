@@ -0,0 +1,98 @@
+"""
+Ontology Linker Benchmarks
+
+Linking a 10k-mention corpus against a local stand-in for the Wikidata
+and DBpedia search endpoints, then re-linking it from the link cache;
+and lookups in an offline snapshot of 200k labels.
+"""
+
+import random
+import string
+import time
+
+from inception.enhance.synthesis.ontology import LinkCache, OntologySnapshot, SnapshotEntry
+from inception.enhance.synthesis.ontology.snapshot import write_snapshot
+
+N_MENTIONS = 10_000
+N_NAMES = 1_000
+N_LABELS = 200_000
+
+
+class TestOntologyLinkerPerformance:
+    """Benchmarks for OntologyLinker.link_entities."""
+    
+    def test_link_10k_mentions(self, kb_server, tmp_path):
+        """Distinct names are looked up concurrently once; a re-run is free."""
+        entities = [
+            (i, f"Entity {i % N_NAMES}" if i % 10 else f"nil {i % N_NAMES}", "concept")
+            for i in range(N_MENTIONS)
+        ]
+        
+        with LinkCache(tmp_path / "links") as cache:
+            start = time.perf_counter()
+            first = kb_server.linker(cache=cache).link_entities(entities)
+            cold = time.perf_counter() - start
+        
+        requests = sum(kb_server.requests.values())
+        
+        with LinkCache(tmp_path / "links") as cache:
+            start = time.perf_counter()
+            second = kb_server.linker(cache=cache).link_entities(entities)
+            warm = time.perf_counter() - start
+        
+        print(
+            f"\nlink_entities({N_MENTIONS} mentions): cold {cold * 1000:.1f}ms "
+            f"({requests} requests), cached {warm * 1000:.1f}ms"
+        )
+        assert requests == 2 * N_NAMES  # One search per distinct name and endpoint
+        assert sum(kb_server.requests.values()) == requests
+        assert second.linked_count == first.linked_count == N_MENTIONS * 9 // 10
+        assert warm < cold
+        assert warm < 5
+    
+    def test_snapshot_200k_labels(self, tmp_path):
+        """Exact lookups over 200k labels take microseconds, fuzzy ones tens of milliseconds."""
+        rng = random.Random(0)
+        names = [
+            " ".join(
+                "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+                for _ in range(rng.randint(1, 3))
+            )
+            for _ in range(N_LABELS)
+        ]
+        
+        start = time.perf_counter()
+        write_snapshot(tmp_path / "kb.idx", (
+            ([name], SnapshotEntry("wikidata", f"Q{i}", name)) for i, name in enumerate(names)
+        ))
+        build = time.perf_counter() - start
+        
+        queries = rng.sample(names, 1_000)
+        typos = [q[:1] + q[2:] if len(q) > 3 else q for q in queries[:100]]
+        
+        with OntologySnapshot(tmp_path / "kb.idx") as snapshot:
+            start = time.perf_counter()
+            for query in queries:
+                assert snapshot.lookup(query)
+            exact = (time.perf_counter() - start) / len(queries)
+            
+            start = time.perf_counter()
+            for typo, query in zip(typos, queries):
+                assert query in {e.matched for e in snapshot.fuzzy(typo, max_distance=1, limit=50)}
+            fuzzy = (time.perf_counter() - start) / len(typos)
+            
+            # As the linker searches: first letter fixed
+            start = time.perf_counter()
+            for typo, query in zip(typos, queries):
+                found = snapshot.fuzzy(typo, max_distance=1, limit=50, prefix_length=1)
+                assert query in {e.matched for e in found}
+            anchored = (time.perf_counter() - start) / len(typos)
+        
+        print(
+            f"\nsnapshot({len(snapshot)} labels): build {build * 1000:.1f}ms, "
+            f"lookup {exact * 1e6:.1f}us, fuzzy(d=1) {fuzzy * 1000:.2f}ms, "
+            f"first letter fixed {anchored * 1000:.2f}ms"
+        )
+        assert exact < 0.001
+        assert fuzzy < 0.25
+        assert anchored < fuzzy
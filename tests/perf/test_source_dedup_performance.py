@@ -0,0 +1,56 @@
+"""
+Source Dedup Benchmarks
+
+Batch graphtag dedup for a 10k-entry batch file against a populated
+source index.
+"""
+
+import time
+
+import pytest
+
+from inception.config import Config
+from inception.db import InceptionDB
+from inception.ingest.source_manager import SourceManager
+
+N_URIS = 10_000
+
+
+@pytest.fixture
+def manager(tmp_path):
+    config = Config()
+    config.lmdb.path = tmp_path / "db"
+    db = InceptionDB(config=config)
+    yield SourceManager(db)
+    db.close()
+
+
+class TestSourceDedupPerformance:
+    """Benchmarks for SourceManager.filter_new_uris."""
+    
+    def test_filter_10k_uris(self, manager):
+        """Dedup of 10k URIs (half already ingested) should take milliseconds."""
+        uris = [f"https://example.com/articles/{i}" for i in range(N_URIS)]
+        manager.create_sources(uris[::2])
+        
+        start = time.perf_counter()
+        new_uris = manager.filter_new_uris(uris)
+        elapsed = time.perf_counter() - start
+        
+        print(f"\nfilter_new_uris({N_URIS}): {elapsed * 1000:.1f}ms")
+        
+        assert new_uris == uris[1::2]
+        assert elapsed < 0.5
+    
+    def test_create_10k_sources(self, manager):
+        """Creating sources for a 10k batch should use a single write txn."""
+        uris = [f"https://example.com/articles/{i}" for i in range(N_URIS)]
+        
+        start = time.perf_counter()
+        manager.filter_new_uris(uris, create=True)
+        elapsed = time.perf_counter() - start
+        
+        print(f"\nfilter_new_uris({N_URIS}, create=True): {elapsed * 1000:.1f}ms")
+        
+        assert manager.filter_new_uris(uris) == []
+        assert elapsed < 2.0
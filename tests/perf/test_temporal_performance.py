@@ -0,0 +1,91 @@
+"""
+Temporal Network Benchmarks
+
+Path-consistency propagation over networks of thousands of events, and
+ordering whole-source timelines of tens of thousands.
+"""
+
+import random
+import time
+
+from inception.enhance.synthesis.temporal.network import TemporalConstraint, TemporalNetwork
+from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner
+from inception.enhance.synthesis.temporal.relations import AllenRelation, relation_from_timestamps
+
+N_TIMELINES = 200
+TIMELINE_LENGTH = 10
+GROUP = 5  # Timelines cross-linked with each other
+
+
+class TestTemporalNetworkPerformance:
+    """Benchmarks for TemporalNetwork.propagate."""
+    
+    def test_propagate_2k_events(self):
+        """Groups of cross-linked timelines of 2k events should converge in seconds."""
+        rng = random.Random(0)
+        n_events = N_TIMELINES * TIMELINE_LENGTH
+        network = TemporalNetwork()
+        
+        # Event i of a timeline spans [10i + offset, 10i + offset + length]
+        spans = {}
+        for t in range(N_TIMELINES):
+            offset = rng.randrange(10)
+            for i in range(TIMELINE_LENGTH):
+                start = 10 * i + offset
+                spans[t * TIMELINE_LENGTH + i] = (start, start + rng.randrange(1, 10))
+        
+        for t in range(N_TIMELINES):
+            for i in range(TIMELINE_LENGTH - 1):
+                event = t * TIMELINE_LENGTH + i
+                network.add_constraint(
+                    TemporalConstraint(event, event + 1, AllenRelation.BEFORE), propagate=False
+                )
+        
+        group_size = GROUP * TIMELINE_LENGTH
+        for g in range(0, n_events, group_size):
+            for _ in range(4 * GROUP):
+                a, b = g + rng.randrange(group_size), g + rng.randrange(group_size)
+                if a // TIMELINE_LENGTH != b // TIMELINE_LENGTH:
+                    relation = relation_from_timestamps(*spans[a], *spans[b])
+                    network.add_constraint(TemporalConstraint(a, b, relation), propagate=False)
+        
+        start = time.perf_counter()
+        inferred = network.propagate()
+        elapsed = time.perf_counter() - start
+        
+        print(f"\npropagate({n_events} events): {elapsed * 1000:.1f}ms, {len(inferred)} inferred")
+        
+        chain_pairs = N_TIMELINES * (TIMELINE_LENGTH - 1) * (TIMELINE_LENGTH - 2) // 2
+        assert len(inferred) >= chain_pairs
+        assert network.is_consistent
+        assert network.get_constraint(0, TIMELINE_LENGTH - 1).relation == AllenRelation.BEFORE
+        assert elapsed < 60
+    
+    def test_order_50k_events(self):
+        """Topological ordering of a 50k-event timeline should be linear time."""
+        rng = random.Random(0)
+        n_events = 50_000
+        reasoner = TemporalReasoner()
+        
+        # A shuffled chain plus forward shortcuts
+        timeline = list(range(n_events))
+        rng.shuffle(timeline)
+        edges = [(timeline[i], timeline[i + 1]) for i in range(n_events - 1)]
+        for _ in range(n_events):
+            i = rng.randrange(n_events - 1)
+            j = rng.randrange(i + 1, min(i + 50, n_events))
+            edges.append((timeline[i], timeline[j]))
+        for a, b in edges:
+            reasoner.network.add_constraint(
+                TemporalConstraint(a, b, AllenRelation.BEFORE), propagate=False
+            )
+        
+        start = time.perf_counter()
+        ordering = reasoner.partial_order(list(range(n_events)))
+        elapsed = time.perf_counter() - start
+        
+        print(f"\npartial_order({n_events} events, {len(edges)} edges): {elapsed * 1000:.1f}ms")
+        assert ordering.order == timeline
+        assert ordering.is_total
+        assert elapsed < 30
+
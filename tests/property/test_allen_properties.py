@@ -0,0 +1,138 @@
+"""
+Property-based tests for Allen's interval algebra.
+"""
+
+from functools import reduce
+
+from hypothesis import given, strategies as st, settings
+
+from inception.enhance.synthesis.temporal.network import TemporalConstraint, TemporalNetwork
+from inception.enhance.synthesis.temporal.relations import (
+    ALL_RELATIONS_MASK,
+    COMPOSITION_MASKS,
+    AllenRelation,
+    allen_compose,
+    allen_inverse,
+    compose_masks,
+    inverse_mask,
+    mask_to_relations,
+    relation_mask,
+)
+
+# Endpoints drawn from a small range, so equal endpoints are common
+intervals = st.tuples(
+    st.integers(min_value=0, max_value=12),
+    st.integers(min_value=1, max_value=6),
+).map(lambda t: (t[0], t[0] + t[1]))
+
+masks = st.integers(min_value=0, max_value=ALL_RELATIONS_MASK)
+relations = st.sampled_from(list(AllenRelation))
+
+
+def allen(x: tuple[int, int], y: tuple[int, int]) -> AllenRelation:
+    """Allen relation from endpoint comparisons, as defined by Allen (1983)."""
+    (xs, xe), (ys, ye) = x, y
+    if xe < ys:
+        return AllenRelation.BEFORE
+    if ye < xs:
+        return AllenRelation.AFTER
+    if xe == ys:
+        return AllenRelation.MEETS
+    if ye == xs:
+        return AllenRelation.MET_BY
+    if xs == ys and xe == ye:
+        return AllenRelation.EQUALS
+    if xs == ys:
+        return AllenRelation.STARTS if xe < ye else AllenRelation.STARTED_BY
+    if xe == ye:
+        return AllenRelation.FINISHES if xs > ys else AllenRelation.FINISHED_BY
+    if ys < xs and xe < ye:
+        return AllenRelation.DURING
+    if xs < ys and ye < xe:
+        return AllenRelation.CONTAINS
+    return AllenRelation.OVERLAPS if xs < ys else AllenRelation.OVERLAPPED_BY
+
+
+class TestCompositionTableProperties:
+    """Property-based tests for the composition table."""
+    
+    @given(intervals, intervals, intervals)
+    @settings(max_examples=500)
+    def test_composition_sound(self, a, b, c):
+        """The relation of A to C is in the composition via any B."""
+        assert allen(a, c) in allen_compose(allen(a, b), allen(b, c))
+    
+    def test_composition_complete(self):
+        """Every relation in every entry is realized by some intervals."""
+        points = range(6)
+        spans = [(s, e) for s in points for e in points if s < e]
+        
+        seen = [0] * 169
+        for a in spans:
+            for b in spans:
+                for c in spans:
+                    i = allen(a, b).value - 1
+                    j = allen(b, c).value - 1
+                    seen[13 * i + j] |= relation_mask(allen(a, c))
+        
+        assert list(COMPOSITION_MASKS) == seen
+        assert sum(bin(mask).count("1") for mask in COMPOSITION_MASKS) == 409
+    
+    @given(relations, relations)
+    def test_composition_converse(self, r1, r2):
+        """The converse of r1;r2 is converse(r2);converse(r1)."""
+        composed = allen_compose(allen_inverse(r2), allen_inverse(r1))
+        assert {allen_inverse(r) for r in allen_compose(r1, r2)} == composed
+    
+    @given(relations)
+    def test_equals_identity(self, r):
+        """EQUALS is the identity of composition."""
+        assert allen_compose(AllenRelation.EQUALS, r) == {r}
+        assert allen_compose(r, AllenRelation.EQUALS) == {r}
+    
+    @given(masks, masks, masks)
+    @settings(max_examples=200)
+    def test_mask_composition_associative(self, m1, m2, m3):
+        """Composition of relation sets is associative."""
+        assert compose_masks(compose_masks(m1, m2), m3) == compose_masks(m1, compose_masks(m2, m3))
+    
+    @given(masks, masks)
+    @settings(max_examples=200)
+    def test_mask_composition_distributes(self, m1, m2):
+        """Composing masks is the union of composing their relations."""
+        expected = reduce(
+            set.union,
+            (allen_compose(r1, r2) for r1 in mask_to_relations(m1) for r2 in mask_to_relations(m2)),
+            set(),
+        )
+        assert mask_to_relations(compose_masks(m1, m2)) == expected
+    
+    @given(masks)
+    def test_inverse_mask_involution(self, mask):
+        """Inverting a mask twice gives it back."""
+        assert inverse_mask(inverse_mask(mask)) == mask
+
+
+class TestNetworkProperties:
+    """Property-based tests for propagation over real intervals."""
+    
+    @given(
+        st.lists(intervals, min_size=3, max_size=8),
+        st.lists(st.tuples(st.integers(0, 7), st.integers(0, 7)), min_size=1, max_size=20),
+    )
+    @settings(max_examples=100, deadline=None)
+    def test_propagation_sound(self, spans, pairs):
+        """Constraints taken from real intervals stay consistent and keep the true relations."""
+        network = TemporalNetwork()
+        for i, j in pairs:
+            i, j = i % len(spans), j % len(spans)
+            if i != j:
+                network.add_constraint(
+                    TemporalConstraint(i, j, allen(spans[i], spans[j])), propagate=False
+                )
+        
+        network.propagate()
+        
+        assert network.is_consistent
+        for (i, j), possible in network.transitive_closure().items():
+            assert allen(spans[i], spans[j]) in possible
@@ -0,0 +1,74 @@
+"""
+Property-based tests for the offline ontology snapshot index.
+"""
+
+import tempfile
+from pathlib import Path
+
+from hypothesis import given, strategies as st, settings
+
+from inception.enhance.synthesis.ontology.snapshot import (
+    OntologySnapshot,
+    SnapshotEntry,
+    write_snapshot,
+)
+
+# A small alphabet (with a non-ASCII letter), so near matches are common
+labels = st.text(alphabet="abcé ", min_size=1, max_size=6)
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance by the textbook full-matrix recurrence."""
+    row = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        previous, row[0] = row[0], i
+        for j, cb in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (ca != cb))
+    return row[-1]
+
+
+def build(names: list[str]) -> tuple[OntologySnapshot, list[str], tempfile.TemporaryDirectory]:
+    tmp = tempfile.TemporaryDirectory()
+    path = Path(tmp.name) / "kb.idx"
+    write_snapshot(path, (
+        ([name], SnapshotEntry("wikidata", f"Q{i}", name)) for i, name in enumerate(names)
+    ))
+    keys = sorted({" ".join(name.split()) for name in names} - {""})
+    return OntologySnapshot(path), keys, tmp
+
+
+@given(
+    st.lists(labels, min_size=1, max_size=40),
+    labels,
+    st.integers(min_value=0, max_value=2),
+    st.integers(min_value=0, max_value=2),
+)
+@settings(max_examples=200, deadline=None)
+def test_fuzzy_matches_brute_force(names, query, max_distance, prefix_length):
+    """Fuzzy lookup returns exactly the labels within the distance."""
+    snapshot, keys, tmp = build(names)
+    with tmp, snapshot:
+        query = " ".join(query.split())
+        expected = sorted(
+            (levenshtein(query, key), key)
+            for key in keys if key.startswith(query[:prefix_length])
+        )
+        expected = [(d, key) for d, key in expected if d <= max_distance]
+        
+        found = snapshot.fuzzy(
+            query, max_distance=max_distance, limit=len(keys), prefix_length=prefix_length,
+        )
+        assert sorted({(e.distance, e.matched) for e in found}) == expected
+
+
+@given(st.lists(labels, min_size=1, max_size=40), st.text(alphabet="abcé", max_size=3))
+@settings(max_examples=200, deadline=None)
+def test_prefix_and_exact_match_brute_force(names, prefix):
+    """Prefix lookup returns the keys with the prefix, and exact lookup each key."""
+    snapshot, keys, tmp = build(names)
+    with tmp, snapshot:
+        found = snapshot.prefix(prefix, limit=len(keys))
+        assert sorted({e.matched for e in found}) == [key for key in keys if key.startswith(prefix)]
+        
+        for key in keys:
+            assert {e.matched for e in snapshot.lookup(key.upper())} == {key}
@@ -215,6 +215,57 @@ class TestLMDBStorage:
         entities = mock_storage.get_entities(search="OAuth")
         # Sample data includes OAuth
         assert any("OAuth" in e.get("name", "") for e in entities)
+    
+    def test_entities_at_time(self, mock_storage):
+        """Should find every entity valid at a time, however many are not."""
+        import json
+        from inception.db.intervals import VALIDITY_DB, put_validity
+        from inception.serve.api import LMDBStorage
+        
+        mock_storage._ensure_init()
+        env = mock_storage._env
+        with env.begin(write=True) as txn:
+            entities_db = env.open_db(b'entities', txn=txn)
+            for i in range(300):
+                entity = {
+                    "id": f"e{i:03d}",
+                    "type": "concept" if i % 2 else "person",
+                    "valid_from": f"{1700 + i}-01-01T00:00:00Z",
+                    "valid_until": f"{1701 + i}-01-01T00:00:00Z",
+                }
+                txn.put(entity["id"].encode(), json.dumps(entity).encode(), db=entities_db)
+            bad = {"id": "bad", "type": "person", "valid_from": "someday", "valid_until": "1800"}
+            txn.put(b"bad", json.dumps(bad).encode(), db=entities_db)
+        
+        # Entities written without a range are indexed at startup
+        env.close()
+        storage = LMDBStorage(db_path=mock_storage.db_path)
+        storage._ensure_init()
+        env = storage._env
+        
+        found = storage.get_entities_at_time(datetime(1990, 6, 1), limit=5)
+        assert [e["id"] for e in found] == ["e290"]
+        
+        found = storage.get_entities_at_time(datetime(1990, 6, 1), type_filter="concept")
+        assert found == []
+        
+        found = storage.get_entities_in_range(datetime(1990, 6, 1), datetime(1992, 1, 1))
+        assert [e["id"] for e in found] == ["e290", "e291", "e292"]
+        
+        # A bad start is unbounded; a bare year is its first instant
+        found = storage.get_entities_at_time(datetime(1650, 1, 1))
+        assert [e["id"] for e in found] == ["bad"]
+        
+        # Ranges recorded by writers are visible at once
+        with env.begin(write=True) as txn:
+            entities_db = env.open_db(b'entities', txn=txn)
+            validity_db = env.open_db(VALIDITY_DB, txn=txn)
+            entity = {"id": "eternal", "type": "person"}
+            txn.put(b"eternal", json.dumps(entity).encode(), db=entities_db)
+            put_validity(txn, validity_db, b"eternal", None, None)
+        
+        found = storage.get_entities_at_time(datetime(1990, 6, 1))
+        assert [e["id"] for e in found] == ["e290", "eternal"]
 
 
 # =============================================================================
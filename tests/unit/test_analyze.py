@@ -46,6 +46,10 @@ from inception.analyze.gaps import (
     detect_gaps,
     create_gap_node,
 )
+from inception.analyze.matcher import PhraseSet, compile_phrases
+from inception.analyze import nlp as nlp_module
+from inception.analyze.nlp import get_nlp
+from inception.analyze.pipeline import analyze_text, analyze_texts
 
 
 class TestEntityExtraction:
@@ -373,3 +377,149 @@ class TestGapDetection:
         dist = result.severity_distribution
         assert dist["minor"] == 2
         assert dist["major"] == 1
+
+
+class TestPhraseSet:
+    """Tests for compiled multi-phrase matching."""
+    
+    def test_finds_all_hits_with_offsets(self):
+        """Test one pass reports every phrase with its offsets."""
+        phrases = PhraseSet({"quantity": ["some", "a lot"], "hedge": ["might"]})
+        text = "Some users might need a lot of memory, some don't."
+        
+        hits = phrases.findall(text)
+        
+        assert [(m.phrase, m.label) for m in hits] == [
+            ("some", "quantity"), ("might", "hedge"),
+            ("a lot", "quantity"), ("some", "quantity"),
+        ]
+        for m in hits:
+            assert text[m.start:m.end].lower() == m.phrase
+    
+    def test_word_boundaries(self):
+        """Test phrases only match whole words unless disabled."""
+        assert PhraseSet(["may"]).findall("The mayor spoke.") == []
+        assert PhraseSet(["may"]).search("It may rain.") is not None
+        assert PhraseSet(["process"], word_boundaries=False).search("Processing data") is not None
+    
+    def test_longest_phrase_wins(self):
+        """Test overlapping phrases prefer the longest at a position."""
+        phrases = PhraseSet(["a bit", "a bit more"])
+        
+        assert [m.phrase for m in phrases.findall("Add a bit more salt.")] == ["a bit more"]
+    
+    def test_overlapping_hits(self):
+        """Test overlapping mode also reports phrases inside a longer hit."""
+        phrases = PhraseSet(["new", "new york", "york", "new york city"])
+        
+        hits = phrases.findall("Flights to New  York City.", overlapping=True)
+        
+        assert [(m.phrase, m.start, m.end) for m in hits] == [
+            ("new york city", 11, 25), ("new york", 11, 20),
+            ("new", 11, 14), ("york", 16, 20),
+        ]
+    
+    def test_phrases_in_distinct(self):
+        """Test distinct phrases in order of first occurrence."""
+        phrases = PhraseSet(["often", "usually"])
+        
+        assert phrases.phrases_in("Usually, often, often.") == ["usually", "often"]
+    
+    def test_compile_phrases_reused(self):
+        """Test compiled sets are shared for the same phrase list."""
+        assert compile_phrases(["some", "many"]) is compile_phrases(["some", "many"])
+    
+    def test_vague_quantities_match_per_pattern_scan(self):
+        """Test gap detection finds the same spans as one regex per pattern."""
+        import re
+        
+        detector = GapDetector()
+        text = "Several steps take a little time. Many of them, and a few more, need some care."
+        
+        expected = sorted(
+            (m.start(), m.end())
+            for pattern in detector.vague_quantity_patterns
+            for m in re.finditer(rf"\b{pattern}\b", text.lower())
+        )
+        gaps = detector._detect_vague_quantities(text)
+        
+        assert [(g.start_char, g.end_char) for g in gaps] == expected[:5]
+        assert gaps[0].description == "Vague quantity 'several'"
+
+
+class _CountingNLP:
+    """Stand-in pipeline (tokenizer + sentencizer) counting parses."""
+    
+    def __init__(self):
+        import spacy
+        
+        self.nlp = spacy.blank("en")
+        self.nlp.add_pipe("sentencizer")
+        self.calls = 0
+    
+    def __call__(self, text):
+        self.calls += 1
+        return self.nlp(text)
+    
+    def pipe(self, texts, n_process=1, batch_size=50):
+        for doc in self.nlp.pipe(texts, batch_size=batch_size):
+            self.calls += 1
+            yield doc
+
+
+class TestSharedPipeline:
+    """Tests for the shared spaCy analysis stage."""
+    
+    @pytest.fixture
+    def fake_nlp(self, monkeypatch):
+        fake = _CountingNLP()
+        loads = []
+        
+        def load(name, exclude=()):
+            loads.append((name, list(exclude)))
+            return fake
+        
+        monkeypatch.setattr(nlp_module, "_models", {})
+        monkeypatch.setattr(nlp_module.spacy, "load", load)
+        fake.loads = loads
+        return fake
+    
+    def test_model_loaded_once(self, fake_nlp):
+        """Test all extractors share one model per process."""
+        assert EntityExtractor()._get_nlp() is ClaimExtractor()._get_nlp()
+        assert ProcedureExtractor()._get_nlp() is get_nlp()
+        
+        assert len(fake_nlp.loads) == 1
+        assert "lemmatizer" in fake_nlp.loads[0][1]
+    
+    def test_analyze_text_parses_once(self, fake_nlp):
+        """Test one parse feeds every extractor."""
+        text = "How to make coffee:\n1. Boil water\n2. Add coffee grounds\nIt is good."
+        
+        analysis = analyze_text(text)
+        
+        assert fake_nlp.calls == 1
+        assert analysis.doc.text == text
+        procedure = analysis.procedures.procedures[0]
+        assert procedure.title == "How to make coffee:"
+        for step in procedure.steps:
+            assert text[step.start_char:step.end_char] == step.text
+        assert isinstance(analysis.gaps, GapDetectionResult)
+    
+    def test_gap_detector_uses_doc_sentences(self, fake_nlp):
+        """Test sentence boundaries come from the shared Doc."""
+        text = "It works well! Some people agree."
+        
+        result = GapDetector().detect(text, doc=get_nlp()(text))
+        
+        ambiguous = result.get_by_type(GapType.AMBIGUOUS_REFERENCE)
+        assert [g.context_text for g in ambiguous] == ["It works well!"]
+    
+    def test_analyze_texts_batches(self, fake_nlp):
+        """Test batch analysis yields one result per text, in order."""
+        texts = ["First text.", "Second text.", "Third text."]
+        
+        results = list(analyze_texts(texts))
+        
+        assert [r.doc.text for r in results] == texts
+        assert fake_nlp.calls == 3
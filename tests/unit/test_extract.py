@@ -0,0 +1,396 @@
+"""Unit tests for extraction layer modules."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from inception.extract.alignment import (
+    AlignedSpan,
+    AlignmentResult,
+    MultimodalAligner,
+)
+from inception.extract.ocr import (
+    FrameSignature,
+    OCRCache,
+    OCRResult,
+    TextBox,
+    _compute_iou,
+    compute_dhash,
+    frame_signature,
+    merge_boxes_across_frames,
+    merge_duplicate_boxes,
+    ocr_keyframes,
+)
+from inception.extract.scenes import SceneDetectionResult, SceneInfo
+from inception.extract.transcription import Segment, TranscriptResult
+
+
+def _write_slide(path: Path, text: str, noise: int = 0) -> Path:
+    """Render a synthetic slide image."""
+    image = np.full((240, 320, 3), 255, dtype=np.uint8)
+    cv2.putText(image, text, (20, 120), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (0, 0, 0), 3)
+    if noise:
+        rng = np.random.default_rng(noise)
+        jitter = rng.integers(-noise, noise + 1, image.shape)
+        image = np.clip(image.astype(int) + jitter, 0, 255).astype(np.uint8)
+    cv2.imwrite(str(path), image)
+    return path
+
+
+def _write_hd_slide(path: Path, lines: list[str], quality: int | None = None) -> Path:
+    """Render a 1920×1080 bullet slide, optionally as a lossy JPEG."""
+    image = np.full((1080, 1920, 3), 255, dtype=np.uint8)
+    cv2.putText(image, "Agenda", (100, 150), cv2.FONT_HERSHEY_SIMPLEX, 3, (0, 0, 0), 6)
+    for i, line in enumerate(lines):
+        cv2.putText(image, line, (140, 300 + i * 90), cv2.FONT_HERSHEY_SIMPLEX, 1.6,
+                    (20, 20, 20), 3)
+    if quality:
+        path = path.with_suffix(".jpg")
+        cv2.imwrite(str(path), image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    else:
+        cv2.imwrite(str(path), image)
+    return path
+
+
+def _fake_recognize(self, image_path, preprocess=True):
+    return OCRResult(
+        image_path=Path(image_path),
+        text_boxes=[TextBox(text=Path(image_path).stem, confidence=0.9,
+                            x0=0.1, y0=0.1, x1=0.5, y1=0.2)],
+        width=320,
+        height=240,
+        engine=f"fake:{os.getpid()}",
+    )
+
+
+class TestPerceptualHash:
+    """Tests for dHash computation."""
+    
+    def test_near_identical_frames_hash_close(self, tmp_path):
+        """Test compression-like noise barely changes the hash."""
+        a = cv2.imread(str(_write_slide(tmp_path / "a.png", "Hello")))
+        b = cv2.imread(str(_write_slide(tmp_path / "b.png", "Hello", noise=3)))
+        
+        assert (compute_dhash(a) ^ compute_dhash(b)).bit_count() <= 4
+    
+    def test_different_frames_hash_apart(self, tmp_path):
+        """Test distinct slides produce distinct hashes."""
+        a = cv2.imread(str(_write_slide(tmp_path / "a.png", "Hello")))
+        b = cv2.imread(str(_write_slide(tmp_path / "b.png", "WORLD 42")))
+        
+        assert compute_dhash(a) != compute_dhash(b)
+    
+    def test_signature_tells_text_changes_apart(self, tmp_path):
+        """Test edits the hash misses are caught by the ink comparison."""
+        def sign(name, *lines, quality=None):
+            path = _write_hd_slide(tmp_path / name, list(lines), quality)
+            return frame_signature(cv2.imread(str(path)))
+        
+        base = sign("base.png", "- point one", "- point two")
+        cache = OCRCache()
+        
+        assert cache.same_text(base, sign("jpeg.png", "- point one", "- point two", quality=60))
+        assert not cache.same_text(base, sign("more.png", "- point one", "- point two", "- three"))
+        assert not cache.same_text(base, sign("digit.png", "- point one", "- point 2"))
+        assert not cache.same_text(sign("b.png", "compute(a, b)"), sign("c.png", "compute(a, c)"))
+
+
+class TestOCRCache:
+    """Tests for the perceptual-hash OCR cache."""
+    
+    def test_get_put_stats(self):
+        """Test hits and misses are counted."""
+        cache = OCRCache(max_distance=2)
+        result = OCRResult(image_path=Path("a.png"))
+        
+        assert cache.get(0b1010) is None
+        cache.put(0b1010, result)
+        assert cache.get(0b1011) is result
+        assert cache.get(0b0101) is None
+        assert cache.get(0b1010 ^ (1 << 200)) is result  # In another chunk
+        
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 2
+        assert cache.stats.hit_rate == 0.5
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted."""
+        cache = OCRCache(max_distance=0, max_entries=2)
+        cache.put(1, OCRResult(image_path=Path("1.png")))
+        cache.put(2, OCRResult(image_path=Path("2.png")))
+        cache.get(1)
+        cache.put(4, OCRResult(image_path=Path("4.png")))
+        
+        assert len(cache) == 2
+        assert cache.find(2) is None
+        assert cache.find(1).image_path == Path("1.png")
+    
+    def test_same_hash_different_text(self):
+        """Test frames sharing a hash are kept apart by their signatures."""
+        def signature(ink):
+            return FrameSignature(phash=7, ink=np.packbits(ink), shape=ink.shape)
+        
+        blank = np.zeros((32, 32), dtype=bool)
+        text = blank.copy()
+        text[8:24, 8:24] = True
+        
+        cache = OCRCache()
+        cache.put(7, OCRResult(image_path=Path("blank.png")), signature(blank))
+        cache.put(7, OCRResult(image_path=Path("text.png")), signature(text))
+        
+        assert len(cache) == 2
+        assert cache.get(7, signature(text)).image_path == Path("text.png")
+        assert cache.get(7, signature(blank)).image_path == Path("blank.png")
+
+
+class TestOCRKeyframes:
+    """Tests for batch keyframe OCR."""
+    
+    def test_dedups_repeated_slides(self, tmp_path):
+        """Test repeated slides are recognized once and share results."""
+        paths = [
+            _write_slide(tmp_path / "s1.png", "Intro"),
+            _write_slide(tmp_path / "s2.png", "Intro", noise=2),
+            _write_slide(tmp_path / "s3.png", "Agenda 2"),
+        ]
+        cache = OCRCache()
+        
+        with patch("inception.extract.ocr.OCREngine.recognize",
+                   autospec=True, side_effect=_fake_recognize) as mock_recognize:
+            results = ocr_keyframes(paths, parallel=False, cache=cache)
+        
+        assert mock_recognize.call_count == 2
+        assert [r.image_path for r in results] == paths
+        assert results[1].full_text == "s1"
+        assert cache.stats.hits == 1
+    
+    def test_cache_reused_across_calls(self, tmp_path):
+        """Test a shared cache skips OCR on a later call."""
+        path = _write_slide(tmp_path / "s1.png", "Intro")
+        cache = OCRCache()
+        
+        with patch("inception.extract.ocr.OCREngine.recognize",
+                   autospec=True, side_effect=_fake_recognize) as mock_recognize:
+            ocr_keyframes([path], parallel=False, cache=cache)
+            ocr_keyframes([path], parallel=False, cache=cache)
+        
+        assert mock_recognize.call_count == 1
+        assert cache.stats.hit_rate == 0.5
+    
+    def test_no_dedup_by_default(self, tmp_path):
+        """Test dedup is opt-in."""
+        paths = [_write_slide(tmp_path / f"s{i}.png", "Intro") for i in range(3)]
+        
+        with patch("inception.extract.ocr.OCREngine.recognize",
+                   autospec=True, side_effect=_fake_recognize) as mock_recognize:
+            ocr_keyframes(paths, parallel=True)
+        
+        assert mock_recognize.call_count == 3
+    
+    def test_changed_slide_not_deduped(self, tmp_path):
+        """Test a bullet reveal gets its own OCR pass."""
+        paths = [
+            _write_hd_slide(tmp_path / "s1.png", ["- point one"]),
+            _write_hd_slide(tmp_path / "s2.png", ["- point one", "- point two"]),
+            _write_hd_slide(tmp_path / "s3.png", ["- point one", "- point two"], quality=70),
+        ]
+        
+        with patch("inception.extract.ocr.OCREngine.recognize",
+                   autospec=True, side_effect=_fake_recognize) as mock_recognize:
+            results = ocr_keyframes(paths, parallel=False, dedup=True)
+        
+        assert mock_recognize.call_count == 2
+        assert [r.full_text for r in results] == ["s1", "s2", "s2"]
+    
+    def test_process_pool(self, tmp_path):
+        """Test process-pool mode recognizes frames in workers, in input order."""
+        paths = [_write_slide(tmp_path / f"s{i}.png", f"Slide {i}") for i in range(4)]
+        paths.append(_write_slide(tmp_path / "s4.png", "Slide 1", noise=2))
+        
+        # Workers are forked with the patched engine
+        with patch("inception.extract.ocr.OCREngine.recognize",
+                   autospec=True, side_effect=_fake_recognize):
+            results = ocr_keyframes(
+                paths, parallel=True, use_processes=True, max_workers=2, dedup=True,
+            )
+        
+        assert [r.image_path for r in results] == paths
+        assert [r.full_text for r in results] == ["s0", "s1", "s2", "s3", "s1"]
+        assert all(r.engine != f"fake:{os.getpid()}" for r in results[:4])
+
+
+def _random_boxes(n: int, seed: int = 0) -> list[TextBox]:
+    rng = np.random.default_rng(seed)
+    boxes = []
+    for i in range(n):
+        x0, y0 = rng.uniform(0, 0.9, 2)
+        w, h = rng.uniform(0.01, 0.1, 2)
+        boxes.append(TextBox(text=f"t{i}", confidence=float(rng.uniform()),
+                             x0=x0, y0=y0, x1=x0 + w, y1=y0 + h))
+    return boxes
+
+
+def _reference_merge(boxes: list[TextBox], iou_threshold: float) -> list[TextBox]:
+    boxes = sorted(boxes, key=lambda b: b.confidence, reverse=True)
+    merged, used = [], set()
+    for i, box in enumerate(boxes):
+        if i in used:
+            continue
+        merged.append(box)
+        used.add(i)
+        for j in range(i + 1, len(boxes)):
+            if j not in used and _compute_iou(box, boxes[j]) > iou_threshold:
+                used.add(j)
+    return merged
+
+
+class TestMergeDuplicateBoxes:
+    """Tests for IoU-based box deduplication."""
+    
+    def test_overlapping_boxes_merged(self):
+        """Test the higher-confidence duplicate is kept."""
+        boxes = [
+            TextBox(text="low", confidence=0.5, x0=0.1, y0=0.1, x1=0.5, y1=0.2),
+            TextBox(text="high", confidence=0.9, x0=0.11, y0=0.1, x1=0.5, y1=0.2),
+            TextBox(text="other", confidence=0.7, x0=0.6, y0=0.6, x1=0.8, y1=0.7),
+        ]
+        
+        merged = merge_duplicate_boxes(boxes)
+        
+        assert [b.text for b in merged] == ["high", "other"]
+    
+    @pytest.mark.parametrize("threshold", [0.1, 0.5])
+    def test_matches_pairwise_reference(self, threshold):
+        """Test the dense path matches the pairwise algorithm."""
+        boxes = _random_boxes(300)
+        
+        assert merge_duplicate_boxes(boxes, threshold) == _reference_merge(boxes, threshold)
+    
+    def test_blocked_dense_path_matches_reference(self):
+        """Test computing the IoU matrix in row blocks does not change the result."""
+        boxes = _random_boxes(300, seed=2)
+        
+        with patch("inception.extract.ocr.IOU_BLOCK_ELEMENTS", 300 * 7):
+            merged = merge_duplicate_boxes(boxes, 0.2)
+        
+        assert merged == _reference_merge(boxes, 0.2)
+    
+    def test_grid_path_matches_reference(self):
+        """Test the grid-index path matches the pairwise algorithm."""
+        boxes = _random_boxes(300, seed=1)
+        
+        with patch("inception.extract.ocr.DENSE_IOU_MAX_BOXES", 0):
+            merged = merge_duplicate_boxes(boxes, 0.2)
+        
+        assert merged == _reference_merge(boxes, 0.2)
+
+
+class TestMergeBoxesAcrossFrames:
+    """Tests for cross-keyframe box deduplication."""
+    
+    def test_repeated_text_dropped(self):
+        """Test text persisting across frames is kept only where it first appears."""
+        title = TextBox(text="Agenda", confidence=0.9, x0=0.1, y0=0.1, x1=0.4, y1=0.2)
+        moved = TextBox(text="Agenda", confidence=0.9, x0=0.6, y0=0.6, x1=0.9, y1=0.7)
+        bullet = TextBox(text="Step one", confidence=0.8, x0=0.1, y0=0.3, x1=0.5, y1=0.4)
+        frames = [
+            OCRResult(image_path=Path("1.png"), text_boxes=[title]),
+            OCRResult(image_path=Path("2.png"), text_boxes=[title, bullet]),
+            OCRResult(image_path=Path("3.png"), text_boxes=[title, bullet, moved]),
+        ]
+        
+        merged = merge_boxes_across_frames(frames)
+        
+        assert [b.text for b in merged[0].text_boxes] == ["Agenda"]
+        assert [b.text for b in merged[1].text_boxes] == ["Step one"]
+        assert merged[2].text_boxes == [moved]
+        assert frames[1].text_boxes == [title, bullet]
+    
+    def test_blocked_iou_matches_whole_matrix(self):
+        """Test row-blocked IoU keeps the same boxes as one full matrix."""
+        previous = _random_boxes(200, seed=3)
+        current = _random_boxes(150, seed=3)[:100] + _random_boxes(50, seed=4)
+        frames = [
+            OCRResult(image_path=Path("1.png"), text_boxes=previous),
+            OCRResult(image_path=Path("2.png"), text_boxes=current),
+        ]
+        
+        expected = merge_boxes_across_frames(frames)
+        with patch("inception.extract.ocr.IOU_BLOCK_ELEMENTS", 200 * 3):
+            blocked = merge_boxes_across_frames(frames)
+        
+        assert blocked == expected
+        assert blocked[1].text_boxes == current[100:]
+
+
+class TestAlignmentIndex:
+    """Tests for indexed transcript/span alignment."""
+    
+    def _random_intervals(self, n: int, seed: int = 0) -> list[tuple[int, int]]:
+        rng = np.random.default_rng(seed)
+        starts = rng.integers(0, 100_000, n)
+        lengths = rng.integers(0, 5_000, n)
+        return [(int(s), int(s + d)) for s, d in zip(starts, lengths)]
+    
+    def test_range_queries_match_linear_scan(self):
+        """Test overlap and point queries match a linear scan, including nested spans."""
+        spans = [AlignedSpan(start_ms=s, end_ms=e) for s, e in self._random_intervals(500)]
+        result = AlignmentResult(spans=spans)
+        
+        for t in range(0, 105_000, 997):
+            assert result.get_spans_at_time(t) == [
+                s for s in spans if s.start_ms <= t <= s.end_ms
+            ]
+            assert result.get_spans_in_range(t, t + 1500) == [
+                s for s in spans if s.start_ms < t + 1500 and s.end_ms > t
+            ]
+    
+    def test_index_spans_after_changes(self):
+        """Test the index is built with the result and rebuilt on request."""
+        spans = [AlignedSpan(start_ms=0, end_ms=100), AlignedSpan(start_ms=200, end_ms=300)]
+        result = AlignmentResult(spans=spans)
+        assert result.get_spans_at_time(250) == [spans[1]]
+        
+        spans[1].start_ms, spans[1].end_ms = 1000, 1100
+        result.spans.append(AlignedSpan(start_ms=400, end_ms=600))
+        result.index_spans()
+        
+        assert result.get_spans_at_time(250) == []
+        assert result.get_spans_at_time(1050) == [spans[1]]
+        assert result.get_spans_at_time(500) == [result.spans[2]]
+    
+    def test_nested_spans(self):
+        """Test a long span covering many short ones is found without hiding them."""
+        outer = AlignedSpan(start_ms=0, end_ms=1_000_000)
+        inner = [AlignedSpan(start_ms=t, end_ms=t + 10) for t in range(0, 1_000_000, 100)]
+        result = AlignmentResult(spans=[outer, *inner])
+        
+        assert result.get_spans_at_time(505) == [outer, inner[5]]
+        assert result.get_spans_in_range(150, 250) == [outer, inner[2]]
+        assert result.get_spans_in_range(110, 200) == [outer]
+    
+    def test_align_transcript_to_scenes(self):
+        """Test segments are attached to every scene they overlap."""
+        segments = [
+            Segment(id=i, text=f"seg{i}", start_ms=s, end_ms=e)
+            for i, (s, e) in enumerate([(0, 900), (900, 2100), (2100, 2500)])
+        ]
+        transcript = TranscriptResult(audio_path=Path("a.wav"), segments=segments)
+        scenes = SceneDetectionResult(
+            video_path=Path("v.mp4"),
+            scenes=[
+                SceneInfo(scene_num=0, start_ms=0, end_ms=1000),
+                SceneInfo(scene_num=1, start_ms=1000, end_ms=3000),
+            ],
+            duration_ms=3000,
+        )
+        
+        result = MultimodalAligner().align(transcript, scenes)
+        
+        assert result.spans[0].transcript_text == "seg0 seg1"
+        assert result.spans[1].transcript_text == "seg1 seg2"
@@ -0,0 +1,198 @@
+"""
+Unit tests for the validity interval index.
+"""
+
+import random
+from datetime import datetime, timezone
+
+import lmdb
+import pytest
+
+from inception.db.intervals import (
+    VALIDITY_DB,
+    IntervalIndex,
+    delete_validity,
+    load_validity_index,
+    put_validity,
+    query_validity,
+    rebuild_validity_summaries,
+    to_epoch_ms,
+    validity_count,
+    validity_generation,
+    validity_ids,
+)
+
+
+def _brute_force(intervals, lo, hi):
+    return sorted(
+        item for start, end, item in intervals
+        if (start is None or start <= hi) and (end is None or lo <= end)
+    )
+
+
+class TestIntervalIndex:
+    """Tests for IntervalIndex queries."""
+    
+    def test_at(self):
+        """Test point queries on closed intervals."""
+        index = IntervalIndex([(0, 10, "a"), (5, 15, "b"), (20, 30, "c")])
+        
+        assert sorted(index.at(5)) == ["a", "b"]
+        assert sorted(index.at(10)) == ["a", "b"]
+        assert index.at(17) == []
+        assert index.at(30) == ["c"]
+    
+    def test_unbounded(self):
+        """Test None as an unbounded start or end."""
+        index = IntervalIndex([(None, 10, "before"), (5, None, "after"), (None, None, "always")])
+        
+        assert sorted(index.at(-1000)) == ["always", "before"]
+        assert sorted(index.at(7)) == ["after", "always", "before"]
+        assert sorted(index.at(1000)) == ["after", "always"]
+    
+    def test_matches_brute_force(self):
+        """Test point and range queries against a linear scan."""
+        rng = random.Random(0)
+        intervals = []
+        for i in range(500):
+            start = rng.choice([None, rng.randrange(1000)])
+            end = rng.choice([None, (start or 0) + rng.randrange(100)])
+            intervals.append((start, end, i))
+        index = IntervalIndex(intervals)
+        
+        for _ in range(200):
+            lo = rng.randrange(-50, 1150)
+            hi = lo + rng.choice([0, rng.randrange(200)])
+            assert sorted(index.at(lo)) == _brute_force(intervals, lo, lo)
+            assert sorted(index.overlapping(lo, hi)) == _brute_force(intervals, lo, hi)
+    
+    def test_add_after_query(self):
+        """Test intervals added after a query are found."""
+        index = IntervalIndex([(0, 10, "a")])
+        assert index.at(20) == []
+        
+        index.add(15, 25, "b")
+        
+        assert index.at(20) == ["b"]
+        assert len(index) == 2
+    
+    def test_interleaved_adds_merge_incrementally(self):
+        """Test adds between queries merge into few trees instead of rebuilding."""
+        rng = random.Random(2)
+        index = IntervalIndex()
+        intervals = []
+        
+        for i in range(1000):
+            start = rng.randrange(1000)
+            intervals.append((start, start + rng.randrange(50), i))
+            index.add(*intervals[-1])
+            
+            point = rng.randrange(1050)
+            assert sorted(index.at(point)) == _brute_force(intervals, point, point)
+            assert len(index._trees) <= (i + 1).bit_length()
+
+
+class TestValidityStore:
+    """Tests for validity ranges stored in LMDB."""
+    
+    @pytest.fixture
+    def env(self, tmp_path):
+        """Create a temporary LMDB environment."""
+        env = lmdb.open(str(tmp_path / "validity.lmdb"), max_dbs=2)
+        yield env
+        env.close()
+    
+    def test_to_epoch_ms(self):
+        """Test timestamp conversion."""
+        assert to_epoch_ms(None) is None
+        assert to_epoch_ms("1970-01-01T00:00:01Z") == 1000
+        assert to_epoch_ms(datetime(1970, 1, 1, 0, 0, 2)) == 2000
+        assert to_epoch_ms(datetime(1969, 12, 31, 23, 59, 59, tzinfo=timezone.utc)) == -1000
+        assert to_epoch_ms("1970") == 0
+        assert to_epoch_ms("1970-02") == 31 * 24 * 3600 * 1000
+        with pytest.raises(ValueError):
+            to_epoch_ms("someday")
+    
+    def test_roundtrip(self, env):
+        """Test stored ranges load into an index."""
+        with env.begin(write=True) as txn:
+            db = env.open_db(VALIDITY_DB, txn=txn)
+            put_validity(txn, db, b"old", "1999-01-01T00:00:00Z", "2001-01-01T00:00:00Z")
+            put_validity(txn, db, b"new", "2000-06-01T00:00:00Z", None)
+            put_validity(txn, db, b"always", None, None)
+            put_validity(txn, db, b"ancient", -5000, -1000)
+        
+        with env.begin() as txn:
+            db = env.open_db(VALIDITY_DB, txn=txn)
+            index = load_validity_index(txn, db)
+        
+        assert sorted(index.at(to_epoch_ms("2000-01-01T00:00:00Z"))) == [b"always", b"old"]
+        assert sorted(index.at(to_epoch_ms("2020-01-01T00:00:00Z"))) == [b"always", b"new"]
+        assert sorted(index.at(-2000)) == [b"always", b"ancient"]
+    
+    def test_replace_and_delete(self, env):
+        """Test replacing and deleting a range bumps the generation."""
+        with env.begin(write=True) as txn:
+            db = env.open_db(VALIDITY_DB, txn=txn)
+            put_validity(txn, db, b"e1", 0, 10)
+            first = validity_generation(txn, db)
+            put_validity(txn, db, b"e1", 20, 30)
+            put_validity(txn, db, b"e2", 0, 10)
+            assert validity_generation(txn, db) > first
+            
+            index = load_validity_index(txn, db)
+            assert index.at(5) == [b"e2"]
+            assert index.at(25) == [b"e1"]
+            
+            assert delete_validity(txn, db, b"e2")
+            assert not delete_validity(txn, db, b"e2")
+            assert list(validity_ids(txn, db)) == [b"e1"]
+            assert load_validity_index(txn, db).at(5) == []
+    
+    def test_query_in_place(self, env):
+        """Test queries on the stored summaries match a linear scan through updates."""
+        rng = random.Random(1)
+        year = 365 * 24 * 3600 * 1000
+        ranges = {}
+        
+        with env.begin(write=True) as txn:
+            db = env.open_db(VALIDITY_DB, txn=txn)
+            for i in range(2000):
+                start = rng.choice([None, rng.randrange(-50 * year, 50 * year)])
+                # Mix of short, long (nested over many others) and open ranges
+                length = rng.choice([0, rng.randrange(3600_000), rng.randrange(20 * year)])
+                end = rng.choice([None, (start or 0) + length])
+                item = f"i{i}".encode()
+                put_validity(txn, db, item, start, end)
+                ranges[item] = (start, end)
+            
+            for item in rng.sample(sorted(ranges), 700):
+                if rng.random() < 0.5:
+                    assert delete_validity(txn, db, item)
+                    del ranges[item]
+                else:
+                    start = rng.randrange(-50 * year, 50 * year)
+                    ranges[item] = (start, start + rng.randrange(year))
+                    put_validity(txn, db, item, *ranges[item])
+            
+            assert validity_count(txn, db) == len(ranges)
+            intervals = [(start, end, item) for item, (start, end) in ranges.items()]
+            for _ in range(300):
+                lo = rng.randrange(-60 * year, 60 * year)
+                hi = lo + rng.choice([0, rng.randrange(3600_000), rng.randrange(5 * year)])
+                assert sorted(query_validity(txn, db, lo, hi)) == _brute_force(intervals, lo, hi)
+            assert sorted(query_validity(txn, db, None, None)) == sorted(ranges)
+            
+            # Incremental summaries equal rebuilt ones
+            before = list(txn.cursor(db=db))
+            assert rebuild_validity_summaries(txn, db) == len(ranges)
+            assert list(txn.cursor(db=db)) == before
+    
+    def test_unparseable_bounds_are_unbounded(self, env):
+        """Test a bad date is stored as unbounded instead of failing the write."""
+        with env.begin(write=True) as txn:
+            db = env.open_db(VALIDITY_DB, txn=txn)
+            put_validity(txn, db, b"bad", "someday", "2000")
+            
+            assert list(query_validity(txn, db, -(10 ** 15), -(10 ** 15))) == [b"bad"]
+            assert list(query_validity(txn, db, to_epoch_ms("2001"), None)) == []
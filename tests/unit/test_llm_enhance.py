@@ -1,8 +1,10 @@
 """Tests for LLM enhancement module."""
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
+import asyncio
 import json
+import multiprocessing
 
 from inception.enhance.llm.providers import (
     LLMProvider,
@@ -10,8 +12,15 @@ from inception.enhance.llm.providers import (
     OllamaProvider,
     OpenRouterProvider,
     CloudProvider,
+    RequestLimiter,
     get_provider,
+    parse_retry_after,
 )
+from inception.enhance.llm import providers as providers_module
+from inception.enhance.llm import registry as registry_module
+from inception.enhance.llm.registry import CircuitBreaker, ProviderRegistry
+from inception.enhance.flow.engine import FlowRunner
+from inception.enhance.flow.schema import FlowRole, FlowSpec, FlowStepSpec
 from inception.enhance.llm.extractor import (
     LLMExtractor,
     LLMExtractionResult,
@@ -20,7 +29,10 @@ from inception.enhance.llm.extractor import (
     ExtractedProcedure,
     ExtractedStep,
     ExtractedGap,
+    chunk_text,
 )
+from inception.enhance.llm.cache import LLMResponseCache, cache_key
+from inception.enhance.llm.streaming import StreamingJSONParser
 from inception.enhance.llm.prompts import (
     CLAIM_EXTRACTION_PROMPT,
     ENTITY_EXTRACTION_PROMPT,
@@ -116,6 +128,219 @@ class TestCloudProvider:
         assert "gpt" in provider.model
 
 
+def _openrouter_body(content: str) -> dict:
+    return {
+        "choices": [{"message": {"content": content}}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+    }
+
+
+class TestAsyncProviders:
+    """Tests for async completion, concurrency limits and rate limiting."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_limiters(self):
+        providers_module._limiters.clear()
+        yield
+        providers_module._limiters.clear()
+    
+    async def test_acomplete(self, httpx_mock):
+        """Test async completion parses the provider response."""
+        httpx_mock.add_response(
+            url="https://openrouter.ai/api/v1/chat/completions",
+            json=_openrouter_body('```json\n{"ok": true}\n```'),
+        )
+        provider = OpenRouterProvider(api_key="test-key")
+        
+        response = await provider.acomplete("Hello")
+        assert response.tokens_used == 15
+        assert response.provider == "openrouter"
+        
+        httpx_mock.add_response(
+            url="https://openrouter.ai/api/v1/chat/completions",
+            json=_openrouter_body('```json\n{"ok": true}\n```'),
+        )
+        assert await provider.acomplete_json("Hello") == {"ok": True}
+    
+    async def test_retries_after_429(self, httpx_mock):
+        """Test a 429 is retried after Retry-After and shrinks the limit."""
+        url = "https://api.openai.com/v1/chat/completions"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=url, json=_openrouter_body("done"))
+        
+        provider = CloudProvider(provider="openai", api_key="test-key")
+        response = await provider.acomplete("Hello")
+        
+        assert response.content == "done"
+        assert len(httpx_mock.get_requests()) == 2
+        assert provider.limiter.limit == CloudProvider.max_concurrency // 2
+    
+    async def test_gives_up_after_max_retries(self, httpx_mock):
+        """Test persistent 429s surface as an HTTP error."""
+        import httpx
+        
+        url = "https://api.anthropic.com/v1/messages"
+        for _ in range(2):
+            httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+        
+        provider = CloudProvider(provider="anthropic", api_key="test-key")
+        provider.max_retries = 1
+        
+        with pytest.raises(httpx.HTTPStatusError):
+            await provider.acomplete("Hello")
+    
+    def test_sync_retries_after_429(self, httpx_mock):
+        """Test the sync path also waits out a 429 and retries."""
+        url = "https://api.openai.com/v1/chat/completions"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=url, json=_openrouter_body("done"))
+        
+        provider = CloudProvider(provider="openai", api_key="test-key")
+        
+        assert provider.complete("Hello").content == "done"
+        assert len(httpx_mock.get_requests()) == 2
+    
+    def test_clients_and_limiters_per_loop(self):
+        """Test each event loop gets its own client and limiter."""
+        provider = CloudProvider(provider="openai", api_key="test-key")
+        
+        async def state():
+            return providers_module.get_async_client(), provider.limiter
+        
+        async def close():
+            await providers_module.close_async_client()
+        
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+        try:
+            client_a, limiter_a = loop_a.run_until_complete(state())
+            client_b, limiter_b = loop_b.run_until_complete(state())
+            
+            assert client_a is not client_b
+            assert limiter_a is not limiter_b
+            assert loop_a.run_until_complete(state()) == (client_a, limiter_a)
+            
+            loop_a.run_until_complete(close())
+            assert client_a.is_closed
+            assert not client_b.is_closed
+            loop_b.run_until_complete(close())
+        finally:
+            loop_a.close()
+            loop_b.close()
+    
+    async def test_limiter_caps_in_flight(self):
+        """Test no more than the limit run at once."""
+        limiter = RequestLimiter(max_concurrency=3)
+        peak = 0
+        
+        async def request():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+        
+        await asyncio.gather(*(request() for _ in range(20)))
+        
+        assert peak == 3
+        assert limiter.in_flight == 0
+    
+    async def test_limiter_pauses_and_recovers(self):
+        """Test a 429 pauses requests, then successes restore the limit."""
+        limiter = RequestLimiter(max_concurrency=4)
+        
+        assert limiter.on_rate_limited(0.05) == 0.05
+        assert limiter.limit == 2
+        
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        async with limiter:
+            pass
+        assert loop.time() - start >= 0.04
+        
+        for _ in range(2 + 3):
+            limiter.on_success()
+        assert limiter.limit == 4
+    
+    async def test_sync_only_provider_runs_in_thread(self):
+        """Test providers without an HTTP request description fall back to complete()."""
+        
+        class SyncProvider(LLMProvider):
+            name = "sync"
+            
+            def complete(self, prompt, system=None, temperature=0.0, max_tokens=2048):
+                return LLMResponse(content=prompt.upper(), model="m", provider="sync")
+            
+            def is_available(self):
+                return True
+        
+        response = await SyncProvider().acomplete("hi")
+        assert response.content == "HI"
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, dates and junk."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestAsyncFlowAndExtraction:
+    """Tests for async callers of the provider interface."""
+    
+    async def test_flow_runner_uses_provider(self):
+        """Test planner and generator steps call the async provider."""
+        provider = Mock(spec=LLMProvider)
+        provider.acomplete_json = AsyncMock(return_value={"plan": "fetch"})
+        provider.acomplete = AsyncMock(
+            return_value=LLMResponse(content="Summary", model="m", provider="mock")
+        )
+        
+        spec = FlowSpec(
+            id="test_flow",
+            entry_point="plan",
+            steps=[
+                FlowStepSpec(name="plan", role=FlowRole.PLANNER,
+                             description="Plan", next_steps=["write"]),
+                FlowStepSpec(name="write", role=FlowRole.GENERATOR, description="Write"),
+            ],
+        )
+        
+        trajectories = await FlowRunner(spec, provider=provider).run_many(
+            [{"uri": f"doc{i}"} for i in range(5)]
+        )
+        
+        assert len(trajectories) == 5
+        assert all(t.status == "completed" for t in trajectories)
+        assert [s.output for s in trajectories[0].steps] == [{"plan": "fetch"}, "Summary"]
+        assert provider.acomplete.await_count == 5
+    
+    async def test_aextract_all(self):
+        """Test async extraction fans chunks out through acomplete."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 8192
+        
+        async def acomplete(prompt, system=None):
+            await asyncio.sleep(0)
+            return LLMResponse(
+                content=json.dumps({"entities": [{"name": "Topic", "type": "CONCEPT"}]}),
+                model="test",
+                provider="mock",
+                tokens_used=10,
+            )
+        
+        provider.acomplete = AsyncMock(side_effect=acomplete)
+        text = _sentences(400)
+        
+        extractor = LLMExtractor(provider=provider, max_chunk_tokens=500)
+        result = await extractor.aextract_all(text)
+        
+        calls = provider.acomplete.await_count
+        assert calls > 1
+        assert len(result.entities) == 1
+        assert extractor.total_tokens == 10 * calls
+        provider.complete.assert_not_called()
+
+
 class TestGetProvider:
     """Tests for provider factory function."""
     
@@ -137,6 +362,368 @@ class TestGetProvider:
             get_provider(name="unknown_provider")
 
 
+class _FakeProvider(LLMProvider):
+    """Provider whose availability can be toggled, counting probes."""
+    
+    def __init__(self, name: str, available: bool = True):
+        self.name = name
+        self.available = available
+        self.probes = 0
+    
+    def is_available(self):
+        self.probes += 1
+        return self.available
+    
+    def complete(self, prompt, system=None, temperature=0.0, max_tokens=2048):
+        return LLMResponse(content="{}", model="m", provider=self.name)
+
+
+_SYNTHESIS_OUTPUT = """```json
+{
+  "entities": [
+    {"name": "Python", "type": "PRODUCT", "description": "A \\"snake\\" {not json}"},
+    {"name": "Guido", "type": "PERSON", "aliases": ["BDFL"]}
+  ],
+  "claims": [{"text": "Python is popular: [citation]", "confidence": 0.8}],
+  "procedures": [{"title": "Install", "steps": [{"index": 1, "text": "Download"}]}],
+  "gaps": []
+}
+```"""
+
+
+class TestStreamingJSONParser:
+    """Tests for incremental parsing of streamed JSON."""
+    
+    @pytest.mark.parametrize("step", [1, 2, 7, len(_SYNTHESIS_OUTPUT)])
+    def test_elements_independent_of_chunking(self, step):
+        """Test elements come out the same however the text is split."""
+        parser = StreamingJSONParser()
+        elements = []
+        for i in range(0, len(_SYNTHESIS_OUTPUT), step):
+            elements.extend(parser.feed(_SYNTHESIS_OUTPUT[i:i + step]))
+        
+        assert [key for key, _ in elements] == ["entities", "entities", "claims", "procedures"]
+        assert elements[0][1]["description"] == 'A "snake" {not json}'
+        assert elements[2][1]["text"] == "Python is popular: [citation]"
+        assert elements[3][1]["steps"] == [{"index": 1, "text": "Download"}]
+        assert parser.done
+    
+    def test_element_yielded_when_closed(self):
+        """Test an element is available before the rest of the output arrives."""
+        parser = StreamingJSONParser()
+        
+        assert parser.feed('{"entities": [{"name": "A"') == []
+        assert parser.feed('}, {"name"') == [("entities", {"name": "A"})]
+        assert not parser.done
+
+
+class TestStreaming:
+    """Tests for provider token streams and streaming extraction."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_limiters(self):
+        providers_module._limiters.clear()
+        yield
+        providers_module._limiters.clear()
+    
+    async def test_ollama_ndjson_stream(self, httpx_mock):
+        """Test Ollama's newline-delimited JSON stream is decoded."""
+        lines = [
+            {"message": {"content": "Hel"}, "done": False},
+            {"message": {"content": "lo"}, "done": False},
+            {"message": {"content": ""}, "done": True, "eval_count": 2},
+        ]
+        httpx_mock.add_response(
+            url="http://localhost:11434/api/chat",
+            content="\n".join(json.dumps(line) for line in lines).encode(),
+        )
+        
+        deltas = [d async for d in OllamaProvider().astream("Hi")]
+        
+        assert deltas == ["Hel", "lo"]
+        assert json.loads(httpx_mock.get_requests()[0].content)["stream"] is True
+    
+    async def test_openai_sse_stream(self, httpx_mock):
+        """Test OpenAI server-sent events are decoded."""
+        events = [
+            {"choices": [{"delta": {"role": "assistant"}}]},
+            {"choices": [{"delta": {"content": "Hel"}}]},
+            {"choices": [{"delta": {"content": "lo"}}]},
+        ]
+        body = "".join(f"data: {json.dumps(e)}\n\n" for e in events) + "data: [DONE]\n\n"
+        httpx_mock.add_response(
+            url="https://api.openai.com/v1/chat/completions",
+            content=body.encode(),
+        )
+        
+        provider = CloudProvider(provider="openai", api_key="test-key")
+        assert "".join([d async for d in provider.astream("Hi")]) == "Hello"
+    
+    async def test_anthropic_sse_stream(self, httpx_mock):
+        """Test Anthropic content_block_delta events are decoded."""
+        body = (
+            "event: message_start\ndata: {\"type\": \"message_start\"}\n\n"
+            "event: content_block_delta\n"
+            "data: {\"type\": \"content_block_delta\", \"delta\": {\"text\": \"Hi\"}}\n\n"
+            "event: message_stop\ndata: {\"type\": \"message_stop\"}\n\n"
+        )
+        httpx_mock.add_response(url="https://api.anthropic.com/v1/messages", content=body.encode())
+        
+        provider = CloudProvider(provider="anthropic", api_key="test-key")
+        assert [d async for d in provider.astream("Hi")] == ["Hi"]
+    
+    async def test_astream_all_yields_before_completion(self, tmp_path):
+        """Test the first entity arrives before the stream ends and results are cached."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 8192
+        provider.name = "mock"
+        provider.model = "test"
+        sent = []
+        
+        async def astream(prompt, system=None):
+            for i in range(0, len(_SYNTHESIS_OUTPUT), 5):
+                await asyncio.sleep(0)  # Network reads yield to the loop
+                sent.append(i)
+                yield _SYNTHESIS_OUTPUT[i:i + 5]
+        
+        provider.astream = astream
+        cache = LLMResponseCache(tmp_path / "cache")
+        extractor = LLMExtractor(provider=provider, cache=cache)
+        
+        items = []
+        async for item in extractor.astream_all("Python was created by Guido."):
+            if not items:
+                first_at = len(sent)
+            items.append(item)
+        
+        assert first_at < len(sent)
+        assert [type(i).__name__ for i in items] == [
+            "ExtractedEntity", "ExtractedEntity", "ExtractedClaim", "ExtractedProcedure",
+        ]
+        assert extractor.total_tokens > 0
+        
+        # Second run is served from the cache without streaming
+        sent.clear()
+        again = [item async for item in extractor.astream_all("Python was created by Guido.")]
+        assert sent == []
+        assert again == items
+        cache.close()
+    
+    async def test_truncated_stream_not_cached(self, tmp_path):
+        """Test a stream that ends before the document closes is not cached."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 8192
+        provider.name = "mock"
+        provider.model = "test"
+        truncated = _SYNTHESIS_OUTPUT[:_SYNTHESIS_OUTPUT.index('"claims"')]
+        
+        async def astream(prompt, system=None):
+            yield truncated
+        
+        provider.astream = astream
+        with LLMResponseCache(tmp_path / "cache") as cache:
+            extractor = LLMExtractor(provider=provider, cache=cache)
+            items = [item async for item in extractor.astream_all("Python was created by Guido.")]
+            
+            assert [i.name for i in items] == ["Python", "Guido"]
+            assert len(cache) == 0
+
+
+class TestProviderRegistry:
+    """Tests for cached provider health and circuit breakers."""
+    
+    def _registry(self, *providers, **kwargs):
+        registry = ProviderRegistry(background=False, **kwargs)
+        for provider in providers:
+            registry.register(provider.name, lambda p=provider: p)
+        return registry
+    
+    def test_selection_is_cached(self):
+        """Test repeated selection does not re-probe providers."""
+        down, up = _FakeProvider("down", available=False), _FakeProvider("up")
+        registry = self._registry(down, up)
+        
+        for _ in range(100):
+            assert registry.get("auto") is up
+        
+        assert down.probes == 1
+        assert up.probes == 1
+        assert registry.get("down") is None
+    
+    def test_get_provider_uses_registry(self):
+        """Test get_provider only probes on first use."""
+        with patch.object(OllamaProvider, "is_available", return_value=True) as probe:
+            first = get_provider(name="auto")
+            second = get_provider(name="auto")
+        
+        assert first is second
+        assert probe.call_count == 1
+    
+    def test_breaker_opens_and_fails_over(self):
+        """Test request failures open the circuit and selection moves on."""
+        primary, backup = _FakeProvider("primary"), _FakeProvider("backup")
+        registry = self._registry(primary, backup, failure_threshold=2)
+        assert registry.get("auto") is primary
+        
+        primary.breaker.record_failure()
+        assert registry.get("auto") is primary
+        primary.breaker.record_failure()
+        assert registry.get("auto") is backup
+        
+        primary.breaker.record_success()
+        assert registry.get("auto") is primary
+    
+    def test_transport_errors_open_immediately(self):
+        """Test connection errors trip the breaker but bad requests don't."""
+        import httpx
+        
+        breaker = CircuitBreaker(failure_threshold=3)
+        request = httpx.Request("POST", "http://localhost")
+        
+        bad_request = httpx.HTTPStatusError(
+            "bad", request=request, response=httpx.Response(400, request=request)
+        )
+        for _ in range(5):
+            breaker.record_exception(bad_request)
+        assert breaker.state == CircuitBreaker.CLOSED
+        
+        breaker.record_exception(httpx.ConnectError("refused", request=request))
+        assert breaker.is_open
+    
+    def test_backoff_doubles(self):
+        """Test each failed re-probe doubles the wait before the next."""
+        breaker = CircuitBreaker(base_backoff=1.0, max_backoff=4.0)
+        
+        delays = []
+        for _ in range(4):
+            breaker.record_failure(immediate=True)
+            delays.append(round(breaker.retry_at - registry_module.time.monotonic()))
+        
+        assert delays == [1, 2, 4, 4]
+    
+    def test_background_reprobe_recovers(self):
+        """Test a provider that comes back is picked up by the background probe."""
+        import time
+        
+        primary, backup = _FakeProvider("primary", available=False), _FakeProvider("backup")
+        registry = ProviderRegistry(base_backoff=0.02, background=True)
+        registry.register("primary", lambda: primary)
+        registry.register("backup", lambda: backup)
+        
+        try:
+            assert registry.get("auto") is backup
+            primary.available = True
+            
+            deadline = time.monotonic() + 2.0
+            while registry.get("auto") is not primary and time.monotonic() < deadline:
+                time.sleep(0.01)
+            
+            assert registry.get("auto") is primary
+        finally:
+            registry.stop()
+    
+    def test_extractor_fails_over_mid_batch(self, httpx_mock, monkeypatch):
+        """Test a provider going down mid-batch fails over without re-probing."""
+        import httpx
+        
+        httpx_mock.add_response(
+            url="http://localhost:11434/api/tags",
+            json={"models": [{"name": "llama3.2:latest"}]},
+        )
+        httpx_mock.add_exception(
+            httpx.ConnectError("refused"), url="http://localhost:11434/api/chat"
+        )
+        for _ in range(2):
+            httpx_mock.add_response(
+                url="https://openrouter.ai/api/v1/chat/completions",
+                json=_openrouter_body('{"claims": []}'),
+            )
+        
+        registry = ProviderRegistry(background=False)
+        registry.register("ollama", OllamaProvider, local=True)
+        registry.register("openrouter", lambda: OpenRouterProvider(api_key="test-key"))
+        monkeypatch.setattr(registry_module, "_registry", registry)
+        
+        extractor = LLMExtractor()
+        assert extractor.provider.name == "ollama"
+        
+        extractor.extract_claims("First text.")
+        assert extractor.provider.name == "openrouter"
+        extractor.extract_claims("Second text.")
+        
+        chat_requests = [r for r in httpx_mock.get_requests() if "11434/api/chat" in str(r.url)]
+        assert len(chat_requests) == 1
+    
+    def test_extractor_does_not_fail_over_on_bad_output(self, monkeypatch):
+        """Test a response that does not parse is not retried on another provider."""
+        primary, backup = _FakeProvider("primary"), _FakeProvider("backup")
+        primary.complete_json = Mock(return_value={"claims": []})
+        backup.complete_json = Mock(side_effect=json.JSONDecodeError("bad", "", 0))
+        monkeypatch.setattr(registry_module, "_registry", self._registry(primary, backup))
+        
+        extractor = LLMExtractor()
+        extractor.provider = backup  # Failed over earlier; primary has since recovered
+        
+        assert extractor.extract_claims("Some text.") == []
+        assert extractor.provider is backup
+        primary.complete_json.assert_not_called()
+    
+    def test_requested_model_is_probed(self, httpx_mock, monkeypatch):
+        """Test asking for another Ollama model checks that model, not the default."""
+        for _ in range(2):
+            httpx_mock.add_response(
+                url="http://localhost:11434/api/tags",
+                json={"models": [{"name": "llama3.2:latest"}]},
+            )
+        registry = ProviderRegistry(background=False)
+        registry.register("ollama", OllamaProvider, local=True)
+        monkeypatch.setattr(registry_module, "_registry", registry)
+        
+        assert get_provider("ollama").model == "llama3.2"
+        with pytest.raises(RuntimeError, match="ollama pull mistral"):
+            get_provider("ollama", model="mistral")
+    
+    def test_model_availability_is_cached(self, httpx_mock, monkeypatch):
+        """Test a requested model is only checked once per probe interval."""
+        httpx_mock.add_response(
+            url="http://localhost:11434/api/tags",
+            json={"models": [{"name": "llama3.2:latest"}, {"name": "mistral:latest"}]},
+            is_reusable=True,
+        )
+        registry = ProviderRegistry(background=False)
+        registry.register("ollama", OllamaProvider, local=True)
+        monkeypatch.setattr(registry_module, "_registry", registry)
+        
+        for _ in range(5):
+            assert get_provider("ollama", model="mistral").model == "mistral"
+        
+        # One probe for the default model, one for the requested one
+        assert len(httpx_mock.get_requests()) == 2
+        assert registry.entry("ollama").models["mistral"][0] is True
+    
+    def test_extractor_fails_over_on_first_server_error(self, monkeypatch):
+        """Test one 5xx moves to another provider before the breaker opens."""
+        import httpx
+        
+        request = httpx.Request("POST", "http://primary")
+        server_error = httpx.HTTPStatusError(
+            "unavailable", request=request, response=httpx.Response(503, request=request)
+        )
+        primary, backup = _FakeProvider("primary"), _FakeProvider("backup")
+        primary.complete_json = Mock(side_effect=server_error)
+        backup.complete_json = Mock(return_value={"claims": []})
+        registry = self._registry(primary, backup, failure_threshold=3)
+        monkeypatch.setattr(registry_module, "_registry", registry)
+        
+        extractor = LLMExtractor()
+        assert extractor.provider is primary
+        
+        assert extractor.extract_claims("Some text.") == []
+        assert extractor.provider is backup
+        assert primary.breaker.state == CircuitBreaker.CLOSED
+        primary.complete_json.assert_called_once()
+
+
 class TestExtractedDataclasses:
     """Tests for extraction result dataclasses."""
     
@@ -366,6 +953,347 @@ class TestLLMExtractor:
         assert result.tokens_used == 500
 
 
+def _sentences(n: int) -> str:
+    return " ".join(f"Sentence number {i} talks about topic {i % 7}." for i in range(n))
+
+
+class TestChunking:
+    """Tests for token-aware text chunking."""
+    
+    def test_short_text_single_chunk(self):
+        """Test text under the limit stays whole."""
+        chunks = chunk_text("One sentence. Two sentences.", max_tokens=100)
+        
+        assert len(chunks) == 1
+        assert chunks[0].text == "One sentence. Two sentences."
+    
+    def test_chunks_respect_limit_and_boundaries(self):
+        """Test chunks fit the budget and split between sentences."""
+        text = _sentences(200)
+        
+        chunks = chunk_text(text, max_tokens=120, overlap_tokens=20)
+        
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.tokens <= 120
+            assert chunk.text.endswith(".")
+            assert text[chunk.start_char:chunk.end_char] == chunk.text
+        assert chunks[0].start_char == 0
+        assert chunks[-1].end_char == len(text)
+    
+    def test_consecutive_chunks_overlap(self):
+        """Test each chunk starts before the previous one ends."""
+        chunks = chunk_text(_sentences(200), max_tokens=120, overlap_tokens=30)
+        
+        for prev, chunk in zip(chunks, chunks[1:]):
+            assert prev.start_char < chunk.start_char < prev.end_char
+    
+    def test_segments_split_on_newlines(self):
+        """Test transcript segments without punctuation are chunk boundaries."""
+        text = "\n".join(f"segment {i} without punctuation" for i in range(100))
+        
+        chunks = chunk_text(text, max_tokens=60, overlap_tokens=0)
+        
+        assert all(chunk.text.startswith("segment") for chunk in chunks)
+        assert all(chunk.text.endswith("punctuation") for chunk in chunks)
+    
+    def test_oversized_sentence_split(self):
+        """Test a single sentence above the limit is split at whitespace."""
+        text = " ".join(f"word{i}" for i in range(2000))
+        
+        chunks = chunk_text(text, max_tokens=200, overlap_tokens=0)
+        
+        assert len(chunks) > 1
+        assert all(chunk.tokens <= 200 for chunk in chunks)
+        assert " ".join(chunk.text for chunk in chunks) == text
+
+
+class TestDeduplicate:
+    """Tests for cross-chunk deduplication."""
+    
+    def test_entities_and_claims_collapsed(self):
+        """Test repeated items collapse to the best copy."""
+        result = LLMExtractionResult(
+            entities=[
+                ExtractedEntity(name="Python", entity_type="PRODUCT", aliases=["py"], confidence=0.7),
+                ExtractedEntity(name="python ", entity_type="product", aliases=["python3"],
+                                description="A language", confidence=0.9),
+                ExtractedEntity(name="Python", entity_type="PERSON"),
+            ],
+            claims=[
+                ExtractedClaim(text="Python is popular.", confidence=0.6),
+                ExtractedClaim(text="python is  popular", confidence=0.8),
+            ],
+            tokens_used=10,
+        )
+        
+        deduped = result.deduplicate()
+        
+        assert len(deduped.entities) == 2
+        python = deduped.entities[0]
+        assert python.aliases == ["py", "python3"]
+        assert python.description == "A language"
+        assert python.confidence == 0.9
+        assert [c.confidence for c in deduped.claims] == [0.8]
+        assert deduped.tokens_used == 10
+        assert len(result.entities) == 3
+
+
+class TestChunkedExtraction:
+    """Tests for map-reduce extraction over long texts."""
+    
+    def test_long_text_fanned_out_and_merged(self):
+        """Test every chunk is extracted and shared entities are merged."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 8192
+        
+        def complete(prompt, system=None):
+            return LLMResponse(
+                content=json.dumps({
+                    "entities": [{"name": "Topic", "type": "CONCEPT"}],
+                    "claims": [{"text": f"Claim {len(prompt)}"}],
+                }),
+                model="test",
+                provider="mock",
+                tokens_used=100,
+            )
+        
+        provider.complete.side_effect = complete
+        text = _sentences(400)
+        
+        extractor = LLMExtractor(provider=provider, max_chunk_tokens=500)
+        result = extractor.extract_all(text)
+        
+        calls = provider.complete.call_count
+        assert calls == len(chunk_text(text, extractor.chunk_tokens, extractor.overlap_tokens))
+        assert calls > 1
+        assert len(result.entities) == 1
+        assert result.tokens_used == 100 * calls
+        assert extractor.total_tokens == 100 * calls
+        assert "Sentence number 399" in provider.complete.call_args_list[-1].args[0]
+    
+    def test_failed_chunks_recorded(self):
+        """Test a chunk that fails is reported while the others are kept."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 8192
+        
+        def complete(prompt, system=None):
+            if "Sentence number 0 " in prompt:
+                raise RuntimeError("model overloaded")
+            return LLMResponse(
+                content=json.dumps({"claims": [{"text": "Kept claim"}]}),
+                model="test",
+                provider="mock",
+                tokens_used=100,
+            )
+        
+        provider.complete.side_effect = complete
+        text = _sentences(400)
+        
+        extractor = LLMExtractor(provider=provider, max_chunk_tokens=500)
+        result = extractor.extract_all(text)
+        
+        assert result.errors == ["model overloaded"]
+        assert [c.text for c in result.claims] == ["Kept claim"]
+        assert extractor.total_tokens == 100 * (provider.complete.call_count - 1)
+    
+    def test_chunk_size_bounded_by_context_window(self):
+        """Test small context windows shrink the chunk size."""
+        provider = Mock(spec=LLMProvider)
+        provider.context_window = 4096
+        
+        extractor = LLMExtractor(provider=provider, max_chunk_tokens=100_000)
+        
+        assert extractor.chunk_tokens <= 4096 - 2048
+        assert extractor.chunk_tokens > 0
+
+
+def _fill_cache(path, worker: int) -> None:
+    with LLMResponseCache(path, max_bytes=10 * 1024 * 1024) as cache:
+        for i in range(50):
+            cache.put(f"w{worker}-{i}", LLMResponse(content="x" * 100, model="m", provider="p"))
+
+
+class TestLLMResponseCache:
+    """Tests for the persistent LLM response cache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        with LLMResponseCache(tmp_path / "llm", max_bytes=10 * 1024 * 1024) as c:
+            yield c
+    
+    def test_key_covers_all_inputs(self):
+        """Test every keyed input changes the key."""
+        base = cache_key("ollama", "llama3.2", "sys", "prompt", 0.0)
+        
+        assert base == cache_key("ollama", "llama3.2", "sys", "prompt", 0.0)
+        assert base != cache_key("openrouter", "llama3.2", "sys", "prompt", 0.0)
+        assert base != cache_key("ollama", "llama3.1", "sys", "prompt", 0.0)
+        assert base != cache_key("ollama", "llama3.2", "other", "prompt", 0.0)
+        assert base != cache_key("ollama", "llama3.2", "sys", "prompt!", 0.0)
+        assert base != cache_key("ollama", "llama3.2", "sys", "prompt", 0.7)
+    
+    def test_roundtrip_and_stats(self, cache):
+        """Test stored responses come back with their original cost."""
+        cache.put("k", LLMResponse(content="hi", model="m", provider="p",
+                                   tokens_used=42, cost_usd=0.5))
+        
+        assert cache.get("missing") is None
+        hit = cache.get("k")
+        
+        assert hit.content == "hi"
+        assert hit.tokens_used == 42
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.tokens_saved == 42
+    
+    def test_ttl_expiry(self, cache):
+        """Test expired entries are misses and free their space."""
+        with patch("inception.enhance.llm.cache.time.time", return_value=1000.0):
+            cache.put("k", LLMResponse(content="hi", model="m", provider="p"), ttl_seconds=60)
+        
+        with patch("inception.enhance.llm.cache.time.time", return_value=1059.0):
+            assert cache.get("k") is not None
+        with patch("inception.enhance.llm.cache.time.time", return_value=1061.0):
+            assert cache.get("k") is None
+            cache.flush()
+        
+        assert cache.stats.expired == 1
+        assert cache.total_bytes() == 0
+    
+    def test_hits_recorded_in_batches(self, cache):
+        """Test lookups only read, with hits written to the LRU index in batches."""
+        cache.TOUCH_BATCH = 2
+        for key in ("a", "b"):
+            cache.put(key, LLMResponse(content=key, model="m", provider="p"))
+        
+        with patch.object(LLMResponseCache, "_touch", autospec=True,
+                          side_effect=LLMResponseCache._touch) as touch:
+            cache.get("a")
+            cache.get("a")
+            cache.get("missing")
+            assert touch.call_count == 0
+            
+            cache.get("b")
+            assert [call.args[2] for call in touch.call_args_list] == [b"a", b"b"]
+            
+            cache.get("b")
+            cache.get("a")
+            assert [call.args[2] for call in touch.call_args_list[2:]] == [b"b", b"a"]
+    
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used entries are evicted over budget."""
+        with LLMResponseCache(tmp_path / "small", max_bytes=600) as cache:
+            for key in ("a", "b"):
+                cache.put(key, LLMResponse(content=key * 200, model="m", provider="p"))
+            cache.get("a")
+            cache.put("c", LLMResponse(content="c" * 200, model="m", provider="p"))
+            
+            assert cache.get("a") is not None
+            assert cache.get("b") is None
+            assert cache.get("c") is not None
+            assert cache.total_bytes() <= 600
+    
+    def test_concurrent_processes(self, tmp_path):
+        """Test writers in separate processes keep the index consistent."""
+        path = tmp_path / "shared"
+        LLMResponseCache(path).close()
+        
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_fill_cache, args=(path, w)) for w in range(3)]
+        for proc in workers:
+            proc.start()
+        for proc in workers:
+            proc.join(timeout=60)
+        
+        assert all(proc.exitcode == 0 for proc in workers)
+        with LLMResponseCache(path) as cache:
+            assert len(cache) == 150
+            sizes = cache.total_bytes()
+            cache.clear()
+            assert sizes > 0
+            assert cache.total_bytes() == 0
+
+
+class TestExtractorCache:
+    """Tests for cached extraction."""
+    
+    @pytest.fixture
+    def provider(self):
+        provider = Mock(spec=LLMProvider)
+        provider.name = "mock"
+        provider.model = "mock-1"
+        provider.complete.return_value = LLMResponse(
+            content=json.dumps({"entities": [{"name": "Python", "type": "PRODUCT"}]}),
+            model="mock-1",
+            provider="mock",
+            tokens_used=300,
+            cost_usd=0.02,
+        )
+        provider.complete_json.return_value = {"claims": [{"text": "Python is popular"}]}
+        return provider
+    
+    def test_rerun_served_from_cache(self, provider, tmp_path):
+        """Test re-running on unchanged text costs nothing."""
+        with LLMResponseCache(tmp_path / "llm") as cache:
+            first = LLMExtractor(provider=provider, cache=cache)
+            first.extract_all("Python is great")
+            
+            second = LLMExtractor(provider=provider, cache=cache)
+            result = second.extract_all("Python is great")
+        
+        assert provider.complete.call_count == 1
+        assert [e.name for e in result.entities] == ["Python"]
+        assert first.total_tokens == 300
+        assert second.total_tokens == 0
+        assert second.total_cost == 0.0
+        assert second.cache_stats.hits == 1
+        assert second.cache_stats.tokens_saved == 300
+        assert second.cache_stats.cost_saved == 0.02
+    
+    def test_json_methods_cached(self, provider, tmp_path):
+        """Test per-type extraction methods use the cache too."""
+        with LLMResponseCache(tmp_path / "llm") as cache:
+            extractor = LLMExtractor(provider=provider, cache=cache)
+            with patch.object(extractor, "_cache_key", wraps=extractor._cache_key) as key:
+                extractor.extract_claims("Python is popular")
+                claims = extractor.extract_claims("Python is popular")
+        
+        assert key.call_count == 2  # Once per call, shared by lookup and store
+        assert provider.complete_json.call_count == 1
+        assert claims[0].text == "Python is popular"
+        assert extractor.cache_stats.misses == 1
+        assert extractor.cache_stats.hits == 1
+    
+    def test_model_change_misses(self, provider, tmp_path):
+        """Test switching models does not reuse responses."""
+        with LLMResponseCache(tmp_path / "llm") as cache:
+            LLMExtractor(provider=provider, cache=cache).extract_all("Python is great")
+            provider.model = "mock-2"
+            LLMExtractor(provider=provider, cache=cache).extract_all("Python is great")
+        
+        assert provider.complete.call_count == 2
+    
+    def test_malformed_response_not_cached(self, provider, tmp_path):
+        """Test a completion that fails to parse is requested again next run."""
+        good = provider.complete.return_value
+        provider.complete.return_value = LLMResponse(
+            content='{"entities": [', model="mock-1", provider="mock",
+        )
+        
+        with LLMResponseCache(tmp_path / "llm") as cache:
+            failed = LLMExtractor(provider=provider, cache=cache).extract_all("Python is great")
+            assert len(cache) == 0
+            
+            provider.complete.return_value = good
+            result = LLMExtractor(provider=provider, cache=cache).extract_all("Python is great")
+            assert len(cache) == 1
+        
+        assert failed.entities == []
+        assert provider.complete.call_count == 2
+        assert [e.name for e in result.entities] == ["Python"]
+
+
 class TestPromptFormatting:
     """Tests for prompt formatting."""
     
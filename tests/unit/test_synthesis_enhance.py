@@ -133,6 +133,70 @@ class TestClaimMatcher:
         
         # Should find match between claims 1 and 2
         assert len(matches) >= 1
+    
+    def test_find_matches_overlap_candidates_exact(self):
+        """Test prefix-filtered candidates find the same pairs as all-pairs matching."""
+        import random
+        from inception.enhance.synthesis.fusion.matcher import ClaimMatcher, ClaimInfo
+        
+        rng = random.Random(7)
+        vocab = [f"w{i}" for i in range(30)]
+        claims = [
+            ClaimInfo(nid=i, text=" ".join(rng.sample(vocab, rng.randint(3, 8))))
+            for i in range(60)
+        ]
+        
+        matcher = ClaimMatcher()
+        expected = {
+            (a.nid, b.nid): matcher.match(a, b).similarity
+            for i, a in enumerate(claims) for b in claims[i + 1:]
+            if matcher.match(a, b).similarity >= 0.3
+        }
+        
+        matches = ClaimMatcher().find_matches(claims, threshold=0.3, top_k=len(claims))
+        
+        assert {(m.claim1_nid, m.claim2_nid): m.similarity for m in matches} == expected
+        assert [m.similarity for m in matches] == sorted(expected.values(), reverse=True)
+    
+    def test_find_matches_embedding_top_k(self):
+        """Test embedding candidates keep each claim's nearest neighbors."""
+        import numpy as np
+        from inception.enhance.synthesis.fusion.matcher import ClaimMatcher, ClaimInfo, MatchType
+        
+        rng = np.random.default_rng(0)
+        centers = rng.normal(size=(10, 16))
+        claims = []
+        for i in range(100):
+            vector = centers[i % 10] + rng.normal(scale=0.01, size=16)
+            claims.append(ClaimInfo(nid=i, text=f"claim {i}", embedding=vector.tolist()))
+        
+        matches = ClaimMatcher().find_matches(claims, threshold=0.9, top_k=9)
+        
+        # Each claim's 9 near-duplicates are exactly its cluster
+        pairs = {(m.claim1_nid, m.claim2_nid) for m in matches}
+        assert pairs == {
+            (i, j) for i in range(100) for j in range(i + 1, 100) if i % 10 == j % 10
+        }
+        assert all(m.match_type == MatchType.IDENTICAL for m in matches)
+    
+    def test_find_matches_batch_encodes_once(self):
+        """Test missing embeddings are encoded in one batch call."""
+        from inception.enhance.synthesis.fusion.matcher import ClaimMatcher, ClaimInfo
+        
+        class _Model:
+            calls = 0
+            
+            def encode_batch(self, texts):
+                self.calls += 1
+                return [[1.0, float(len(t))] for t in texts]
+        
+        model = _Model()
+        claims = [ClaimInfo(nid=i, text="x" * (i + 1)) for i in range(5)]
+        
+        matches = ClaimMatcher(embedding_model=model).find_matches(claims, threshold=0.5)
+        
+        assert model.calls == 1
+        assert len(matches) == 10
 
 
 class TestUncertainty:
@@ -179,6 +243,183 @@ class TestUncertainty:
         
         assert stats.claims_fused == 2
         assert stats.uncertainty_reduction > 0
+    
+    def _ragged_groups(self, seed=3):
+        """Random groups including empty, single-claim, zero-std and zero-weight claims."""
+        import random
+        from inception.enhance.synthesis.fusion.uncertainty import UncertainClaim
+        
+        rng = random.Random(seed)
+        groups = [[], [UncertainClaim(nid=0, text="", mean_confidence=0.3, std_confidence=0.0)]]
+        for g in range(200):
+            groups.append([
+                UncertainClaim(
+                    nid=i, text="",
+                    mean_confidence=rng.random(),
+                    std_confidence=rng.choice([0.0, rng.uniform(0.01, 0.5)]),
+                    source_weight=rng.choice([0.0, rng.uniform(0.1, 2.0)]),
+                )
+                for i in range(rng.choice([0, 1, 2, 3, 17, 40]))
+            ])
+        groups.append([UncertainClaim(nid=1, text="", source_weight=0.0)] * 3)
+        
+        flat = [c for group in groups for c in group]
+        offsets = [0]
+        for group in groups:
+            offsets.append(offsets[-1] + len(group))
+        return groups, flat, offsets
+    
+    def test_bayesian_fuse_segments_identical(self):
+        """Test the segmented Bayesian kernel matches bayesian_fuse bit for bit."""
+        import numpy as np
+        from inception.enhance.synthesis.fusion.uncertainty import bayesian_fuse, bayesian_fuse_segments
+        
+        groups, flat, offsets = self._ragged_groups()
+        
+        means, stds = bayesian_fuse_segments(
+            np.array([c.mean_confidence for c in flat]),
+            np.array([c.std_confidence for c in flat]),
+            np.array([c.source_weight for c in flat]),
+            offsets,
+        )
+        
+        expected = [bayesian_fuse(group) for group in groups]
+        assert means.tolist() == [e.mean_confidence for e in expected]
+        assert stds.tolist() == [e.std_confidence for e in expected]
+    
+    def test_entropy_fusion_segments_identical(self):
+        """Test the segmented entropy kernel matches entropy_fusion bit for bit."""
+        import numpy as np
+        from inception.enhance.synthesis.fusion.uncertainty import entropy_fusion, entropy_fusion_segments
+        
+        groups, flat, offsets = self._ragged_groups(seed=5)
+        
+        means, stds = entropy_fusion_segments(
+            np.array([c.mean_confidence for c in flat]),
+            np.array([c.std_confidence for c in flat]),
+            offsets,
+        )
+        
+        expected = [entropy_fusion(group) for group in groups]
+        assert means.tolist() == [e.mean_confidence for e in expected]
+        assert stds.tolist() == [e.std_confidence for e in expected]
+    
+    def test_dempster_shafer_segments_identical(self):
+        """Test the segmented Dempster-Shafer fold matches reducing the pairwise rule."""
+        import random
+        from functools import reduce
+        import numpy as np
+        from inception.enhance.synthesis.fusion.uncertainty import (
+            dempster_shafer_combine, dempster_shafer_combine_segments
+        )
+        
+        rng = random.Random(11)
+        groups = []
+        for _ in range(300):
+            group = []
+            for _ in range(rng.choice([0, 1, 2, 5, 12])):
+                belief = rng.choice([0.0, 1.0, rng.random()])
+                group.append((belief, rng.uniform(belief, 1.0)))
+            groups.append(group)
+        flat = [pair for group in groups for pair in group]
+        offsets = np.cumsum([0] + [len(g) for g in groups])
+        
+        beliefs, plausibilities = dempster_shafer_combine_segments(
+            np.array([b for b, _ in flat]), np.array([p for _, p in flat]), offsets,
+        )
+        
+        expected = [reduce(dempster_shafer_combine, g) if g else (0.0, 1.0) for g in groups]
+        assert list(zip(beliefs.tolist(), plausibilities.tolist())) == expected
+    
+    def test_fusion_stats_segments_identical(self):
+        """Test the segmented stats match compute_fusion_stats per group."""
+        import numpy as np
+        from inception.enhance.synthesis.fusion.uncertainty import (
+            bayesian_fuse, compute_fusion_stats, compute_fusion_stats_segments
+        )
+        
+        groups, flat, offsets = self._ragged_groups(seed=9)
+        fused = [bayesian_fuse(group) for group in groups]
+        
+        stats = compute_fusion_stats_segments(
+            np.array([c.std_confidence for c in flat]),
+            offsets,
+            np.array([f.std_confidence for f in fused]),
+        )
+        
+        for g, group in enumerate(groups):
+            expected = compute_fusion_stats(group, fused[g])
+            assert stats["claims_fused"][g] == expected.claims_fused
+            assert stats["original_uncertainty"][g] == expected.original_uncertainty
+            assert stats["fused_uncertainty"][g] == expected.fused_uncertainty
+            assert stats["uncertainty_reduction"][g] == expected.uncertainty_reduction
+    
+    def test_segments_long_groups_identical(self):
+        """Test groups reduced on their own still match the scalar functions bit for bit."""
+        import numpy as np
+        from functools import reduce
+        from inception.enhance.synthesis.fusion.uncertainty import (
+            UncertainClaim,
+            bayesian_fuse,
+            bayesian_fuse_segments,
+            dempster_shafer_combine,
+            dempster_shafer_combine_segments,
+            entropy_fusion,
+            entropy_fusion_segments,
+        )
+        
+        rng = np.random.default_rng(2)
+        offsets = np.array([0, 3, 50_003, 50_010, 60_010])
+        n = int(offsets[-1])
+        means, stds = rng.random(n), rng.uniform(0.01, 0.5, n)
+        weights = rng.uniform(0.1, 2.0, n)
+        beliefs, plausibilities = rng.uniform(0.0, 0.3, n), rng.uniform(0.7, 1.0, n)
+        
+        claims = [
+            UncertainClaim(nid=i, text="", mean_confidence=m, std_confidence=s, source_weight=w)
+            for i, (m, s, w) in enumerate(zip(means.tolist(), stds.tolist(), weights.tolist()))
+        ]
+        pairs = list(zip(beliefs.tolist(), plausibilities.tolist()))
+        bounds = list(zip(offsets[:-1].tolist(), offsets[1:].tolist()))
+        
+        fused = bayesian_fuse_segments(means, stds, weights, offsets)
+        expected = [bayesian_fuse(claims[a:b]) for a, b in bounds]
+        assert fused[0].tolist() == [e.mean_confidence for e in expected]
+        assert fused[1].tolist() == [e.std_confidence for e in expected]
+        
+        fused = entropy_fusion_segments(means, stds, offsets)
+        expected = [entropy_fusion(claims[a:b]) for a, b in bounds]
+        assert fused[0].tolist() == [e.mean_confidence for e in expected]
+        assert fused[1].tolist() == [e.std_confidence for e in expected]
+        
+        fused = dempster_shafer_combine_segments(beliefs, plausibilities, offsets)
+        expected = [reduce(dempster_shafer_combine, pairs[a:b]) for a, b in bounds]
+        assert list(zip(fused[0].tolist(), fused[1].tolist())) == expected
+    
+    def test_segments_offsets_need_not_start_at_zero(self):
+        """Test kernels fuse a sub-range of the claim arrays."""
+        import numpy as np
+        from inception.enhance.synthesis.fusion.uncertainty import (
+            bayesian_fuse_segments,
+            entropy_fusion_segments,
+        )
+        
+        groups, flat, offsets = self._ragged_groups(seed=7)
+        means = np.array([0.9] * 5 + [c.mean_confidence for c in flat] + [0.1] * 4)
+        stds = np.array([0.2] * 5 + [c.std_confidence for c in flat] + [0.3] * 4)
+        weights = np.array([1.0] * 5 + [c.source_weight for c in flat] + [1.0] * 4)
+        shifted = np.asarray(offsets) + 5
+        
+        for fused, expected in [
+            (entropy_fusion_segments(means, stds, shifted), entropy_fusion_segments(
+                means[5:-4], stds[5:-4], offsets
+            )),
+            (bayesian_fuse_segments(means, stds, weights, shifted), bayesian_fuse_segments(
+                means[5:-4], stds[5:-4], weights[5:-4], offsets
+            )),
+        ]:
+            assert fused[0].tolist() == expected[0].tolist()
+            assert fused[1].tolist() == expected[1].tolist()
 
 
 class TestConflictResolver:
@@ -241,6 +482,292 @@ class TestFusionEngine:
         
         assert result.claims_processed == 2
         assert len(result.fused_claims) >= 1
+    
+    def test_cluster_claims_transitive(self):
+        """Test agreeing matches merge transitively and conflicts are bucketed."""
+        from inception.enhance.synthesis.fusion.engine import FusionEngine
+        from inception.enhance.synthesis.fusion.matcher import ClaimInfo, MatchResult, MatchType
+        
+        claims = [ClaimInfo(nid=n, text=f"claim {n}") for n in (1, 2, 3, 4, 5, 6)]
+        matches = [
+            MatchResult(1, 2, MatchType.PARAPHRASE, 0.9, 0.85),
+            MatchResult(3, 4, MatchType.IDENTICAL, 0.99, 0.95),
+            MatchResult(2, 3, MatchType.SUBSUMES, 0.7, 0.7),
+            MatchResult(5, 6, MatchType.RELATED, 0.7, 0.6),
+            MatchResult(4, 5, MatchType.CONTRADICTS, 0.9, 0.85),
+        ]
+        
+        clusters, conflicts = FusionEngine()._cluster_claims(claims, matches)
+        
+        assert [[c.nid for c in cluster] for cluster in clusters] == [[1, 2, 3, 4], [5], [6]]
+        assert [len(c) for c in conflicts] == [1, 1, 0]
+        assert conflicts[0][0] is matches[4]
+    
+    def test_union_find(self):
+        """Test union-find merges and finds roots."""
+        from inception.enhance.synthesis.fusion.engine import UnionFind
+        
+        sets = UnionFind(6)
+        sets.union(0, 1)
+        sets.union(2, 3)
+        sets.union(1, 3)
+        
+        assert len({sets.find(i) for i in range(4)}) == 1
+        assert sets.find(4) != sets.find(5)
+
+
+class TestIncrementalFusionJob:
+    """Tests for incremental fusion over the claim store."""
+    
+    @pytest.fixture
+    def db(self, tmp_path):
+        from inception.config import Config
+        from inception.db import InceptionDB
+        
+        config = Config()
+        config.lmdb.path = tmp_path / "db"
+        db = InceptionDB(config=config)
+        yield db
+        db.close()
+    
+    def _add_claim(self, db, text, source_nid=100):
+        from inception.db.keys import NodeKind
+        from inception.db.records import NodeRecord
+        
+        nid = db.allocate_nid()
+        db.put_node(NodeRecord(
+            nid=nid, kind=NodeKind.CLAIM, payload={"text": text}, source_nids=[source_nid],
+        ))
+        return nid
+    
+    def _fused_members(self, db):
+        from inception.enhance.synthesis.fusion.job import is_fused_claim
+        
+        return sorted(
+            sorted(node.payload["fused_from"])
+            for node in db.iter_nodes() if is_fused_claim(node)
+        )
+    
+    def test_fuses_and_persists(self, db):
+        """Test fused claims are written as nodes with SAME_AS edges."""
+        from inception.db.keys import EdgeType
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        a = self._add_claim(db, "Python was released in 1991", source_nid=100)
+        b = self._add_claim(db, "Python was released in 1991", source_nid=101)
+        self._add_claim(db, "Rust guarantees memory safety")
+        
+        result = IncrementalFusionJob(db=db, max_workers=1).run()
+        
+        assert result.new_claims == 3
+        assert result.fused_nodes == 1
+        assert self._fused_members(db) == [[a, b]]
+        
+        (_, fused_nid, _), = db.get_edges_from(a, EdgeType.SAME_AS)
+        fused = db.get_node(fused_nid)
+        assert fused.verification_state == "corroborated"
+        assert db.get_edges_from(b, EdgeType.SAME_AS)[0][1] == fused_nid
+    
+    def test_only_touched_clusters_refused(self, db):
+        """Test a later run re-fuses just the cluster its new claims match."""
+        from inception.db.keys import EdgeType
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        a = self._add_claim(db, "Python was released in 1991")
+        b = self._add_claim(db, "Python was released in 1991")
+        c = self._add_claim(db, "Rust guarantees memory safety")
+        d = self._add_claim(db, "Rust guarantees memory safety")
+        
+        job = IncrementalFusionJob(db=db, max_workers=1)
+        job.run()
+        
+        assert job.run().new_claims == 0
+        
+        e = self._add_claim(db, "Python was released in 1991")
+        result = job.run()
+        
+        assert result.new_claims == 1
+        assert result.groups == 1
+        assert result.replaced_nodes == 1
+        assert self._fused_members(db) == [[a, b, e], [c, d]]
+        assert len(db.get_edges_from(a, EdgeType.SAME_AS)) == 1
+    
+    def test_new_job_resumes_from_watermark(self, db):
+        """Test a fresh job (e.g. a new process) only fuses claims past the watermark."""
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        self._add_claim(db, "Python was released in 1991")
+        self._add_claim(db, "Python was released in 1991")
+        IncrementalFusionJob(db=db, max_workers=1).run()
+        
+        result = IncrementalFusionJob(db=db, max_workers=1).run()
+        
+        assert result.new_claims == 0
+        assert result.fused_nodes == 0
+    
+    def test_conflicts_persisted(self, db):
+        """Test conflicts found during fusion become CONTRADICTS edges."""
+        from inception.db.keys import EdgeType
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        a = self._add_claim(db, "Python is statically typed")
+        b = self._add_claim(db, "Python is not statically typed")
+        
+        result = IncrementalFusionJob(db=db, max_workers=1).run()
+        
+        assert result.unresolved_conflicts >= 1
+        (_, to_nid, edge), = db.get_edges_from(a, EdgeType.CONTRADICTS)
+        assert to_nid == b
+        assert edge.polarity == -1
+        assert edge.metadata["fusion"] and not edge.metadata["resolved"]
+    
+    def test_independent_groups_in_process_pool(self, db):
+        """Test independent groups are fused in worker processes."""
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        a = self._add_claim(db, "Python was released in 1991")
+        b = self._add_claim(db, "Python was released in 1991")
+        c = self._add_claim(db, "Rust guarantees memory safety")
+        d = self._add_claim(db, "Rust guarantees memory safety")
+        
+        result = IncrementalFusionJob(db=db, max_workers=2).run()
+        
+        assert result.groups == 2
+        assert self._fused_members(db) == [[a, b], [c, d]]
+    
+    def test_new_job_only_encodes_new_claims(self, db):
+        """Test embeddings are stored, so a fresh job encodes just the new claims."""
+        from inception.enhance.synthesis.fusion.engine import FusionEngine
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        from inception.enhance.synthesis.fusion.matcher import ClaimMatcher
+        
+        class _Model:
+            def __init__(self):
+                self.encoded = []
+            
+            def encode_batch(self, texts):
+                self.encoded.extend(texts)
+                return [[1.0, 0.0] if "Python" in t else [0.0, 1.0] for t in texts]
+        
+        def job(model):
+            engine = FusionEngine(claim_matcher=ClaimMatcher(embedding_model=model))
+            return IncrementalFusionJob(db=db, engine=engine, max_workers=1)
+        
+        a = self._add_claim(db, "Python was released in 1991")
+        b = self._add_claim(db, "Python was first released in 1991")
+        c = self._add_claim(db, "Rust guarantees memory safety")
+        job(_Model()).run()
+        
+        e = self._add_claim(db, "Python was released in February 1991")
+        model = _Model()
+        result = job(model).run()
+        
+        assert model.encoded == ["Python was released in February 1991"]
+        assert result.replaced_nodes == 1
+        assert self._fused_members(db) == [[a, b, e]]
+    
+    def test_index_candidates_cover_overlap_matches(self, db):
+        """Test probing the word index finds every match a full scan finds."""
+        import random
+        
+        from inception.enhance.synthesis.fusion.index import ClaimIndex
+        from inception.enhance.synthesis.fusion.matcher import ClaimInfo, ClaimMatcher
+        
+        rng = random.Random(0)
+        vocabulary = [f"w{i}" for i in range(30)]
+        claims = [
+            ClaimInfo(nid=i, text=" ".join(rng.sample(vocabulary, rng.randint(3, 8))))
+            for i in range(1, 301)
+        ]
+        index = ClaimIndex(db)
+        index.add(claims)
+        
+        matcher = ClaimMatcher()
+        new = claims[-20:]
+        queries = [c.nid for c in new]
+        expected = matcher.find_matches(claims, threshold=0.5, top_k=300, queries=queries)
+        found = matcher.find_matches(
+            index.candidates(new, 0.5), threshold=0.5, top_k=300, queries=queries,
+        )
+        
+        assert expected
+        assert {(m.claim1_nid, m.claim2_nid) for m in found} == {
+            (m.claim1_nid, m.claim2_nid) for m in expected
+        }
+    
+    def test_vector_candidates_cover_embedding_matches(self, db, monkeypatch):
+        """Test scoring new claims against the stored vectors finds every dense match."""
+        import numpy as np
+        
+        from inception.enhance.synthesis.fusion import index as index_module
+        from inception.enhance.synthesis.fusion.engine import FusionEngine
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        from inception.enhance.synthesis.fusion.matcher import ClaimInfo, ClaimMatcher
+        
+        monkeypatch.setattr(index_module, "VECTOR_BLOCK", 16)
+        rng = np.random.default_rng(4)
+        centers = rng.normal(size=(12, 8))
+        claims = [
+            ClaimInfo(
+                nid=i, text=f"claim {i}",
+                embedding=(centers[i % 12] + rng.normal(scale=0.3, size=8)).tolist(),
+            )
+            for i in range(1, 201)
+        ]
+        engine = FusionEngine(claim_matcher=ClaimMatcher(embedding_model=MagicMock()))
+        job = IncrementalFusionJob(db=db, engine=engine, top_k=5, threshold=0.8)
+        for start in range(0, 200, 30):  # Partly filled blocks get topped up
+            job.index.add(claims[start:start + 30])
+        assert job.index.vector_count() == 200
+        
+        matcher = ClaimMatcher()
+        new = claims[-20:]
+        queries = [c.nid for c in new]
+        expected = matcher.find_matches(claims, threshold=0.8, top_k=5, queries=queries)
+        candidates = job._candidates(new)
+        found = matcher.find_matches(candidates, threshold=0.8, top_k=5, queries=queries)
+        
+        assert expected
+        assert len(candidates) < len(claims)
+        assert {(m.claim1_nid, m.claim2_nid) for m in found} == {
+            (m.claim1_nid, m.claim2_nid) for m in expected
+        }
+    
+    def test_fused_claims_not_counted_as_claims(self, db):
+        """Test fused claims get their own node kind."""
+        from inception.db.keys import NodeKind
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        
+        self._add_claim(db, "Python was released in 1991", source_nid=100)
+        self._add_claim(db, "Python was released in 1991", source_nid=101)
+        
+        IncrementalFusionJob(db=db, max_workers=1).run()
+        
+        kinds = [node.kind for node in db.iter_nodes()]
+        assert kinds.count(NodeKind.CLAIM) == 2
+        assert kinds.count(NodeKind.FUSED_CLAIM) == 1
+    
+    def test_workers_get_engine_settings(self, db):
+        """Test worker processes fuse with the caller's resolver and matcher settings."""
+        import pickle
+        
+        from inception.enhance.synthesis.fusion.engine import FusionEngine
+        from inception.enhance.synthesis.fusion.job import IncrementalFusionJob
+        from inception.enhance.synthesis.fusion.matcher import ClaimMatcher
+        from inception.enhance.synthesis.fusion.resolver import ConflictResolver, ResolutionStrategy
+        
+        engine = FusionEngine(
+            claim_matcher=ClaimMatcher(embedding_model=MagicMock(), use_llm_for_contradiction=True),
+            conflict_resolver=ConflictResolver(default_strategy=ResolutionStrategy.SPECIFICITY),
+        )
+        job = IncrementalFusionJob(db=db, engine=engine, max_workers=2)
+        
+        worker = pickle.loads(pickle.dumps(job._worker_engine()))
+        
+        assert worker.conflict_resolver.default_strategy == ResolutionStrategy.SPECIFICITY
+        assert worker.claim_matcher._use_llm
+        assert worker.claim_matcher._embedding_model is None  # Claims arrive embedded
+        assert engine.claim_matcher._embedding_model is not None
 
 
 # ==============================================================================
@@ -332,7 +859,7 @@ class TestOntologyLinker:
         """Test batch linking."""
         from inception.enhance.synthesis.ontology.linker import OntologyLinker
         
-        linker = OntologyLinker()
+        linker = OntologyLinker(cache=False)
         
         # Mock the clients
         linker.wikidata.search = MagicMock(return_value=[])
@@ -346,6 +873,329 @@ class TestOntologyLinker:
         result = linker.link_entities(entities)
         
         assert result.total_entities == 2
+    
+    def test_link_entities_concurrent(self, kb_server):
+        """Test each distinct name is looked up once per knowledge base."""
+        linker = kb_server.linker()
+        
+        entities = [(i, f"Entity {i % 20}", "concept") for i in range(60)]
+        entities += [(100, "ENTITY  3", "Concept"), (101, "nil thing", "concept")]
+        progress = []
+        
+        result = linker.link_entities(entities, progress_callback=lambda done, total: progress.append(done))
+        
+        assert result.total_entities == 62
+        assert result.linked_count == 61
+        assert result.nil_count == 1
+        assert kb_server.requests["/w/api.php"] == 21
+        assert kb_server.requests["/api/search"] == 21
+        assert progress[-1] == 62
+        assert progress == sorted(progress)
+        
+        by_nid = {e.nid: e for e in result.linked_entities}
+        assert by_nid[100].wikidata_qid == by_nid[3].wikidata_qid
+        assert by_nid[100].name == "ENTITY  3"
+        assert by_nid[3].dbpedia_uri.endswith("Entity_3")
+        assert by_nid[3].schema_org_type == "https://schema.org/Thing"
+        assert by_nid[101].is_nil
+    
+    def test_persistent_cache_rerun(self, kb_server, tmp_path):
+        """Test a re-run with a fresh linker is answered from the link cache."""
+        from inception.enhance.synthesis.ontology import LinkCache
+        
+        entities = [(i, f"Entity {i}", "person") for i in range(30)]
+        entities.append((30, "nil person", "person"))
+        
+        with LinkCache(tmp_path / "links") as cache:
+            first = kb_server.linker(cache=cache).link_entities(entities)
+            assert len(cache) == 31
+        
+        requests = sum(kb_server.requests.values())
+        with LinkCache(tmp_path / "links") as cache:
+            second = kb_server.linker(cache=cache).link_entities(entities)
+            assert cache.stats.hits == 31
+            assert cache.stats.nil_hits == 1
+        
+        assert sum(kb_server.requests.values()) == requests
+        assert [(e.wikidata_qid, e.dbpedia_uri, e.is_nil) for e in second.linked_entities] == [
+            (e.wikidata_qid, e.dbpedia_uri, e.is_nil) for e in first.linked_entities
+        ]
+    
+    def test_failed_lookup_not_cached(self, kb_server, tmp_path):
+        """Test a server error is reported, not cached as NIL."""
+        from inception.enhance.synthesis.ontology import LinkCache
+        
+        with LinkCache(tmp_path / "links") as cache:
+            linker = kb_server.linker(cache=cache)
+            
+            entity = linker.link_entity(1, "failing name", "concept")
+            assert not entity.is_nil
+            assert not entity.is_linked
+            assert entity.metadata["link_errors"]
+            assert len(cache) == 0
+            
+            linker.link_entity(2, "failing name", "concept")
+            assert kb_server.requests["/w/api.php"] == 2
+    
+    def test_default_persistent_cache(self, kb_server, tmp_path, monkeypatch):
+        """Test linkers share the global link cache unless told not to."""
+        from inception.config import get_config
+        from inception.enhance.synthesis.ontology import close_link_cache, get_link_cache
+        
+        monkeypatch.setattr(get_config(), "cache_dir", tmp_path)
+        close_link_cache()
+        try:
+            linker = kb_server.linker(cache=True)
+            assert linker.cache is get_link_cache()
+            assert linker.cache.path == tmp_path / "links"
+            
+            linker.link_entity(1, "Entity 1", "concept")
+            requests = sum(kb_server.requests.values())
+            kb_server.linker(cache=True).link_entity(2, "Entity 1", "concept")
+            
+            assert sum(kb_server.requests.values()) == requests
+            assert kb_server.linker(cache=False).cache is None
+        finally:
+            close_link_cache()
+    
+    def test_memory_layer_bounded(self, kb_server):
+        """Test the in-memory decision layer evicts the least recently used."""
+        linker = kb_server.linker()
+        linker.MEMORY_ENTRIES = 5
+        
+        linker.link_entities([(i, f"Entity {i}", "concept") for i in range(20)])
+        
+        assert len(linker._cache) == 5
+        requests = sum(kb_server.requests.values())
+        linker.link_entity(20, "Entity 19", "concept")
+        assert sum(kb_server.requests.values()) == requests
+    
+    def test_rate_limited_retry(self, kb_server):
+        """Test 429 responses are retried after Retry-After."""
+        kb_server.rate_limited = 3
+        linker = kb_server.linker()
+        
+        entity = linker.link_entity(1, "Entity 1", "concept")
+        
+        assert entity.wikidata_qid
+        assert entity.dbpedia_uri
+        assert sum(kb_server.requests.values()) == 5
+
+
+class TestLinkCache:
+    """Tests for the persistent LinkCache and endpoint rate limits."""
+    
+    def _fields(self, qid=None, is_nil=False):
+        return {
+            "wikidata_qid": qid,
+            "wikidata_label": "Label" if qid else "",
+            "dbpedia_uri": None,
+            "dbpedia_label": "",
+            "linking_confidence": 0.8 if qid else 0.0,
+            "is_nil": is_nil,
+        }
+    
+    def test_key_normalization(self):
+        """Test keys ignore case and spacing."""
+        from inception.enhance.synthesis.ontology.cache import link_cache_key
+        
+        assert link_cache_key("New  York", "City") == link_cache_key("new york", " city ")
+        assert link_cache_key("Paris", "city") != link_cache_key("Paris", "person")
+    
+    def test_roundtrip_and_reopen(self, tmp_path):
+        """Test entries persist across reopening the cache."""
+        from inception.enhance.synthesis.ontology import LinkCache
+        
+        with LinkCache(tmp_path) as cache:
+            cache.put("paris\0city", self._fields("Q90"))
+            cache.put_many([("nowhere\0city", self._fields(is_nil=True))])
+        
+        with LinkCache(tmp_path) as cache:
+            assert cache.get("paris\0city")["wikidata_qid"] == "Q90"
+            assert cache.get("nowhere\0city")["is_nil"]
+            assert cache.get("london\0city") is None
+            assert cache.stats.hits == 2
+            assert cache.stats.misses == 1
+    
+    def test_nil_ttl(self, tmp_path):
+        """Test NIL entries expire on their own, shorter TTL."""
+        import time
+        from inception.enhance.synthesis.ontology import LinkCache
+        
+        with LinkCache(tmp_path, ttl_seconds=3600, nil_ttl_seconds=0.01) as cache:
+            cache.put("paris\0city", self._fields("Q90"))
+            cache.put("nowhere\0city", self._fields(is_nil=True))
+            time.sleep(0.05)
+            
+            found = cache.get_many(["paris\0city", "nowhere\0city"])
+            assert list(found) == ["paris\0city"]
+            assert cache.stats.expired == 1
+            
+            assert cache.purge_expired() == 1
+            assert len(cache) == 1
+    
+    def test_rate_limiter_spacing(self):
+        """Test the shared limiter spaces requests across threads."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+        from inception.enhance.synthesis.ontology.throttle import RateLimiter
+        
+        limiter = RateLimiter(rate=100)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda _: limiter.wait(), range(21)))
+        
+        assert time.monotonic() - start >= 0.19
+    
+    def test_rate_limiter_rate_change(self, caplog):
+        """Test asking for a different rate updates the shared limiter and warns."""
+        from inception.enhance.synthesis.ontology.throttle import get_rate_limiter
+        
+        endpoint = "http://kb.invalid/rate-change"
+        limiter = get_rate_limiter(endpoint, 10.0)
+        
+        with caplog.at_level("WARNING"):
+            assert get_rate_limiter(endpoint, 10.0) is limiter
+            assert not caplog.records
+            assert get_rate_limiter(endpoint, 40.0) is limiter
+        
+        assert limiter.rate == 40.0
+        assert limiter._interval == 0.025
+        assert "from 10.0 to 40.0" in caplog.text
+
+
+class TestOntologySnapshot:
+    """Tests for the offline OntologySnapshot index."""
+    
+    @pytest.fixture
+    def snapshot_path(self, tmp_path):
+        """Snapshot built from small Wikidata and DBpedia dumps."""
+        import bz2
+        import gzip
+        import json
+        from inception.enhance.synthesis.ontology import build_snapshot
+        
+        items = [
+            {
+                "id": "Q28865",
+                "labels": {"en": {"value": "Python"}},
+                "aliases": {"en": [{"value": "Python programming language"}]},
+                "descriptions": {"en": {"value": "general-purpose programming language"}},
+            },
+            {
+                "id": "Q42",
+                "labels": {"en": {"value": "Douglas Adams"}, "fr": {"value": "Douglas Adams"}},
+                "descriptions": {"en": {"value": "English author and humorist"}},
+            },
+            {"id": "Q1", "labels": {"fr": {"value": "Univers"}}},
+        ]
+        wikidata_dump = tmp_path / "wikidata.json.gz"
+        with gzip.open(wikidata_dump, "wt", encoding="utf-8") as f:
+            f.write("[\n" + ",\n".join(json.dumps(item) for item in items) + "\n]\n")
+        
+        label = "<http://www.w3.org/2000/01/rdf-schema#label>"
+        dbpedia_dump = tmp_path / "labels_en.nt.bz2"
+        with bz2.open(dbpedia_dump, "wt", encoding="utf-8") as f:
+            f.write(f'<http://dbpedia.org/resource/Douglas_Adams> {label} "Douglas Adams"@en .\n')
+            f.write(f'<http://dbpedia.org/resource/Z%C3%BCrich> {label} "Z\\u00FCrich"@en .\n')
+            f.write(f'<http://dbpedia.org/resource/Paris> {label} "Paris"@fr .\n')
+        
+        path = tmp_path / "kb.idx"
+        assert build_snapshot(path, [wikidata_dump], [dbpedia_dump]) == 4
+        return path
+    
+    def test_lookup(self, snapshot_path):
+        """Test exact lookup by label and alias across sources."""
+        from inception.enhance.synthesis.ontology import OntologySnapshot
+        
+        with OntologySnapshot(snapshot_path) as snapshot:
+            assert len(snapshot) == 4
+            assert {(e.source, e.id) for e in snapshot.lookup("douglas  ADAMS")} == {
+                ("wikidata", "Q42"),
+                ("dbpedia", "http://dbpedia.org/resource/Douglas_Adams"),
+            }
+            assert snapshot.lookup("Python Programming Language")[0].label == "Python"
+            assert snapshot.lookup("Zürich")[0].id == "http://dbpedia.org/resource/Z%C3%BCrich"
+            assert snapshot.lookup("Paris") == []
+            assert snapshot.lookup("Univers") == []
+    
+    def test_prefix_and_fuzzy(self, snapshot_path):
+        """Test prefix and edit-distance lookup."""
+        from inception.enhance.synthesis.ontology import OntologySnapshot
+        
+        with OntologySnapshot(snapshot_path) as snapshot:
+            assert [e.matched for e in snapshot.prefix("pyth")] == [
+                "python", "python programming language",
+            ]
+            
+            found = snapshot.fuzzy("Duglas Adams", max_distance=1)
+            assert {e.id for e in found} == {"Q42", "http://dbpedia.org/resource/Douglas_Adams"}
+            assert all(e.distance == 1 for e in found)
+            assert snapshot.fuzzy("Pyhton", max_distance=1) == []
+            assert snapshot.fuzzy("Pyhton", max_distance=2)[0].id == "Q28865"
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test opening a file that is not a snapshot fails."""
+        from inception.enhance.synthesis.ontology import OntologySnapshot
+        
+        path = tmp_path / "other.idx"
+        path.write_bytes(b"not an index at all")
+        with pytest.raises(ValueError):
+            OntologySnapshot(path)
+    
+    def test_linker_uses_snapshot_first(self, kb_server, snapshot_path):
+        """Test the linker only searches a knowledge base the snapshot had no link for."""
+        from inception.enhance.synthesis.ontology import OntologySnapshot
+        
+        with OntologySnapshot(snapshot_path) as snapshot:
+            linker = kb_server.linker()
+            linker.snapshot = snapshot
+            
+            result = linker.link_entities([
+                (1, "Douglas Adams", "author"),
+                (2, "Python", "programming language"),
+                (3, "Entity 7", "concept"),
+            ])
+        
+        adams, python, other = result.linked_entities
+        assert adams.wikidata_qid == "Q42"
+        assert adams.dbpedia_uri == "http://dbpedia.org/resource/Douglas_Adams"
+        assert python.wikidata_qid == "Q28865"
+        assert other.is_linked
+        assert kb_server.requests["/w/api.php"] == 1
+        assert kb_server.requests["/api/search"] == 2
+    
+    def test_offline_mode(self, kb_server, snapshot_path, tmp_path):
+        """Test offline mode links from the snapshot alone, caching no misses."""
+        from inception.config import get_config
+        from inception.enhance.synthesis.ontology import LinkCache, OntologySnapshot
+        
+        config = get_config()
+        config.pipeline.offline_mode = True
+        try:
+            with OntologySnapshot(snapshot_path) as snapshot, \
+                    LinkCache(tmp_path / "links") as cache:
+                linker = kb_server.linker(cache=cache)
+                linker.snapshot = snapshot
+                
+                adams = linker.link_entity(1, "Duglas Adams", "author")
+                other = linker.link_entity(2, "Entity 7", "concept")
+                batch = linker.link_entities([(3, "Entity 8", "concept")])
+                assert len(cache) == 1  # only the snapshot's complete answer
+        finally:
+            config.pipeline.offline_mode = False
+        
+        assert adams.wikidata_qid == "Q42"
+        assert not other.is_nil
+        assert "Wikidata not queried (offline mode)" in other.metadata["link_errors"]
+        assert batch.nil_count == 0
+        assert batch.linked_entities[0].metadata["link_errors"]
+        assert sum(kb_server.requests.values()) == 0
+        
+        with LinkCache(tmp_path / "links") as cache:
+            online = kb_server.linker(cache=cache).link_entity(2, "Entity 7", "concept")
+        assert online.wikidata_qid
+        assert kb_server.requests["/w/api.php"] == 1
 
 
 # ==============================================================================
@@ -493,6 +1343,100 @@ class TestTemporalNetwork:
         inferred = network.propagate()
         
         assert len(inferred) > 0
+    
+    def test_propagate_chain(self):
+        """Test propagation reaches the end of a chain of constraints."""
+        from inception.enhance.synthesis.temporal.network import (
+            TemporalNetwork, TemporalConstraint
+        )
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        network = TemporalNetwork()
+        for i in range(1, 6):
+            network.add_constraint(TemporalConstraint(
+                event1_nid=i,
+                event2_nid=i + 1,
+                relation=AllenRelation.BEFORE,
+            ), propagate=False)
+        
+        inferred = network.propagate()
+        
+        assert len(inferred) == 10
+        assert network.get_constraint(1, 6).relation == AllenRelation.BEFORE
+        assert network.get_constraint(6, 1).relation == AllenRelation.AFTER
+        assert network.get_constraint(1, 6).is_inferred
+        assert network.propagate() == []
+    
+    def test_propagate_indeterminate(self):
+        """Test propagation keeping a set of possible relations."""
+        from inception.enhance.synthesis.temporal.network import (
+            TemporalNetwork, TemporalConstraint
+        )
+        from inception.enhance.synthesis.temporal.relations import AllenRelation, allen_compose
+        
+        network = TemporalNetwork()
+        network.add_constraint(TemporalConstraint(1, 2, AllenRelation.BEFORE))
+        inferred = network.add_constraint(TemporalConstraint(2, 3, AllenRelation.DURING))
+        
+        expected = allen_compose(AllenRelation.BEFORE, AllenRelation.DURING)
+        assert [i.possible_relations for i in inferred] == [expected]
+        assert network.get_relations(1, 3) == expected
+        assert network.get_constraint(1, 3) is None
+    
+    def test_inconsistency(self):
+        """Test detecting a cycle of BEFORE constraints."""
+        from inception.enhance.synthesis.temporal.network import (
+            TemporalNetwork, TemporalConstraint
+        )
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        network = TemporalNetwork()
+        network.add_constraint(TemporalConstraint(1, 2, AllenRelation.BEFORE))
+        network.add_constraint(TemporalConstraint(2, 3, AllenRelation.BEFORE))
+        network.add_constraint(TemporalConstraint(3, 1, AllenRelation.BEFORE))
+        
+        assert not network.is_consistent
+        inconsistencies = network.get_inconsistencies()
+        for inconsistency in inconsistencies:
+            assert inconsistency.existing.relation not in inconsistency.inferred.possible_relations
+        
+        # Propagating again doesn't report them twice
+        network.propagate()
+        assert len(network.get_inconsistencies()) == len(inconsistencies)
+    
+    def test_replaced_constraint(self):
+        """Test replacing a constraint drops inferences made from the old one."""
+        from inception.enhance.synthesis.temporal.network import (
+            TemporalNetwork, TemporalConstraint
+        )
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        network = TemporalNetwork()
+        network.add_constraint(TemporalConstraint(1, 2, AllenRelation.BEFORE))
+        network.add_constraint(TemporalConstraint(2, 3, AllenRelation.BEFORE))
+        assert network.get_constraint(1, 3).relation == AllenRelation.BEFORE
+        
+        network.add_constraint(TemporalConstraint(2, 3, AllenRelation.AFTER))
+        
+        assert network.get_constraint(1, 3) is None
+        assert network.is_consistent
+    
+    def test_transitive_closure(self):
+        """Test the closure is computed without changing the network."""
+        from inception.enhance.synthesis.temporal.network import (
+            TemporalNetwork, TemporalConstraint
+        )
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        network = TemporalNetwork()
+        network.add_constraint(TemporalConstraint(1, 2, AllenRelation.MEETS), propagate=False)
+        network.add_constraint(TemporalConstraint(2, 3, AllenRelation.BEFORE), propagate=False)
+        
+        closure = network.transitive_closure()
+        
+        assert closure[(1, 3)] == {AllenRelation.BEFORE}
+        assert closure[(3, 1)] == {AllenRelation.AFTER}
+        assert network.get_constraint(1, 3) is None
 
 
 class TestTemporalFact:
@@ -559,6 +1503,72 @@ class TestTemporalReasoner:
         assert order[0] == 1
         assert order[-1] == 3
     
+    def test_order_events_chain(self):
+        """Test a chain is ordered exactly, whatever the input order."""
+        from inception.enhance.synthesis.temporal.network import TemporalConstraint
+        from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        reasoner = TemporalReasoner()
+        relations = [AllenRelation.BEFORE, AllenRelation.MEETS, AllenRelation.AFTER, AllenRelation.MET_BY]
+        for i in range(1, 20):
+            relation = relations[i % 4]
+            if relation in (AllenRelation.BEFORE, AllenRelation.MEETS):
+                constraint = TemporalConstraint(i, i + 1, relation)
+            else:
+                constraint = TemporalConstraint(i + 1, i, relation)
+            reasoner.network.add_constraint(constraint, propagate=False)
+        
+        ordering = reasoner.partial_order(list(range(20, 0, -1)))
+        
+        assert ordering.order == list(range(1, 21))
+        assert ordering.is_total
+    
+    def test_partial_order(self):
+        """Test undetermined events share a layer."""
+        from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        reasoner = TemporalReasoner()
+        
+        # 1 before 2 and 3; 2 and 3 unrelated; both before 4; 5 unconstrained
+        reasoner.add_temporal_relation(1, 2, AllenRelation.BEFORE)
+        reasoner.add_temporal_relation(1, 3, AllenRelation.MEETS)
+        reasoner.add_temporal_relation(4, 2, AllenRelation.AFTER)
+        reasoner.add_temporal_relation(3, 4, AllenRelation.BEFORE)
+        
+        ordering = reasoner.partial_order([5, 4, 3, 2, 1])
+        
+        assert ordering.levels == [[5, 1], [3, 2], [4]]
+        assert ordering.order == [5, 1, 3, 2, 4]
+        assert ordering.cycles == []
+        assert not ordering.is_total
+    
+    def test_order_events_cycle(self):
+        """Test events on a BEFORE cycle are reported and kept together."""
+        from inception.enhance.synthesis.temporal.network import TemporalConstraint
+        from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner
+        from inception.enhance.synthesis.temporal.relations import AllenRelation
+        
+        reasoner = TemporalReasoner()
+        for a, b in [(1, 2), (2, 3), (3, 4), (4, 2), (4, 5)]:
+            reasoner.network.add_constraint(
+                TemporalConstraint(a, b, AllenRelation.BEFORE), propagate=False
+            )
+        
+        ordering = reasoner.partial_order([5, 4, 3, 2, 1])
+        
+        assert ordering.cycles == [[4, 3, 2]]
+        assert ordering.levels == [[1], [4, 3, 2], [5]]
+        
+        recorded = reasoner.network.get_inconsistencies()
+        assert [i.inferred.inference_path for i in recorded] == [[4, 2, 3]]
+        assert recorded[0].existing.relation == AllenRelation.AFTER
+        assert recorded[0] in reasoner.validate_consistency()
+        
+        reasoner.partial_order([5, 4, 3, 2, 1])
+        assert sum("cycle" in i.explanation for i in reasoner.validate_consistency()) == 1
+    
     def test_validate_consistency(self):
         """Test consistency validation."""
         from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner
@@ -574,6 +1584,34 @@ class TestTemporalReasoner:
         
         # Should be consistent
         assert len(inconsistencies) == 0
+    
+    def test_get_facts_at_time(self):
+        """Test point-in-time fact lookup keeps insertion order."""
+        from inception.enhance.synthesis.temporal.reasoner import TemporalReasoner, TemporalFact
+        
+        reasoner = TemporalReasoner()
+        for version, start, end in [
+            ("3.10", datetime(2021, 10, 4), datetime(2022, 10, 24)),
+            ("3.11", datetime(2022, 10, 24), datetime(2023, 10, 2)),
+            ("3.12", datetime(2023, 10, 2), None),
+        ]:
+            reasoner.add_temporal_fact(TemporalFact(
+                subject_nid=1,
+                predicate="latest_version",
+                object_value=version,
+                valid_from=start,
+                valid_to=end,
+            ))
+        reasoner.add_temporal_fact(TemporalFact(subject_nid=1, predicate="is_a", object_value="language"))
+        
+        def at(time):
+            return [f.object_value for f in reasoner.get_facts_at_time(1, time)]
+        
+        assert at(datetime(2022, 1, 1)) == ["3.10", "language"]
+        assert at(datetime(2022, 10, 24)) == ["3.10", "3.11", "language"]
+        assert at(datetime(2030, 1, 1)) == ["3.12", "language"]
+        assert at(datetime(2000, 1, 1)) == ["language"]
+        assert reasoner.get_facts_at_time(2, datetime(2022, 1, 1)) == []
 
 
 # ==============================================================================